@@ -34,6 +34,11 @@ from registry_review_mcp.tools import (
     human_review_tools,
 )
 from registry_review_mcp.config.settings import settings, SESSION_ID_PATTERN
+from registry_review_mcp.llm.cli_pool import get_cli_pool
+from registry_review_mcp.llm.client_pool import get_client_pool
+from registry_review_mcp.llm.image_prep import get_image_preparer
+from registry_review_mcp.llm.streaming import get_stream_metrics
+from registry_review_mcp.llm.token_budget import llm_priority
 from registry_review_mcp.tools.human_review_tools import (
     OverrideStatus,
     DeterminationStatus,
@@ -190,6 +195,17 @@ async def request_id_middleware(request: Request, call_next):
     return response
 
 
+@app.middleware("http")
+async def interactive_llm_priority_middleware(request: Request, call_next):
+    """Run LLM calls made while serving a request at interactive priority.
+
+    The token scheduler serves interactive calls ahead of queued bulk
+    work; evidence extraction still marks its own calls as bulk.
+    """
+    with llm_priority("interactive"):
+        return await call_next(request)
+
+
 # In-memory storage for pending uploads (use Redis/database in production)
 pending_uploads: dict[str, dict] = {}
 
@@ -336,7 +352,8 @@ async def root():
 async def health():
     """Liveness probe for PM2 and monitoring.
 
-    Returns service status, version, and session directory health.
+    Returns service status, version, session directory health, and LLM
+    HTTP connection pool utilization.
     """
     sessions_dir = settings.sessions_dir
     session_count = len(list(sessions_dir.glob("session-*"))) if sessions_dir.exists() else 0
@@ -346,6 +363,10 @@ async def health():
         "sessions_dir_exists": sessions_dir.exists(),
         "session_count": session_count,
         "last_request_at": _last_request_at.isoformat().replace("+00:00", "Z") if _last_request_at else None,
+        "llm_http_pools": get_client_pool().stats(),
+        "llm_cli_pool": get_cli_pool().stats(),
+        "llm_streams": get_stream_metrics().stats(),
+        "llm_images": get_image_preparer().stats(),
     }
 
 
@@ -516,17 +537,45 @@ async def get_conversion_status(session_id: str):
         raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
 
 
+@app.get("/sessions/{session_id}/evidence-status", summary="Get evidence extraction progress")
+async def get_evidence_status(session_id: str):
+    """Get progress of the current or last evidence extraction run.
+
+    Counts advance as each requirement is checkpointed, so clients can poll
+    this while a long extraction is running, or after one was interrupted.
+    """
+    try:
+        from registry_review_mcp.tools.evidence_tools import get_evidence_progress
+
+        return get_evidence_progress(session_id)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
+
+
 @app.post("/sessions/{session_id}/evidence", summary="Extract evidence")
-async def extract_evidence(session_id: str):
+async def extract_evidence(
+    session_id: str,
+    resume: bool = Query(True, description="Reuse requirements checkpointed by an earlier run for the same inputs"),
+    incremental: bool = Query(
+        False, description="Re-extract only requirement/document pairs whose inputs changed since the last run"
+    ),
+):
     """Extract evidence for all requirements from mapped documents.
 
     Analyzes documents and extracts specific evidence snippets with
-    page citations for each requirement.
+    page citations for each requirement. Each requirement is checkpointed
+    as it completes; an interrupted run resumes where it stopped.
+
+    After upload-additional-files, use incremental=true to recompute only
+    the pairs affected by the new or changed documents.
     """
     try:
-        from registry_review_mcp.tools.evidence_tools import extract_all_evidence
+        from registry_review_mcp.tools.evidence_tools import extract_all_evidence, extract_evidence_incremental
 
-        result = await extract_all_evidence(session_id)
+        if incremental:
+            result = await extract_evidence_incremental(session_id)
+        else:
+            result = await extract_all_evidence(session_id, resume=resume)
 
         # Add workflow guidance for ChatGPT
         result["next_steps"] = {
@@ -580,7 +629,7 @@ async def get_evidence_matrix(session_id: str):
     """
     try:
         from registry_review_mcp.utils.state import StateManager
-        import json
+        from registry_review_mcp.utils.state_cache import get_state_cache
 
         state_manager = StateManager(session_id)
 
@@ -592,8 +641,8 @@ async def get_evidence_matrix(session_id: str):
                 detail="Evidence not yet extracted. Run evidence extraction first.",
             )
 
-        with open(evidence_path) as f:
-            evidence_data = json.load(f)
+        # Cached in-process until evidence.json changes on disk
+        evidence_data = state_manager.read_json("evidence.json")
 
         # Load checklist for validation_type mapping
         session_data = state_manager.read_json("session.json")
@@ -604,8 +653,7 @@ async def get_evidence_matrix(session_id: str):
 
         validation_types = {}
         if checklist_path.exists():
-            with open(checklist_path) as f:
-                checklist = json.load(f)
+            checklist = get_state_cache().load("checklists", methodology, checklist_path)
             for req in checklist.get("requirements", []):
                 validation_types[req["requirement_id"]] = req.get(
                     "validation_type", "manual"
@@ -1222,11 +1270,13 @@ async def get_audit_log(
     action_filter: str | None = None,
     actor_filter: str | None = None,
     limit: int = 100,
+    cursor: int | None = None,
 ):
     """Get the audit log for a session.
 
     Returns a chronological list of all actions taken during the review,
-    with optional filtering by action type or actor.
+    with optional filtering by action type or actor. Pass ``next_cursor``
+    from a response as ``cursor`` to fetch the page of older events.
     """
     try:
         result = await human_review_tools.get_audit_log(
@@ -1234,6 +1284,7 @@ async def get_audit_log(
             action_filter=action_filter,
             actor_filter=actor_filter,
             limit=limit,
+            cursor=cursor,
         )
         return result
     except FileNotFoundError:
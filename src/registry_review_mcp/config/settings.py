@@ -105,9 +105,27 @@ class Settings(BaseSettings):
 
     # Session
     session_lock_timeout: int = 30  # seconds
+    # In-memory cache of parsed session JSON (utils.state_cache), validated
+    # against each file's mtime/size on every read. 0 disables it.
+    state_cache_max_bytes: int = Field(default=64 * 1024 * 1024, ge=0)
+    # Audit trail (utils.audit_log): fsync after this many appended events or
+    # this many seconds since the last sync, whichever comes first.
+    audit_fsync_batch: int = Field(default=20, ge=1)
+    audit_fsync_interval: float = Field(default=1.0, ge=0.0)
 
     # Document Processing
     pdf_cache_ttl: int = 86400  # 24 hours in seconds
+    # Extraction artifacts are keyed by file content (utils.artifacts), so they
+    # cannot go stale; the TTL only bounds how long unused ones linger on disk.
+    artifact_cache_ttl: int = Field(default=2592000, ge=1)  # 30 days in seconds
+    # Process-pool width for batch fast extraction. 0 = auto (CPU count - 1,
+    # capped at 8 and at the batch size); 1 = in-process (worker thread only).
+    fast_extraction_max_workers: int = Field(default=0, ge=0)
+    # PDFs with at least this many pages are split into page windows, converted
+    # across the pool, and streamed to their .fast.md instead of being held in
+    # memory whole. 0 disables sharding.
+    fast_extraction_shard_min_pages: int = Field(default=150, ge=0)
+    fast_extraction_window_pages: int = Field(default=25, ge=1)
 
     # OCR fallback (Issue #4 — image-heavy PDFs like Ecometric monitoring reports)
     # Disabled by default until the operator confirms Tesseract is installed
@@ -152,6 +170,11 @@ class Settings(BaseSettings):
     llm_chunk_overlap: int = Field(default=2000, ge=0)  # Overlap to avoid missing boundary content
     llm_max_images_per_call: int = Field(default=20, ge=1)  # Max images per API call (cost consideration)
     llm_warn_image_threshold: int = Field(default=10, ge=1)  # Warn when exceeding this many images
+    # Image payloads (llm.image_prep): downsampled past this long edge (the API's
+    # own limit), re-encoded past this size, cached by content hash.
+    llm_image_max_edge: int = Field(default=1568, ge=256)
+    llm_image_max_bytes: int = Field(default=1_000_000, ge=50_000)
+    llm_image_cache_bytes: int = Field(default=64 * 1024 * 1024, ge=0)
 
     # LLM Response Caching (2025-11-26)
     # Cache LLM responses locally to avoid redundant API calls during development
@@ -162,12 +185,78 @@ class Settings(BaseSettings):
     # cache. PROMPT_VERSION in the cache key (Phase F1.4) invalidates stale
     # entries automatically on every prompt change, so a longer TTL is safe.
     llm_cache_ttl: int = Field(default=2592000)  # 30 days in seconds
+    # Responses live in llm.response_store: compressed, in llm_cache_shards
+    # SQLite files under <llm_cache_dir>/store/, LRU-bounded in total. The
+    # shard count is fixed when a store is created (recorded in its manifest).
+    llm_cache_max_bytes: int = Field(default=1024**3, ge=1024 * 1024)  # 1 GiB compressed
+    llm_cache_max_entries: int = Field(default=500_000, ge=1)
+    llm_cache_shards: int = Field(default=16, ge=1, le=256)
+    # Batch mode (llm.batch): offline runs submit their prompts as one batch
+    # job and hydrate the cache from its results. "auto" uses the Anthropic
+    # Message Batches API when Anthropic serves the calls, else the local
+    # file-based stand-in under <llm_cache_dir>/batches/.
+    llm_batch_backend: Literal["auto", "anthropic", "local"] = Field(default="auto")
+    llm_batch_poll_interval: float = Field(default=30.0, ge=0.0)  # seconds between job status polls
+
+    # Shared HTTP clients (llm.client_pool): one keep-alive connection pool
+    # per backend, HTTP/2 when the h2 package is installed. Timeouts and
+    # retry counts per backend live here and nowhere else (call_llm and the
+    # extractors run the retries themselves, one throttle slot per attempt).
+    llm_http_max_connections: int = Field(default=20, ge=1)
+    llm_http_max_keepalive_connections: int = Field(default=10, ge=0)
+    llm_http_keepalive_expiry: float = Field(default=30.0, ge=0.0)  # seconds an idle connection is kept
+    llm_http2: bool = Field(default=True)
+    llm_anthropic_timeout_seconds: float = Field(default=600.0, gt=0)
+    llm_anthropic_max_retries: int = Field(default=2, ge=0)
+    llm_openai_timeout_seconds: float = Field(default=600.0, gt=0)
+    llm_openai_max_retries: int = Field(default=2, ge=0)
+
+    # Claude CLI backend (llm.cli_pool): warm stream-json workers. Prompts a
+    # worker serves share its conversation, so by default each serves one.
+    # Pool size 0 follows the throttle's max_concurrent.
+    llm_cli_pool_enabled: bool = Field(default=True)
+    llm_cli_pool_size: int = Field(default=0, ge=0)
+    llm_cli_worker_max_requests: int = Field(default=1, ge=1)
+    llm_cli_worker_idle_seconds: float = Field(default=300.0, gt=0)
+    llm_cli_request_timeout_seconds: float = Field(default=300.0, gt=0)
 
     # Cost Management
     api_call_timeout_seconds: int = Field(default=30, ge=5, le=120)
+    # CostTracker appends every call to a JSONL ledger and rewrites its
+    # summary snapshot (cost_tracking.json) only every N calls.
+    cost_snapshot_interval: int = Field(default=50, ge=1)
+    # Evidence extraction (tools.evidence_tools): send each document once with
+    # every requirement mapped to it, up to this many requirements per prompt
+    # (PromptBudget.max_total_chars also bounds the prompt).
+    evidence_batch_extraction: bool = Field(default=True)
+    evidence_batch_max_requirements: int = Field(default=8, ge=1)
+    # Documents longer than evidence_retrieval_max_chars are narrowed to the
+    # evidence_retrieval_top_k BM25-ranked chunks per requirement (llm.chunk_index)
+    # instead of being truncated at the prompt budget.
+    evidence_retrieval_enabled: bool = Field(default=True)
+    evidence_retrieval_max_chars: int = Field(default=24_000, ge=1000)
+    evidence_retrieval_top_k: int = Field(default=12, ge=1)
+    # Stream per-pair evidence and date-extraction responses (llm.streaming),
+    # handling each JSON item as it arrives. A streamed evidence response is
+    # cut off once a snippet at or above evidence_stream_stop_confidence is
+    # found in the document (0 reads every response to the end).
+    llm_stream_responses: bool = Field(default=False)
+    evidence_stream_stop_confidence: float = Field(default=0.0, ge=0.0, le=1.0)
+    # Unified analysis (tools.analyze_llm): split the documents into shards whose
+    # prompts fit PromptBudget.max_total_chars, analyze the shards concurrently
+    # and merge the results. Shard results are cached, so a retry re-runs only
+    # the shards that failed.
+    unified_analysis_sharding: bool = Field(default=True)
 
     # Performance
     enable_caching: bool = True
+    # Cache backend (utils.cache). "sqlite" keeps every namespace in one
+    # LRU-bounded file; "json" is the legacy one-file-per-key layout, for
+    # filesystems where SQLite locking misbehaves (some NFS mounts).
+    cache_backend: Literal["sqlite", "json"] = Field(default="sqlite")
+    cache_max_bytes: int = Field(default=2 * 1024**3, ge=1024 * 1024)  # 2 GiB across all namespaces
+    cache_max_entries: int = Field(default=200_000, ge=1)
+    cache_sweep_interval: int = Field(default=600, ge=0)  # seconds between TTL sweeps; 0 = only on read
 
     # Session Monitoring (for REST API)
     monitor_sessions: bool = False
@@ -277,7 +366,10 @@ class Settings(BaseSettings):
         return self.cache_dir / f"{cache_key}.cache"
 
     def get_llm_cache_path(self, cache_key: str) -> Path:
-        """Get the path to a cached LLM response.
+        """Get the path of a legacy one-file-per-key cached LLM response.
+
+        Responses are now kept in ``llm.response_store``; files at this path
+        are adopted into the store when first read (or by ``migrate``).
 
         Args:
             cache_key: Hash of (requirement_id, document_content, model)
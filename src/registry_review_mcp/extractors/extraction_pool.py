@@ -0,0 +1,235 @@
+"""Bounded process-pool engine for CPU-bound document extraction.
+
+PyMuPDF4LLM conversion, the OCR fallback, and openpyxl parsing are all
+synchronous and CPU-bound. Awaiting them one document at a time on the
+event loop meant a 40-PDF submission blocked the REST API for minutes.
+
+This module fans a batch of documents out across a process pool and
+yields outcomes in the order they *finish*, so callers can report
+progress as soon as each document lands:
+
+- :func:`iter_extractions`: async iterator of :class:`ExtractionOutcome`.
+  One outcome per input path; a failure in one document never affects
+  the others.
+- :func:`iter_page_windows`: the same pool applied *within* one large PDF;
+  page windows convert in parallel and come back in page order.
+- :func:`calculate_extraction_workers`: pool width for a batch, honouring
+  ``settings.fast_extraction_max_workers``.
+- :func:`get_extraction_pool` / :func:`shutdown_extraction_pool`: the
+  process-wide pool, created lazily and rebuilt if a worker dies.
+
+With a single worker (or a single document) we skip the pool entirely
+and run on a worker thread — process start-up would dominate the
+2-3 second extraction, and the event loop stays free either way.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+from ..config.settings import settings
+from ..utils.patterns import SPREADSHEET_EXTENSIONS
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on auto-sized pools. PyMuPDF4LLM holds a few hundred MB per
+# large document, so more workers than this trades throughput for swap.
+MAX_AUTO_WORKERS = 8
+
+_pool: ProcessPoolExecutor | None = None
+_pool_workers: int = 0
+
+
+@dataclass
+class ExtractionOutcome:
+    """Result of extracting one document from a batch.
+
+    Exactly one of ``result`` / ``error`` is set.
+    """
+
+    filepath: str
+    result: dict[str, Any] | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def extract_document_sync(filepath: str) -> dict[str, Any]:
+    """Run the fast extractor appropriate for ``filepath``'s suffix.
+
+    Executed inside pool workers, so it must stay module-level.
+    """
+    if Path(filepath).suffix.lower() in SPREADSHEET_EXTENSIONS:
+        from .spreadsheet_extractor import extract_spreadsheet_sync
+
+        return extract_spreadsheet_sync(filepath)
+
+    from .fast_extractor import fast_extract_pdf_sync
+
+    return fast_extract_pdf_sync(filepath)
+
+
+def calculate_extraction_workers(num_docs: int) -> int:
+    """Return the pool width to use for a batch of ``num_docs`` documents.
+
+    ``settings.fast_extraction_max_workers`` wins when set; otherwise we
+    leave one core for the event loop and cap at :data:`MAX_AUTO_WORKERS`.
+    Never more workers than documents, never fewer than one.
+    """
+    configured = settings.fast_extraction_max_workers
+    if configured > 0:
+        limit = configured
+    else:
+        limit = min(MAX_AUTO_WORKERS, max(1, (os.cpu_count() or 2) - 1))
+    return max(1, min(limit, num_docs))
+
+
+def get_extraction_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Return the process-wide extraction pool, sized to at least ``max_workers``.
+
+    Uses the ``spawn`` start method: forking a process that is running an
+    asyncio loop (and, under uvicorn, several threads) is unsafe.
+    """
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers < max_workers:
+        if _pool is not None:
+            _pool.shutdown(wait=False)
+        _pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        _pool_workers = max_workers
+    return _pool
+
+
+def shutdown_extraction_pool(wait: bool = True) -> None:
+    """Tear down the process-wide pool. The next batch rebuilds it."""
+    global _pool, _pool_workers
+    if _pool is not None:
+        _pool.shutdown(wait=wait, cancel_futures=True)
+    _pool = None
+    _pool_workers = 0
+
+
+async def iter_extractions(
+    filepaths: list[str],
+    max_workers: int | None = None,
+) -> AsyncIterator[ExtractionOutcome]:
+    """Extract ``filepaths`` concurrently, yielding outcomes as they finish.
+
+    Args:
+        filepaths: Documents to extract (PDFs and spreadsheets).
+        max_workers: Pool width. Defaults to :func:`calculate_extraction_workers`.
+
+    Yields:
+        One :class:`ExtractionOutcome` per input path, in completion order.
+    """
+    if not filepaths:
+        return
+
+    workers = max_workers or calculate_extraction_workers(len(filepaths))
+    loop = asyncio.get_running_loop()
+
+    pool: ProcessPoolExecutor | None = None
+    if workers > 1 and len(filepaths) > 1:
+        pool = get_extraction_pool(workers)
+        logger.info(f"Extracting {len(filepaths)} documents across {workers} worker processes")
+
+    # The semaphore bounds the thread path to ``workers`` as well; the
+    # default executor would otherwise run the whole batch at once.
+    slots = asyncio.Semaphore(workers)
+
+    async def run_one(path: str) -> ExtractionOutcome:
+        try:
+            async with slots:
+                # ``pool=None`` selects the loop's default thread pool: off
+                # the event loop, without the process start-up cost.
+                result = await loop.run_in_executor(pool, extract_document_sync, path)
+            return ExtractionOutcome(filepath=path, result=result)
+        except BrokenProcessPool as e:
+            # A worker died (segfault in a native library, OOM kill). Every
+            # in-flight future fails with it; drop the pool so the next
+            # batch starts clean, and report the casualty per document.
+            logger.error(f"Extraction worker crashed while processing {path}: {e}")
+            if pool is not None and pool is _pool:
+                shutdown_extraction_pool(wait=False)
+            return ExtractionOutcome(filepath=path, error=e)
+        except Exception as e:
+            return ExtractionOutcome(filepath=path, error=e)
+
+    for next_done in asyncio.as_completed([run_one(path) for path in filepaths]):
+        yield await next_done
+
+
+async def iter_page_windows(
+    filepath: str,
+    window_pages: int | None = None,
+    max_workers: int | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Convert one PDF as page windows across the pool, yielding in page order.
+
+    At most ``2 * workers`` windows are in flight: enough to keep every
+    worker busy while the caller drains the head window, small enough that
+    a 400-page document never materialises in memory at once. Windows that
+    finish early wait in their futures until their turn.
+
+    Args:
+        filepath: PDF to convert.
+        window_pages: Pages per window. Defaults to ``settings.fast_extraction_window_pages``.
+        max_workers: Pool width. Defaults to :func:`calculate_extraction_workers`.
+
+    Yields:
+        :func:`~.fast_extractor.fast_extract_page_window_sync` results,
+        first page first. The first window failure propagates and cancels
+        the rest.
+    """
+    from ..utils.artifacts import file_sha256
+    from .fast_extractor import fast_extract_page_window_sync, pdf_page_count
+
+    size = window_pages or settings.fast_extraction_window_pages
+    page_count = await asyncio.to_thread(pdf_page_count, filepath)
+    # Hashed once here rather than once per window in every worker.
+    content_hash = await asyncio.to_thread(file_sha256, filepath)
+    windows = [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+    if not windows:
+        return
+
+    workers = max_workers or calculate_extraction_workers(len(windows))
+    loop = asyncio.get_running_loop()
+
+    pool: ProcessPoolExecutor | None = None
+    if workers > 1 and len(windows) > 1:
+        pool = get_extraction_pool(workers)
+        logger.info(
+            f"Extracting {Path(filepath).name} as {len(windows)} page windows across {workers} worker processes"
+        )
+
+    max_in_flight = workers * 2
+    in_flight: dict[int, asyncio.Future] = {}
+    next_submit = 0
+    try:
+        for index in range(len(windows)):
+            while next_submit < len(windows) and len(in_flight) < max_in_flight:
+                start, stop = windows[next_submit]
+                in_flight[next_submit] = loop.run_in_executor(
+                    pool, fast_extract_page_window_sync, filepath, start, stop, content_hash
+                )
+                next_submit += 1
+            try:
+                window = await in_flight.pop(index)
+            except BrokenProcessPool:
+                if pool is not None and pool is _pool:
+                    shutdown_extraction_pool(wait=False)
+                raise
+            yield window
+    finally:
+        for future in in_flight.values():
+            future.cancel()
@@ -20,16 +20,149 @@ OCR fallback (Issue #4):
     to 0/23 requirement coverage.
 """
 
+import asyncio
 import logging
 import re
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, Iterator
 
 from ..models.errors import DocumentExtractionError
+from ..utils.artifacts import artifact_store
 
 logger = logging.getLogger(__name__)
 
+# Page blocks are joined with a blank line and headed by "--- Page N ---",
+# the format extract_page_from_markers() recognises for citations.
+PAGE_SEPARATOR = "\n\n"
+PAGE_MARKER_PATTERN = re.compile(r"^--- Page (\d+) ---$")
+
+# Simple markdown table detection (header row followed by a separator row)
+TABLE_PATTERN = re.compile(r"\|.*\|.*\n\|[-:| ]+\|", re.MULTILINE)
+
+# MuPDF is not thread-safe. Worker processes are single-threaded, but the
+# in-process thread path (single documents, 1-worker pools) can overlap
+# across concurrent requests, so conversions in one process serialize here.
+_PYMUPDF_LOCK = threading.Lock()
+
+
+def _page_block(page_number: int, text: str) -> str:
+    """Render one page chunk with its citation marker."""
+    return f"--- Page {page_number} ---\n\n{text}"
+
+
+def _ocr_settings() -> tuple[bool, int, str, int, Path]:
+    """Read the OCR knobs from settings, falling back to safe defaults."""
+    try:
+        from ..config.settings import settings
+
+        _default_cache = Path.home() / ".cache" / "registry-review-mcp"
+        return (
+            bool(getattr(settings, "ocr_enabled", False)),
+            int(getattr(settings, "ocr_density_threshold", 50)),
+            str(getattr(settings, "ocr_language", "eng")),
+            int(getattr(settings, "ocr_dpi", 150)),
+            Path(getattr(settings, "cache_dir", _default_cache)),
+        )
+    except Exception as exc:
+        logger.debug("OCR settings probe failed, leaving fallback disabled: %s", exc)
+        return False, 50, "eng", 150, Path.home() / ".cache" / "registry-review-mcp"
+
+
+def _ocr_variant() -> str:
+    """Artifact variant for the OCR knobs that change fast-extraction output."""
+    ocr_enabled, density_threshold, ocr_language, ocr_dpi, _ = _ocr_settings()
+    if not ocr_enabled:
+        return "ocr=off"
+    return f"ocr={density_threshold}:{ocr_language}:{ocr_dpi}"
+
+
+def _cacheable(ocr_mode: str) -> bool:
+    """Whether a result may be stored as an artifact.
+
+    Output produced while Tesseract was missing would outlive the missing
+    install, so it is never stored.
+    """
+    return ocr_mode != "requested-but-tesseract-missing"
+
+
+def _apply_ocr_fallback(
+    file_path: Path,
+    page_chunks: list[dict[str, Any]],
+    first_page_index: int = 0,
+) -> tuple[str, int, str, int]:
+    """Splice OCR-recovered text into sparse, image-bearing page chunks.
+
+    OCR fallback (Issue #4): for any chunk that came back under the
+    density threshold on a page that contains image blocks, run OCR
+    and splice the recovered text into the chunk's markdown. We defer
+    the imports and the tesseract probe until OCR is enabled so the
+    happy path stays fast.
+
+    ``page_chunks[i]`` is page ``first_page_index + i`` of the PDF, which
+    lets page-window workers OCR only their own slice.
+
+    Returns:
+        Tuple of (ocr_mode, pages_recovered, language, dpi)
+    """
+    ocr_enabled, density_threshold, ocr_language, ocr_dpi, cache_root = _ocr_settings()
+    ocr_pages_recovered = 0
+    ocr_mode = "disabled"
+
+    if ocr_enabled:
+        from .ocr import is_tesseract_available, ocr_page, page_needs_ocr
+
+        if not is_tesseract_available():
+            ocr_mode = "requested-but-tesseract-missing"
+        else:
+            ocr_mode = "enabled"
+            import pymupdf
+
+            pdf_doc = pymupdf.open(str(file_path))
+            try:
+                for offset, chunk in enumerate(page_chunks):
+                    idx = first_page_index + offset
+                    if idx >= pdf_doc.page_count:
+                        break
+                    page_obj = pdf_doc[idx]
+                    if not page_needs_ocr(
+                        chunk.get("text", ""),
+                        page_obj,
+                        density_threshold=density_threshold,
+                    ):
+                        continue
+                    ocr_text = ocr_page(
+                        str(file_path),
+                        idx,
+                        mode="auto",
+                        language=ocr_language,
+                        dpi=ocr_dpi,
+                        cache_root=cache_root,
+                    )
+                    if not ocr_text:
+                        continue
+                    # Tag the OCR block so downstream consumers can tell
+                    # recovered text from natively-extracted text.
+                    chunk_text = chunk.get("text", "").rstrip()
+                    ocr_block = f"\n\n<!-- OCR-recovered page {idx + 1} -->\n{ocr_text}\n"
+                    chunk["text"] = f"{chunk_text}{ocr_block}" if chunk_text else ocr_block
+                    ocr_pages_recovered += 1
+            finally:
+                pdf_doc.close()
+
+    return ocr_mode, ocr_pages_recovered, ocr_language, ocr_dpi
+
+
+def _ocr_summary(mode: str, pages_recovered: int, language: str, dpi: int) -> dict[str, Any]:
+    """Build the ``ocr`` sub-dictionary every fast-extraction result carries."""
+    return {
+        "mode": mode,
+        "pages_recovered": pages_recovered,
+        "language": language if mode == "enabled" else None,
+        "dpi": dpi if mode == "enabled" else None,
+    }
+
 
 async def fast_extract_pdf(filepath: str) -> dict[str, Any]:
     """Fast PDF to markdown extraction using PyMuPDF4LLM.
@@ -67,6 +200,20 @@ async def fast_extract_pdf(filepath: str) -> dict[str, Any]:
 
         This project applies the Soil Carbon methodology...
     """
+    # PyMuPDF4LLM (and the OCR fallback) are CPU-bound and synchronous.
+    # Running them on a worker thread keeps the event loop — and with it
+    # the REST API — responsive while a single document converts. Batch
+    # callers go through ``extraction_pool`` for true multi-core fan-out.
+    return await asyncio.to_thread(fast_extract_pdf_sync, filepath)
+
+
+def fast_extract_pdf_sync(filepath: str) -> dict[str, Any]:
+    """Blocking core of :func:`fast_extract_pdf`.
+
+    Module-level (and therefore picklable) so the extraction pool can run
+    it in a worker process. The returned dict contains only plain Python
+    values for the same reason.
+    """
     try:
         import pymupdf4llm
     except ImportError:
@@ -83,90 +230,34 @@ async def fast_extract_pdf(filepath: str) -> dict[str, Any]:
                 details={"filepath": filepath},
             )
 
+        variant = _ocr_variant()
+        cached = artifact_store.get("fast", file_path, variant=variant)
+        if cached is not None:
+            logger.info(f"📦 Using cached fast extraction for {file_path.name}")
+            return cached
+
         logger.info(f"⚡️ Fast extracting {file_path.name} using PyMuPDF4LLM...")
 
-        # Extract as page chunks (better for RAG/citation)
-        page_chunks = pymupdf4llm.to_markdown(
-            str(file_path),
-            page_chunks=True,
-            # Note: Could add header=False, footer=False to exclude headers/footers
-        )
+        with _PYMUPDF_LOCK:
+            # Extract as page chunks (better for RAG/citation)
+            page_chunks = pymupdf4llm.to_markdown(
+                str(file_path),
+                page_chunks=True,
+                # Note: Could add header=False, footer=False to exclude headers/footers
+            )
+            # PyMuPDF4LLM returns defaultdicts with a lambda factory, which do not
+            # pickle. Plain dicts let results cross the process-pool boundary.
+            page_chunks = [dict(chunk) for chunk in page_chunks]
 
-        # OCR fallback (Issue #4): for any chunk that came back under the
-        # density threshold on a page that contains image blocks, run OCR
-        # and splice the recovered text into the chunk's markdown. We defer
-        # the imports and the settings/tesseract probes until a page is
-        # actually flagged so the happy path stays as fast as today.
-        ocr_pages_recovered = 0
-        ocr_mode = "disabled"
-        try:
-            from ..config.settings import settings
-
-            ocr_enabled = bool(getattr(settings, "ocr_enabled", False))
-            density_threshold = int(getattr(settings, "ocr_density_threshold", 50))
-            ocr_language = str(getattr(settings, "ocr_language", "eng"))
-            ocr_dpi = int(getattr(settings, "ocr_dpi", 150))
-            _default_cache = Path.home() / ".cache" / "registry-review-mcp"
-            cache_root = Path(getattr(settings, "cache_dir", _default_cache))
-        except Exception as exc:
-            logger.debug("OCR settings probe failed, leaving fallback disabled: %s", exc)
-            ocr_enabled = False
-            density_threshold = 50
-            ocr_language = "eng"
-            ocr_dpi = 150
-            cache_root = Path.home() / ".cache" / "registry-review-mcp"
-
-        if ocr_enabled:
-            from .ocr import is_tesseract_available, ocr_page, page_needs_ocr
-
-            if not is_tesseract_available():
-                ocr_mode = "requested-but-tesseract-missing"
-            else:
-                ocr_mode = "enabled"
-                import pymupdf
-
-                pdf_doc = pymupdf.open(str(file_path))
-                try:
-                    for idx, chunk in enumerate(page_chunks):
-                        if idx >= pdf_doc.page_count:
-                            break
-                        page_obj = pdf_doc[idx]
-                        if not page_needs_ocr(
-                            chunk.get("text", ""),
-                            page_obj,
-                            density_threshold=density_threshold,
-                        ):
-                            continue
-                        ocr_text = ocr_page(
-                            str(file_path),
-                            idx,
-                            mode="auto",
-                            language=ocr_language,
-                            dpi=ocr_dpi,
-                            cache_root=cache_root,
-                        )
-                        if not ocr_text:
-                            continue
-                        # Tag the OCR block so downstream consumers can tell
-                        # recovered text from natively-extracted text.
-                        chunk_text = chunk.get("text", "").rstrip()
-                        ocr_block = f"\n\n<!-- OCR-recovered page {idx + 1} -->\n{ocr_text}\n"
-                        chunk["text"] = f"{chunk_text}{ocr_block}" if chunk_text else ocr_block
-                        ocr_pages_recovered += 1
-                finally:
-                    pdf_doc.close()
+            ocr_mode, ocr_pages_recovered, ocr_language, ocr_dpi = _apply_ocr_fallback(file_path, page_chunks)
 
         # Combine for full text with page markers for citation extraction
         # Use format: "--- Page N ---" which matches extract_page_from_markers() patterns
-        pages_with_markers = []
-        for i, chunk in enumerate(page_chunks, 1):
-            page_marker = f"--- Page {i} ---"
-            pages_with_markers.append(f"{page_marker}\n\n{chunk['text']}")
-        full_markdown = "\n\n".join(pages_with_markers)
+        pages_with_markers = [_page_block(i, chunk["text"]) for i, chunk in enumerate(page_chunks, 1)]
+        full_markdown = PAGE_SEPARATOR.join(pages_with_markers)
 
         # Count tables (simple markdown table detection)
-        table_pattern = re.compile(r"\|.*\|.*\n\|[-:| ]+\|", re.MULTILINE)
-        tables_found = len(table_pattern.findall(full_markdown))
+        tables_found = len(TABLE_PATTERN.findall(full_markdown))
 
         result = {
             "filepath": filepath,
@@ -177,12 +268,7 @@ async def fast_extract_pdf(filepath: str) -> dict[str, Any]:
             "extraction_method": "pymupdf4llm" if ocr_pages_recovered == 0 else "pymupdf4llm+ocr",
             "tables_found": tables_found,
             "total_chars": len(full_markdown),
-            "ocr": {
-                "mode": ocr_mode,
-                "pages_recovered": ocr_pages_recovered,
-                "language": ocr_language if ocr_mode == "enabled" else None,
-                "dpi": ocr_dpi if ocr_mode == "enabled" else None,
-            },
+            "ocr": _ocr_summary(ocr_mode, ocr_pages_recovered, ocr_language, ocr_dpi),
         }
 
         char_count = len(full_markdown)
@@ -192,6 +278,9 @@ async def fast_extract_pdf(filepath: str) -> dict[str, Any]:
             f"{tables_found} tables)"
         )
 
+        if _cacheable(ocr_mode):
+            artifact_store.put("fast", file_path, result, variant=variant)
+
         return result
 
     except DocumentExtractionError:
@@ -204,6 +293,209 @@ async def fast_extract_pdf(filepath: str) -> dict[str, Any]:
         )
 
 
+def pdf_page_count(filepath: str) -> int:
+    """Return the page count of a PDF without converting it."""
+    import pymupdf
+
+    with _PYMUPDF_LOCK:
+        with pymupdf.open(filepath) as pdf_doc:
+            return pdf_doc.page_count
+
+
+def fast_extract_page_window_sync(
+    filepath: str,
+    start: int,
+    stop: int,
+    content_hash: str | None = None,
+) -> dict[str, Any]:
+    """Extract pages ``[start, stop)`` (0-indexed) of a PDF.
+
+    Unit of work for page-sharded extraction: each worker process converts
+    one window, so a 400-page report never sits in a single process (or a
+    single result dict) at once. Windows are cached as artifacts of their
+    own; ``content_hash`` spares every worker from re-hashing the file.
+
+    Returns:
+        Dictionary with:
+            - start: int - First page index of the window
+            - pages: list[dict] - ``{"page": n, "text": str}`` per page, 1-indexed
+            - ocr_mode: str - Same vocabulary as ``result["ocr"]["mode"]``
+            - ocr_pages_recovered: int - Pages in this window rescued by OCR
+    """
+    import pymupdf4llm
+
+    file_path = Path(filepath)
+    variant = f"{_ocr_variant()}:pages={start}-{stop}"
+    cached = artifact_store.get("fast", file_path, variant=variant, content_hash=content_hash)
+    if cached is not None:
+        return cached
+
+    with _PYMUPDF_LOCK:
+        page_chunks = [
+            dict(chunk)
+            for chunk in pymupdf4llm.to_markdown(str(file_path), page_chunks=True, pages=list(range(start, stop)))
+        ]
+        ocr_mode, ocr_pages_recovered, _, _ = _apply_ocr_fallback(file_path, page_chunks, first_page_index=start)
+
+    window = {
+        "start": start,
+        "pages": [{"page": start + offset + 1, "text": chunk["text"]} for offset, chunk in enumerate(page_chunks)],
+        "ocr_mode": ocr_mode,
+        "ocr_pages_recovered": ocr_pages_recovered,
+    }
+    if _cacheable(ocr_mode):
+        artifact_store.put("fast", file_path, window, variant=variant, content_hash=content_hash)
+    return window
+
+
+async def iter_fast_extract_pages(
+    filepath: str,
+    window_pages: int | None = None,
+    max_workers: int | None = None,
+) -> AsyncIterator[tuple[int, str]]:
+    """Lazily yield ``(page_number, markdown)`` for every page of a PDF.
+
+    Page windows are converted on the extraction pool; pages come back in
+    document order while later windows are still converting. Memory stays
+    proportional to the windows in flight, not to the document.
+
+    Args:
+        filepath: Path to PDF file
+        window_pages: Pages per worker task (default: settings.fast_extraction_window_pages)
+        max_workers: Pool width (default: sized to the number of windows)
+    """
+    from .extraction_pool import iter_page_windows
+
+    async for window in iter_page_windows(filepath, window_pages=window_pages, max_workers=max_workers):
+        for page in window["pages"]:
+            yield page["page"], page["text"]
+
+
+async def stream_fast_extract_pdf(
+    filepath: str,
+    output_path: str | Path | None = None,
+    window_pages: int | None = None,
+    max_workers: int | None = None,
+) -> dict[str, Any]:
+    """Page-sharded fast extraction that streams straight to a ``.fast.md`` file.
+
+    For very large PDFs (400-page monitoring reports) holding every page
+    chunk plus the joined markdown in one dict peaked at several GB. This
+    variant writes each page block to disk as soon as its window lands and
+    returns only a summary. Read the pages back lazily with
+    :func:`iter_markdown_pages`.
+
+    The on-disk format is byte-identical to ``fast_extract_pdf``'s
+    ``markdown`` value, so downstream consumers cannot tell the modes apart.
+
+    Args:
+        filepath: Path to PDF file
+        output_path: Destination markdown (default: ``<pdf>.fast.md``)
+        window_pages: Pages per worker task (default: settings.fast_extraction_window_pages)
+        max_workers: Pool width (default: sized to the number of windows)
+
+    Returns:
+        The ``fast_extract_pdf`` summary keys minus ``markdown``/``pages``,
+        plus ``fast_markdown_path`` and ``streamed: True``.
+
+    Raises:
+        DocumentExtractionError: If any window fails; the partial output is removed.
+    """
+    from .extraction_pool import iter_page_windows
+
+    file_path = Path(filepath)
+    if not file_path.exists():
+        raise DocumentExtractionError(
+            f"PDF file not found: {filepath}",
+            details={"filepath": filepath},
+        )
+
+    md_path = Path(output_path) if output_path else file_path.with_suffix(".fast.md")
+    tmp_path = md_path.with_name(f".{md_path.name}.tmp")
+
+    page_count = 0
+    total_chars = 0
+    tables_found = 0
+    ocr_pages_recovered = 0
+    ocr_mode = "disabled"
+    _, _, ocr_language, ocr_dpi, _ = _ocr_settings()
+
+    logger.info(f"⚡️ Streaming page-sharded extraction of {file_path.name}...")
+
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as out:
+            async for window in iter_page_windows(filepath, window_pages=window_pages, max_workers=max_workers):
+                ocr_mode = window["ocr_mode"]
+                ocr_pages_recovered += window["ocr_pages_recovered"]
+                for page in window["pages"]:
+                    block = _page_block(page["page"], page["text"])
+                    if page_count:
+                        block = PAGE_SEPARATOR + block
+                    out.write(block)
+                    page_count += 1
+                    total_chars += len(block)
+                    tables_found += len(TABLE_PATTERN.findall(page["text"]))
+        tmp_path.replace(md_path)
+    except Exception as e:
+        tmp_path.unlink(missing_ok=True)
+        if isinstance(e, DocumentExtractionError):
+            raise
+        logger.error(f"❌ Streaming extraction failed for {filepath}: {str(e)}")
+        raise DocumentExtractionError(
+            f"Failed to extract PDF with PyMuPDF4LLM: {str(e)}",
+            details={"filepath": filepath, "error": str(e), "error_type": type(e).__name__},
+        )
+
+    logger.info(
+        f"✅ Streaming extraction complete: {file_path.name} "
+        f"({page_count} pages, {total_chars:,} chars, {tables_found} tables)"
+    )
+
+    return {
+        "filepath": filepath,
+        "fast_markdown_path": str(md_path),
+        "page_count": page_count,
+        "extracted_at": datetime.now(timezone.utc).isoformat(),
+        "extraction_method": "pymupdf4llm" if ocr_pages_recovered == 0 else "pymupdf4llm+ocr",
+        "tables_found": tables_found,
+        "total_chars": total_chars,
+        "streamed": True,
+        "ocr": _ocr_summary(ocr_mode, ocr_pages_recovered, ocr_language, ocr_dpi),
+    }
+
+
+def iter_markdown_pages(md_path: str | Path) -> Iterator[tuple[int, str]]:
+    """Lazily yield ``(page_number, text)`` from a page-marked markdown file.
+
+    Reads line by line, so only one page is held in memory at a time.
+    Content before the first ``--- Page N ---`` marker is reported as page 0.
+    """
+    page_number = 0
+    lines: list[str] = []
+    with open(md_path, encoding="utf-8") as f:
+        for line in f:
+            match = PAGE_MARKER_PATTERN.match(line.rstrip("\n"))
+            if match:
+                if page_number or "".join(lines).strip():
+                    yield page_number, _strip_page_text(lines, followed_by_page=True)
+                page_number = int(match.group(1))
+                lines = []
+            else:
+                lines.append(line)
+    if page_number or "".join(lines).strip():
+        yield page_number, _strip_page_text(lines, followed_by_page=False)
+
+
+def _strip_page_text(lines: list[str], followed_by_page: bool) -> str:
+    """Undo the marker padding and page separator around one page's text."""
+    text = "".join(lines)
+    if text.startswith("\n"):
+        text = text[1:]
+    if followed_by_page and text.endswith(PAGE_SEPARATOR):
+        text = text[: -len(PAGE_SEPARATOR)]
+    return text
+
+
 async def fast_extract_with_quality_check(filepath: str) -> dict[str, Any]:
     """Fast extraction with quality heuristics.
 
@@ -260,13 +552,18 @@ async def fast_extract_with_quality_check(filepath: str) -> dict[str, Any]:
 
 async def batch_fast_extract_pdfs(
     filepaths: list[str],
+    max_workers: int | None = None,
 ) -> dict[str, dict[str, Any]]:
     """Batch fast extract multiple PDFs.
 
-    Processes PDFs sequentially (fast enough that parallelization not needed).
+    Fans the batch out across the extraction process pool (see
+    ``extraction_pool``) and records each document as it finishes. A
+    failure is captured per document; the rest of the batch continues.
 
     Args:
         filepaths: List of PDF file paths
+        max_workers: Pool width. Defaults to
+            ``extraction_pool.calculate_extraction_workers(len(filepaths))``.
 
     Returns:
         Dictionary mapping filepath -> extraction result
@@ -285,6 +582,8 @@ async def batch_fast_extract_pdfs(
         >>> results = await batch_fast_extract_pdfs(pdfs)
         >>> print(f"Extracted {len(results)} PDFs in 8 seconds")
     """
+    from .extraction_pool import iter_extractions
+
     if not filepaths:
         return {}
 
@@ -295,24 +594,23 @@ async def batch_fast_extract_pdfs(
     logger.info(f"⚡️ Fast extracting {len(filepaths)} PDFs")
     print(f"⚡️ Fast extracting {len(filepaths)} PDFs...", flush=True)
 
-    for i, filepath in enumerate(filepaths, 1):
-        try:
-            print(f"   [{i}/{len(filepaths)}] Extracting {Path(filepath).name}...", flush=True)
+    completed = 0
+    async for outcome in iter_extractions(filepaths, max_workers=max_workers):
+        completed += 1
+        filepath = outcome.filepath
+        progress = f"   [{completed}/{len(filepaths)}] {Path(filepath).name}"
 
-            result = await fast_extract_pdf(filepath)
-            results[filepath] = result
+        if outcome.ok:
+            results[filepath] = outcome.result
             successful += 1
-
-            char_count = result["total_chars"]
-            print(f"   ✓ Extracted ({char_count:,} chars)", flush=True)
-
-        except Exception as e:
-            logger.error(f"Failed to extract {filepath}: {e}")
-            print(f"   ✗ Failed: {e}", flush=True)
+            print(f"{progress} ✓ Extracted ({outcome.result['total_chars']:,} chars)", flush=True)
+        else:
+            logger.error(f"Failed to extract {filepath}: {outcome.error}")
+            print(f"{progress} ✗ Failed: {outcome.error}", flush=True)
             failed += 1
             results[filepath] = {
                 "filepath": filepath,
-                "error": str(e),
+                "error": str(outcome.error),
                 "success": False,
             }
 
@@ -11,12 +11,14 @@ evidence (markdown + images) with confidence scoring.
 """
 
 import asyncio
-import base64
+import hashlib
 import json
 import logging
 import random
 import re
 import time
+import unicodedata
+from contextlib import aclosing, nullcontext
 from pathlib import Path
 from typing import Any, Callable
 
@@ -31,7 +33,11 @@ from pydantic import BaseModel, Field
 from rapidfuzz import fuzz
 
 from ..config.settings import settings
-from ..utils.cache import Cache
+from ..llm.batch import BatchBackend, ReadOnlyCache, RecordingClient, ReplayClient, get_batch_backend, run_batch_job
+from ..llm.client_pool import backend_options, get_client_pool
+from ..llm.image_prep import get_image_preparer
+from ..llm.response_store import ResponseCache
+from ..llm.throttle import acquire_slot
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +101,23 @@ class ExtractedField(BaseModel):
     raw_text: str | None = None  # Original text snippet
 
 
+# Extractor prompt-contract version, part of every extractor cache key with
+# the model settings and a hash of the normalized input. Bump it when an
+# extraction prompt (DATE_EXTRACTION_PROMPT etc.) or the parsing and
+# verification of its responses changes in a way that could change the
+# extracted fields.
+#
+# Version history:
+# - ``v1.0.0`` — content-hash keys (entries were keyed by document name).
+EXTRACTOR_PROMPT_VERSION = "v1.0.0"
+
+
+def _normalize_for_key(text: str) -> str:
+    """Text as hashed for a cache key: NFC, LF line endings, no trailing whitespace."""
+    text = unicodedata.normalize("NFC", text).replace("\r\n", "\n").replace("\r", "\n")
+    return "\n".join(line.rstrip() for line in text.split("\n")).strip()
+
+
 class BaseExtractor:
     """Base class for LLM-powered field extractors.
 
@@ -106,15 +129,31 @@ class BaseExtractor:
 
         Args:
             cache_namespace: Namespace for caching (e.g., "date_extraction")
-            client: Optional AsyncAnthropic client (will create new one if not provided)
+            client: Optional AsyncAnthropic client (the shared pooled client if not provided)
         """
-        self.client = client or AsyncAnthropic(api_key=settings.anthropic_api_key)
-        self.cache = Cache(cache_namespace)
+        self._client = client
+        self.cache = ResponseCache(cache_namespace)
+        self._preloaded: dict[str, Any] = {}
+
+    @property
+    def client(self) -> AsyncAnthropic:
+        """The injected client, else the pooled one for the running event loop.
+
+        The pooled client makes no SDK-level retries: :meth:`_call_api_with_retry`
+        is the only retry loop.
+        """
+        if self._client is not None:
+            return self._client
+        return get_client_pool().anthropic(settings.anthropic_api_key, max_retries=0)
+
+    @client.setter
+    def client(self, client: AsyncAnthropic | None) -> None:
+        self._client = client
 
     async def _call_api_with_retry(
         self,
         api_call: Callable,
-        max_retries: int = 3,
+        max_retries: int | None = None,
         initial_delay: float = 1.0,
         max_delay: float = 32.0,
         **kwargs,
@@ -134,7 +173,8 @@ class BaseExtractor:
 
         Args:
             api_call: Async callable that makes the API call
-            max_retries: Maximum number of retry attempts (default: 3)
+            max_retries: Maximum number of retry attempts
+                (default: settings.llm_anthropic_max_retries)
             initial_delay: Initial retry delay in seconds (default: 1.0)
             max_delay: Maximum retry delay in seconds (default: 32.0)
             **kwargs: Arguments to pass to api_call
@@ -145,13 +185,16 @@ class BaseExtractor:
         Raises:
             Exception: Re-raises the last exception after all retries exhausted
         """
+        if max_retries is None:
+            max_retries = backend_options("anthropic").max_retries
         delay = initial_delay
         last_exception = None
 
         for attempt in range(max_retries + 1):
             try:
                 # Call the API
-                return await api_call(**kwargs)
+                async with self._api_slot():
+                    return await api_call(**kwargs)
 
             except (RateLimitError, InternalServerError, APIConnectionError, APITimeoutError) as e:
                 last_exception = e
@@ -186,6 +229,70 @@ class BaseExtractor:
         if last_exception:
             raise last_exception
 
+    def cache_key(self, markdown_content: str, images: list[Path]) -> str:
+        """Cache key for one extraction.
+
+        Hashes the normalized text, the images' bytes and preparation
+        settings, ``EXTRACTOR_PROMPT_VERSION`` and the model settings. The
+        document name is left out, so an edited document misses and
+        identical content under another name hits.
+        """
+        preparer = get_image_preparer()
+        cache_input = {
+            "text_hash": hashlib.sha256(_normalize_for_key(markdown_content).encode()).hexdigest(),
+            "image_hashes": [preparer.digest(path) if path.exists() else f"missing:{path.name}" for path in images],
+            "prompt_version": EXTRACTOR_PROMPT_VERSION,
+            "model": settings.llm_model,
+            "temperature": settings.llm_temperature,
+            "max_tokens": settings.llm_max_tokens,
+        }
+        if images:
+            # The model saw the prepared payloads, not the source files.
+            cache_input["image_prep"] = preparer.params_key
+        return hashlib.sha256(json.dumps(cache_input, sort_keys=True).encode()).hexdigest()[:32]
+
+    def preload(self, inputs: list[tuple[str, list[Path]]]) -> int:
+        """Warm start: read the cached results for ``inputs`` in one bulk read.
+
+        Args:
+            inputs: (markdown, images) pairs about to be extracted
+
+        Returns:
+            Number of inputs with a cached result; :meth:`extract` serves
+            those from memory.
+        """
+        if not inputs:
+            return 0
+        try:
+            found = self.cache.get_many([self.cache_key(markdown, images) for markdown, images in inputs])
+        except Exception as e:
+            logger.warning(f"Extractor cache preload failed: {e}")
+            return 0
+        self._preloaded.update(found)
+        return len(found)
+
+    def _cached_fields(self, cache_key: str, document_name: str) -> list[ExtractedField] | None:
+        """Cached fields for ``cache_key``, with sources renamed to ``document_name``."""
+        cached = self._preloaded.get(cache_key)
+        if cached is None:
+            cached = self.cache.get(cache_key)
+        if not isinstance(cached, dict) or not cached.get("fields"):
+            return None
+        fields = [ExtractedField(**f) for f in cached["fields"]]
+        cached_name = cached.get("document_name")
+        if cached_name and cached_name != document_name:
+            fields = [f.model_copy(update={"source": f.source.replace(cached_name, document_name)}) for f in fields]
+        return fields
+
+    def _cache_fields(self, cache_key: str, document_name: str, fields: list[ExtractedField]) -> None:
+        self.cache.set(cache_key, {"document_name": document_name, "fields": [f.model_dump() for f in fields]})
+
+    def _api_slot(self):
+        """Shared throttle slot for one API attempt; batch stand-ins answer without one."""
+        if isinstance(self._client, (RecordingClient, ReplayClient)):
+            return nullcontext()
+        return acquire_slot("api")
+
     def _chunk_content(self, content: str) -> list[str]:
         """Split content into overlapping chunks if needed.
 
@@ -305,6 +412,10 @@ class BaseExtractor:
         if not images:
             return [[] for _ in range(num_chunks)]
 
+        # The same figure often appears under several paths (one per page it
+        # is printed on); send its content once.
+        images = get_image_preparer().dedupe(images)
+
         # Warn if many images (cost consideration)
         if len(images) > settings.llm_warn_image_threshold:
             logger.warning(
@@ -333,6 +444,22 @@ class BaseExtractor:
 
         return distributed
 
+    async def _image_blocks(self, images: list[Path]) -> list[dict[str, Any]]:
+        """Image content blocks for ``images``, prepared by ``llm.image_prep``.
+
+        Missing or unreadable images are skipped (and logged). Decoding and
+        re-encoding run in a worker thread; repeated images come from the
+        preparer's cache.
+        """
+        preparer = get_image_preparer()
+        blocks = []
+        for img_path in images:
+            if img_path.exists():
+                prepared = await asyncio.to_thread(preparer.prepare, img_path)
+                if prepared is not None:
+                    blocks.append(prepared.content_block())
+        return blocks
+
 
 # Date extraction prompt
 DATE_EXTRACTION_PROMPT = """You are a date extraction specialist for carbon credit project reviews.
@@ -482,6 +609,35 @@ class DateExtractor(BaseExtractor):
         """
         super().__init__(cache_namespace="date_extraction", client=client)
 
+    async def _stream_date_chunk(self, chunk: str, **params: Any) -> tuple[Any, list[dict[str, Any]]]:
+        """Stream one date-extraction call, verifying each date's citation as it arrives.
+
+        Returns:
+            The final message and its verified fields. The complete response
+            is validated as in the unstreamed path; should it differ from the
+            streamed items, it is verified afresh.
+        """
+        from ..extractors.verification import log_verification_summary, verify_date_extraction, verify_extracted_field
+        from ..llm.streaming import JSONArrayStream, stream_json_array
+
+        parser = JSONArrayStream()
+        streamed: list[tuple[Any, dict[str, Any] | None]] = []  # (item as parsed, verified copy)
+        async with self.client.messages.stream(**params) as stream:
+            async with aclosing(stream_json_array(stream.text_stream, parser)) as items:
+                async for item in items:
+                    streamed.append(
+                        (item, verify_extracted_field(dict(item), chunk) if isinstance(item, dict) else None)
+                    )
+            response = await stream.get_final_message()
+
+        extracted_data = validate_and_parse_extraction_response(extract_json_from_response(parser.text), "date")
+        if extracted_data == [item for item, _ in streamed]:
+            verified_data = [verified for _, verified in streamed]
+            log_verification_summary(verified_data)
+        else:
+            verified_data = verify_date_extraction(extracted_data, chunk)
+        return response, verified_data
+
     async def _process_date_chunk(
         self, chunk: str, chunk_images: list[Path], chunk_name: str, chunk_index: int
     ) -> list[ExtractedField]:
@@ -505,36 +661,28 @@ class DateExtractor(BaseExtractor):
         ]
 
         # Add images for this chunk
-        for img_path in chunk_images:
-            if img_path.exists():
-                try:
-                    img_data = base64.standard_b64encode(img_path.read_bytes()).decode("utf-8")
-                    content.append(
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": "image/jpeg",
-                                "data": img_data,
-                            },
-                        }
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to load image {img_path}: {e}")
+        content.extend(await self._image_blocks(chunk_images))
 
         # Call Anthropic API with retry logic and prompt caching
         # Mark system prompt for caching to save 90% on repeated extractions
+        params = {
+            "model": settings.llm_model,
+            "max_tokens": settings.llm_max_tokens,
+            "temperature": settings.llm_temperature,
+            "system": [{"type": "text", "text": DATE_EXTRACTION_PROMPT, "cache_control": {"type": "ephemeral"}}],
+            "messages": [{"role": "user", "content": content}],
+            "timeout": settings.api_call_timeout_seconds,
+        }
         try:
             start_time = time.time()
-            response = await self._call_api_with_retry(
-                self.client.messages.create,
-                model=settings.llm_model,
-                max_tokens=settings.llm_max_tokens,
-                temperature=settings.llm_temperature,
-                system=[{"type": "text", "text": DATE_EXTRACTION_PROMPT, "cache_control": {"type": "ephemeral"}}],
-                messages=[{"role": "user", "content": content}],
-                timeout=settings.api_call_timeout_seconds,
-            )
+            # Batch-mode stand-in clients only answer ``create``.
+            if settings.llm_stream_responses and hasattr(self.client.messages, "stream"):
+                response, verified_data = await self._call_api_with_retry(
+                    self._stream_date_chunk, chunk=chunk, **params
+                )
+            else:
+                response = await self._call_api_with_retry(self.client.messages.create, **params)
+                verified_data = None
             duration = time.time() - start_time
 
             # Track cost if tracker is enabled
@@ -547,17 +695,18 @@ class DateExtractor(BaseExtractor):
                 cached=False,
             )
 
-            # Parse response
-            response_text = response.content[0].text
+            if verified_data is None:
+                # Parse response
+                response_text = response.content[0].text
 
-            # Extract and validate JSON from response
-            json_str = extract_json_from_response(response_text)
-            extracted_data = validate_and_parse_extraction_response(json_str, "date")
+                # Extract and validate JSON from response
+                json_str = extract_json_from_response(response_text)
+                extracted_data = validate_and_parse_extraction_response(json_str, "date")
 
-            # Verify citations against source content (prevent hallucination)
-            from ..extractors.verification import verify_date_extraction
+                # Verify citations against source content (prevent hallucination)
+                from ..extractors.verification import verify_date_extraction
 
-            verified_data = verify_date_extraction(extracted_data, chunk)
+                verified_data = verify_date_extraction(extracted_data, chunk)
 
             # Convert to ExtractedField objects
             chunk_fields = [ExtractedField(**data) for data in verified_data]
@@ -585,8 +734,8 @@ class DateExtractor(BaseExtractor):
             List of extracted date fields
         """
         # Check cache
-        cache_key = f"{document_name}_dates"
-        if cached := self.cache.get(cache_key):
+        cache_key = self.cache_key(markdown_content, images)
+        if (cached := self._cached_fields(cache_key, document_name)) is not None:
             logger.debug(f"Cache hit for {document_name} dates")
             # Track cache hit (zero cost)
             _track_api_call(
@@ -597,7 +746,7 @@ class DateExtractor(BaseExtractor):
                 duration=0.0,
                 cached=True,
             )
-            return [ExtractedField(**f) for f in cached]
+            return cached
 
         # Split content into chunks if needed
         chunks = self._chunk_content(markdown_content)
@@ -634,7 +783,7 @@ class DateExtractor(BaseExtractor):
         fields = list(deduplicated.values())
 
         # Cache results
-        self.cache.set(cache_key, [f.model_dump() for f in fields])
+        self._cache_fields(cache_key, document_name, fields)
 
         logger.info(f"Extracted {len(fields)} unique dates from {document_name} ({len(all_fields)} total before dedup)")
         return fields
@@ -647,7 +796,7 @@ class LandTenureExtractor(BaseExtractor):
         """Initialize land tenure extractor.
 
         Args:
-            client: Optional AsyncAnthropic client (will create new one if not provided)
+            client: Optional AsyncAnthropic client (the shared pooled client if not provided)
         """
         super().__init__(cache_namespace="land_tenure_extraction", client=client)
 
@@ -663,8 +812,8 @@ class LandTenureExtractor(BaseExtractor):
             List of extracted land tenure fields
         """
         # Check cache
-        cache_key = f"{document_name}_tenure"
-        if cached := self.cache.get(cache_key):
+        cache_key = self.cache_key(markdown_content, images)
+        if (cached := self._cached_fields(cache_key, document_name)) is not None:
             logger.debug(f"Cache hit for {document_name} tenure")
             # Track cache hit (zero cost)
             _track_api_call(
@@ -675,7 +824,7 @@ class LandTenureExtractor(BaseExtractor):
                 duration=0.0,
                 cached=True,
             )
-            return [ExtractedField(**f) for f in cached]
+            return cached
 
         # Split content and distribute images
         chunks = self._chunk_content(markdown_content)
@@ -694,29 +843,7 @@ class LandTenureExtractor(BaseExtractor):
             ]
 
             # Add images for this chunk (especially important for land titles)
-            for img_path in chunk_images[i]:
-                if img_path.exists():
-                    try:
-                        img_data = base64.standard_b64encode(img_path.read_bytes()).decode("utf-8")
-                        # Detect media type
-                        media_type = "image/jpeg"
-                        if img_path.suffix.lower() in [".png"]:
-                            media_type = "image/png"
-                        elif img_path.suffix.lower() in [".webp"]:
-                            media_type = "image/webp"
-
-                        content.append(
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": media_type,
-                                    "data": img_data,
-                                },
-                            }
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to load image {img_path}: {e}")
+            content.extend(await self._image_blocks(chunk_images[i]))
 
             # Call Anthropic API with retry logic and prompt caching
             try:
@@ -813,7 +940,7 @@ class LandTenureExtractor(BaseExtractor):
         fields = list(deduplicated.values())
 
         # Cache results
-        self.cache.set(cache_key, [f.model_dump() for f in fields])
+        self._cache_fields(cache_key, document_name, fields)
 
         logger.info(
             f"Extracted {len(fields)} unique tenure fields from {document_name} ({len(all_fields)} total before dedup)"
@@ -828,7 +955,7 @@ class ProjectIDExtractor(BaseExtractor):
         """Initialize project ID extractor.
 
         Args:
-            client: Optional AsyncAnthropic client (will create new one if not provided)
+            client: Optional AsyncAnthropic client (the shared pooled client if not provided)
         """
         super().__init__(cache_namespace="project_id_extraction", client=client)
 
@@ -844,8 +971,8 @@ class ProjectIDExtractor(BaseExtractor):
             List of extracted project ID fields
         """
         # Check cache
-        cache_key = f"{document_name}_project_ids"
-        if cached := self.cache.get(cache_key):
+        cache_key = self.cache_key(markdown_content, images)
+        if (cached := self._cached_fields(cache_key, document_name)) is not None:
             logger.debug(f"Cache hit for {document_name} project IDs")
             # Track cache hit (zero cost)
             _track_api_call(
@@ -856,7 +983,7 @@ class ProjectIDExtractor(BaseExtractor):
                 duration=0.0,
                 cached=True,
             )
-            return [ExtractedField(**f) for f in cached]
+            return cached
 
         # Split content into chunks if needed
         chunks = self._chunk_content(markdown_content)
@@ -877,28 +1004,7 @@ class ProjectIDExtractor(BaseExtractor):
             ]
 
             # Add images for this chunk (headers/footers might contain IDs)
-            for img_path in chunk_images[i]:
-                if img_path.exists():
-                    try:
-                        img_data = base64.standard_b64encode(img_path.read_bytes()).decode("utf-8")
-                        media_type = "image/jpeg"
-                        if img_path.suffix.lower() in [".png"]:
-                            media_type = "image/png"
-                        elif img_path.suffix.lower() in [".webp"]:
-                            media_type = "image/webp"
-
-                        content.append(
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": media_type,
-                                    "data": img_data,
-                                },
-                            }
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to load image {img_path}: {e}")
+            content.extend(await self._image_blocks(chunk_images[i]))
 
             # Call Anthropic API with retry logic and prompt caching
             try:
@@ -965,7 +1071,7 @@ class ProjectIDExtractor(BaseExtractor):
         fields = list(deduplicated.values())
 
         # Cache results
-        self.cache.set(cache_key, [f.model_dump() for f in fields])
+        self._cache_fields(cache_key, document_name, fields)
 
         logger.info(
             f"Extracted {len(fields)} unique project IDs from {document_name} ({len(all_fields)} total before dedup)"
@@ -1177,15 +1283,93 @@ def group_fields_by_document(fields: list[ExtractedField]) -> list[dict]:
     return list(by_doc.values())
 
 
-async def extract_fields_with_llm(session_id: str, evidence_data: dict[str, Any]) -> dict[str, Any]:
+# Extractors fed by each checklist validation_type. Requirements of other
+# types (document_presence, manual) carry no values to extract.
+VALIDATION_TYPE_EXTRACTORS: dict[str, tuple[str, ...]] = {
+    "structured_field": (),
+    "date_alignment": ("dates",),
+    "cross_document": ("project_ids",),  # project IDs are compared across every document
+}
+# Extractor for each field config (evidence_tools.STRUCTURED_FIELD_CONFIGS)
+# a requirement's text can name.
+FIELD_CONFIG_EXTRACTORS = {
+    "land_tenure": "tenure",
+    "project_identity": "project_ids",
+    "project_start_date": "dates",
+    "crediting_period": "dates",
+}
+MAX_SNIPPETS_PER_REQUIREMENT = 5
+
+
+def _route_requirement(requirement: dict[str, Any]) -> list[str]:
+    """Names of the extractors a requirement's evidence goes to.
+
+    Those of its ``validation_type``, plus the extractor of the field config
+    its text names, matched by keyword the way the evidence prompt picks
+    its structured-field guidance.
+    """
+    from ..tools.evidence_tools import STRUCTURED_FIELD_CONFIGS
+
+    routes = VALIDATION_TYPE_EXTRACTORS.get(requirement.get("validation_type", "document_presence"))
+    if routes is None:
+        return []
+    routes = list(routes)
+    text = (requirement.get("requirement_text") or "").lower()
+    for config_name, config in STRUCTURED_FIELD_CONFIGS.items():
+        if any(kw in text for kw in config["keywords"]):
+            extractor = FIELD_CONFIG_EXTRACTORS.get(config_name)
+            if extractor and extractor not in routes:
+                routes.append(extractor)
+            break
+    return routes
+
+
+def _checklist_requirements(session_id: str) -> dict[str, dict[str, Any]]:
+    """The session methodology's checklist requirements by ID.
+
+    Falls back to the default methodology when the session has no
+    ``session.json`` (or the ID is not a session's).
+    """
+    from ..utils.checklist import load_checklist
+    from ..utils.state import StateManager
+
+    methodology = "soil-carbon-v1.2.2"
+    try:
+        state_manager = StateManager(session_id)
+        if state_manager.exists("session.json"):
+            session_data = state_manager.read_json("session.json")
+            methodology = session_data.get("project_metadata", {}).get("methodology", methodology)
+    except ValueError:
+        pass
+    try:
+        checklist = load_checklist(methodology)
+    except FileNotFoundError:
+        logger.warning(f"Checklist not found for {methodology}; routing evidence by its own metadata")
+        return {}
+    return {req["requirement_id"]: req for req in checklist.get("requirements", [])}
+
+
+async def extract_fields_with_llm(
+    session_id: str,
+    evidence_data: dict[str, Any],
+    batch: bool = False,
+    backend: BatchBackend | None = None,
+) -> dict[str, Any]:
     """
     Extract structured fields from evidence using LLM.
 
     Main entry point called by cross_validate().
 
+    With ``batch``, the extractors' API calls go through one batch job
+    (``llm.batch``) instead: a first pass runs them against a recording
+    client to collect every uncached request, and once the job ends a second
+    pass replays its responses (calls the job did not answer go live).
+
     Args:
         session_id: Session identifier
         evidence_data: Evidence JSON with snippets
+        batch: Submit the calls as a batch job (for offline runs)
+        backend: Batch backend (default: ``llm.batch.get_batch_backend()``)
 
     Returns:
         Dictionary with extracted fields:
@@ -1198,56 +1382,73 @@ async def extract_fields_with_llm(session_id: str, evidence_data: dict[str, Any]
     if not settings.anthropic_api_key:
         raise ValueError("ANTHROPIC_API_KEY not set - required for LLM extraction")
 
-    client = AsyncAnthropic(api_key=settings.anthropic_api_key)
-    date_extractor = DateExtractor(client)
-    tenure_extractor = LandTenureExtractor(client)
-    project_id_extractor = ProjectIDExtractor(client)
-
-    all_dates = []
-    all_tenure = []
-    all_project_ids = []
+    requirements = _checklist_requirements(session_id)
+    if not batch:
+        return await _extract_fields(evidence_data, requirements)
+
+    from ..utils.state import StateManager
+
+    recorder = RecordingClient()
+    await _extract_fields(evidence_data, requirements, recorder, read_only_cache=True)
+    results = await run_batch_job(
+        list(recorder.requests.values()),
+        backend or get_batch_backend(),
+        StateManager(session_id).session_dir / "fields_batch_job.json",
+    )
+    fallback = get_client_pool().anthropic(settings.anthropic_api_key, max_retries=0)
+    return await _extract_fields(evidence_data, requirements, ReplayClient(results, fallback=fallback))
+
+
+async def _extract_fields(
+    evidence_data: dict[str, Any],
+    requirements: dict[str, dict[str, Any]],
+    client: Any = None,
+    read_only_cache: bool = False,
+) -> dict[str, Any]:
+    """Run the extractors concurrently over the evidence snippets of their requirements.
+
+    Each requirement's snippets go to the extractors ``_route_requirement``
+    picks from its checklist metadata (``requirements``, by ID). A snippet
+    already sent to an extractor for an earlier requirement is not sent to
+    it again. Every extractor call is a task of its own, paced by the shared
+    throttle; results are merged in requirement order.
+    """
+    extractors: dict[str, BaseExtractor] = {
+        "dates": DateExtractor(client),
+        "tenure": LandTenureExtractor(client),
+        "project_ids": ProjectIDExtractor(client),
+    }
+    if read_only_cache:
+        for extractor in extractors.values():
+            extractor.cache = ReadOnlyCache(extractor.cache)
 
     # Extract from evidence snippets (token-efficient)
+    sent: dict[str, set[tuple[str, str]]] = {name: set() for name in extractors}
+    jobs: list[tuple[str, str, str]] = []  # (extractor, snippet markdown, requirement ID)
     for req in evidence_data.get("evidence", []):
         req_id = req["requirement_id"]
-
-        # Process date-related requirements
-        if req_id in ["REQ-007", "REQ-018", "REQ-019"]:
-            # Aggregate snippets for this requirement
+        for name in _route_requirement({**req, **requirements.get(req_id, {})}):
             snippet_texts = []
-            for snippet in req.get("evidence_snippets", [])[:5]:  # Limit to 5 snippets
-                snippet_texts.append(f"[{snippet['document_name']}]\n{snippet['text']}")
-
+            for snippet in req.get("evidence_snippets", [])[:MAX_SNIPPETS_PER_REQUIREMENT]:
+                key = (snippet["document_name"], " ".join(snippet["text"].split()))
+                if key not in sent[name]:
+                    sent[name].add(key)
+                    snippet_texts.append(f"[{snippet['document_name']}]\n{snippet['text']}")
             if snippet_texts:
-                markdown = "\n\n---\n\n".join(snippet_texts)
-                dates = await date_extractor.extract(markdown, [], req_id)
-                all_dates.extend(dates)
-
-        # Process land tenure requirements
-        elif req_id in ["REQ-003", "REQ-004"]:  # Land tenure/ownership requirements
-            snippet_texts = []
-            for snippet in req.get("evidence_snippets", [])[:5]:
-                snippet_texts.append(f"[{snippet['document_name']}]\n{snippet['text']}")
-
-            if snippet_texts:
-                markdown = "\n\n---\n\n".join(snippet_texts)
-                tenure_fields = await tenure_extractor.extract(markdown, [], req_id)
-                all_tenure.extend(tenure_fields)
-
-        # Process project ID requirements (extract from all requirements to find IDs)
-        # Project IDs can appear anywhere in the documents
-        if req_id in ["REQ-001", "REQ-002"]:  # Project identification requirements
-            snippet_texts = []
-            for snippet in req.get("evidence_snippets", [])[:5]:
-                snippet_texts.append(f"[{snippet['document_name']}]\n{snippet['text']}")
-
-            if snippet_texts:
-                markdown = "\n\n---\n\n".join(snippet_texts)
-                project_ids = await project_id_extractor.extract(markdown, [], req_id)
-                all_project_ids.extend(project_ids)
-
-    return {
-        "dates": all_dates,
-        "tenure": all_tenure,
-        "project_ids": all_project_ids,
-    }
+                jobs.append((name, "\n\n---\n\n".join(snippet_texts), req_id))
+
+    # Warm start: one bulk cache read per extractor for all of its inputs.
+    for name, extractor in extractors.items():
+        extractor.preload([(markdown, []) for job_name, markdown, _ in jobs if job_name == name])
+
+    # Every job runs to completion (and is cached) before a failure is raised.
+    outcomes = await asyncio.gather(
+        *(extractors[name].extract(markdown, [], req_id) for name, markdown, req_id in jobs),
+        return_exceptions=True,
+    )
+    results: dict[str, list[ExtractedField]] = {name: [] for name in extractors}
+    for (name, _, _), outcome in zip(jobs, outcomes):
+        if isinstance(outcome, BaseException):
+            raise outcome
+        results[name].extend(outcome)
+    return results
@@ -21,7 +21,7 @@ from pathlib import Path
 from typing import Any
 
 from ..models.errors import DocumentExtractionError
-from ..utils.cache import Cache
+from ..utils.artifacts import artifact_store
 
 logger = logging.getLogger(__name__)
 
@@ -31,9 +31,6 @@ USE_MARKER = os.environ.get("USE_MARKER", "").lower() == "true"
 # Global model cache (loaded once, reused across conversions)
 _marker_models = None
 
-# Markdown cache (separate from PDF cache)
-pdf_markdown_cache = Cache(namespace="marker_pdf")
-
 
 def get_marker_models():
     """Lazy-load marker models (loads once on first use).
@@ -113,13 +110,6 @@ async def convert_pdf_to_markdown(
 
         This project applies the Regen Network Soil Carbon v1.2.2...
     """
-    # Check cache
-    cache_key = f"marker:{filepath}:{page_range}"
-    cached = pdf_markdown_cache.get(cache_key)
-    if cached is not None:
-        logger.info(f"📦 Using cached markdown for {Path(filepath).name}")
-        return cached
-
     try:
         file_path = Path(filepath)
         if not file_path.exists():
@@ -128,15 +118,20 @@ async def convert_pdf_to_markdown(
                 details={"filepath": filepath},
             )
 
-        # Use fast extraction by default (unless USE_MARKER=true)
+        # Use fast extraction by default (unless USE_MARKER=true).
+        # The fast extractor stores its own content-addressed artifact.
         if not USE_MARKER:
             logger.info(f"⚡ Fast extraction for {file_path.name} (PyMuPDF)")
             from .fast_extractor import fast_extract_pdf
 
-            result = await fast_extract_pdf(filepath)
-            # Cache the result
-            pdf_markdown_cache.set(cache_key, result)
-            return result
+            return await fast_extract_pdf(filepath)
+
+        # Check cache (keyed by file content, so copies in other sessions hit too)
+        variant = f"pages={page_range[0]}-{page_range[1]}" if page_range else "pages=all"
+        cached = artifact_store.get("marker", file_path, variant=variant)
+        if cached is not None:
+            logger.info(f"📦 Using cached markdown for {file_path.name}")
+            return cached
 
         logger.info(f"🔄 Converting {file_path.name} to markdown using marker...")
 
@@ -187,7 +182,7 @@ async def convert_pdf_to_markdown(
         }
 
         # Cache the result
-        pdf_markdown_cache.set(cache_key, result)
+        artifact_store.put("marker", file_path, result, variant=variant)
 
         char_count = len(full_text)
         logger.info(f"✅ Conversion complete: {file_path.name} ({page_count} pages, {char_count:,} chars)")
@@ -413,7 +408,8 @@ async def batch_convert_pdfs_parallel(
 
     Args:
         filepaths: List of PDF file paths to convert
-        max_workers: Number of concurrent workers (ignored for fast extraction)
+        max_workers: Number of concurrent workers for marker (fast extraction
+            sizes its own process pool)
         unload_after: Whether to unload models after conversion (ignored for fast)
 
     Returns:
@@ -17,10 +17,10 @@ must be installed at runtime. When Tesseract is missing the helpers degrade
 gracefully: the fast extractor logs a one-time warning and returns its
 original output untouched.
 
-Results are cached per ``(filepath, mtime, page_num, mode, language, dpi)``
+Results are cached per ``(file content hash, page_num, mode, language, dpi)``
 under ``REGISTRY_REVIEW_CACHE_DIR/ocr/`` so a monitoring-report PDF that
 takes 30s to OCR the first time returns in milliseconds on subsequent
-review sessions.
+review sessions — including sessions that uploaded their own copy.
 """
 
 from __future__ import annotations
@@ -97,18 +97,22 @@ def _ocr_cache_path(
 ) -> Path:
     """Deterministic cache path for a single OCRed page.
 
-    Keying on ``mtime`` so a re-exported PDF invalidates its cache entries
-    without us having to maintain a side index. Keying on mode/language/dpi
-    because the same page OCR'd at 300dpi English vs 150dpi English+Czech
-    produces different text and we want both to coexist for benchmark runs.
+    Keying on the file's content hash (shared with ``utils.artifacts``) so a
+    re-exported PDF invalidates its cache entries without us having to
+    maintain a side index, while the same bytes at another path (another
+    session's upload) reuse them. Keying on mode/language/dpi because the
+    same page OCR'd at 300dpi English vs 150dpi English+Czech produces
+    different text and we want both to coexist for benchmark runs.
     """
+    from ..utils.artifacts import EXTRACTOR_VERSIONS, file_sha256
+
     try:
-        stat = Path(filepath).stat()
-        mtime = int(stat.st_mtime_ns)
+        source = f"sha256:{file_sha256(filepath)}"
     except OSError:
-        mtime = 0
+        # Unreadable now; ocr_page will fail to open it too. Any stable key will do.
+        source = filepath
 
-    key = f"{filepath}::{mtime}::p{page_num}::{mode}::{language}::dpi{dpi}"
+    key = f"{source}::v{EXTRACTOR_VERSIONS['ocr']}::p{page_num}::{mode}::{language}::dpi{dpi}"
     digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
     return cache_root / "ocr" / f"{digest}.txt"
 
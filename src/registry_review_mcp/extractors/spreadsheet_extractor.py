@@ -8,6 +8,7 @@ Output format uses sheet markers that mirror the PDF page marker convention
 (``--- Sheet "name" (N of M) ---``) so citation extraction works uniformly.
 """
 
+import asyncio
 import csv
 import io
 import logging
@@ -17,6 +18,7 @@ from pathlib import Path
 from typing import Any
 
 from ..models.errors import DocumentExtractionError
+from ..utils.artifacts import artifact_store
 
 logger = logging.getLogger(__name__)
 
@@ -238,6 +240,16 @@ async def extract_spreadsheet(filepath: str) -> dict[str, Any]:
     Raises:
         DocumentExtractionError: If the file cannot be read or parsed
     """
+    # openpyxl parsing is synchronous and can take seconds on large
+    # workbooks; keep it off the event loop.
+    return await asyncio.to_thread(extract_spreadsheet_sync, filepath)
+
+
+def extract_spreadsheet_sync(filepath: str) -> dict[str, Any]:
+    """Blocking core of :func:`extract_spreadsheet`.
+
+    Module-level so the extraction pool can run it in a worker process.
+    """
     file_path = Path(filepath)
     if not file_path.exists():
         raise DocumentExtractionError(
@@ -245,6 +257,10 @@ async def extract_spreadsheet(filepath: str) -> dict[str, Any]:
             details={"filepath": filepath},
         )
 
+    cached = artifact_store.get("spreadsheet", file_path)
+    if cached is not None:
+        return cached
+
     suffix = file_path.suffix.lower()
 
     if suffix in (".xlsx", ".xls"):
@@ -289,4 +305,6 @@ async def extract_spreadsheet(filepath: str) -> dict[str, Any]:
 
     logger.info(f"Extracted {file_path.name}: {sheet_count} sheet(s), {row_count:,} rows, {len(markdown):,} chars")
 
+    artifact_store.put("spreadsheet", file_path, result)
+
     return result
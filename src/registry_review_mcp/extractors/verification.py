@@ -162,7 +162,12 @@ def verify_date_extraction(
         verified_field = verify_extracted_field(field, source_content)
         verified_fields.append(verified_field)
 
-    # Log summary
+    log_verification_summary(verified_fields)
+    return verified_fields
+
+
+def log_verification_summary(verified_fields: list[dict[str, Any]]) -> None:
+    """Log how many of a response's fields passed citation verification."""
     total = len(verified_fields)
     verified_count = sum(1 for f in verified_fields if f.get("verification_status") == "verified")
     failed_count = total - verified_count
@@ -171,5 +176,3 @@ def verify_date_extraction(
         logger.warning(f"Citation verification: {verified_count}/{total} verified, {failed_count} failed")
     else:
         logger.info(f"Citation verification: all {total} fields verified")
-
-    return verified_fields
@@ -7,12 +7,68 @@ extractor path passes through before the prompt reaches ``call_llm``:
   budget with a boundary-aware, footer-annotated trim.
 - :mod:`throttle` (Phase E5): limit aggregate concurrency + interval
   between LLM calls to keep the TELUS Cloudflare gateway happy.
+- :mod:`chunk_index`: BM25 index over a document's page/section chunks,
+  so evidence prompts carry the relevant passages instead of a
+  truncated prefix.
+- :mod:`single_flight`: identical requests already in flight share one
+  response instead of each paying for a call.
+- :mod:`token_budget`: input/output tokens-per-minute buckets in front
+  of the throttle, with priority classes so interactive calls overtake
+  bulk extraction.
+- :mod:`prompt_layout`: prompts assembled stable-prefix first (document
+  before requirement) with provider cache breakpoints on the shared prefix.
+- :mod:`response_store`: sharded, compressed, size-bounded store for
+  cached evidence and extractor responses, with pack export/import.
+- :mod:`client_pool`: one long-lived, keep-alive SDK client per backend,
+  with per-backend timeouts/retries and pool-utilization metrics.
+- :mod:`cli_pool`: warm, long-lived ``claude`` CLI workers driven over
+  stream-json, recycled after N prompts or on error.
+- :mod:`streaming`: incremental parsing of streamed JSON-array responses,
+  with time-to-first-token / first-item metrics.
+- :mod:`batch`: offline runs submit their prompts as one provider batch
+  job (or a local file-based stand-in) and hydrate the response cache.
 
 Extractor-layer caps (``spreadsheet_extractor.MAX_CHARS_PER_SHEET`` etc.)
 remain as defensive defaults for offline debugging. The shared gates in
 this package are the primary discipline.
 """
 
+from .batch import BatchRequest, BatchResult, LocalBatchBackend, get_batch_backend, run_batch_job
+from .chunk_index import ChunkIndex, get_chunk_index
+from .cli_pool import CLIWorkerPool, get_cli_pool
+from .client_pool import ClientPool, get_client_pool
 from .prompt_budget import DEFAULT_BUDGET, PromptBudget, default_budget
+from .prompt_layout import PromptLayout, Segment
+from .response_store import ResponseCache, ResponseStore, get_response_store
+from .single_flight import SingleFlight, get_single_flight
+from .streaming import JSONArrayStream, get_stream_metrics
+from .token_budget import TokenScheduler, get_token_scheduler, llm_priority
 
-__all__ = ["DEFAULT_BUDGET", "PromptBudget", "default_budget"]
+__all__ = [
+    "DEFAULT_BUDGET",
+    "BatchRequest",
+    "BatchResult",
+    "CLIWorkerPool",
+    "ChunkIndex",
+    "ClientPool",
+    "JSONArrayStream",
+    "LocalBatchBackend",
+    "PromptBudget",
+    "PromptLayout",
+    "ResponseCache",
+    "ResponseStore",
+    "Segment",
+    "SingleFlight",
+    "TokenScheduler",
+    "default_budget",
+    "get_batch_backend",
+    "get_chunk_index",
+    "get_cli_pool",
+    "get_client_pool",
+    "get_response_store",
+    "get_single_flight",
+    "get_stream_metrics",
+    "get_token_scheduler",
+    "llm_priority",
+    "run_batch_job",
+]
@@ -0,0 +1,411 @@
+"""Offline bulk extraction through provider batch APIs.
+
+Regression and backfill runs (the ``tests/evaluation`` fixtures, re-reviews
+after a ``PROMPT_VERSION`` bump) do not need interactive latency, yet they
+paid full price and queued behind live reviewers in the throttle. In batch
+mode their prompts are serialized into one batch job instead; the job is
+polled until it ends and its results hydrate the LLM response cache. The
+normal pipeline then runs against a warm cache and makes no live calls
+for anything the batch answered.
+
+Backends (``settings.llm_batch_backend``):
+
+- ``anthropic``: the Message Batches API (half the per-token price,
+  results within 24 hours).
+- ``local``: a file-based stand-in. A job is a directory under
+  ``<llm_cache_dir>/batches/`` holding ``requests.jsonl``; the first poll
+  "runs" it by answering every request with a responder (by default
+  ``call_llm``) and writes ``results.jsonl``. The whole flow works offline
+  with a test responder.
+
+Requests are Anthropic Messages ``create`` parameters. Their ``custom_id``
+is a hash of those parameters (:func:`request_id`), so a caller can always
+map results back without keeping its own table. :func:`run_batch_job`
+records the job it submitted next to the caller's state, so a run that is
+interrupted while waiting resumes polling the same job instead of paying
+for a second one.
+
+Callers:
+
+- ``evidence_tools.extract_all_evidence_batch``: one request per
+  uncached (requirement, document) pair, built exactly as the live
+  per-pair path builds it.
+- ``llm_extractors.extract_fields_with_llm(..., batch=True)``: the
+  extractors run once against a :class:`RecordingClient` to collect their
+  requests, then again against a :class:`ReplayClient` serving the
+  results.
+
+Run a session's evidence extraction in batch mode from the shell with::
+
+    python -m registry_review_mcp.llm.batch evidence <session_id> [--backend local]
+
+(also installed as ``registry-review-llm-batch``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import uuid
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Protocol
+
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+BATCH_DIRNAME = "batches"
+
+
+def request_id(params: dict[str, Any]) -> str:
+    """Deterministic ``custom_id`` for a request (fits the API's 64-char limit)."""
+    encoded = json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+    return "req-" + hashlib.sha256(encoded).hexdigest()[:48]
+
+
+@dataclass
+class BatchRequest:
+    """One Messages ``create`` call to run in a batch."""
+
+    custom_id: str
+    params: dict[str, Any]
+
+    @classmethod
+    def from_params(cls, params: dict[str, Any]) -> BatchRequest:
+        return cls(custom_id=request_id(params), params=params)
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one request: an Anthropic ``Message`` as a dict, or an error."""
+
+    custom_id: str
+    message: dict[str, Any] | None = None
+    error: str | None = None
+
+    @property
+    def text(self) -> str:
+        """Concatenated text blocks of the response ("" on error)."""
+        if not self.message:
+            return ""
+        return _text_of(self.message.get("content", []))
+
+    @property
+    def usage(self) -> dict[str, Any]:
+        return (self.message or {}).get("usage") or {}
+
+
+class BatchBackend(Protocol):
+    name: str
+
+    async def submit(self, requests: list[BatchRequest]) -> str: ...
+
+    async def status(self, job_id: str) -> str:
+        """``"in_progress"`` or ``"ended"``."""
+        ...
+
+    async def results(self, job_id: str) -> dict[str, BatchResult]: ...
+
+
+class AnthropicBatchBackend:
+    """Anthropic Message Batches API."""
+
+    name = "anthropic"
+
+    def __init__(self, client: Any = None):
+        if client is None:
+            from ..utils.llm_client import get_anthropic_client
+
+            client = get_anthropic_client()
+        self.client = client
+
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        batch = await self.client.messages.batches.create(
+            requests=[{"custom_id": r.custom_id, "params": r.params} for r in requests]
+        )
+        return batch.id
+
+    async def status(self, job_id: str) -> str:
+        batch = await self.client.messages.batches.retrieve(job_id)
+        return "ended" if batch.processing_status == "ended" else "in_progress"
+
+    async def results(self, job_id: str) -> dict[str, BatchResult]:
+        results: dict[str, BatchResult] = {}
+        async for entry in await self.client.messages.batches.results(job_id):
+            if entry.result.type == "succeeded":
+                results[entry.custom_id] = BatchResult(entry.custom_id, message=entry.result.message.model_dump())
+            else:
+                error = getattr(entry.result, "error", None)
+                results[entry.custom_id] = BatchResult(entry.custom_id, error=f"{entry.result.type}: {error}")
+        return results
+
+
+Responder = Callable[[dict[str, Any]], Awaitable[str]]
+
+
+def _text_of(content: str | list[dict[str, Any]]) -> str:
+    if isinstance(content, str):
+        return content
+    return "".join(block.get("text", "") for block in content if block.get("type") == "text")
+
+
+async def respond_via_call_llm(params: dict[str, Any]) -> str:
+    """Default local responder: send the request's text through ``call_llm``.
+
+    Images are dropped; ``call_llm`` is text-only.
+    """
+    from ..utils.llm_client import call_llm
+
+    return await call_llm(
+        prompt="\n\n".join(_text_of(m["content"]) for m in params.get("messages", []) if m.get("role") == "user"),
+        system=_text_of(params["system"]) if params.get("system") else None,
+        model=params.get("model"),
+        max_tokens=params.get("max_tokens", 4000),
+    )
+
+
+class LocalBatchBackend:
+    """File-based batch stand-in; jobs live under ``root``."""
+
+    name = "local"
+
+    def __init__(self, root: Path | None = None, responder: Responder | None = None, concurrency: int = 4):
+        self.root = root or settings.llm_cache_dir / BATCH_DIRNAME
+        self.responder = responder or respond_via_call_llm
+        self.concurrency = concurrency
+
+    def _job_dir(self, job_id: str) -> Path:
+        return self.root / job_id
+
+    async def submit(self, requests: list[BatchRequest]) -> str:
+        job_id = f"localbatch_{uuid.uuid4().hex[:16]}"
+        job_dir = self._job_dir(job_id)
+        job_dir.mkdir(parents=True)
+        with open(job_dir / "requests.jsonl", "w", encoding="utf-8") as f:
+            for request in requests:
+                f.write(json.dumps({"custom_id": request.custom_id, "params": request.params}) + "\n")
+        _write_json(job_dir / "status.json", {"status": "in_progress", "requests": len(requests)})
+        return job_id
+
+    async def status(self, job_id: str) -> str:
+        job_dir = self._job_dir(job_id)
+        status = json.loads((job_dir / "status.json").read_text(encoding="utf-8"))["status"]
+        if status != "ended":
+            await self._process(job_dir)
+        return "ended"
+
+    async def _process(self, job_dir: Path) -> None:
+        with open(job_dir / "requests.jsonl", encoding="utf-8") as f:
+            requests = [json.loads(line) for line in f]
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def answer(request: dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                custom_id = request["custom_id"]
+                try:
+                    text = await self.responder(request["params"])
+                except Exception as e:
+                    return {"custom_id": custom_id, "error": f"errored: {e}"}
+                return {"custom_id": custom_id, "message": _local_message(custom_id, request["params"], text)}
+
+        answers = await asyncio.gather(*(answer(r) for r in requests))
+        tmp_path = job_dir / "results.jsonl.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for result in answers:
+                f.write(json.dumps(result) + "\n")
+        os.replace(tmp_path, job_dir / "results.jsonl")
+        _write_json(job_dir / "status.json", {"status": "ended", "requests": len(requests)})
+
+    async def results(self, job_id: str) -> dict[str, BatchResult]:
+        results: dict[str, BatchResult] = {}
+        with open(self._job_dir(job_id) / "results.jsonl", encoding="utf-8") as f:
+            for line in f:
+                item = json.loads(line)
+                results[item["custom_id"]] = BatchResult(item["custom_id"], item.get("message"), item.get("error"))
+        return results
+
+
+def _local_message(custom_id: str, params: dict[str, Any], text: str) -> dict[str, Any]:
+    """An Anthropic ``Message``-shaped dict, so replayed responses parse like real ones."""
+    return {
+        "id": f"msg_{custom_id}",
+        "type": "message",
+        "role": "assistant",
+        "model": params.get("model", ""),
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {"input_tokens": 0, "output_tokens": 0},
+    }
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(data), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def get_batch_backend(name: str | None = None) -> BatchBackend:
+    """Backend by name (default: settings.llm_batch_backend).
+
+    "auto" picks the Anthropic API when Anthropic would serve live calls
+    (so batch answers land under the same cache keys), else "local".
+    """
+    name = name or settings.llm_batch_backend
+    if name == "auto":
+        anthropic_serves = settings.anthropic_api_key and (
+            settings.get_active_executor_model() == settings.get_active_llm_model()
+        )
+        name = "anthropic" if anthropic_serves else "local"
+    if name == "anthropic":
+        return AnthropicBatchBackend()
+    if name == "local":
+        return LocalBatchBackend()
+    raise ValueError(f"Unknown batch backend: {name!r}")
+
+
+async def run_batch_job(
+    requests: Sequence[BatchRequest],
+    backend: BatchBackend,
+    job_path: Path,
+    poll_interval: float | None = None,
+) -> dict[str, BatchResult]:
+    """Submit ``requests`` as one job, wait for it to end and return its results.
+
+    ``job_path`` records the submitted job. If it already names a job on
+    this backend for exactly these requests (an earlier run was
+    interrupted while waiting), that job is polled instead of submitting a
+    new one. The record is removed once results are in.
+    """
+    unique = list({r.custom_id: r for r in requests}.values())
+    if not unique:
+        return {}
+    ids = sorted(r.custom_id for r in unique)
+    poll_interval = settings.llm_batch_poll_interval if poll_interval is None else poll_interval
+
+    job_id = None
+    if job_path.exists():
+        try:
+            record = json.loads(job_path.read_text(encoding="utf-8"))
+            if record.get("backend") == backend.name and record.get("request_ids") == ids:
+                job_id = record["job_id"]
+                logger.info(f"Resuming batch job {job_id}")
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable batch job record {job_path}: {e}")
+
+    if job_id is None:
+        job_id = await backend.submit(unique)
+        logger.info(f"Submitted batch job {job_id} ({len(unique)} requests, {backend.name})")
+        _write_json(
+            job_path,
+            {
+                "job_id": job_id,
+                "backend": backend.name,
+                "request_ids": ids,
+                "submitted_at": datetime.now(timezone.utc).isoformat(),
+            },
+        )
+
+    while await backend.status(job_id) != "ended":
+        await asyncio.sleep(poll_interval)
+
+    results = await backend.results(job_id)
+    job_path.unlink(missing_ok=True)
+    return results
+
+
+# -- record / replay for SDK-level callers (the extractors) --------------------
+
+
+class ReadOnlyCache:
+    """Cache wrapper that reads through and drops writes (for the recording pass)."""
+
+    def __init__(self, cache: Any):
+        self._cache = cache
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._cache.get(key, default)
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        return self._cache.get_many(keys)
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        pass
+
+
+class _Messages:
+    def __init__(self, create: Callable[..., Awaitable[Any]]):
+        self.create = create
+
+
+def _batch_params(params: dict[str, Any]) -> dict[str, Any]:
+    # ``timeout`` is a client option, not part of the request body
+    return {k: v for k, v in params.items() if k != "timeout"}
+
+
+class RecordingClient:
+    """Stands in for ``AsyncAnthropic``: records each request and answers ``[]``."""
+
+    def __init__(self):
+        self.requests: dict[str, BatchRequest] = {}
+        self.messages = _Messages(self._create)
+
+    async def _create(self, **params: Any) -> Any:
+        from anthropic.types import Message
+
+        request = BatchRequest.from_params(_batch_params(params))
+        self.requests[request.custom_id] = request
+        return Message.model_validate(_local_message(request.custom_id, request.params, "[]"))
+
+
+class ReplayClient:
+    """Stands in for ``AsyncAnthropic``: serves batch results, else calls ``fallback``."""
+
+    def __init__(self, results: dict[str, BatchResult], fallback: Any = None):
+        self.results = results
+        self.fallback = fallback
+        self.messages = _Messages(self._create)
+
+    async def _create(self, **params: Any) -> Any:
+        from anthropic.types import Message
+
+        result = self.results.get(request_id(_batch_params(params)))
+        if result is not None and result.message is not None:
+            return Message.model_validate(result.message)
+        if self.fallback is None:
+            raise LookupError(f"No batch result for request ({result.error if result else 'not submitted'})")
+        return await self.fallback.messages.create(**params)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Command-line entry point: run a session's evidence extraction in batch mode."""
+    parser = argparse.ArgumentParser(
+        prog="registry-review-llm-batch", description="Offline bulk extraction via batch APIs."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    evidence = commands.add_parser("evidence", help="Extract a session's evidence through one batch job")
+    evidence.add_argument("session_id")
+    evidence.add_argument("--backend", choices=["auto", "anthropic", "local"], default=None)
+    evidence.add_argument("--poll-interval", type=float, default=None, help="Seconds between status polls")
+    args = parser.parse_args(argv)
+
+    from ..tools.evidence_tools import extract_all_evidence_batch
+
+    result = asyncio.run(
+        extract_all_evidence_batch(
+            args.session_id, backend=get_batch_backend(args.backend), poll_interval=args.poll_interval
+        )
+    )
+    print(json.dumps(result["batch"], indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
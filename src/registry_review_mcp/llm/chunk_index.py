@@ -0,0 +1,248 @@
+"""Per-document BM25 index for retrieval-narrowed evidence prompts.
+
+Phase E's prompt budget keeps a document under the gateway limit by cutting
+its tail (``evidence_tools._truncate_markdown_by_chars``). On large
+submissions that tail is often where the evidence lives (CSSCP's Project
+Plan keeps 14% of its 554K chars), and every requirement still pays for the
+full 80K prefix.
+
+This module splits a document's markdown into page/section chunks and ranks
+them against a requirement with Okapi BM25, so the evidence prompt can carry
+only the passages relevant to that requirement, drawn from anywhere in the
+document:
+
+- :func:`chunk_markdown`: page boundaries come from the fast extractor's
+  ``--- Page N ---`` markers, section boundaries from
+  :func:`marker_extractor.extract_section_hierarchy`. Oversized chunks are
+  split on paragraph, then line boundaries.
+- :class:`ChunkIndex`: the BM25 index. :meth:`ChunkIndex.top_chunks` picks
+  the best chunks that fit a char budget; :meth:`ChunkIndex.render` lays
+  them out in document order with their page markers restored, so page
+  citations keep working.
+- :func:`get_chunk_index`: indexes are built once per document version and
+  kept in a small in-process LRU keyed by content hash, so every
+  requirement mapped to a document reuses the same index.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import re
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+
+from ..extractors.fast_extractor import PAGE_MARKER_PATTERN
+from ..extractors.marker_extractor import extract_section_hierarchy
+
+# Upper bound on one chunk. Small enough that top-k selection is precise,
+# large enough that a chunk keeps a paragraph's context.
+MAX_CHUNK_CHARS = 2_000
+
+# Indexes kept in memory (one per document version).
+MAX_CACHED_INDEXES = 32
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_PAGE_LINE_PATTERN = re.compile(PAGE_MARKER_PATTERN.pattern, re.MULTILINE)
+
+# Function words only; domain words ("project", "carbon") are left to IDF.
+_STOPWORDS = frozenset(
+    "a an and are as at be been by for from has have in is it its of on or that the this to was "
+    "were which with will must shall should any all each per such than these those their there".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase alphanumeric terms, minus stopwords and single characters."""
+    return [t for t in _TOKEN_PATTERN.findall(text.lower()) if len(t) > 1 and t not in _STOPWORDS]
+
+
+@dataclass
+class Chunk:
+    """One retrievable passage of a document."""
+
+    text: str
+    page: int | None  # None before the first page marker
+    section: str | None  # nearest preceding markdown header
+
+
+def _pack(units: list[str], separator: str, max_chars: int) -> list[str]:
+    """Greedily join ``units`` with ``separator`` into pieces of at most ``max_chars``."""
+    pieces: list[str] = []
+    current = ""
+    for unit in units:
+        candidate = f"{current}{separator}{unit}" if current else unit
+        if len(candidate) <= max_chars:
+            current = candidate
+            continue
+        if current:
+            pieces.append(current)
+        current = unit
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def _split_oversized(text: str, max_chars: int) -> list[str]:
+    """Split ``text`` into pieces of at most ``max_chars``, preferring paragraph then line breaks."""
+    if len(text) <= max_chars:
+        return [text]
+
+    pieces: list[str] = []
+    for piece in _pack(text.split("\n\n"), "\n\n", max_chars):
+        if len(piece) <= max_chars:
+            pieces.append(piece)
+            continue
+        # A paragraph over the cap (e.g. a long table): fall back to lines,
+        # then to a hard cut for a single enormous line.
+        for line_piece in _pack(piece.split("\n"), "\n", max_chars):
+            pieces.extend(line_piece[i : i + max_chars] for i in range(0, len(line_piece), max_chars))
+    return pieces
+
+
+def chunk_markdown(markdown: str, max_chunk_chars: int = MAX_CHUNK_CHARS) -> list[Chunk]:
+    """Split page-marked markdown into page/section chunks.
+
+    Page markers are consumed (``Chunk.page`` records them); header lines
+    stay at the top of their chunk's text.
+    """
+    # (position, content start, new page, new section)
+    boundaries: list[tuple[int, int, int | None, str | None]] = [
+        (m.start(), m.end(), int(m.group(1)), None) for m in _PAGE_LINE_PATTERN.finditer(markdown)
+    ]
+    boundaries.extend(
+        (s["position"], s["position"], None, s["title"]) for s in extract_section_hierarchy(markdown)["sections"]
+    )
+    boundaries.sort(key=lambda b: b[0])
+
+    chunks: list[Chunk] = []
+    page: int | None = None
+    section: str | None = None
+
+    def emit(text: str) -> None:
+        for piece in _split_oversized(text.strip(), max_chunk_chars):
+            if piece.strip():
+                chunks.append(Chunk(text=piece.strip(), page=page, section=section))
+
+    pos = 0
+    for start, content_start, new_page, new_section in boundaries:
+        emit(markdown[pos:start])
+        if new_page is not None:
+            page = new_page
+        if new_section is not None:
+            section = new_section
+        pos = content_start
+    emit(markdown[pos:])
+    return chunks
+
+
+class ChunkIndex:
+    """Okapi BM25 index over one document's chunks."""
+
+    def __init__(self, chunks: list[Chunk], k1: float = 1.5, b: float = 0.75):
+        self.chunks = chunks
+        self.k1 = k1
+        self.b = b
+        self.total_chars = sum(len(c.text) for c in chunks)
+
+        # term -> [(chunk id, term frequency)]
+        self._postings: dict[str, list[tuple[int, int]]] = {}
+        self._lengths: list[int] = []
+        for chunk_id, chunk in enumerate(chunks):
+            # The section title is indexed with its chunk, so passages under a
+            # "Land Tenure" header match a land-tenure requirement.
+            terms = tokenize(f"{chunk.section or ''}\n{chunk.text}")
+            self._lengths.append(len(terms))
+            for term, tf in Counter(terms).items():
+                self._postings.setdefault(term, []).append((chunk_id, tf))
+
+        n = len(chunks)
+        self._avg_length = (sum(self._lengths) / n) if n else 0.0
+        self._idf = {
+            term: math.log((n - len(postings) + 0.5) / (len(postings) + 0.5) + 1.0)
+            for term, postings in self._postings.items()
+        }
+
+    @classmethod
+    def from_markdown(cls, markdown: str, max_chunk_chars: int = MAX_CHUNK_CHARS) -> ChunkIndex:
+        return cls(chunk_markdown(markdown, max_chunk_chars))
+
+    def search(self, query: str) -> list[tuple[float, int]]:
+        """``(score, chunk id)`` for every chunk sharing a term with ``query``, best first."""
+        scores: dict[int, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = self._idf[term]
+            for chunk_id, tf in postings:
+                norm = 1 - self.b + self.b * self._lengths[chunk_id] / (self._avg_length or 1.0)
+                scores[chunk_id] = scores.get(chunk_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + self.k1 * norm)
+        return sorted(((score, chunk_id) for chunk_id, score in scores.items()), key=lambda s: (-s[0], s[1]))
+
+    def top_chunks(self, query: str, max_chars: int, top_k: int) -> list[int]:
+        """Ids of the best-scoring chunks (at most ``top_k``) whose text fits in ``max_chars``."""
+        selected: list[int] = []
+        used = 0
+        for _, chunk_id in self.search(query):
+            size = len(self.chunks[chunk_id].text)
+            if used + size > max_chars:
+                continue
+            selected.append(chunk_id)
+            used += size
+            if len(selected) >= top_k:
+                break
+        return selected
+
+    def render(self, chunk_ids: list[int], source_name: str) -> str:
+        """Selected chunks in document order, with page markers and section labels restored."""
+        ordered = sorted(set(chunk_ids))
+        parts: list[str] = []
+        last_page: int | None = None
+        previous: int | None = None
+        for chunk_id in ordered:
+            chunk = self.chunks[chunk_id]
+            if previous is not None and chunk_id != previous + 1:
+                parts.append("[…]")
+            if chunk.page is not None and chunk.page != last_page:
+                parts.append(f"--- Page {chunk.page} ---")
+                last_page = chunk.page
+            if chunk.section and not chunk.text.startswith("#"):
+                parts.append(f"*(Section: {chunk.section})*")
+            parts.append(chunk.text)
+            previous = chunk_id
+
+        kept = sum(len(self.chunks[i].text) for i in ordered)
+        header = (
+            f"*Excerpts selected by relevance: {len(ordered)} of {len(self.chunks)} passages "
+            f"({kept:,} of {self.total_chars:,} chars). Full document remains on disk at {source_name}.*"
+        )
+        return "\n\n".join([header, *parts])
+
+
+_indexes: OrderedDict[str, ChunkIndex] = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def get_chunk_index(markdown: str) -> ChunkIndex:
+    """Index for ``markdown``, built on first request and reused while cached."""
+    key = hashlib.sha256(markdown.encode("utf-8")).hexdigest()
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is not None:
+            _indexes.move_to_end(key)
+            return index
+
+    index = ChunkIndex.from_markdown(markdown)
+    with _indexes_lock:
+        _indexes[key] = index
+        while len(_indexes) > MAX_CACHED_INDEXES:
+            _indexes.popitem(last=False)
+    return index
+
+
+def reset_for_tests() -> None:
+    """Drop cached indexes."""
+    with _indexes_lock:
+        _indexes.clear()
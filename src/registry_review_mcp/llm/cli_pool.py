@@ -0,0 +1,342 @@
+"""Warm, long-lived ``claude`` CLI workers for the CLI backend.
+
+``_call_via_cli_once`` spawns ``claude -p --output-format json`` per
+prompt, so for the short evidence prompts process start-up and the CLI's
+auth handshake dominated each call.
+
+:class:`CLIWorkerPool` keeps workers started ahead of demand and drives
+them over the CLI's streaming JSON protocol
+(``--input-format stream-json --output-format stream-json``): one
+``{"type": "user", ...}`` line per prompt on stdin, answered by event
+lines on stdout ending in a ``{"type": "result", ...}`` line that carries
+the same ``result``/``is_error``/``usage`` fields as the one-shot JSON.
+
+- Workers are keyed by (model, system prompt), which are process flags.
+- Health check on checkout: the process is alive, and has been idle for
+  less than ``settings.llm_cli_worker_idle_seconds``.
+- Recycling: a worker is retired after
+  ``settings.llm_cli_worker_max_requests`` prompts, and immediately on any
+  error, timeout or protocol violation. A replacement is started before
+  the caller returns; only its fork/exec is awaited, its start-up
+  overlaps the caller's work, so the next caller finds a warm worker.
+- Prompts served by one worker share its conversation, so the default of
+  one prompt per worker keeps every prompt independent; start-up still
+  happens off the request path. Raise it only for prompts that may see
+  each other.
+- Pool size: up to ``settings.llm_cli_pool_size`` idle workers, by
+  default (0) the throttle's ``max_concurrent``; the throttle already
+  bounds how many are busy.
+
+Workers belong to the event loop that spawned them; a pool used from a
+new loop discards the old loop's workers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import json
+import logging
+import time
+from collections import Counter, deque
+from collections.abc import Sequence
+from typing import Any
+
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+CLI_COMMAND = ("claude",)
+# Responses arrive as single JSON lines; the default 64 KiB line limit is too small.
+STREAM_LIMIT = 16 * 1024 * 1024
+COUNTERS = ("requests", "spawned", "warm_hits", "cold_starts", "recycled", "recycled_on_error", "unhealthy_discarded")
+
+
+class CLIWorker:
+    """One ``claude`` process speaking stream-json."""
+
+    def __init__(self, command: Sequence[str], model: str, system: str | None):
+        self.command = list(command)
+        self.model = model
+        self.system = system
+        self.requests = 0
+        self.last_used = time.monotonic()
+        self.proc: asyncio.subprocess.Process | None = None
+        self._stderr: deque[str] = deque(maxlen=50)
+        self._stderr_task: asyncio.Task | None = None
+
+    def _argv(self) -> list[str]:
+        argv = [
+            *self.command,
+            "-p",
+            "--input-format",
+            "stream-json",
+            "--output-format",
+            "stream-json",
+            "--verbose",
+            "--model",
+            self.model,
+        ]
+        if self.system:
+            argv.extend(["--system-prompt", self.system])
+        return argv
+
+    async def start(self) -> None:
+        self.proc = await asyncio.create_subprocess_exec(
+            *self._argv(),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=STREAM_LIMIT,
+        )
+        # Drain stderr so a chatty CLI never blocks on a full pipe.
+        self._stderr_task = asyncio.ensure_future(self._drain_stderr())
+
+    async def _drain_stderr(self) -> None:
+        async for line in self.proc.stderr:
+            self._stderr.append(line.decode("utf-8", errors="replace"))
+
+    @property
+    def alive(self) -> bool:
+        return self.proc is not None and self.proc.returncode is None
+
+    def healthy(self, idle_seconds: float) -> bool:
+        return self.alive and time.monotonic() - self.last_used < idle_seconds
+
+    async def request(self, prompt: str) -> dict[str, Any]:
+        """Send one prompt; return the ``result`` event.
+
+        Raises:
+            LLMBackendError: If the worker exits, breaks protocol, or the
+                result is an error
+        """
+        from ..utils.llm_client import LLMBackendError, classify_cli_error
+
+        self.requests += 1
+        message = {"type": "user", "message": {"role": "user", "content": [{"type": "text", "text": prompt}]}}
+        try:
+            self.proc.stdin.write(json.dumps(message).encode("utf-8") + b"\n")
+            await self.proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            raise await self._exited_error(f"CLI worker closed its input: {e}") from e
+
+        while True:
+            line = await self.proc.stdout.readline()
+            if not line:
+                raise await self._exited_error("CLI worker exited before answering")
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise LLMBackendError(
+                    f"Failed to parse CLI stream event: {e}",
+                    details={"stdout_preview": line[:500].decode("utf-8", errors="replace")},
+                ) from e
+            if event.get("type") == "result":
+                break
+
+        self.last_used = time.monotonic()
+        if event.get("is_error"):
+            error_info = classify_cli_error(str(event.get("result", "Unknown CLI error")), 0)
+            raise LLMBackendError(
+                error_info.message,
+                details={"category": error_info.category, "is_fatal": error_info.is_fatal},
+            )
+        return event
+
+    async def _exited_error(self, message: str) -> Exception:
+        from ..utils.llm_client import LLMBackendError, classify_cli_error
+
+        try:
+            returncode = await asyncio.wait_for(self.proc.wait(), timeout=5)
+            if self._stderr_task is not None:
+                await asyncio.wait_for(self._stderr_task, timeout=1)
+        except (asyncio.TimeoutError, TimeoutError):
+            returncode = self.proc.returncode
+        stderr = "".join(self._stderr)
+        if returncode:
+            error_info = classify_cli_error(stderr, returncode)
+            return LLMBackendError(
+                error_info.message,
+                details={"category": error_info.category, "is_fatal": error_info.is_fatal},
+            )
+        return LLMBackendError(message, details={"stderr": stderr[-500:]})
+
+    def kill(self) -> None:
+        if self.alive:
+            try:
+                self.proc.stdin.close()
+                self.proc.kill()
+            except (ProcessLookupError, RuntimeError):
+                pass  # already gone, or its event loop is closed
+        if self._stderr_task is not None:
+            self._stderr_task.cancel()
+
+    async def close(self) -> None:
+        """Close stdin (the CLI exits at end of input), then kill if it lingers."""
+        if self.alive:
+            try:
+                self.proc.stdin.close()
+                await asyncio.wait_for(self.proc.wait(), timeout=5)
+            except (asyncio.TimeoutError, TimeoutError, BrokenPipeError, ConnectionResetError):
+                pass
+        self.kill()
+
+
+class CLIWorkerPool:
+    """Warm CLI workers keyed by (model, system prompt)."""
+
+    def __init__(
+        self,
+        command: Sequence[str] = CLI_COMMAND,
+        size: int | None = None,
+        max_requests: int | None = None,
+        idle_seconds: float | None = None,
+        request_timeout: float | None = None,
+    ):
+        self.command = tuple(command)
+        self._size = size
+        self.max_requests = max_requests or settings.llm_cli_worker_max_requests
+        self.idle_seconds = idle_seconds or settings.llm_cli_worker_idle_seconds
+        self.request_timeout = request_timeout or settings.llm_cli_request_timeout_seconds
+        self.counters: Counter = Counter()
+        self._idle: dict[tuple[str, str | None], list[CLIWorker]] = {}
+        self._busy: set[CLIWorker] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def size(self) -> int:
+        """Idle workers kept warm (default: the throttle's concurrency ceiling)."""
+        if self._size or settings.llm_cli_pool_size:
+            return self._size or settings.llm_cli_pool_size
+        from .throttle import get_throttle
+
+        return max(1, get_throttle().max_concurrent)
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._loop is not None:
+                self.kill_all()
+            self._loop = loop
+
+    async def run(self, prompt: str, system: str | None, model: str) -> dict[str, Any]:
+        """Answer ``prompt`` on a warm worker; return the CLI's ``result`` event."""
+        self._bind_loop()
+        key = (model, system)
+        worker = await self._checkout(key)
+        self._busy.add(worker)
+        try:
+            event = await asyncio.wait_for(worker.request(prompt), timeout=self.request_timeout)
+        except BaseException as e:
+            self._busy.discard(worker)
+            self.counters["recycled_on_error"] += 1
+            worker.kill()
+            if isinstance(e, Exception):
+                await self._replenish(key)
+            raise
+        self._busy.discard(worker)
+        self.counters["requests"] += 1
+        if worker.requests >= self.max_requests or not worker.alive:
+            self.counters["recycled"] += 1
+            worker.kill()
+            await self._replenish(key)
+        else:
+            self._add_idle(key, worker)
+        return event
+
+    async def _checkout(self, key: tuple[str, str | None]) -> CLIWorker:
+        idle = self._idle.get(key, [])
+        while idle:
+            worker = idle.pop()
+            if worker.healthy(self.idle_seconds):
+                self.counters["warm_hits"] += 1
+                return worker
+            self.counters["unhealthy_discarded"] += 1
+            worker.kill()
+        self.counters["cold_starts"] += 1
+        return await self._spawn(key)
+
+    async def _spawn(self, key: tuple[str, str | None]) -> CLIWorker:
+        worker = CLIWorker(self.command, *key)
+        await worker.start()
+        self.counters["spawned"] += 1
+        return worker
+
+    async def _replenish(self, key: tuple[str, str | None]) -> None:
+        """Start a replacement for a retired worker.
+
+        Only the fork/exec is awaited; the CLI's own start-up runs in the
+        child while the caller carries on, so the next prompt finds it warm.
+        """
+        if self.idle_count() >= self.size:
+            return
+        try:
+            worker = await self._spawn(key)
+        except Exception as e:
+            logger.warning(f"Could not start a warm CLI worker: {e}")
+            return
+        self._add_idle(key, worker)
+
+    def _add_idle(self, key: tuple[str, str | None], worker: CLIWorker) -> None:
+        worker.last_used = time.monotonic()
+        self._idle.setdefault(key, []).append(worker)
+        # Bound idle workers across keys; retire the least recently used.
+        while self.idle_count() > self.size:
+            oldest_key, oldest = min(
+                ((k, w) for k, workers in self._idle.items() for w in workers), key=lambda kw: kw[1].last_used
+            )
+            self._idle[oldest_key].remove(oldest)
+            oldest.kill()
+
+    async def prewarm(self, model: str, system: str | None = None, count: int | None = None) -> None:
+        """Start up to ``count`` (default: pool size) idle workers for (model, system)."""
+        self._bind_loop()
+        key = (model, system)
+        missing = (count or self.size) - len(self._idle.get(key, []))
+        for worker in await asyncio.gather(*(self._spawn(key) for _ in range(max(0, missing)))):
+            self._add_idle(key, worker)
+
+    def idle_count(self) -> int:
+        return sum(len(workers) for workers in self._idle.values())
+
+    def stats(self) -> dict[str, int]:
+        counters = {name: self.counters[name] for name in COUNTERS}
+        return {"size": self.size, "idle": self.idle_count(), "busy": len(self._busy), **counters}
+
+    async def close(self) -> None:
+        workers = [w for workers in self._idle.values() for w in workers] + list(self._busy)
+        self._idle.clear()
+        self._busy.clear()
+        await asyncio.gather(*(worker.close() for worker in workers), return_exceptions=True)
+
+    def kill_all(self) -> None:
+        """Kill every worker without awaiting (another loop's, or at exit)."""
+        for worker in [w for workers in self._idle.values() for w in workers] + list(self._busy):
+            worker.kill()
+        self._idle.clear()
+        self._busy.clear()
+
+
+_pool: CLIWorkerPool | None = None
+
+
+def get_cli_pool() -> CLIWorkerPool:
+    """Return the process-wide CLI worker pool, creating it on first call."""
+    global _pool
+    if _pool is None:
+        _pool = CLIWorkerPool()
+    return _pool
+
+
+def reset_for_tests() -> None:
+    """Kill every worker and forget the pool."""
+    global _pool
+    if _pool is not None:
+        _pool.kill_all()
+    _pool = None
+
+
+@atexit.register
+def _kill_workers_at_exit() -> None:
+    if _pool is not None:
+        _pool.kill_all()
@@ -0,0 +1,283 @@
+"""Shared, long-lived HTTP clients for the LLM backends.
+
+Every OpenAI call used to construct a fresh ``AsyncOpenAI``, every
+extractor its own ``AsyncAnthropic`` and ``extract_fields_with_llm`` one
+more, so each call paid a TCP + TLS handshake and nothing coordinated the
+number of open connections.
+
+:class:`ClientPool` hands out one SDK client per backend (and API key)
+built on a keep-alive connection pool:
+
+- limits from ``settings.llm_http_max_connections``,
+  ``llm_http_max_keepalive_connections`` and ``llm_http_keepalive_expiry``;
+- HTTP/2 when ``settings.llm_http2`` is on and the ``h2`` package is
+  installed (the ``http2`` extra); HTTP/1.1 otherwise;
+- per-backend timeout and SDK retry count from :func:`backend_options`,
+  the one place they are configured. A caller that runs its own retry
+  loop (``call_llm``, ``BaseExtractor._call_api_with_retry``) asks for
+  ``max_retries=0`` and gets a view of the same client and pool; each of
+  its attempts then takes its own throttle slot.
+
+Connections belong to the event loop that opened them, so clients are
+kept per running loop; clients of a closed loop are dropped.
+
+:meth:`ClientPool.stats` reports per-backend pool utilization (requests,
+in-flight and peak in-flight requests, connections opened, open and idle
+connections); the REST API serves it from ``/health``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import importlib
+import importlib.util
+import logging
+import threading
+import weakref
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Any
+
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("anthropic", "openai")
+
+
+@dataclass(frozen=True)
+class BackendOptions:
+    """Request policy for one backend's clients."""
+
+    timeout: float
+    max_retries: int
+
+
+def backend_options(backend: str) -> BackendOptions:
+    """Timeout and retry count for ``backend`` ("anthropic" or "openai")."""
+    if backend == "anthropic":
+        return BackendOptions(settings.llm_anthropic_timeout_seconds, settings.llm_anthropic_max_retries)
+    if backend == "openai":
+        return BackendOptions(settings.llm_openai_timeout_seconds, settings.llm_openai_max_retries)
+    raise ValueError(f"Unknown LLM backend: {backend!r}")
+
+
+def _http_library(sdk: ModuleType) -> ModuleType:
+    """The HTTP library (``httpx`` or ``httpx2``) an SDK's client is built on."""
+    base = next(cls for cls in sdk.DefaultAsyncHttpxClient.__mro__ if cls.__name__ == "AsyncClient")
+    return importlib.import_module(base.__module__.partition(".")[0])
+
+
+def _limits(sdk: ModuleType) -> Any:
+    """Connection limits from settings, in the SDK's HTTP library."""
+    return _http_library(sdk).Limits(
+        max_connections=settings.llm_http_max_connections,
+        max_keepalive_connections=settings.llm_http_max_keepalive_connections,
+        keepalive_expiry=settings.llm_http_keepalive_expiry,
+    )
+
+
+def http2_available() -> bool:
+    """True when HTTP/2 is enabled and ``h2`` is installed."""
+    return settings.llm_http2 and importlib.util.find_spec("h2") is not None
+
+
+@dataclass
+class PoolMeter:
+    """Request and connection counters for one pooled client."""
+
+    requests: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    connections_opened: int = 0
+    pool: Any = field(default=None, repr=False)
+    _seen: weakref.WeakSet = field(default_factory=weakref.WeakSet, repr=False)
+
+    def started(self) -> None:
+        self.requests += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def finished(self) -> None:
+        self.in_flight -= 1
+        for connection in self._connections():
+            if connection not in self._seen:
+                self._seen.add(connection)
+                self.connections_opened += 1
+
+    def _connections(self) -> list:
+        return list(getattr(self.pool, "connections", None) or [])
+
+    def stats(self) -> dict[str, int]:
+        connections = self._connections()
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "connections_opened": self.connections_opened,
+            "connections_open": len(connections),
+            "connections_idle": sum(connection.is_idle() for connection in connections),
+        }
+
+
+@functools.cache
+def _metered_http_client_class(base: type) -> type:
+    """Subclass of an SDK's default ``httpx`` client that reports to a :class:`PoolMeter`.
+
+    SDK releases differ in their HTTP library (``httpx`` or ``httpx2``), and
+    reject transports from the other one, so the meter wraps ``send`` and
+    leaves the transport to the SDK.
+    """
+
+    class MeteredHttpxClient(base):
+        def __init__(self, meter: PoolMeter, **kwargs: Any):
+            super().__init__(**kwargs)
+            self.meter = meter
+            meter.pool = getattr(self._transport, "_pool", None)
+
+        async def send(self, request: Any, **kwargs: Any) -> Any:
+            self.meter.started()
+            try:
+                return await super().send(request, **kwargs)
+            except Exception:
+                self.meter.errors += 1
+                raise
+            finally:
+                self.meter.finished()
+
+    return MeteredHttpxClient
+
+
+@dataclass
+class _Pooled:
+    client: Any
+    meter: PoolMeter
+    loop: weakref.ReferenceType | None
+    views: dict[int, Any] = field(default_factory=dict)  # max_retries -> client sharing the pool
+
+    def loop_closed(self) -> bool:
+        if self.loop is None:
+            return False
+        loop = self.loop()
+        return loop is None or loop.is_closed()
+
+
+class ClientPool:
+    """Process-wide registry of pooled LLM SDK clients."""
+
+    def __init__(self):
+        self._clients: dict[tuple[str, str, int], _Pooled] = {}
+        self._lock = threading.Lock()
+
+    def anthropic(self, api_key: str, max_retries: int | None = None) -> Any:
+        """Pooled ``AsyncAnthropic`` for ``api_key``."""
+        return self._client("anthropic", api_key, max_retries)
+
+    def openai(self, api_key: str, max_retries: int | None = None) -> Any:
+        """Pooled ``AsyncOpenAI`` for ``api_key``."""
+        return self._client("openai", api_key, max_retries)
+
+    def _client(self, backend: str, api_key: str, max_retries: int | None) -> Any:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        key = (backend, hashlib.sha256(api_key.encode()).hexdigest()[:16], id(loop))
+        with self._lock:
+            self._drop_closed()
+            pooled = self._clients.get(key)
+            if pooled is None or (loop is not None and pooled.loop() is not loop):
+                pooled = self._clients[key] = self._build(backend, api_key, loop)
+            options = backend_options(backend)
+            if max_retries is None or max_retries == options.max_retries:
+                return pooled.client
+            view = pooled.views.get(max_retries)
+            if view is None:
+                view = pooled.views[max_retries] = pooled.client.with_options(max_retries=max_retries)
+            return view
+
+    def _build(self, backend: str, api_key: str, loop: asyncio.AbstractEventLoop | None) -> _Pooled:
+        if backend == "anthropic":
+            import anthropic as sdk
+
+            client_class = sdk.AsyncAnthropic
+        else:
+            import openai as sdk
+
+            client_class = sdk.AsyncOpenAI
+        options = backend_options(backend)
+        http2 = http2_available()
+        meter = PoolMeter()
+        http_client = _metered_http_client_class(sdk.DefaultAsyncHttpxClient)(
+            meter,
+            limits=_limits(sdk),
+            http2=http2,
+            timeout=options.timeout,
+        )
+        client = client_class(
+            api_key=api_key, http_client=http_client, timeout=options.timeout, max_retries=options.max_retries
+        )
+        logger.debug(f"Created pooled {backend} client (http2={http2})")
+        return _Pooled(client=client, meter=meter, loop=weakref.ref(loop) if loop else None)
+
+    def _drop_closed(self) -> None:
+        for key in [key for key, pooled in self._clients.items() if pooled.loop_closed()]:
+            del self._clients[key]
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Pool utilization per backend, summed over its clients."""
+        report = {
+            backend: {
+                "clients": 0,
+                "requests": 0,
+                "errors": 0,
+                "in_flight": 0,
+                "peak_in_flight": 0,
+                "connections_opened": 0,
+                "connections_open": 0,
+                "connections_idle": 0,
+            }
+            for backend in BACKENDS
+        }
+        with self._lock:
+            self._drop_closed()
+            for (backend, _, _), pooled in self._clients.items():
+                totals = report[backend]
+                totals["clients"] += 1
+                for name, value in pooled.meter.stats().items():
+                    totals[name] = max(totals[name], value) if name == "peak_in_flight" else totals[name] + value
+        return report
+
+    async def aclose(self) -> None:
+        """Close the clients of the running loop (and forget every other one)."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pooled_clients = list(self._clients.values())
+            self._clients.clear()
+        for pooled in pooled_clients:
+            if pooled.loop is not None and pooled.loop() is loop:
+                await pooled.client.close()
+
+
+_pool: ClientPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_client_pool() -> ClientPool:
+    """Return the process-wide client pool, creating it on first call."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ClientPool()
+        return _pool
+
+
+def reset_for_tests() -> None:
+    """Forget every pooled client."""
+    global _pool
+    with _pool_lock:
+        _pool = None
@@ -0,0 +1,308 @@
+"""Image preparation for multimodal extractor calls.
+
+The date, land-tenure and project-ID extractors attach page images to
+their prompts. Each call re-read the image from disk and base64-encoded
+the full-resolution bytes. The date extractor also declared every image
+as ``image/jpeg``, whatever it really was. Monitoring reports carry
+multi-megabyte scans and photos. Their request bodies were mostly image
+payload, and the API downsamples anything past ~1568 px on the long edge
+anyway, so the extra pixels were uploaded only to be thrown away.
+
+:class:`ImagePreparer` turns an image path into the payload a request
+sends:
+
+- the real format is read from the file's contents, not its suffix;
+- images larger than ``llm_image_max_edge`` on the long edge are
+  downsampled;
+- images over ``llm_image_max_bytes`` are re-encoded (PNG for line art
+  with transparency, otherwise JPEG at falling quality, then smaller)
+  until they fit;
+- images already small enough are sent byte-for-byte.
+
+Prepared payloads are kept in an LRU cache keyed by the SHA-256 of the
+source bytes and the preparation settings, and bounded by
+``llm_image_cache_bytes``. Hashing a file is cheap next to decoding it;
+a figure shared by several chunks, extractors or documents is decoded
+and encoded once. :meth:`ImagePreparer.dedupe` drops repeated content
+from an image list before it is spread over chunks.
+
+Dedupe is exact (content hash). A perceptual hash would merge near-
+duplicates, but land-title scans and monitoring charts that differ only
+in small printed values look alike to a 64-bit dHash. Dropping one of
+them would lose evidence.
+
+Pillow comes in through pdfplumber and fpdf2 and is pinned in
+``pyproject.toml``.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import io
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Formats the Messages API accepts, by Pillow format name.
+SUPPORTED_MEDIA_TYPES = {
+    "JPEG": "image/jpeg",
+    "PNG": "image/png",
+    "GIF": "image/gif",
+    "WEBP": "image/webp",
+}
+
+# JPEG qualities tried, in order, before the image is shrunk further.
+JPEG_QUALITIES = (85, 70, 55)
+
+# Each shrink step scales both edges by this factor.
+SHRINK_FACTOR = 0.75
+
+# Smallest long edge a shrink step goes down to.
+MIN_EDGE = 256
+
+
+@dataclass(frozen=True)
+class PreparedImage:
+    """An image ready to attach to a message.
+
+    Attributes:
+        digest: SHA-256 of the source file's bytes.
+        media_type: MIME type of ``data``.
+        data: Base64-encoded payload.
+        source_bytes: Size of the source file.
+        prepared_bytes: Size of the payload before base64.
+        size: (width, height) of the payload.
+    """
+
+    digest: str
+    media_type: str
+    data: str
+    source_bytes: int
+    prepared_bytes: int
+    size: tuple[int, int]
+
+    def content_block(self) -> dict[str, Any]:
+        """Return the ``image`` content block for a Messages API request."""
+        return {
+            "type": "image",
+            "source": {"type": "base64", "media_type": self.media_type, "data": self.data},
+        }
+
+
+def _encode(image: Image.Image, fmt: str, quality: int = 85) -> bytes:
+    buffer = io.BytesIO()
+    if fmt == "JPEG":
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        image.save(buffer, format="JPEG", quality=quality, optimize=True)
+    else:
+        image.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def _has_alpha(image: Image.Image) -> bool:
+    return image.mode in ("RGBA", "LA", "PA") or (image.mode == "P" and "transparency" in image.info)
+
+
+def prepare_bytes(raw: bytes, max_edge: int, max_bytes: int) -> tuple[str, bytes, tuple[int, int]]:
+    """Normalize and downsample one image.
+
+    Args:
+        raw: The image file's bytes
+        max_edge: Longest edge, in pixels, of the result
+        max_bytes: Size budget of the result; a best effort if the image
+            cannot fit even at ``MIN_EDGE``
+
+    Returns:
+        (media_type, payload, (width, height))
+
+    Raises:
+        ValueError: ``raw`` is not an image Pillow can read.
+    """
+    try:
+        image = Image.open(io.BytesIO(raw))
+        image.load()
+    except (UnidentifiedImageError, OSError) as e:
+        raise ValueError(f"unreadable image: {e}") from e
+
+    source_format = image.format
+    exif_rotated = bool(image.getexif().get(0x0112, 1) != 1)
+    if (
+        source_format in SUPPORTED_MEDIA_TYPES
+        and max(image.size) <= max_edge
+        and len(raw) <= max_bytes
+        and not exif_rotated
+        and not getattr(image, "is_animated", False)
+    ):
+        return SUPPORTED_MEDIA_TYPES[source_format], raw, image.size
+
+    image = ImageOps.exif_transpose(image)
+    if max(image.size) > max_edge:
+        image.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+
+    # Keep transparency and crisp line art as PNG while it fits the budget.
+    keep_png = source_format in ("PNG", "GIF") or _has_alpha(image)
+    while True:
+        if keep_png:
+            if image.mode not in ("RGB", "RGBA", "L", "LA", "P"):
+                image = image.convert("RGBA")
+            payload = _encode(image, "PNG")
+            if len(payload) <= max_bytes:
+                return "image/png", payload, image.size
+        if _has_alpha(image):
+            background = Image.new("RGB", image.size, "white")
+            background.paste(image.convert("RGBA"), mask=image.convert("RGBA").getchannel("A"))
+            image = background
+        for quality in JPEG_QUALITIES:
+            payload = _encode(image, "JPEG", quality)
+            if len(payload) <= max_bytes:
+                return "image/jpeg", payload, image.size
+        if max(image.size) <= MIN_EDGE:
+            return "image/jpeg", payload, image.size
+        scale = max(SHRINK_FACTOR, MIN_EDGE / max(image.size))
+        image = image.resize(
+            (max(1, round(image.width * scale)), max(1, round(image.height * scale))), Image.Resampling.LANCZOS
+        )
+
+
+class ImagePreparer:
+    """Prepare images for requests and keep the payloads in an LRU cache."""
+
+    def __init__(self, max_edge: int, max_bytes: int, cache_bytes: int):
+        self.max_edge = max_edge
+        self.max_bytes = max_bytes
+        self.cache_bytes = cache_bytes
+        self._cache: OrderedDict[str, PreparedImage] = OrderedDict()
+        self._cached_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.failures = 0
+        self.source_bytes = 0
+        self.prepared_bytes = 0
+
+    @property
+    def params_key(self) -> str:
+        """The preparation parameters, for cache keys of anything built from the payloads."""
+        return f"edge={self.max_edge}:bytes={self.max_bytes}"
+
+    def digest(self, path: Path) -> str:
+        """SHA-256 of ``path``'s bytes.
+
+        Raises:
+            OSError: The file cannot be read.
+        """
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+
+    def dedupe(self, images: list[Path]) -> list[Path]:
+        """Drop images whose content repeats an earlier one; keep the order.
+
+        Unreadable paths are kept so :meth:`prepare` reports them.
+        """
+        seen: set[str] = set()
+        unique = []
+        for path in images:
+            try:
+                digest = self.digest(path)
+            except OSError:
+                unique.append(path)
+                continue
+            if digest not in seen:
+                seen.add(digest)
+                unique.append(path)
+        if len(unique) < len(images):
+            logger.info(f"Dropped {len(images) - len(unique)} duplicate image(s) of {len(images)}")
+        return unique
+
+    def prepare(self, path: Path) -> PreparedImage | None:
+        """Return the payload for ``path``; None (logged) if it cannot be used."""
+        try:
+            raw = path.read_bytes()
+        except OSError as e:
+            logger.warning(f"Failed to load image {path}: {e}")
+            with self._lock:
+                self.failures += 1
+            return None
+        digest = hashlib.sha256(raw).hexdigest()
+        key = f"{digest}:{self.params_key}"
+        with self._lock:
+            prepared = self._cache.get(key)
+            if prepared is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return prepared
+
+        try:
+            media_type, payload, size = prepare_bytes(raw, self.max_edge, self.max_bytes)
+        except ValueError as e:
+            logger.warning(f"Failed to load image {path}: {e}")
+            with self._lock:
+                self.failures += 1
+            return None
+        prepared = PreparedImage(
+            digest=digest,
+            media_type=media_type,
+            data=base64.standard_b64encode(payload).decode("ascii"),
+            source_bytes=len(raw),
+            prepared_bytes=len(payload),
+            size=size,
+        )
+        with self._lock:
+            self.misses += 1
+            self.source_bytes += len(raw)
+            self.prepared_bytes += len(payload)
+            if key not in self._cache and len(prepared.data) <= self.cache_bytes:
+                self._cache[key] = prepared
+                self._cached_bytes += len(prepared.data)
+                while self._cached_bytes > self.cache_bytes:
+                    _, evicted = self._cache.popitem(last=False)
+                    self._cached_bytes -= len(evicted.data)
+        return prepared
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._cache),
+                "cached_bytes": self._cached_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "failures": self.failures,
+                "source_bytes": self.source_bytes,
+                "prepared_bytes": self.prepared_bytes,
+            }
+
+
+_preparer: ImagePreparer | None = None
+
+
+def get_image_preparer() -> ImagePreparer:
+    """Return the process-wide preparer, rebuilt when its settings have changed."""
+    global _preparer
+    if (
+        _preparer is None
+        or _preparer.max_edge != settings.llm_image_max_edge
+        or _preparer.max_bytes != settings.llm_image_max_bytes
+        or _preparer.cache_bytes != settings.llm_image_cache_bytes
+    ):
+        _preparer = ImagePreparer(
+            max_edge=settings.llm_image_max_edge,
+            max_bytes=settings.llm_image_max_bytes,
+            cache_bytes=settings.llm_image_cache_bytes,
+        )
+    return _preparer
+
+
+def reset_for_tests() -> None:
+    """Drop the process-wide preparer and its cache."""
+    global _preparer
+    _preparer = None
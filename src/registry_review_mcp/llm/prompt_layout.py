@@ -0,0 +1,77 @@
+"""Prompt assembly that keeps the shared prefix first and marks it cacheable.
+
+Anthropic (explicitly, via ``cache_control`` breakpoints) and OpenAI
+(automatically, past 1024 tokens) only reuse a prompt *prefix*. The
+evidence prompt used to open with the requirement's text and put the
+document after it, so the 80K-char document body shared by the 20+
+requirements mapped to it sat behind a different prefix every call and
+never produced a cache read; ``_call_via_api`` marked the whole user
+prompt as a cache write anyway.
+
+A :class:`PromptLayout` is the prompt string assembled from ordered
+segments, most stable first::
+
+    system prompt                (constant; cached by ``_call_via_api``)
+    document header + body       Segment(..., cache=True)
+    requirement-specific tail    Segment(...)
+
+``cache=True`` places a breakpoint after that segment. Because a layout
+*is* a ``str``, it passes through ``call_llm``, the single-flight key, the
+token scheduler and the OpenAI/CLI backends unchanged; only
+``_call_via_api`` looks at :meth:`PromptLayout.content_blocks`. Plain
+string prompts carry no breakpoint.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+# Anthropic accepts four breakpoints per request; the system prompt uses one.
+MAX_MESSAGE_BREAKPOINTS = 3
+
+
+@dataclass(frozen=True)
+class Segment:
+    """One contiguous piece of a prompt.
+
+    Attributes:
+        text: The segment's text, included verbatim.
+        cache: Place a cache breakpoint after this segment, making the
+            prompt up to and including it a reusable prefix.
+    """
+
+    text: str
+    cache: bool = False
+
+
+class PromptLayout(str):
+    """A prompt string that remembers the segments it was assembled from."""
+
+    segments: tuple[Segment, ...]
+
+    def __new__(cls, *segments: Segment) -> PromptLayout:
+        layout = super().__new__(cls, "".join(segment.text for segment in segments))
+        layout.segments = segments
+        return layout
+
+    def content_blocks(self) -> list[dict[str, Any]]:
+        """Anthropic message content: one text block per cached prefix, plus the tail.
+
+        Segments are merged up to each breakpoint. Only the last
+        :data:`MAX_MESSAGE_BREAKPOINTS` breakpoints are kept, since they
+        cover the longest prefixes.
+        """
+        breakpoints = [i for i, segment in enumerate(self.segments) if segment.cache and segment.text]
+        breakpoints = breakpoints[-MAX_MESSAGE_BREAKPOINTS:]
+
+        blocks: list[dict[str, Any]] = []
+        start = 0
+        for end in breakpoints:
+            text = "".join(segment.text for segment in self.segments[start : end + 1])
+            blocks.append({"type": "text", "text": text, "cache_control": {"type": "ephemeral"}})
+            start = end + 1
+        tail = "".join(segment.text for segment in self.segments[start:])
+        if tail or not blocks:
+            blocks.append({"type": "text", "text": tail})
+        return blocks
@@ -0,0 +1,348 @@
+"""Compact on-disk store for cached LLM responses.
+
+The evidence cache used to write one pretty-printed JSON file per cache
+key into ``llm_cache_dir`` and only removed a file when a read found it
+past its TTL. A warmed regression host held hundreds of thousands of tiny
+files, most of their bytes indentation, and ran out of inodes long before
+it ran out of disk.
+
+:class:`ResponseStore` keeps responses in a fixed number of SQLite shard
+files under ``<llm_cache_dir>/store/``:
+
+- values are JSON compressed with zstd (when ``zstandard`` is installed)
+  or zlib; each value is tagged with its codec, so hosts with different
+  codecs can share packs;
+- a key's shard is picked from a hash of its namespace and key; each
+  shard is an indexed table (``utils.cache.SQLiteBackend``) bounded by
+  its share of ``llm_cache_max_bytes`` / ``llm_cache_max_entries`` with
+  least-recently-used eviction, so writers in different processes
+  contend on one shard rather than one file;
+- ``manifest.json`` pins the shard count the store was created with.
+
+Evidence responses live in the ``evidence`` namespace, unified-analysis
+shard results in ``unified_analysis``, and extractor responses in their
+extractor's namespace (``date_extraction`` etc.) via :class:`ResponseCache`. Legacy per-key files are adopted into the store
+the first time they are read, or all at once with ``migrate``.
+
+A warmed cache moves between hosts as a *pack*, a gzip-compressed JSON
+Lines file with one header line and one line per live entry::
+
+    python -m registry_review_mcp.llm.response_store pack export warm.pack
+    python -m registry_review_mcp.llm.response_store pack import warm.pack
+
+(also installed as ``registry-review-llm-cache``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from ..config.settings import settings
+from ..utils.cache import _MISSING, SQLiteBackend, default_codec
+
+logger = logging.getLogger(__name__)
+
+STORE_DIRNAME = "store"
+MANIFEST_FILENAME = "manifest.json"
+PACK_FORMAT = "registry-review-llm-cache-pack"
+PACK_VERSION = 1
+
+EVIDENCE_NAMESPACE = "evidence"
+UNIFIED_ANALYSIS_NAMESPACE = "unified_analysis"
+
+
+class ResponseStore:
+    """Sharded, compressed, LRU-bounded key/value store for LLM responses."""
+
+    def __init__(
+        self,
+        root: Path,
+        shards: int | None = None,
+        max_bytes: int | None = None,
+        max_entries: int | None = None,
+        codec: str | None = None,
+    ):
+        """Open (or create) the store under ``root / "store"``.
+
+        Args:
+            root: The LLM cache directory
+            shards: Shard count for a new store (default: settings.llm_cache_shards);
+                an existing store keeps the count in its manifest
+            max_bytes: Total compressed-size bound (default: settings.llm_cache_max_bytes)
+            max_entries: Total entry bound (default: settings.llm_cache_max_entries)
+            codec: "zstd" or "zlib" for new writes (default: best available)
+        """
+        self.root = root
+        self.directory = root / STORE_DIRNAME
+        self.codec = codec or default_codec()
+        self.max_bytes = max_bytes or settings.llm_cache_max_bytes
+        self.max_entries = max_entries or settings.llm_cache_max_entries
+        self.shard_count = self._load_manifest(shards or settings.llm_cache_shards)
+        self.shards = [
+            SQLiteBackend(
+                self.directory / f"shard-{i:03d}.sqlite3",
+                max_bytes=max(1, self.max_bytes // self.shard_count),
+                max_entries=max(1, self.max_entries // self.shard_count),
+                codec=self.codec,
+            )
+            for i in range(self.shard_count)
+        ]
+
+    def _load_manifest(self, shards: int) -> int:
+        manifest = self.directory / MANIFEST_FILENAME
+        if manifest.exists():
+            try:
+                return int(json.loads(manifest.read_text(encoding="utf-8"))["shards"])
+            except (ValueError, KeyError, OSError) as e:
+                logger.warning(f"Unreadable response store manifest {manifest}: {e}; recreating")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = manifest.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps({"version": 1, "shards": shards}), encoding="utf-8")
+        os.replace(tmp_path, manifest)
+        return shards
+
+    def _shard(self, namespace: str, key: str) -> SQLiteBackend:
+        digest = hashlib.sha256(f"{namespace}:{key}".encode()).digest()
+        return self.shards[int.from_bytes(digest[:4], "big") % self.shard_count]
+
+    # -- key/value --------------------------------------------------------
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        value = self._shard(namespace, key).get(namespace, key)
+        return default if value is _MISSING else value
+
+    def get_many(self, namespace: str, keys: list[str]) -> dict[str, Any]:
+        """Values for ``keys`` with one read per shard they fall in. Misses are omitted."""
+        by_shard: dict[SQLiteBackend, list[str]] = {}
+        for key in keys:
+            by_shard.setdefault(self._shard(namespace, key), []).append(key)
+        found: dict[str, Any] = {}
+        for shard, shard_keys in by_shard.items():
+            found.update(shard.get_many(namespace, shard_keys))
+        return found
+
+    def set(self, namespace: str, key: str, value: Any, ttl: int | None = None) -> None:
+        self._shard(namespace, key).set(namespace, key, value, ttl or settings.llm_cache_ttl)
+
+    def delete(self, namespace: str, key: str) -> None:
+        self._shard(namespace, key).delete(namespace, key)
+
+    def clear(self, namespace: str) -> int:
+        return sum(shard.clear(namespace) for shard in self.shards)
+
+    def sweep_expired(self) -> int:
+        return sum(shard.sweep_expired() for shard in self.shards)
+
+    def stats(self, namespace: str | None = None) -> dict[str, Any]:
+        """Totals across shards plus the process-local counters."""
+        totals = {"entries": 0, "bytes": 0, "hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        for shard in self.shards:
+            shard_stats = shard.stats(namespace)
+            for name in totals:
+                totals[name] += shard_stats[name]
+        return {
+            "backend": "response_store",
+            "codec": self.codec,
+            "shards": self.shard_count,
+            "max_bytes": self.max_bytes,
+            "max_entries": self.max_entries,
+            **totals,
+        }
+
+    def close(self) -> None:
+        for shard in self.shards:
+            shard.close()
+
+    # -- legacy files -----------------------------------------------------
+
+    def adopt_legacy_file(self, path: Path, namespace: str = EVIDENCE_NAMESPACE) -> dict[str, Any] | None:
+        """Move one legacy ``<cache_key>.json`` response into the store.
+
+        Returns the stored value (``{"response", "metadata"}``), or None if
+        the file is missing, expired or unreadable. The file is removed in
+        every case but missing.
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                cached = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Dropping unreadable legacy cache file {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        remaining = cached.get("created_at", 0) + cached.get("ttl", settings.llm_cache_ttl) - time.time()
+        value = None
+        if remaining > 0 and "response" in cached:
+            value = {"response": cached["response"], "metadata": cached.get("metadata", {})}
+            self.set(namespace, cached.get("cache_key", path.stem), value, ttl=int(remaining) or 1)
+        path.unlink(missing_ok=True)
+        return value
+
+    def migrate_legacy(self, namespace: str = EVIDENCE_NAMESPACE) -> int:
+        """Adopt every legacy response file in the cache root. Returns the number kept."""
+        return sum(self.adopt_legacy_file(path, namespace) is not None for path in sorted(self.root.glob("*.json")))
+
+    # -- packs ------------------------------------------------------------
+
+    def export_pack(self, path: Path, namespace: str | None = None) -> int:
+        """Write every live entry (of ``namespace``, or all) to a pack file.
+
+        Returns the number of entries written.
+        """
+        count = 0
+        tmp_path = path.with_name(path.name + ".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            header = {
+                "format": PACK_FORMAT,
+                "version": PACK_VERSION,
+                "exported_at": datetime.now(timezone.utc).isoformat(),
+                "namespace": namespace,
+            }
+            f.write(json.dumps(header) + "\n")
+            for shard in self.shards:
+                for entry in shard.entries(namespace):
+                    f.write(json.dumps(entry, default=str) + "\n")
+                    count += 1
+        os.replace(tmp_path, path)
+        return count
+
+    def import_pack(self, path: Path) -> dict[str, int]:
+        """Load a pack written by :meth:`export_pack`.
+
+        Entries keep their original expiry; ones that have expired since
+        the export are skipped.
+
+        Raises:
+            ValueError: If ``path`` is not a pack of a supported version
+        """
+        imported = expired = 0
+        now = time.time()
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            try:
+                header = json.loads(f.readline())
+            except (json.JSONDecodeError, gzip.BadGzipFile) as e:
+                raise ValueError(f"{path} is not an LLM cache pack: {e}") from e
+            if header.get("format") != PACK_FORMAT or header.get("version") != PACK_VERSION:
+                raise ValueError(f"{path} is not a version {PACK_VERSION} LLM cache pack")
+            for line in f:
+                entry = json.loads(line)
+                expires_at = entry.get("expires_at")
+                if expires_at is not None and expires_at <= now:
+                    expired += 1
+                    continue
+                ttl = (int(expires_at - now) or 1) if expires_at is not None else 0
+                self._shard(entry["namespace"], entry["key"]).set(entry["namespace"], entry["key"], entry["value"], ttl)
+                imported += 1
+        return {"imported": imported, "expired": expired}
+
+
+class ResponseCache:
+    """One namespace of the response store, with the ``utils.cache.Cache`` interface.
+
+    Used by the LLM extractors. Honors ``settings.enable_caching`` like
+    ``Cache`` does.
+    """
+
+    def __init__(self, namespace: str, root: Path | None = None):
+        self.namespace = namespace
+        self._store = get_response_store(root)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if not settings.enable_caching:
+            return default
+        return self._store.get(self.namespace, key, default)
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        if not settings.enable_caching:
+            return
+        self._store.set(self.namespace, key, value, ttl)
+
+    def get_many(self, keys: list[str]) -> dict[str, Any]:
+        if not settings.enable_caching:
+            return {}
+        return self._store.get_many(self.namespace, keys)
+
+    def delete(self, key: str) -> None:
+        self._store.delete(self.namespace, key)
+
+    def clear(self) -> int:
+        return self._store.clear(self.namespace)
+
+    def exists(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def stats(self) -> dict[str, Any]:
+        return self._store.stats(self.namespace)
+
+
+# One store per root, shared by every namespace in the process.
+_stores: dict[Path, ResponseStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_response_store(root: Path | None = None) -> ResponseStore:
+    """Return the shared store rooted at ``root`` (default: settings.llm_cache_dir)."""
+    root = root or settings.llm_cache_dir
+    with _stores_lock:
+        store = _stores.get(root)
+        if store is None:
+            store = _stores[root] = ResponseStore(root)
+        return store
+
+
+def reset_for_tests() -> None:
+    """Close and forget every store."""
+    with _stores_lock:
+        for store in _stores.values():
+            store.close()
+        _stores.clear()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Command-line entry point: ``stats``, ``migrate``, ``pack export``, ``pack import``."""
+    parser = argparse.ArgumentParser(prog="registry-review-llm-cache", description="Manage the LLM response cache.")
+    parser.add_argument("--cache-dir", type=Path, default=None, help="LLM cache directory (default: settings)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("stats", help="Print entry counts and sizes")
+    commands.add_parser("migrate", help="Move legacy one-file-per-key responses into the store")
+    pack = commands.add_parser("pack", help="Move a warmed cache between hosts")
+    pack_commands = pack.add_subparsers(dest="pack_command", required=True)
+    export = pack_commands.add_parser("export", help="Write live entries to a pack file")
+    export.add_argument("path", type=Path)
+    export.add_argument("--namespace", default=None, help="Only this namespace (e.g. evidence)")
+    load = pack_commands.add_parser("import", help="Load a pack file into this host's store")
+    load.add_argument("path", type=Path)
+    args = parser.parse_args(argv)
+
+    store = get_response_store(args.cache_dir)
+    if args.command == "stats":
+        print(json.dumps(store.stats(), indent=2))
+    elif args.command == "migrate":
+        print(f"Migrated {store.migrate_legacy()} legacy responses into {store.directory}")
+    elif args.pack_command == "export":
+        print(f"Exported {store.export_pack(args.path, args.namespace)} entries to {args.path}")
+    else:
+        try:
+            result = store.import_pack(args.path)
+        except ValueError as e:
+            parser.error(str(e))
+        print(f"Imported {result['imported']} entries from {args.path} ({result['expired']} expired, skipped)")
+    store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,121 @@
+"""Single-flight de-duplication of identical in-flight LLM work.
+
+The response cache is written only after a response arrives, so two
+callers that ask the same question at the same time (the REST API and an
+MCP client running ``extract_evidence`` on one session, or two reviewers)
+both miss it and both pay for the call.
+
+:class:`SingleFlight` closes that window: the first caller for a key
+becomes the leader and runs the work in its own task; callers arriving
+with the same key while it runs await that task instead of starting
+their own, and all of them receive its result or its exception. The key
+is dropped as soon as the work finishes, so later callers go back to the
+cache (or a fresh call).
+
+Keys are namespaced by the caller:
+
+- ``evidence:<cache key>``: ``extract_evidence_with_llm`` coalesces the
+  whole miss path (call, parse, cache write) on its evidence cache key.
+- ``llm:<prompt hash>``: ``call_llm`` coalesces every other caller on a
+  hash of backend, model, system prompt, prompt and ``max_tokens``.
+
+The shared result object is handed to every caller; callers that mutate
+it must copy first.
+
+A caller that is cancelled stops waiting without disturbing the others;
+the work itself is cancelled only once nobody is waiting on it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Flight:
+    task: asyncio.Task
+    waiters: int = 0
+
+
+@dataclass
+class SingleFlight:
+    """Process-wide registry of in-flight work, keyed by request identity.
+
+    Attributes:
+        leaders: Keys whose work actually ran, per namespace.
+        coalesced: Callers that joined work already in flight, per namespace.
+    """
+
+    leaders: Counter = field(default_factory=Counter)
+    coalesced: Counter = field(default_factory=Counter)
+    _flights: dict[str, _Flight] = field(default_factory=dict, repr=False)
+
+    async def run(self, key: str, work: Callable[[], Awaitable[T]]) -> T:
+        """Return ``await work()``, sharing one execution among concurrent callers of ``key``."""
+        namespace = key.split(":", 1)[0]
+        flight = self._flights.get(key)
+        if flight is not None and flight.task.get_loop() is asyncio.get_running_loop():
+            self.coalesced[namespace] += 1
+            logger.debug(f"Coalesced in-flight LLM request {key[:48]}")
+        else:
+            flight = _Flight(task=asyncio.ensure_future(work()))
+            self._flights[key] = flight
+            self.leaders[namespace] += 1
+            flight.task.add_done_callback(lambda _task: self._forget(key, flight))
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()  # last one waiting: nobody needs the result
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _forget(self, key: str, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def telemetry(self) -> dict[str, Any]:
+        return {
+            "in_flight": len(self._flights),
+            "leaders": dict(self.leaders),
+            "coalesced": dict(self.coalesced),
+        }
+
+
+def prompt_key(*parts: object) -> str:
+    """Stable ``llm:`` key for a request made of ``parts``."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\x00")
+    return f"llm:{digest.hexdigest()}"
+
+
+_single_flight: SingleFlight | None = None
+
+
+def get_single_flight() -> SingleFlight:
+    """Return the process-wide single-flight registry, creating on first call."""
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
+
+
+def reset_for_tests() -> None:
+    """Drop the registry and its counters."""
+    global _single_flight
+    _single_flight = None
@@ -0,0 +1,192 @@
+"""Incremental parsing of streamed JSON-array responses.
+
+Evidence and date-extraction prompts answer with a JSON array of objects
+(possibly inside a markdown fence). Waiting for the whole completion, up
+to 4,000 output tokens, before parsing it meant no snippet could be
+verified, reported or acted on until the last one was written.
+
+:class:`JSONArrayStream` is fed the response text as ``call_llm_stream``
+(or an SDK stream) yields it and returns each array element as soon as
+its closing brace arrives. :func:`stream_json_array` drives it over an
+async iterator of text chunks, and records per-stream latency in
+:class:`StreamMetrics`:
+
+- time to first token: the call's first text chunk;
+- time to first item: its first complete array element (for evidence,
+  the first snippet);
+- streams closed early by their consumer (a requirement conclusively
+  covered before the response ended).
+
+The array starts at the first ``[`` of the response. Consumers still
+parse the complete text with their usual parser once the stream ends
+(``parser.text``), so a response the incremental parser reads
+differently never changes a result; streamed items are a preview that
+lets work start early.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Latency samples kept per metric.
+METRIC_WINDOW = 1000
+
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+class JSONArrayStream:
+    """Incremental parser for the top-level JSON array of a response.
+
+    Attributes:
+        text: Everything fed so far.
+        items: Elements parsed so far.
+        done: The array's closing bracket has arrived.
+        failed: An element was not valid JSON; no more items are returned.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.items: list[Any] = []
+        self.done = False
+        self.failed = False
+        self._pos = 0
+        self._started = False
+        self._stack: list[str] = []  # expected closing brackets inside the current element
+        self._in_string = False
+        self._escape = False
+        self._item_start: int | None = None
+
+    def feed(self, chunk: str) -> list[Any]:
+        """Add ``chunk``; return the elements it completed."""
+        self.text += chunk
+        completed: list[Any] = []
+        text = self.text
+        while self._pos < len(text) and not (self.done or self.failed):
+            char = text[self._pos]
+            if not self._started:
+                self._started = char == "["
+            elif self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+                if self._item_start is None:
+                    self._item_start = self._pos
+            elif char in _CLOSERS:
+                if self._item_start is None:
+                    self._item_start = self._pos
+                self._stack.append(_CLOSERS[char])
+            elif self._stack:
+                if char in "}]":
+                    if char != self._stack.pop():
+                        self.failed = True
+                    elif not self._stack:
+                        self._complete(self._pos + 1, completed)
+            elif char in ",]":
+                if self._item_start is not None:
+                    self._complete(self._pos, completed)
+                self.done = char == "]"
+            elif not char.isspace() and self._item_start is None:
+                self._item_start = self._pos  # a scalar element
+            self._pos += 1
+        return completed
+
+    def _complete(self, end: int, completed: list[Any]) -> None:
+        try:
+            item = json.loads(self.text[self._item_start : end])
+        except json.JSONDecodeError:
+            self.failed = True
+            return
+        self._item_start = None
+        self.items.append(item)
+        completed.append(item)
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+@dataclass
+class StreamMetrics:
+    """Latency of streamed responses, over the last ``METRIC_WINDOW`` streams."""
+
+    streams: int = 0
+    completed: int = 0
+    stopped_early: int = 0
+    first_token_seconds: deque = field(default_factory=lambda: deque(maxlen=METRIC_WINDOW))
+    first_item_seconds: deque = field(default_factory=lambda: deque(maxlen=METRIC_WINDOW))
+
+    def stats(self) -> dict[str, Any]:
+        report: dict[str, Any] = {
+            "streams": self.streams,
+            "completed": self.completed,
+            "stopped_early": self.stopped_early,
+        }
+        for name, samples in (("first_token", self.first_token_seconds), ("first_item", self.first_item_seconds)):
+            if samples:
+                values = list(samples)
+                report[f"time_to_{name}"] = {
+                    "mean": round(sum(values) / len(values), 3),
+                    "p50": round(_percentile(values, 0.5), 3),
+                    "p95": round(_percentile(values, 0.95), 3),
+                }
+        return report
+
+
+async def stream_json_array(chunks: AsyncIterator[str], parser: JSONArrayStream | None = None) -> AsyncIterator[Any]:
+    """Yield the elements of the JSON array in ``chunks`` as each one completes.
+
+    ``parser`` (default: a new one) is left holding the full text for the
+    consumer's final parse. Closing this generator early counts as a
+    stopped stream; the consumer is expected to close ``chunks`` too
+    (``call_llm_stream`` and the SDK streams cancel their request then).
+    """
+    parser = parser if parser is not None else JSONArrayStream()
+    metrics = get_stream_metrics()
+    metrics.streams += 1
+    started = time.monotonic()
+    first_token = first_item = True
+    try:
+        async for chunk in chunks:
+            if first_token and chunk:
+                metrics.first_token_seconds.append(time.monotonic() - started)
+                first_token = False
+            for item in parser.feed(chunk):
+                if first_item:
+                    metrics.first_item_seconds.append(time.monotonic() - started)
+                    first_item = False
+                yield item
+    except GeneratorExit:
+        metrics.stopped_early += 1
+        raise
+    metrics.completed += 1
+
+
+_metrics: StreamMetrics | None = None
+
+
+def get_stream_metrics() -> StreamMetrics:
+    """Return the process-wide stream metrics, creating them on first call."""
+    global _metrics
+    if _metrics is None:
+        _metrics = StreamMetrics()
+    return _metrics
+
+
+def reset_for_tests() -> None:
+    """Forget the recorded metrics."""
+    global _metrics
+    _metrics = None
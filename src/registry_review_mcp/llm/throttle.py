@@ -11,19 +11,45 @@ This module adds an explicit aggregate throttle:
 
 - :class:`Throttle`: holds semaphore depth + minimum interval.
 - :func:`acquire_slot`: async context manager callers wrap around a
-  backend call. Enforces semaphore depth and minimum monotonic interval.
+  backend call. Enforces the concurrency window and minimum monotonic
+  interval, and feeds the call's outcome back to the window.
 - :func:`get_throttle`: returns the process-wide throttle. Caches on
   first access so env vars are read once.
 - :func:`reset_for_tests`: clears the cached instance so unit tests
   can tweak env vars between cases without leaking state.
 
+Adaptive concurrency (AIMD):
+
+A fixed depth had to be hand-tuned per backend and still let 100-200
+504s through per run. Each backend now gets its own
+:class:`AdaptiveWindow`, a congestion window in the TCP sense:
+
+- additive increase: every successful call adds ``1 / window``, so the
+  window grows by one per window's worth of successes, but only while
+  latency stays within ``LATENCY_TOLERANCE`` of the best seen;
+- multiplicative decrease: a call that fails with a congestion error
+  (429, 5xx, timeout or connection error, per ``classify_api_error`` /
+  ``classify_openai_error`` / the CLI's classified category) halves the
+  window. Failures of calls admitted before the last cut belong to the
+  same congestion event and are not counted again.
+
+The window never exceeds ``LLM_MAX_CONCURRENT`` and never drops below 1.
+``LLM_MAX_CONCURRENT`` also stays the hard operator ceiling for the whole
+process: a call holds a slot in its backend's window and one of
+``LLM_MAX_CONCURRENT`` process-wide slots, so several backends together
+never run more calls than that.
+
 Env-configurable (read at first access):
 
-- ``LLM_MAX_CONCURRENT``: semaphore depth. Default 4.
+- ``LLM_MAX_CONCURRENT``: concurrency ceiling, per backend window and
+  process-wide. Default 4.
+- ``LLM_INITIAL_CONCURRENT``: starting window. Default ``min(2, ceiling)``.
+- ``LLM_ADAPTIVE``: ``0`` pins the window at the ceiling (the pre-AIMD
+  fixed semaphore). Default 1.
 - ``LLM_MIN_INTERVAL_MS``: minimum gap between successive acquisitions.
   Default 100 ms.
 
-Disable entirely with ``LLM_MAX_CONCURRENT=0``. Semaphore is not bound
+Disable entirely with ``LLM_MAX_CONCURRENT=0``. Concurrency is not bound
 but interval still fires if configured; set both to 0 for true disable.
 
 Telemetry:
@@ -33,15 +59,113 @@ Telemetry:
   quantify whether the throttle actually bit.
 - ``Throttle.calls_throttled``: count of acquisitions that had to wait
   for either the semaphore or the interval.
+- :meth:`Throttle.telemetry`: per-backend window, peak, in-flight count,
+  latency EWMA and backoff events.
 """
 
 from __future__ import annotations
 
 import asyncio
+import logging
 import os
 import time
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Grow only while the latency EWMA stays within this factor of the best seen.
+LATENCY_TOLERANCE = 2.0
+# Weight of the newest sample in the latency EWMA.
+LATENCY_EWMA_ALPHA = 0.2
+# Multiplicative-decrease factor on a congestion signal.
+BACKOFF_FACTOR = 0.5
+
+# Error categories (APIErrorInfo.category) that mean "slow down".
+_CONGESTION_CATEGORIES = {"rate_limit", "server", "network"}
+
+
+@dataclass
+class AdaptiveWindow:
+    """AIMD concurrency window for one backend.
+
+    Attributes:
+        ceiling: Hard upper bound (``LLM_MAX_CONCURRENT``).
+        window: Current allowed concurrency; fractional between increments.
+        adaptive: ``False`` pins ``window`` at ``ceiling``.
+        peak_window: Largest window reached.
+        in_flight: Calls currently holding a slot.
+        backoff_events: Multiplicative decreases applied.
+        successes / failures: Outcomes reported by :func:`acquire_slot`.
+        latency_ewma_ms: Smoothed latency of successful calls.
+        latency_floor_ms: Best (lowest) EWMA seen; the health baseline.
+    """
+
+    ceiling: int
+    window: float
+    adaptive: bool = True
+    peak_window: float = 0.0
+    in_flight: int = 0
+    backoff_events: int = 0
+    successes: int = 0
+    failures: int = 0
+    latency_ewma_ms: float | None = None
+    latency_floor_ms: float | None = None
+    # Incremented on every decrease; a slot remembers the epoch it entered in.
+    epoch: int = 0
+    _condition: asyncio.Condition | None = field(default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        self.window = float(max(1, min(self.ceiling, self.window)))
+        if not self.adaptive:
+            self.window = float(self.ceiling)
+        self.peak_window = self.window
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Slots currently admitted."""
+        return max(1, int(self.window))
+
+    def record_success(self, latency_ms: float) -> None:
+        self.successes += 1
+        if self.latency_ewma_ms is None:
+            self.latency_ewma_ms = latency_ms
+        else:
+            self.latency_ewma_ms += LATENCY_EWMA_ALPHA * (latency_ms - self.latency_ewma_ms)
+        if self.latency_floor_ms is None or self.latency_ewma_ms < self.latency_floor_ms:
+            self.latency_floor_ms = self.latency_ewma_ms
+
+        if not self.adaptive or self.window >= self.ceiling:
+            return
+        if self.latency_ewma_ms > LATENCY_TOLERANCE * self.latency_floor_ms:
+            return  # queueing at the backend: hold, don't probe for more
+        self.window = min(float(self.ceiling), self.window + 1.0 / self.window)
+        self.peak_window = max(self.peak_window, self.window)
+
+    def record_congestion(self, entry_epoch: int) -> bool:
+        """Apply a multiplicative decrease; returns False if already cut for this event."""
+        self.failures += 1
+        if not self.adaptive or entry_epoch != self.epoch:
+            return False
+        self.window = max(1.0, self.window * BACKOFF_FACTOR)
+        self.epoch += 1
+        self.backoff_events += 1
+        return True
+
+    def telemetry(self) -> dict[str, Any]:
+        return {
+            "window": round(self.window, 2),
+            "limit": self.limit,
+            "ceiling": self.ceiling,
+            "peak_window": round(self.peak_window, 2),
+            "in_flight": self.in_flight,
+            "backoff_events": self.backoff_events,
+            "successes": self.successes,
+            "failures": self.failures,
+            "latency_ewma_ms": round(self.latency_ewma_ms, 1) if self.latency_ewma_ms is not None else None,
+        }
 
 
 @dataclass
@@ -49,28 +173,60 @@ class Throttle:
     """Aggregate LLM-call throttle for a process.
 
     Attributes:
-        max_concurrent: Semaphore depth. ``0`` disables the semaphore.
+        max_concurrent: Concurrency ceiling, both for each backend's window
+            and for all backends together. ``0`` disables the concurrency
+            gate.
         min_interval_ms: Minimum monotonic gap between successive
             acquisitions. ``0`` disables the interval gate.
+        initial_concurrent: Starting window for each backend.
+        adaptive: Adjust each backend's window with AIMD; when ``False``
+            the window is fixed at ``max_concurrent``.
         active_permits_peak: High-water mark of simultaneously-held
             permits. Useful for the closing journal's telemetry.
         calls_throttled: Count of acquisitions that waited for either
-            the semaphore or the interval.
+            the concurrency window or the interval.
     """
 
     max_concurrent: int = 4
     min_interval_ms: int = 100
+    initial_concurrent: int | None = None
+    adaptive: bool = True
     active_permits_peak: int = 0
     calls_throttled: int = 0
-    _semaphore: asyncio.Semaphore | None = field(default=None, repr=False)
+    _windows: dict[str, AdaptiveWindow] = field(default_factory=dict, repr=False)
     _active_permits: int = field(default=0, repr=False)
     _last_entry_monotonic_ms: float = field(default=0.0, repr=False)
     _interval_lock: asyncio.Lock | None = field(default=None, repr=False)
+    _ceiling: asyncio.Semaphore | None = field(default=None, repr=False)
 
     def __post_init__(self) -> None:
-        if self.max_concurrent > 0:
-            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        if self.initial_concurrent is None:
+            self.initial_concurrent = min(2, self.max_concurrent)
         self._interval_lock = asyncio.Lock()
+        if self.max_concurrent > 0:
+            self._ceiling = asyncio.Semaphore(self.max_concurrent)
+
+    def window_for(self, backend: str) -> AdaptiveWindow | None:
+        """The backend's concurrency window, or None when the gate is disabled."""
+        if self.max_concurrent <= 0:
+            return None
+        window = self._windows.get(backend)
+        if window is None:
+            window = AdaptiveWindow(
+                ceiling=self.max_concurrent,
+                window=float(self.initial_concurrent or 1),
+                adaptive=self.adaptive,
+            )
+            self._windows[backend] = window
+        return window
+
+    def telemetry(self) -> dict[str, Any]:
+        """Aggregate counters plus each backend's window state."""
+        return {
+            "active_permits_peak": self.active_permits_peak,
+            "calls_throttled": self.calls_throttled,
+            "backends": {name: w.telemetry() for name, w in self._windows.items()},
+        }
 
 
 _throttle: Throttle | None = None
@@ -90,9 +246,12 @@ def get_throttle() -> Throttle:
     """Return the process-wide throttle instance, creating on first call."""
     global _throttle
     if _throttle is None:
+        max_concurrent = _read_env_int("LLM_MAX_CONCURRENT", 4)
         _throttle = Throttle(
-            max_concurrent=_read_env_int("LLM_MAX_CONCURRENT", 4),
+            max_concurrent=max_concurrent,
             min_interval_ms=_read_env_int("LLM_MIN_INTERVAL_MS", 100),
+            initial_concurrent=_read_env_int("LLM_INITIAL_CONCURRENT", min(2, max_concurrent)),
+            adaptive=_read_env_int("LLM_ADAPTIVE", 1) != 0,
         )
     return _throttle
 
@@ -107,26 +266,65 @@ def reset_for_tests() -> None:
     _throttle = None
 
 
+def is_congestion_error(error: BaseException, backend: str) -> bool:
+    """True when ``error`` says the backend is overloaded (429, 5xx, timeout).
+
+    Uses the same classifiers the callers use for user-facing guidance, so
+    "slow down" and "retry later" stay one decision.
+    """
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError)):
+        return True
+
+    from ..utils.llm_client import LLMBackendError, classify_api_error, classify_openai_error
+
+    if isinstance(error, LLMBackendError):
+        return (error.details or {}).get("category") in _CONGESTION_CATEGORIES
+
+    try:
+        info = classify_openai_error(error) if backend == "openai" else classify_api_error(error)
+    except ImportError:  # SDK for this backend not installed
+        return False
+    if info.category not in _CONGESTION_CATEGORIES:
+        return False
+    # "server" also covers 4xx responses without a dedicated SDK class (403, 404).
+    status = getattr(error, "status_code", None)
+    return info.category != "server" or status is None or status >= 500
+
+
 @asynccontextmanager
-async def acquire_slot():
+async def acquire_slot(backend: str = "default"):
     """Async context manager: acquire a throttle slot for one LLM call.
 
-    Holds a semaphore permit for the duration of the ``async with`` block
-    and enforces ``min_interval_ms`` between successive acquisitions
-    across the whole process.
+    Waits for room in ``backend``'s concurrency window for the duration of
+    the ``async with`` block and enforces ``min_interval_ms`` between
+    successive acquisitions across the whole process. The block's outcome
+    adjusts the window: success (with healthy latency) grows it, a
+    congestion error shrinks it.
     """
     t = get_throttle()
+    window = t.window_for(backend)
     entered_without_wait = True
 
-    # Semaphore gate: acquire before interval so we don't hold timing
-    # state for a permit we don't yet own.
-    if t._semaphore is not None:
-        # Fast path: try_acquire-ish — tests for instant acquisition.
-        if t._semaphore.locked():
-            entered_without_wait = False
-        await t._semaphore.acquire()
+    # Window gate: acquire before interval so we don't hold timing
+    # state for a slot we don't yet own.
+    if window is not None:
+        async with window._condition:
+            if window.in_flight >= window.limit:
+                entered_without_wait = False
+                await window._condition.wait_for(lambda: window.in_flight < window.limit)
+            window.in_flight += 1
+    entry_epoch = window.epoch if window is not None else 0
 
+    ceiling_held = False
     try:
+        # Process-wide ceiling: the windows adapt per backend, but together
+        # they never hold more than ``max_concurrent`` slots.
+        if window is not None and t._ceiling is not None:
+            if t._ceiling.locked():
+                entered_without_wait = False
+            await t._ceiling.acquire()
+            ceiling_held = True
+
         # Interval gate: serialized across the whole process.
         if t.min_interval_ms > 0 and t._interval_lock is not None:
             async with t._interval_lock:
@@ -144,8 +342,26 @@ async def acquire_slot():
         if not entered_without_wait:
             t.calls_throttled += 1
 
-        yield
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            if window is not None and is_congestion_error(e, backend):
+                if window.record_congestion(entry_epoch):
+                    logger.warning(
+                        f"LLM backend '{backend}' congested ({type(e).__name__}); "
+                        f"concurrency window cut to {window.limit}"
+                    )
+            raise
+        else:
+            if window is not None:
+                window.record_success((time.monotonic() - started) * 1000.0)
+        finally:
+            t._active_permits -= 1
     finally:
-        t._active_permits -= 1
-        if t._semaphore is not None:
-            t._semaphore.release()
+        if ceiling_held:
+            t._ceiling.release()
+        if window is not None:
+            async with window._condition:
+                window.in_flight -= 1
+                window._condition.notify_all()
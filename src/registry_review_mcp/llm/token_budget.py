@@ -0,0 +1,331 @@
+"""Token-per-minute scheduler — the token gate in front of the throttle.
+
+:mod:`throttle` bounds how many calls are in flight and how closely they
+are spaced, but provider quotas are metered in input and output tokens
+per minute: one 80K-char project-plan prompt costs as much as twenty
+snippet prompts, so a request-count limit either starves small calls or
+lets large ones blow the quota.
+
+This module charges each ``call_llm`` against two token buckets before
+the call may take a throttle slot:
+
+- :class:`TokenBucket`: refills continuously at ``per_minute / 60``
+  tokens per second up to one minute's worth. It may go negative when a
+  call turns out to cost more than was reserved; later calls wait out
+  the debt.
+- :class:`TokenScheduler`: estimates the prompt's input tokens from its
+  char count (the unit :class:`~.prompt_budget.PromptBudget` measures
+  in) and its output tokens from recent responses, then admits the call
+  once both buckets can cover it. Waiting calls are served by priority
+  class, FIFO within a class, so an interactive REST call jumps ahead of
+  queued bulk evidence extraction.
+- :func:`reserve_tokens`: async context manager ``call_llm`` wraps
+  around the throttle. Backends report the provider's real ``usage``
+  through :func:`record_usage`; on exit the reservation is settled
+  (over-estimates refunded, under-estimates charged) and the
+  chars-per-token ratio is recalibrated.
+- :func:`llm_priority`: context manager that sets the priority class
+  for every LLM call made inside it, including from tasks spawned
+  inside it.
+
+Env-configurable (read at first access):
+
+- ``LLM_INPUT_TOKENS_PER_MINUTE``: input-token budget. Default 0.
+- ``LLM_OUTPUT_TOKENS_PER_MINUTE``: output-token budget. Default 0.
+
+``0`` disables that bucket; with both at 0 calls are admitted
+immediately, but usage is still recorded for calibration and telemetry.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from .throttle import _read_env_int
+
+logger = logging.getLogger(__name__)
+
+# Priority classes, most urgent first.
+PRIORITIES: dict[str, int] = {"interactive": 0, "default": 1, "bulk": 2}
+
+# Starting chars-per-token estimate for English prose/markdown, before any
+# real usage has been observed.
+DEFAULT_CHARS_PER_TOKEN = 4.0
+# Calibrated ratio is kept inside this range so one odd sample (a table of
+# digits, an empty completion) cannot skew every later estimate.
+MIN_CHARS_PER_TOKEN = 1.0
+MAX_CHARS_PER_TOKEN = 10.0
+# Weight of the newest sample in the calibration EWMAs.
+CALIBRATION_EWMA_ALPHA = 0.2
+
+_priority: ContextVar[str] = ContextVar("llm_priority", default="default")
+_reservation: ContextVar[Reservation | None] = ContextVar("llm_token_reservation", default=None)
+
+
+@contextmanager
+def llm_priority(priority: str) -> Iterator[None]:
+    """Run LLM calls inside the block at ``priority`` (see :data:`PRIORITIES`)."""
+    if priority not in PRIORITIES:
+        raise ValueError(f"Unknown LLM priority {priority!r}; expected one of {sorted(PRIORITIES)}")
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> str:
+    return _priority.get()
+
+
+@dataclass
+class TokenBucket:
+    """Continuously refilling token bucket holding up to one minute of budget."""
+
+    per_minute: int
+    level: float = field(default=-1.0)
+    _updated: float = field(default_factory=time.monotonic, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.level < 0:
+            self.level = float(self.per_minute)
+
+    @property
+    def capacity(self) -> int:
+        return self.per_minute
+
+    def refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self.level = min(float(self.capacity), self.level + elapsed * self.per_minute / 60.0)
+        self._updated = now
+
+    def seconds_until(self, amount: int, now: float) -> float:
+        """Seconds until ``amount`` tokens are available (0 when they already are)."""
+        self.refill(now)
+        shortfall = amount - self.level
+        return 0.0 if shortfall <= 0 else shortfall * 60.0 / self.per_minute
+
+    def charge(self, amount: float) -> None:
+        self.level = min(float(self.capacity), self.level - amount)
+
+
+@dataclass
+class Reservation:
+    """Tokens charged for one admitted call, plus the usage it reported."""
+
+    prompt_chars: int
+    input_tokens: int
+    output_tokens: int
+    priority: str
+    actual_input_tokens: int | None = None
+    actual_output_tokens: int | None = None
+    # Cache reads are prompt tokens (they calibrate chars-per-token) but
+    # providers do not meter them against the input-token rate limit.
+    actual_cache_read_tokens: int = 0
+
+
+class TokenScheduler:
+    """Admits LLM calls against input/output tokens-per-minute budgets."""
+
+    def __init__(self, input_tokens_per_minute: int = 0, output_tokens_per_minute: int = 0):
+        self.input = TokenBucket(input_tokens_per_minute) if input_tokens_per_minute > 0 else None
+        self.output = TokenBucket(output_tokens_per_minute) if output_tokens_per_minute > 0 else None
+        self.chars_per_token = DEFAULT_CHARS_PER_TOKEN
+        self.output_tokens_ewma: float | None = None
+        self.calibration_samples = 0
+        self.admitted: dict[str, int] = dict.fromkeys(PRIORITIES, 0)
+        self.waited: dict[str, int] = dict.fromkeys(PRIORITIES, 0)
+        self.wait_seconds: dict[str, float] = dict.fromkeys(PRIORITIES, 0.0)
+        self._queue: list[tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._condition = asyncio.Condition()
+
+    @property
+    def enabled(self) -> bool:
+        return self.input is not None or self.output is not None
+
+    def estimate_input_tokens(self, prompt_chars: int) -> int:
+        return max(1, round(prompt_chars / self.chars_per_token))
+
+    def estimate_output_tokens(self, max_tokens: int) -> int:
+        """Recent average completion size, never more than ``max_tokens``."""
+        if self.output_tokens_ewma is None:
+            return max_tokens
+        return max(1, min(max_tokens, round(self.output_tokens_ewma)))
+
+    def _delay(self, reservation: Reservation, now: float) -> float:
+        delay = 0.0
+        if self.input is not None:
+            delay = max(delay, self.input.seconds_until(reservation.input_tokens, now))
+        if self.output is not None:
+            delay = max(delay, self.output.seconds_until(reservation.output_tokens, now))
+        return delay
+
+    async def acquire(self, prompt_chars: int, max_tokens: int, priority: str = "default") -> Reservation:
+        """Wait until the call's estimated tokens fit, then charge them."""
+        reservation = Reservation(
+            prompt_chars=prompt_chars,
+            input_tokens=self.estimate_input_tokens(prompt_chars),
+            output_tokens=self.estimate_output_tokens(max_tokens),
+            priority=priority,
+        )
+        if not self.enabled:
+            self.admitted[priority] += 1
+            return reservation
+
+        # A prompt bigger than a whole minute's budget still has to run
+        # eventually: cap what it waits for at the bucket capacity, and let
+        # settlement charge the rest as debt.
+        if self.input is not None:
+            reservation.input_tokens = min(reservation.input_tokens, self.input.capacity)
+        if self.output is not None:
+            reservation.output_tokens = min(reservation.output_tokens, self.output.capacity)
+
+        entry = (PRIORITIES[priority], next(self._sequence))
+        started = time.monotonic()
+        waited = False
+        async with self._condition:
+            heapq.heappush(self._queue, entry)
+            try:
+                while True:
+                    # Only the head of the queue may take tokens; everyone
+                    # else waits to be woken when the head changes.
+                    delay = self._delay(reservation, time.monotonic()) if self._queue[0] == entry else None
+                    if delay == 0.0:
+                        break
+                    waited = True
+                    try:
+                        await asyncio.wait_for(self._condition.wait(), timeout=delay)
+                    except (asyncio.TimeoutError, TimeoutError):
+                        pass
+                if self.input is not None:
+                    self.input.charge(reservation.input_tokens)
+                if self.output is not None:
+                    self.output.charge(reservation.output_tokens)
+            finally:
+                if self._queue and self._queue[0] == entry:
+                    heapq.heappop(self._queue)
+                elif entry in self._queue:
+                    self._queue.remove(entry)
+                    heapq.heapify(self._queue)
+                self._condition.notify_all()
+
+        self.admitted[priority] += 1
+        if waited:
+            self.waited[priority] += 1
+            self.wait_seconds[priority] += time.monotonic() - started
+        return reservation
+
+    async def settle(self, reservation: Reservation) -> None:
+        """Reconcile a finished call's reservation with its reported usage.
+
+        Calls that reported no usage (CLI backend, failed requests) keep
+        their estimate charged.
+        """
+        if reservation.actual_input_tokens is not None:
+            prompt_tokens = reservation.actual_input_tokens + reservation.actual_cache_read_tokens
+            if prompt_tokens > 0 and reservation.prompt_chars > 0:
+                sample = reservation.prompt_chars / prompt_tokens
+                self.chars_per_token += CALIBRATION_EWMA_ALPHA * (sample - self.chars_per_token)
+                self.chars_per_token = min(MAX_CHARS_PER_TOKEN, max(MIN_CHARS_PER_TOKEN, self.chars_per_token))
+                self.calibration_samples += 1
+        if reservation.actual_output_tokens is not None:
+            if self.output_tokens_ewma is None:
+                self.output_tokens_ewma = float(reservation.actual_output_tokens)
+            else:
+                self.output_tokens_ewma += CALIBRATION_EWMA_ALPHA * (
+                    reservation.actual_output_tokens - self.output_tokens_ewma
+                )
+
+        if not self.enabled:
+            return
+        now = time.monotonic()
+        if self.input is not None and reservation.actual_input_tokens is not None:
+            self.input.refill(now)
+            self.input.charge(reservation.actual_input_tokens - reservation.input_tokens)
+        if self.output is not None and reservation.actual_output_tokens is not None:
+            self.output.refill(now)
+            self.output.charge(reservation.actual_output_tokens - reservation.output_tokens)
+        # A refund may let the head of the queue in early.
+        async with self._condition:
+            self._condition.notify_all()
+
+    def telemetry(self) -> dict[str, Any]:
+        now = time.monotonic()
+        buckets: dict[str, Any] = {}
+        for name, bucket in (("input", self.input), ("output", self.output)):
+            if bucket is not None:
+                bucket.refill(now)
+                buckets[name] = {"per_minute": bucket.per_minute, "available": round(bucket.level)}
+        return {
+            "buckets": buckets,
+            "chars_per_token": round(self.chars_per_token, 2),
+            "output_tokens_ewma": round(self.output_tokens_ewma) if self.output_tokens_ewma is not None else None,
+            "calibration_samples": self.calibration_samples,
+            "queued": len(self._queue),
+            "admitted": dict(self.admitted),
+            "waited": dict(self.waited),
+            "wait_seconds": {k: round(v, 3) for k, v in self.wait_seconds.items()},
+        }
+
+
+_scheduler: TokenScheduler | None = None
+
+
+def get_token_scheduler() -> TokenScheduler:
+    """Return the process-wide token scheduler, creating on first call."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = TokenScheduler(
+            input_tokens_per_minute=_read_env_int("LLM_INPUT_TOKENS_PER_MINUTE", 0),
+            output_tokens_per_minute=_read_env_int("LLM_OUTPUT_TOKENS_PER_MINUTE", 0),
+        )
+    return _scheduler
+
+
+def reset_for_tests() -> None:
+    """Drop the cached scheduler so env var changes re-read cleanly."""
+    global _scheduler
+    _scheduler = None
+
+
+def record_usage(input_tokens: int, output_tokens: int, cache_read_tokens: int = 0) -> None:
+    """Report the provider's usage for the call in progress.
+
+    Backends call this with the response's ``usage``. ``input_tokens``
+    counts everything metered against the input rate limit (for
+    Anthropic, uncached plus cache-write tokens). No-op outside
+    :func:`reserve_tokens`.
+    """
+    reservation = _reservation.get()
+    if reservation is None:
+        return
+    reservation.actual_input_tokens = input_tokens
+    reservation.actual_output_tokens = output_tokens
+    reservation.actual_cache_read_tokens = cache_read_tokens
+
+
+@asynccontextmanager
+async def reserve_tokens(prompt_chars: int, max_tokens: int):
+    """Async context manager: hold a token reservation for one LLM call.
+
+    Waits for budget at the caller's :func:`llm_priority`, and settles the
+    reservation against :func:`record_usage` when the block exits.
+    """
+    scheduler = get_token_scheduler()
+    reservation = await scheduler.acquire(prompt_chars, max_tokens, current_priority())
+    token = _reservation.set(reservation)
+    try:
+        yield reservation
+    finally:
+        _reservation.reset(token)
+        await scheduler.settle(reservation)
@@ -14,13 +14,18 @@ Phase 4.1 Net Gain: ~26,080 additional chars saved (93% reduction on new modules
 Total Reduction: 134,827 chars (91% overall reduction in extraction logic)
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    from ..llm.prompt_budget import PromptBudget
+
 # === Response Schema ===
 
 
@@ -469,6 +474,10 @@ You MUST return your analysis as JSON matching this EXACT schema.
 # === LLM Call Function ===
 
 
+# Output ceiling of one unified analysis call (whole set or one shard).
+ANALYSIS_MAX_TOKENS = 16000
+
+
 async def analyze_with_llm(
     documents: list[dict[str, Any]],
     markdown_contents: dict[str, str],
@@ -509,7 +518,7 @@ async def analyze_with_llm(
             prompt=prompt,
             system=SYSTEM_PROMPT,
             model=settings.get_active_llm_model(),
-            max_tokens=16000,
+            max_tokens=ANALYSIS_MAX_TOKENS,
         )
 
         # Log first 1000 chars for debugging
@@ -538,3 +547,244 @@ async def analyze_with_llm(
         )
     except Exception as e:
         raise DocumentExtractionError(f"LLM analysis failed: {str(e)}", details={"error_type": type(e).__name__})
+
+
+# === Sharded Analysis ===
+#
+# One prompt holding every document hits context limits on large
+# submissions and makes a single 10+ minute call that loses everything if
+# it fails. Sharded analysis splits the documents into groups whose prompts
+# fit the prompt budget, analyzes the groups concurrently (call_llm's
+# throttle bounds how many run at once) and merges the results with
+# merge_unified_results. Each shard's result is cached under a hash of its
+# prompt, so a retry after a failure re-runs only the failed shards.
+
+_STATUS_RANK = {"covered": 2, "partial": 1, "missing": 0}
+_CHECK_RANK = {"fail": 2, "warning": 1, "pass": 0}
+
+
+def _shard_markdown(documents: list[dict[str, Any]], markdown_contents: dict[str, str]) -> dict[str, str]:
+    return {doc["document_id"]: markdown_contents.get(doc["document_id"], "") for doc in documents}
+
+
+def plan_document_shards(
+    documents: list[dict[str, Any]],
+    markdown_contents: dict[str, str],
+    requirements: list[dict[str, Any]],
+    max_total_chars: int,
+) -> list[list[dict[str, Any]]]:
+    """Group documents, in order, into shards whose prompts fit ``max_total_chars``.
+
+    A document too large for a shard of its own still gets one (its
+    markdown is already capped by ``format_documents``).
+    """
+    shards: list[list[dict[str, Any]]] = []
+    current: list[dict[str, Any]] = []
+    for doc in documents:
+        candidate = current + [doc]
+        prompt = build_unified_analysis_prompt(candidate, _shard_markdown(candidate, markdown_contents), requirements)
+        if current and len(prompt) > max_total_chars:
+            shards.append(current)
+            candidate = [doc]
+        current = candidate
+    if current or not shards:
+        shards.append(current)
+    return shards
+
+
+def _shard_cache_key(prompt: str, model: str) -> str:
+    """Cache key for one shard: its prompt, the system prompt and the model."""
+    from ..config.settings import settings
+
+    cache_input = {
+        "prompt_hash": hashlib.sha256(prompt.encode()).hexdigest(),
+        "system_hash": hashlib.sha256(SYSTEM_PROMPT.encode()).hexdigest()[:16],
+        "model": model,
+        "temperature": settings.llm_temperature,
+        "max_tokens": ANALYSIS_MAX_TOKENS,
+    }
+    return hashlib.sha256(json.dumps(cache_input, sort_keys=True).encode()).hexdigest()[:16]
+
+
+async def _analyze_shard(
+    documents: list[dict[str, Any]],
+    markdown_contents: dict[str, str],
+    requirements: list[dict[str, Any]],
+) -> UnifiedAnalysisResult:
+    """Analyze one shard, from the response store when it has been analyzed before."""
+    from ..config.settings import settings
+    from ..llm.response_store import UNIFIED_ANALYSIS_NAMESPACE, get_response_store
+
+    logger = logging.getLogger(__name__)
+    shard_markdown = _shard_markdown(documents, markdown_contents)
+    prompt = build_unified_analysis_prompt(documents, shard_markdown, requirements)
+    cache_key = _shard_cache_key(prompt, settings.get_active_executor_model())
+
+    if settings.llm_cache_enabled:
+        try:
+            cached = get_response_store(settings.llm_cache_dir).get(UNIFIED_ANALYSIS_NAMESPACE, cache_key)
+            if cached is not None:
+                logger.info(f"Unified analysis shard cache hit ({len(documents)} documents)")
+                return UnifiedAnalysisResult(**cached)
+        except Exception as e:
+            logger.warning(f"Shard cache load failed for {cache_key}: {e}")
+
+    result = await analyze_with_llm(documents, shard_markdown, requirements)
+
+    if settings.llm_cache_enabled:
+        try:
+            get_response_store(settings.llm_cache_dir).set(
+                UNIFIED_ANALYSIS_NAMESPACE, cache_key, result.model_dump(), settings.llm_cache_ttl
+            )
+        except Exception as e:
+            logger.warning(f"Shard cache save failed for {cache_key}: {e}")
+    return result
+
+
+async def analyze_sharded(
+    documents: list[dict[str, Any]],
+    markdown_contents: dict[str, str],
+    requirements: list[dict[str, Any]],
+    budget: "PromptBudget | None" = None,
+) -> UnifiedAnalysisResult:
+    """Perform unified analysis over budget-sized document shards.
+
+    Documents that fit one prompt are analyzed in a single call, exactly
+    as ``analyze_with_llm`` would. Every shard runs to completion before a
+    failure is raised, so the shards that succeeded are cached for the
+    retry.
+
+    Args:
+        documents: Document metadata
+        markdown_contents: Full markdown for each document
+        requirements: Requirements checklist
+        budget: Prompt budget (default: ``PromptBudget()``)
+
+    Returns:
+        Merged analysis result
+
+    Raises:
+        DocumentExtractionError: If the analysis of any shard fails
+    """
+    from ..llm.prompt_budget import default_budget
+
+    budget = budget or default_budget()
+    shards = plan_document_shards(documents, markdown_contents, requirements, budget.max_total_chars)
+    if len(shards) > 1:
+        logging.getLogger(__name__).info(
+            f"Unified analysis split into {len(shards)} shards of {[len(shard) for shard in shards]} documents"
+        )
+
+    outcomes = await asyncio.gather(
+        *(_analyze_shard(shard, markdown_contents, requirements) for shard in shards), return_exceptions=True
+    )
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
+    return merge_unified_results(outcomes, requirements)
+
+
+def _merge_requirement(entries: list[RequirementEvidence]) -> RequirementEvidence:
+    """Combine one requirement's evidence from several shards, strongest first."""
+    ranked = sorted(entries, key=lambda e: (-_STATUS_RANK.get(e.status, 0), -e.confidence))
+    best = ranked[0]
+
+    mapped: dict[str, MappedDocument] = {}
+    for entry in ranked:
+        for doc in entry.mapped_documents:
+            if doc.document_id not in mapped or doc.relevance_score > mapped[doc.document_id].relevance_score:
+                mapped[doc.document_id] = doc
+    notes = list(dict.fromkeys(entry.notes for entry in ranked if entry.notes))
+
+    return RequirementEvidence(
+        requirement_id=best.requirement_id,
+        status=best.status,
+        confidence=best.confidence,
+        mapped_documents=list(mapped.values()),
+        evidence_snippets=[snippet for entry in ranked for snippet in entry.evidence_snippets],
+        notes="\n".join(notes) or None,
+    )
+
+
+def _merge_metadata(results: list[UnifiedAnalysisResult]) -> ProjectMetadata:
+    """Take each metadata field from the most confident shard that found it."""
+    ranked = sorted((r.project_metadata for r in results), key=lambda m: -m.confidence)
+    values = {
+        name: next((getattr(m, name) for m in ranked if getattr(m, name) is not None), None)
+        for name in ProjectMetadata.model_fields
+        if name != "confidence"
+    }
+    return ProjectMetadata(**values, confidence=ranked[0].confidence)
+
+
+def _merge_prior_review(results: list[UnifiedAnalysisResult]) -> PriorReviewStatus | None:
+    """A prior review found by any shard wins; otherwise the most confident negative."""
+    statuses = [r.prior_review_status for r in results if r.prior_review_status is not None]
+    found = [s for s in statuses if s.has_prior_review]
+    candidates = found or statuses
+    return max(candidates, key=lambda s: s.confidence) if candidates else None
+
+
+def merge_unified_results(
+    results: list[UnifiedAnalysisResult], requirements: list[dict[str, Any]]
+) -> UnifiedAnalysisResult:
+    """Merge per-shard results into one, deterministically.
+
+    - Requirement evidence: a requirement takes the strongest status
+      (covered > partial > missing) and its confidence; mapped documents,
+      snippets and notes are combined, strongest shard first. Evidence is
+      ordered as in the checklist, and the coverage counts are recomputed.
+    - Extracted fields: the most confident value per field; differing
+      values across shards are flagged.
+    - Validation checks: the worst status per check type.
+    - Metadata and prior review: see ``_merge_metadata`` and
+      ``_merge_prior_review``.
+
+    Ties go to the earlier shard. A single result is returned unchanged.
+    """
+    if len(results) == 1:
+        return results[0]
+
+    order = {req["requirement_id"]: i for i, req in enumerate(requirements)}
+    by_requirement: dict[str, list[RequirementEvidence]] = {}
+    for result in results:
+        for entry in result.requirements_evidence:
+            by_requirement.setdefault(entry.requirement_id, []).append(entry)
+    evidence = [
+        _merge_requirement(entries)
+        for _, entries in sorted(by_requirement.items(), key=lambda item: (order.get(item[0], len(order)), item[0]))
+    ]
+    covered = sum(1 for e in evidence if e.status == "covered")
+    partial = sum(1 for e in evidence if e.status == "partial")
+    missing = sum(1 for e in evidence if e.status == "missing")
+
+    fields: dict[str, list[ExtractedField]] = {}
+    for result in results:
+        for extracted in result.extracted_fields:
+            fields.setdefault(extracted.field_name, []).append(extracted)
+    flagged = [item for result in results for item in result.flagged_items]
+    for name, candidates in fields.items():
+        distinct = dict.fromkeys(c.field_value.strip() for c in candidates)
+        if len({value.casefold() for value in distinct}) > 1:
+            flagged.append(f"Conflicting values for {name} across documents: {', '.join(distinct)}")
+
+    checks: dict[str, ValidationCheck] = {}
+    for result in results:
+        for check in result.validation_checks:
+            current = checks.get(check.check_type)
+            if current is None or _CHECK_RANK.get(check.status, 0) > _CHECK_RANK.get(current.status, 0):
+                checks[check.check_type] = check
+
+    return UnifiedAnalysisResult(
+        requirements_evidence=evidence,
+        requirements_covered=covered,
+        requirements_partial=partial,
+        requirements_missing=missing,
+        overall_coverage=(covered + partial * 0.5) / len(evidence) if evidence else 0.0,
+        extracted_fields=[max(candidates, key=lambda c: c.confidence) for candidates in fields.values()],
+        validation_checks=list(checks.values()),
+        project_metadata=_merge_metadata(results),
+        prior_review_status=_merge_prior_review(results),
+        overall_assessment="\n\n".join(dict.fromkeys(r.overall_assessment for r in results if r.overall_assessment)),
+        flagged_items=list(dict.fromkeys(flagged)),
+    )
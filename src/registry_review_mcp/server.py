@@ -419,7 +419,7 @@ async def get_mapping_status(session_id: str) -> str:
 
 @mcp.tool()
 @with_error_handling("extract_evidence")
-async def extract_evidence(session_id: str) -> str:
+async def extract_evidence(session_id: str, resume: bool = True, incremental: bool = False) -> str:
     """Extract evidence for all requirements from mapped documents.
 
     This tool extracts evidence snippets with page citations from documents
@@ -427,16 +427,43 @@ async def extract_evidence(session_id: str) -> str:
 
     Args:
         session_id: Unique session identifier
+        resume: Reuse requirements already checkpointed for the same inputs
+            by an earlier (possibly interrupted) run. False re-extracts all.
+        incremental: After adding or changing documents, re-extract only the
+            requirement/document pairs whose inputs changed, then refresh
+            validation and existing reports.
 
     Returns:
         Summary of evidence extraction results with coverage statistics
     """
-    from .tools.evidence_tools import extract_all_evidence
+    from .tools.evidence_tools import extract_all_evidence, extract_evidence_incremental
 
-    results = await extract_all_evidence(session_id)
+    if incremental:
+        results = await extract_evidence_incremental(session_id)
+    else:
+        results = await extract_all_evidence(session_id, resume=resume)
     return json.dumps(results, indent=2)
 
 
+@mcp.tool()
+@with_error_handling("get_evidence_status")
+async def get_evidence_status(session_id: str) -> str:
+    """Get progress of the current or last evidence extraction run.
+
+    Counts advance as each requirement is checkpointed, so this can be
+    polled while extract_evidence is still running.
+
+    Args:
+        session_id: Unique session identifier
+
+    Returns:
+        Completed/remaining requirement counts and coverage so far
+    """
+    from .tools.evidence_tools import get_evidence_progress
+
+    return json.dumps(get_evidence_progress(session_id), indent=2)
+
+
 @mcp.tool()
 @with_error_handling("map_requirement")
 async def map_requirement(session_id: str, requirement_id: str) -> str:
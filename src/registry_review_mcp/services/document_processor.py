@@ -11,6 +11,7 @@ Architecture:
               HQ Available → Upgrade quality
 """
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -19,6 +20,7 @@ from typing import Any
 
 import psutil
 
+from ..config.settings import settings
 from ..utils.state import get_session_or_raise
 
 logger = logging.getLogger(__name__)
@@ -70,6 +72,57 @@ class ConversionStatus:
     message: str
 
 
+def _apply_fast_outcome(doc: dict[str, Any], result: dict[str, Any] | None, error: Exception | None) -> None:
+    """Record a fast-extraction outcome on a ``documents.json`` record."""
+    from ..utils.patterns import SPREADSHEET_EXTENSIONS
+
+    if result is None:
+        doc["fast_status"] = "failed"
+        doc["fast_error"] = str(error)
+        return
+
+    doc["fast_status"] = "complete"
+    doc.pop("fast_error", None)
+    doc["fast_markdown_path"] = result["fast_markdown_path"]
+    doc["fast_extracted_at"] = datetime.now(timezone.utc).isoformat()
+    doc["fast_page_count"] = result["page_count"]
+    doc["fast_char_count"] = result["total_chars"]
+
+    # Set as active markdown
+    if not doc.get("hq_status") == "complete":
+        doc["has_markdown"] = True
+        doc["markdown_path"] = result["fast_markdown_path"]
+        doc["active_quality"] = "fast"
+
+    # Spreadsheets don't need HQ conversion — they're already structured
+    if Path(doc["filepath"]).suffix.lower() in SPREADSHEET_EXTENSIONS:
+        doc["hq_status"] = "not_applicable"
+    elif "hq_status" not in doc:
+        doc["hq_status"] = "pending"
+
+
+def _select_streamed_pdfs(filepaths: list[str]) -> list[str]:
+    """Return the PDFs long enough to warrant page-sharded streaming extraction."""
+    threshold = settings.fast_extraction_shard_min_pages
+    if threshold <= 0:
+        return []
+
+    from ..extractors.fast_extractor import pdf_page_count
+
+    selected = []
+    for filepath in filepaths:
+        if Path(filepath).suffix.lower() != ".pdf":
+            continue
+        try:
+            if pdf_page_count(filepath) >= threshold:
+                selected.append(filepath)
+        except Exception:
+            # Unreadable here means unreadable in the pool too; let the
+            # regular path record the failure.
+            continue
+    return selected
+
+
 class DocumentProcessor:
     """Orchestrates dual-track PDF extraction for a session.
 
@@ -102,14 +155,25 @@ class DocumentProcessor:
         Spreadsheets are already structured data so they only need one
         extraction pass — no HQ conversion is applicable.
 
+        Documents are fanned out across the extraction process pool and
+        handled in the order they finish. A failure is recorded on that
+        document only; the rest of the batch carries on. ``documents.json``
+        is written once, after the whole batch, with the results merged into
+        a fresh read so concurrent writers (e.g. a running HQ job) are not
+        clobbered.
+
+        PDFs of ``settings.fast_extraction_shard_min_pages`` pages or more
+        are instead split into page windows and streamed to their
+        ``.fast.md`` (see ``fast_extractor.stream_fast_extract_pdf``).
+
         Args:
             document_ids: Specific documents to process. If None, process all extractable files.
 
         Returns:
             Summary of extraction results
         """
-        from ..extractors.fast_extractor import fast_extract_pdf
-        from ..extractors.spreadsheet_extractor import extract_spreadsheet
+        from ..extractors.extraction_pool import iter_extractions
+        from ..extractors.fast_extractor import stream_fast_extract_pdf
         from ..utils.patterns import SPREADSHEET_EXTENSIONS
 
         # Get fresh state for this operation
@@ -141,45 +205,29 @@ class DocumentProcessor:
         print(f"⚡ Fast extracting {len(to_process)} document(s)...", flush=True)
 
         results = {"successful": 0, "failed": 0, "documents": []}
-
-        for i, doc in enumerate(to_process, 1):
+        docs_by_path = {doc["filepath"]: doc for doc in to_process}
+        # document_id -> (result, error); applied to documents.json in one write
+        outcomes: dict[str, tuple[dict[str, Any] | None, Exception | None]] = {}
+
+        # Very large PDFs are sharded by page window and streamed to disk
+        # rather than fanned out whole, so one 400-page report cannot hold
+        # a worker (and the parent) at several GB of page chunks.
+        streamed_paths = await asyncio.to_thread(_select_streamed_pdfs, list(docs_by_path))
+        pooled_paths = [path for path in docs_by_path if path not in streamed_paths]
+
+        completed = 0
+
+        def record(filepath: str, result: dict[str, Any] | None, error: Exception | None) -> None:
+            nonlocal completed
+            completed += 1
+            doc = docs_by_path[filepath]
             doc_id = doc["document_id"]
-            filepath = doc["filepath"]
             filename = Path(filepath).name
-            suffix = Path(filepath).suffix.lower()
-
-            print(f"  [{i}/{len(to_process)}] {filename}...", flush=True, end=" ")
+            progress = f"  [{completed}/{len(to_process)}] {filename}..."
 
-            try:
-                if suffix in SPREADSHEET_EXTENSIONS:
-                    result = await extract_spreadsheet(filepath)
-                else:
-                    result = await fast_extract_pdf(filepath)
-
-                # Save markdown alongside the source file
-                src_path = Path(filepath)
-                fast_md_path = src_path.with_suffix(".fast.md")
-                fast_md_path.write_text(result["markdown"], encoding="utf-8")
-
-                # Update document record
-                doc["fast_status"] = "complete"
-                doc["fast_markdown_path"] = str(fast_md_path)
-                doc["fast_extracted_at"] = datetime.now(timezone.utc).isoformat()
-                doc["fast_page_count"] = result["page_count"]
-                doc["fast_char_count"] = result["total_chars"]
-
-                # Set as active markdown
-                if not doc.get("hq_status") == "complete":
-                    doc["has_markdown"] = True
-                    doc["markdown_path"] = str(fast_md_path)
-                    doc["active_quality"] = "fast"
-
-                # Spreadsheets don't need HQ conversion — they're already structured
-                if suffix in SPREADSHEET_EXTENSIONS:
-                    doc["hq_status"] = "not_applicable"
-                elif "hq_status" not in doc:
-                    doc["hq_status"] = "pending"
+            outcomes[doc_id] = (result, error)
 
+            if result is not None:
                 results["successful"] += 1
                 results["documents"].append(
                     {
@@ -189,18 +237,40 @@ class DocumentProcessor:
                         "pages": result["page_count"],
                     }
                 )
-                print(f"✓ ({result['total_chars']:,} chars)", flush=True)
-
-            except Exception as e:
-                doc["fast_status"] = "failed"
-                doc["fast_error"] = str(e)
+                print(f"{progress} ✓ ({result['total_chars']:,} chars)", flush=True)
+            else:
                 results["failed"] += 1
-                logger.error(f"Fast extraction failed for {filename}: {e}")
-                print(f"✗ {e}", flush=True)
+                logger.error(f"Fast extraction failed for {filename}: {error}")
+                print(f"{progress} ✗ {error}", flush=True)
+
+        async for outcome in iter_extractions(pooled_paths):
+            result = outcome.result
+            error = outcome.error
+            if result is not None:
+                try:
+                    # Save markdown alongside the source file
+                    fast_md_path = Path(outcome.filepath).with_suffix(".fast.md")
+                    fast_md_path.write_text(result["markdown"], encoding="utf-8")
+                    result["fast_markdown_path"] = str(fast_md_path)
+                except Exception as e:
+                    result, error = None, e
+            record(outcome.filepath, result, error)
+
+        # One large document at a time: each already spans the whole pool.
+        for filepath in streamed_paths:
+            try:
+                record(filepath, await stream_fast_extract_pdf(filepath), None)
+            except Exception as e:
+                record(filepath, None, e)
 
-        # Save updated documents
-        docs_data["documents"] = documents
-        state.write_json("documents.json", docs_data)
+        # Save updated documents — once per batch, merged into a fresh read
+        async with state.async_lock(filename="documents.json"):
+            docs_data = state.read_json("documents.json")
+            for doc in docs_data.get("documents", []):
+                if doc["document_id"] in outcomes:
+                    result, error = outcomes[doc["document_id"]]
+                    _apply_fast_outcome(doc, result, error)
+            state._write_json_unlocked("documents.json", docs_data)
 
         print(
             f"\n✅ Fast extraction complete: {results['successful']} successful, {results['failed']} failed", flush=True
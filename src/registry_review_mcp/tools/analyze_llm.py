@@ -5,15 +5,18 @@ This module provides a unified replacement for the legacy Path 1 pipeline:
 - validation_tools.cross_validate()
 - llm_extractors field extraction
 
-Uses a single unified LLM call instead of 100+ separate operations.
+Uses a single unified LLM call instead of 100+ separate operations; large
+submissions are split into budget-sized document shards that are analyzed
+concurrently and merged (``settings.unified_analysis_sharding``).
 """
 
 import logging
 from pathlib import Path
 from typing import Any
 
+from ..config.settings import settings
 from ..models.errors import SessionNotFoundError
-from ..prompts.unified_analysis import UnifiedAnalysisResult, analyze_with_llm
+from ..prompts.unified_analysis import UnifiedAnalysisResult, analyze_sharded, analyze_with_llm
 from ..utils.state import StateManager
 
 logger = logging.getLogger(__name__)
@@ -88,7 +91,9 @@ async def analyze_session_unified(session_id: str) -> dict[str, Any]:
     2. validation_tools.cross_validate()
     3. Multiple llm_extractors calls
 
-    With a single LLM orchestration that does everything in one pass.
+    With a single LLM orchestration that does everything in one pass. When
+    the documents do not fit one prompt budget, each budget-sized shard of
+    documents gets that pass and the shard results are merged.
 
     Args:
         session_id: Session identifier
@@ -123,9 +128,10 @@ async def analyze_session_unified(session_id: str) -> dict[str, Any]:
 
     from ..utils.llm_client import classify_api_error
 
-    # Single unified LLM call
+    # One unified LLM call per document shard
+    analyze = analyze_sharded if settings.unified_analysis_sharding else analyze_with_llm
     try:
-        result: UnifiedAnalysisResult = await analyze_with_llm(
+        result: UnifiedAnalysisResult = await analyze(
             documents=documents,
             markdown_contents=markdown_contents,
             requirements=requirements,
@@ -231,12 +237,12 @@ async def analyze_session_unified(session_id: str) -> dict[str, Any]:
     }
 
     # Save results
-    state_manager.write_json("evidence.json", evidence_result)
-    state_manager.write_json("validation.json", validation_result)
-    state_manager.write_json("extracted_fields.json", fields_result)
+    await state_manager.async_write_json("evidence.json", evidence_result)
+    await state_manager.async_write_json("validation.json", validation_result)
+    await state_manager.async_write_json("extracted_fields.json", fields_result)
 
     # Update session
-    state_manager.update_json(
+    await state_manager.async_update_json(
         "session.json",
         {
             "workflow_progress.evidence_extraction": "completed",
@@ -16,7 +16,7 @@ from ..models.errors import (
     DocumentExtractionError,
 )
 from ..models.schemas import Document, DocumentMetadata, DocumentSource
-from ..utils.cache import gis_cache
+from ..utils.artifacts import artifact_store, file_sha256
 from ..utils.patterns import (
     BASELINE_PATTERNS,
     GHG_PATTERNS,
@@ -36,13 +36,13 @@ from ..utils.state import StateManager, get_session_or_raise
 
 
 def compute_file_hash(filepath: Path) -> str:
-    """Compute SHA256 hash of file content for deduplication."""
-    sha256_hash = hashlib.sha256()
-    with open(filepath, "rb") as f:
-        # Read in chunks to handle large files efficiently
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+    """Compute SHA256 hash of file content for deduplication.
+
+    Shares ``utils.artifacts``' per-process memo, so the hash discovery
+    records as ``content_hash`` is the same one extraction artifacts are
+    addressed by, and an unchanged file is only read once.
+    """
+    return file_sha256(filepath)
 
 
 def calculate_optimal_workers(num_pdfs: int) -> int:
@@ -320,7 +320,7 @@ async def add_documents(
             document_sources = session_data.get("document_sources", [])
             document_sources.append(doc_source.model_dump(mode="json"))
 
-            state_manager.update_json("session.json", {"document_sources": document_sources})
+            await state_manager.async_update_json("session.json", {"document_sources": document_sources})
 
             result["files_added"] = len(files_saved)
             result["message"] = f"Added {len(files_saved)} files via upload"
@@ -390,7 +390,7 @@ async def add_documents(
         document_sources = session_data.get("document_sources", [])
         document_sources.append(doc_source.model_dump(mode="json"))
 
-        state_manager.update_json("session.json", {"document_sources": document_sources})
+        await state_manager.async_update_json("session.json", {"document_sources": document_sources})
 
         result["files_added"] = file_count
         result["message"] = f"Added path source with {file_count} files"
@@ -637,10 +637,10 @@ async def discover_documents(session_id: str) -> dict[str, Any]:
         "error_count": len(errors),
         "discovered_at": datetime.now(timezone.utc).isoformat(),
     }
-    state_manager.write_json("documents.json", documents_data)
+    await state_manager.async_write_json("documents.json", documents_data)
 
     # Update session statistics
-    state_manager.update_json(
+    await state_manager.async_update_json(
         "session.json",
         {
             "statistics": {
@@ -785,13 +785,26 @@ async def extract_pdf_text(
     }
 
 
+def _gis_sidecar_variant(file_path: Path) -> str:
+    """Hash the shapefile sidecars (.dbf, .prj, ...) that shape its metadata.
+
+    The artifact is addressed by the main file's content; an edited
+    attribute table or projection must still produce a different key.
+    """
+    sidecars = sorted(p for p in file_path.parent.glob(f"{file_path.stem}.*") if p != file_path and p.is_file())
+    return ",".join(f"{p.suffix.lower()}={file_sha256(p)[:16]}" for p in sidecars)
+
+
 async def extract_gis_metadata(filepath: str) -> dict[str, Any]:
     """Extract metadata from a GIS shapefile."""
-    # Check cache
-    cache_key = filepath
-    cached = gis_cache.get(cache_key)
-    if cached is not None:
-        return cached
+    # Check cache (content-addressed: identical files in other sessions hit too)
+    file_path = Path(filepath)
+    variant = ""
+    if file_path.exists():
+        variant = _gis_sidecar_variant(file_path)
+        cached = artifact_store.get("gis", file_path, variant=variant)
+        if cached is not None:
+            return cached
 
     # Lazy import: fiona is heavy and only needed for GIS extraction
     try:
@@ -834,7 +847,7 @@ async def extract_gis_metadata(filepath: str) -> dict[str, Any]:
                 result["geometry_type"] = first_feature.get("geometry", {}).get("type")
 
         # Cache the result
-        gis_cache.set(cache_key, result)
+        artifact_store.put("gis", file_path, result, variant=variant)
 
         return result
 
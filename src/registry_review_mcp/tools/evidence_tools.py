@@ -13,9 +13,9 @@ import hashlib
 import json
 import logging
 import re
-import time
+from contextlib import aclosing
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable
 
 from ..config.settings import settings
 from ..models.evidence import (
@@ -24,8 +24,17 @@ from ..models.evidence import (
     MappedDocument,
     RequirementEvidence,
 )
-from ..utils.llm_client import call_llm, classify_api_error
-from ..utils.state import StateManager
+from ..utils.cost_tracker import CostTracker, track_llm_costs
+from ..utils.evidence_checkpoint import EvidenceCheckpoints
+from ..utils.evidence_graph import EvidenceGraph, content_hash, document_fingerprint
+from ..utils.llm_client import call_llm, call_llm_stream, classify_api_error
+from ..utils.state import StateManager, get_session_or_raise
+
+if TYPE_CHECKING:
+    from ..llm.batch import BatchBackend
+    from ..llm.chunk_index import ChunkIndex
+    from ..llm.prompt_budget import PromptBudget
+    from ..llm.prompt_layout import PromptLayout, Segment
 
 logger = logging.getLogger(__name__)
 
@@ -105,7 +114,8 @@ MAX_CHARS_PER_DOCUMENT = 80_000
 # Version history:
 # - ``v2.4.0`` — Phase E baseline (snippet + type-aware + structured).
 # - ``v2.5.0`` — Phase F1 accepted-evidence schema-check tightening.
-PROMPT_VERSION = "v2.5.0"
+# - ``v2.6.0`` — document before requirement, for provider prompt-cache reuse.
+PROMPT_VERSION = "v2.6.0"
 
 
 def _truncate_markdown_by_chars(markdown: str, cap: int, source_name: str) -> str:
@@ -270,12 +280,44 @@ For example, use "project_id" NOT "project_identifier" or "registry_id".
 """
 
 
+# Output ceiling for one batched evidence call (4000 per requirement, as in
+# the per-pair path, up to this cap).
+_BATCH_MAX_TOKENS = 16_000
+
+_EVIDENCE_SYSTEM_PROMPT = (
+    "You are an expert at analyzing carbon credit project documentation and "
+    "extracting relevant evidence for compliance requirements."
+)
+
+# Phase F1 schema-check contract, shared by the per-pair and batched prompts.
+_SCHEMA_CHECK_DISCIPLINE = """**Schema-check discipline (REQUIRED for Phase F1):**
+For EACH snippet you return, you MUST decide whether the snippet DIRECTLY satisfies
+the fields named in the "Accepted Evidence" field above, and record that decision
+in the `schema_match` boolean:
+
+- `schema_match: true` — the snippet contains the specific data points the
+  "Accepted Evidence" field calls for (e.g. if the evidence schema is "Sampling
+  plan with plot locations and sampling frequency", the snippet must actually
+  describe plot locations AND sampling frequency, not merely mention that
+  sampling occurs).
+- `schema_match: false` — the snippet is topically related to the requirement
+  (same domain, same subject matter) but does NOT contain the required fields.
+  Example: the document mentions a "monitoring plan exists" without detailing
+  the sampling protocol when the "Accepted Evidence" requires a sampling protocol.
+
+Return topically-related snippets with `schema_match: false` — they are still
+useful context for human reviewers, but the downstream classifier will not
+treat them as sufficient evidence to mark the requirement as covered. Do NOT
+omit them; honesty about schema coverage is the point.
+"""
+
+
 def build_type_aware_prompt(
     requirement: dict,
     document_content: str,
     document_name: str,
     validation_type: str,
-) -> str:
+) -> "PromptLayout":
     """Build an LLM prompt tailored to the validation type.
 
     For cross_document and structured_field requirements, includes instructions
@@ -292,9 +334,12 @@ def build_type_aware_prompt(
             (document_presence, cross_document, structured_field, manual).
 
     Returns:
-        Formatted prompt string for LLM extraction, including base task
-        description, structured field guidance (if applicable), and output format.
+        Formatted prompt for LLM extraction: the document (a cacheable
+        prefix), then the requirement, task description, structured field
+        guidance (if applicable), and output format.
     """
+    from ..llm.prompt_layout import PromptLayout, Segment
+
     requirement_text = requirement.get("requirement_text", "")
     accepted_evidence = requirement.get("accepted_evidence", "")
     category = requirement.get("category", "")
@@ -302,9 +347,10 @@ def build_type_aware_prompt(
     # Base prompt structure. Phase F1 tightens the contract: every snippet
     # is annotated with ``schema_match`` so downstream status determination
     # can distinguish "some evidence exists" from "sufficient evidence exists."
-    base_prompt = f"""You are analyzing a carbon credit project document to find evidence for a specific requirement.
-
-**Requirement Category:** {category}
+    # The requirement follows the document so every requirement mapped to a
+    # document shares the same (provider-cached) prefix.
+    base_prompt = (
+        f"""**Requirement Category:** {category}
 
 **Requirement Text:**
 {requirement_text}
@@ -312,34 +358,12 @@ def build_type_aware_prompt(
 **Accepted Evidence:**
 {accepted_evidence}
 
-**Document Name:** {document_name}
-
-**Document Content:**
-{document_content}
-
 **Task:**
-Extract ALL passages from the document that provide evidence for this requirement.
-
-**Schema-check discipline (REQUIRED for Phase F1):**
-For EACH snippet you return, you MUST decide whether the snippet DIRECTLY satisfies
-the fields named in the "Accepted Evidence" field above, and record that decision
-in the `schema_match` boolean:
-
-- `schema_match: true` — the snippet contains the specific data points the
-  "Accepted Evidence" field calls for (e.g. if the evidence schema is "Sampling
-  plan with plot locations and sampling frequency", the snippet must actually
-  describe plot locations AND sampling frequency, not merely mention that
-  sampling occurs).
-- `schema_match: false` — the snippet is topically related to the requirement
-  (same domain, same subject matter) but does NOT contain the required fields.
-  Example: the document mentions a "monitoring plan exists" without detailing
-  the sampling protocol when the "Accepted Evidence" requires a sampling protocol.
+Extract ALL passages from the document above that provide evidence for this requirement.
 
-Return topically-related snippets with `schema_match: false` — they are still
-useful context for human reviewers, but the downstream classifier will not
-treat them as sufficient evidence to mark the requirement as covered. Do NOT
-omit them; honesty about schema coverage is the point.
 """
+        + _SCHEMA_CHECK_DISCIPLINE
+    )
 
     # Build structured guidance from config (if validation type requires it)
     structured_guidance = ""
@@ -406,7 +430,170 @@ For each piece of evidence, provide:
 Return a JSON array of evidence snippets. If no relevant evidence found, return empty array.
 """
 
-    return base_prompt + structured_guidance + evidence_instructions + output_format
+    return PromptLayout(
+        _document_segment("a specific requirement", document_content, document_name),
+        Segment(base_prompt + structured_guidance + evidence_instructions + output_format),
+    )
+
+
+def _document_segment(subject: str, document_content: str, document_name: str) -> "Segment":
+    """Cacheable prompt prefix: the document, identical for every requirement asked of it."""
+    from ..llm.prompt_layout import Segment
+
+    return Segment(
+        f"""You are analyzing a carbon credit project document to find evidence for {subject}.
+
+**Document Name:** {document_name}
+
+**Document Content:**
+{document_content}
+
+""",
+        cache=True,
+    )
+
+
+def _batched_requirement_block(requirement: dict) -> str:
+    """One requirement's section of a batched evidence prompt."""
+    requirement_text = requirement.get("requirement_text", "")
+    validation_type = requirement.get("validation_type", "document_presence")
+
+    structured_guidance = ""
+    if validation_type in ("cross_document", "structured_field"):
+        config = _find_matching_config(requirement_text)
+        structured_guidance = _build_structured_guidance(config, validation_type)
+        if structured_guidance:
+            structured_guidance += (
+                "\nReturn these values in a `structured_fields` object on the snippets that contain them.\n"
+            )
+
+    return f"""
+### {requirement.get("requirement_id", "")}
+
+**Requirement Category:** {requirement.get("category", "")}
+
+**Requirement Text:**
+{requirement_text}
+
+**Accepted Evidence:**
+{requirement.get("accepted_evidence", "")}
+{structured_guidance}"""
+
+
+def build_batched_evidence_prompt(
+    requirement_blocks: list[str],
+    document_content: str,
+    document_name: str,
+) -> "PromptLayout":
+    """Build one prompt asking for evidence for several requirements in one document.
+
+    The document is sent once instead of once per requirement. The answer is
+    a JSON object keyed by requirement ID whose values use the same snippet
+    schema as :func:`build_type_aware_prompt`.
+
+    Args:
+        requirement_blocks: Sections from ``_batched_requirement_block``.
+        document_content: Markdown content of the document (already trimmed).
+        document_name: Name of the document for context in the prompt.
+
+    Returns:
+        Formatted prompt for batched LLM extraction, the document first as a
+        cacheable prefix.
+    """
+    from ..llm.prompt_layout import PromptLayout, Segment
+
+    tail = (
+        """**Requirements:**
+"""
+        + "".join(requirement_blocks)
+        + """
+**Task:**
+For EACH requirement above, extract ALL passages from the document that provide evidence for it.
+Judge each requirement independently against its own Accepted Evidence.
+
+"""
+        + _SCHEMA_CHECK_DISCIPLINE
+        + """
+For each piece of evidence, provide:
+1. **text**: The exact quote from the document (2-3 sentences with context)
+2. **page**: Page number (extract from markers like `![](_page_5_Picture_0.jpeg)` or section headers)
+3. **section**: The section header this appears under
+4. **confidence**: Your confidence that this provides evidence (0.0-1.0)
+5. **schema_match**: Whether the snippet satisfies that requirement's Accepted Evidence
+6. **reasoning**: Brief explanation of why this is relevant evidence
+
+**Output Format:**
+Return ONE JSON object with a key for EVERY requirement ID listed above. Each value
+is an array of evidence snippets; use an empty array when the document has none.
+```json
+{
+  "REQ-001": [
+    {
+      "text": "The exact quote from the document (2-3 sentences)",
+      "page": 5,
+      "section": "2. Land Tenure",
+      "confidence": 0.95,
+      "schema_match": true,
+      "reasoning": "Why this is relevant evidence, and whether it satisfies the Accepted Evidence schema"
+    }
+  ],
+  "REQ-002": []
+}
+```
+
+Extract only high-quality evidence (confidence > 0.6). Be precise and thorough."""
+    )
+    return PromptLayout(_document_segment("several requirements", document_content, document_name), Segment(tail))
+
+
+def _plan_evidence_batches(
+    indices: list[int],
+    prompt_chars: Callable[[list[int]], int],
+    max_total_chars: int,
+    max_requirements: int,
+) -> list[list[int]]:
+    """Group requirements (by index) into prompts that fit the budget.
+
+    ``prompt_chars`` sizes the prompt for a candidate batch. A requirement
+    that does not fit even on its own still gets a batch of one, the same
+    prompt size the per-pair path would send.
+    """
+    batches: list[list[int]] = []
+    current: list[int] = []
+    for i in indices:
+        if current and (len(current) >= max_requirements or prompt_chars(current + [i]) > max_total_chars):
+            batches.append(current)
+            current = []
+        current.append(i)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _retrieval_index(document_content: str) -> "ChunkIndex | None":
+    """BM25 chunk index for a document worth narrowing, else None.
+
+    Documents within ``evidence_retrieval_max_chars`` are sent whole, as
+    before; larger ones are narrowed to the chunks relevant to each
+    requirement instead of being truncated at the prompt budget.
+    """
+    if not settings.evidence_retrieval_enabled or len(document_content) <= settings.evidence_retrieval_max_chars:
+        return None
+    from ..llm.chunk_index import get_chunk_index
+
+    return get_chunk_index(document_content)
+
+
+def _relevant_chunk_ids(index: "ChunkIndex", requirement: dict) -> list[int]:
+    """Top chunks for a requirement's text and accepted evidence, within the excerpt budget."""
+    query = "\n".join(
+        requirement.get(field, "") or "" for field in ("category", "requirement_text", "accepted_evidence")
+    )
+    return index.top_chunks(
+        query,
+        max_chars=settings.evidence_retrieval_max_chars,
+        top_k=settings.evidence_retrieval_top_k,
+    )
 
 
 async def get_markdown_content(document: dict[str, Any], session_id: str) -> str | None:
@@ -483,28 +670,57 @@ def generate_cache_key(
     return hashlib.sha256(cache_str.encode()).hexdigest()[:16]
 
 
+def _evidence_cache_key(
+    requirement: dict,
+    document_content: str,
+    document_id: str,
+    validation_type: str,
+    model: str,
+) -> str:
+    """Per-(requirement, document) cache key for already-trimmed ``document_content``.
+
+    Shared by the per-pair and batched paths, so a response cached by one
+    is a hit for the other.
+    """
+    cache_key = generate_cache_key(
+        requirement_id=requirement.get("requirement_id", ""),
+        requirement_text=requirement.get("requirement_text", ""),
+        accepted_evidence=requirement.get("accepted_evidence", ""),
+        document_id=document_id,
+        document_content=document_content,
+        model=model,
+        temperature=settings.llm_temperature,
+        prompt_version=PROMPT_VERSION,
+    )
+    # Add validation_type suffix to differentiate cache entries
+    cache_key = f"{cache_key}_{validation_type[:4]}"
+    if settings.llm_stream_responses and settings.evidence_stream_stop_confidence:
+        # Responses cut off early hold fewer snippets than complete ones.
+        cache_key += f"_stop{settings.evidence_stream_stop_confidence:g}"
+    return cache_key
+
+
 def load_from_cache(cache_key: str) -> list[EvidenceSnippet] | None:
     """Load cached LLM response if valid.
 
+    Responses live in the ``evidence`` namespace of the response store
+    (``llm.response_store``); a legacy per-key JSON file is adopted into
+    the store on first read.
+
     Args:
         cache_key: Cache key from generate_cache_key()
 
     Returns:
         List of EvidenceSnippet objects if cache hit and valid, None otherwise
     """
-    cache_path = settings.get_llm_cache_path(cache_key)
-
-    if not cache_path.exists():
-        return None
+    from ..llm.response_store import EVIDENCE_NAMESPACE, get_response_store
 
     try:
-        with open(cache_path) as f:
-            cached = json.load(f)
-
-        # Check TTL
-        age = time.time() - cached["created_at"]
-        if age > settings.llm_cache_ttl:
-            cache_path.unlink()  # Expired, delete
+        store = get_response_store(settings.llm_cache_dir)
+        cached = store.get(EVIDENCE_NAMESPACE, cache_key)
+        if cached is None:
+            cached = store.adopt_legacy_file(settings.get_llm_cache_path(cache_key))
+        if cached is None:
             return None
 
         # Convert back to EvidenceSnippet objects
@@ -527,29 +743,145 @@ def save_to_cache(
         snippets: Extracted evidence snippets
         metadata: Optional dict with model/token info (informational only)
     """
-    cache_path = settings.get_llm_cache_path(cache_key)
+    from ..llm.response_store import EVIDENCE_NAMESPACE, get_response_store
 
     cache_data = {
-        "cache_key": cache_key,
-        "created_at": time.time(),
-        "ttl": settings.llm_cache_ttl,
         "response": [s.model_dump() for s in snippets],
         "metadata": metadata or {},
     }
 
     try:
-        with open(cache_path, "w") as f:
-            json.dump(cache_data, f, indent=2)
+        get_response_store(settings.llm_cache_dir).set(
+            EVIDENCE_NAMESPACE, cache_key, cache_data, settings.llm_cache_ttl
+        )
     except Exception as e:
         logger.warning(f"Cache save failed for {cache_key}: {e}")
 
 
+def _snippets_from_response_items(
+    evidence_array: list[dict[str, Any]],
+    document_id: str,
+    document_name: str,
+) -> list[EvidenceSnippet]:
+    """Convert the LLM's JSON snippet objects for one document into ``EvidenceSnippet``s."""
+    # Convert to EvidenceSnippet objects
+    snippets = []
+    for item in evidence_array:
+        # Extract structured fields if present (for cross_document/structured_field types)
+        structured_fields = item.get("structured_fields")
+        if structured_fields and not isinstance(structured_fields, dict):
+            structured_fields = None  # Ensure it's a dict or None
+
+        # Determine extraction method based on presence of structured fields
+        extraction_method = "structured" if structured_fields else "semantic"
+
+        # Phase F1: schema_match defaults to True for back-compat, but
+        # the LLM is instructed to set it explicitly. A snippet that omits
+        # the field is treated as ``schema_match=True`` (the pre-F1 default)
+        # to avoid silently over-flipping older responses into partial.
+        schema_match_raw = item.get("schema_match", True)
+        # Tolerate string "true"/"false" from models that stringify booleans.
+        if isinstance(schema_match_raw, str):
+            schema_match_raw = schema_match_raw.strip().lower() == "true"
+
+        snippet = EvidenceSnippet(
+            text=item["text"],
+            document_id=document_id,
+            document_name=document_name,
+            page=item.get("page"),
+            section=item.get("section"),
+            confidence=item["confidence"],
+            keywords_matched=[],  # Not using keywords anymore
+            extraction_method=extraction_method,
+            structured_fields=structured_fields,
+            schema_match=bool(schema_match_raw),
+        )
+        snippets.append(snippet)
+
+    return snippets
+
+
+def _pair_document_content(requirement: dict, document_content: str, document_name: str) -> str:
+    """The document text the per-pair prompt carries for ``requirement``."""
+    # Apply prompt-budget cap before the LLM call. Replaces the previous
+    # ad-hoc 200K slice with a boundary-aware, footer-annotated trim that
+    # stays inside the TELUS Cloudflare gateway's ~150K edge-timeout budget.
+    # ``MAX_CHARS_PER_DOCUMENT`` lives at module scope so tests + the
+    # PromptBudget abstraction (Phase E4) can import the same constant.
+    #
+    # Large documents are narrowed instead: only the chunks a BM25 index
+    # ranks relevant to this requirement are sent, wherever they sit in the
+    # document. Truncation remains the fallback when nothing matches.
+    index = _retrieval_index(document_content)
+    chunk_ids = _relevant_chunk_ids(index, requirement) if index else []
+    if chunk_ids:
+        return index.render(chunk_ids, document_name)
+    return _truncate_markdown_by_chars(
+        document_content,
+        cap=MAX_CHARS_PER_DOCUMENT,
+        source_name=document_name,
+    )
+
+
+def _parse_evidence_array(response_text: str) -> Any:
+    """The JSON array of a per-pair response (which might be wrapped in markdown)."""
+    json_match = re.search(r"```json\s*(\[.*?\])\s*```", response_text, re.DOTALL)
+    if json_match:
+        return json.loads(json_match.group(1))
+    return json.loads(response_text)
+
+
+async def _stream_evidence(
+    prompt: "str | PromptLayout",
+    model: str,
+    requirement_id: str,
+    document_content: str,
+    document_id: str,
+    document_name: str,
+    on_snippet: Callable[[EvidenceSnippet], None] | None = None,
+) -> list[EvidenceSnippet]:
+    """Per-pair evidence call with the response streamed (``settings.llm_stream_responses``).
+
+    Each snippet goes to ``on_snippet`` as soon as its JSON object is
+    complete. With ``settings.evidence_stream_stop_confidence`` set, the
+    response is cut off at the first snippet at or above it whose text is
+    found in ``document_content``: the requirement is covered, and the
+    remaining output is not generated.
+
+    Returns:
+        The complete response's snippets, parsed as the unstreamed path
+        does, or those that arrived before a cut-off
+    """
+    from ..extractors.verification import verify_citation
+    from ..llm.streaming import JSONArrayStream, stream_json_array
+
+    stop_confidence = settings.evidence_stream_stop_confidence
+    parser = JSONArrayStream()
+    snippets: list[EvidenceSnippet] = []
+    chunks = call_llm_stream(prompt=prompt, system=_EVIDENCE_SYSTEM_PROMPT, model=model, max_tokens=4000)
+    async with aclosing(chunks), aclosing(stream_json_array(chunks, parser)) as items:
+        async for item in items:
+            snippets.extend(_snippets_from_response_items([item], document_id, document_name))
+            if on_snippet is not None:
+                on_snippet(snippets[-1])
+            if (
+                stop_confidence
+                and snippets[-1].confidence >= stop_confidence
+                and verify_citation(snippets[-1].text, document_content, f"evidence {requirement_id}")[0]
+            ):
+                logger.info(f"✂️  Covered after {len(snippets)} snippet(s), response cut off: {requirement_id}")
+                return snippets
+
+    return _snippets_from_response_items(_parse_evidence_array(parser.text), document_id, document_name)
+
+
 async def extract_evidence_with_llm(
     requirement: dict,
     document_content: str,
     document_id: str,
     document_name: str,
     validation_type: str = "document_presence",
+    on_snippet: Callable[[EvidenceSnippet], None] | None = None,
 ) -> list[EvidenceSnippet]:
     """Use LLM to extract evidence for a requirement from a document.
 
@@ -558,21 +890,14 @@ async def extract_evidence_with_llm(
 
     For cross_document and structured_field validation types, also extracts
     structured fields (owner_name, dates, etc.) for use in validation.
+
+    With ``settings.llm_stream_responses``, the response is streamed and
+    ``on_snippet`` receives each snippet as it arrives (see
+    :func:`_stream_evidence`); a caller served from the cache, or joining
+    a call already in flight, gets no callbacks.
     """
     requirement_id = requirement.get("requirement_id", "")
-    requirement_text = requirement.get("requirement_text", "")
-    accepted_evidence = requirement.get("accepted_evidence", "")
-
-    # Apply prompt-budget cap before the LLM call. Replaces the previous
-    # ad-hoc 200K slice with a boundary-aware, footer-annotated trim that
-    # stays inside the TELUS Cloudflare gateway's ~150K edge-timeout budget.
-    # ``MAX_CHARS_PER_DOCUMENT`` lives at module scope so tests + the
-    # PromptBudget abstraction (Phase E4) can import the same constant.
-    document_content = _truncate_markdown_by_chars(
-        document_content,
-        cap=MAX_CHARS_PER_DOCUMENT,
-        source_name=document_name,
-    )
+    document_content = _pair_document_content(requirement, document_content, document_name)
 
     # Generate cache key (include validation_type for cache differentiation).
     # Phase F1 — the cache key now tracks the EXECUTOR model (the one that
@@ -581,23 +906,12 @@ async def extract_evidence_with_llm(
     # GPT-OSS to Gemma to Qwen now produces three distinct cache entries per
     # (requirement, document, prompt_version) triple.
     active_model = settings.get_active_executor_model()
-    cache_key = generate_cache_key(
-        requirement_id=requirement_id,
-        requirement_text=requirement_text,
-        accepted_evidence=accepted_evidence,
-        document_id=document_id,
-        document_content=document_content,
-        model=active_model,
-        temperature=settings.llm_temperature,
-        prompt_version=PROMPT_VERSION,
-    )
-    # Add validation_type suffix to differentiate cache entries
-    cache_key = f"{cache_key}_{validation_type[:4]}"
+    cache_key = _evidence_cache_key(requirement, document_content, document_id, validation_type, active_model)
 
     # Try cache first (if enabled)
     if settings.llm_cache_enabled:
         cached_response = load_from_cache(cache_key)
-        if cached_response:
+        if cached_response is not None:
             logger.info(f"📦 Cache hit: {requirement_id} + {document_name}")
             return cached_response
 
@@ -609,57 +923,24 @@ async def extract_evidence_with_llm(
         validation_type=validation_type,
     )
 
-    # Cache miss - call API
-    logger.info(f"🌐 API call: {requirement_id} + {document_name}")
-
-    try:
-        response_text = await call_llm(
-            prompt=prompt,
-            system="You are an expert at analyzing carbon credit project documentation and extracting relevant evidence for compliance requirements.",
-            model=active_model,
-            max_tokens=4000,
-        )
-
-        # Extract JSON from response (might be wrapped in markdown)
-        json_match = re.search(r"```json\s*(\[.*?\])\s*```", response_text, re.DOTALL)
-        if json_match:
-            evidence_array = json.loads(json_match.group(1))
-        else:
-            evidence_array = json.loads(response_text)
-
-        # Convert to EvidenceSnippet objects
-        snippets = []
-        for item in evidence_array:
-            # Extract structured fields if present (for cross_document/structured_field types)
-            structured_fields = item.get("structured_fields")
-            if structured_fields and not isinstance(structured_fields, dict):
-                structured_fields = None  # Ensure it's a dict or None
-
-            # Determine extraction method based on presence of structured fields
-            extraction_method = "structured" if structured_fields else "semantic"
-
-            # Phase F1: schema_match defaults to True for back-compat, but
-            # the LLM is instructed to set it explicitly. A snippet that omits
-            # the field is treated as ``schema_match=True`` (the pre-F1 default)
-            # to avoid silently over-flipping older responses into partial.
-            schema_match_raw = item.get("schema_match", True)
-            # Tolerate string "true"/"false" from models that stringify booleans.
-            if isinstance(schema_match_raw, str):
-                schema_match_raw = schema_match_raw.strip().lower() == "true"
-
-            snippet = EvidenceSnippet(
-                text=item["text"],
-                document_id=document_id,
-                document_name=document_name,
-                page=item.get("page"),
-                section=item.get("section"),
-                confidence=item["confidence"],
-                keywords_matched=[],  # Not using keywords anymore
-                extraction_method=extraction_method,
-                structured_fields=structured_fields,
-                schema_match=bool(schema_match_raw),
-            )
-            snippets.append(snippet)
+    async def call_and_parse() -> list[EvidenceSnippet]:
+        # Cache miss - call API
+        logger.info(f"🌐 API call: {requirement_id} + {document_name}")
+        with track_llm_costs(document_name=document_name):
+            if settings.llm_stream_responses:
+                snippets = await _stream_evidence(
+                    prompt, active_model, requirement_id, document_content, document_id, document_name, on_snippet
+                )
+            else:
+                response_text = await call_llm(
+                    prompt=prompt,
+                    system=_EVIDENCE_SYSTEM_PROMPT,
+                    model=active_model,
+                    max_tokens=4000,
+                )
+                snippets = _snippets_from_response_items(
+                    _parse_evidence_array(response_text), document_id, document_name
+                )
 
         # Save to cache (if enabled)
         if settings.llm_cache_enabled:
@@ -667,6 +948,14 @@ async def extract_evidence_with_llm(
 
         return snippets
 
+    # The cache is only written once the response arrives, so a concurrent
+    # run of the same pair (REST and MCP on one session) would miss it too.
+    # Single-flight on the cache key makes it wait for this call instead.
+    from ..llm.single_flight import get_single_flight
+
+    try:
+        return list(await get_single_flight().run(f"evidence:{cache_key}", call_and_parse))
+
     except Exception as e:
         error_info = classify_api_error(e)
         if error_info.is_fatal:
@@ -677,6 +966,131 @@ async def extract_evidence_with_llm(
         return []
 
 
+async def extract_evidence_batch_with_llm(
+    requirements: list[dict],
+    document_content: str,
+    document_id: str,
+    document_name: str,
+    budget: "PromptBudget | None" = None,
+) -> dict[str, list[EvidenceSnippet]]:
+    """Extract evidence for several requirements from one document.
+
+    Requirements whose (requirement, document) pair is already cached are
+    answered from the cache; the rest are grouped into as few prompts as
+    ``budget`` and ``settings.evidence_batch_max_requirements`` allow, each
+    sending the document once. Each requirement's snippets are cached under
+    the same per-pair key :func:`extract_evidence_with_llm` uses.
+
+    A batch whose response cannot be parsed, or that leaves out a
+    requirement, falls back to per-pair extraction for the affected
+    requirements.
+
+    Returns:
+        Snippets keyed by requirement ID, for every requirement given
+    """
+    from ..llm.prompt_budget import default_budget
+
+    budget = budget or default_budget()
+    full_content = document_content
+    trimmed_content = budget.trim_document(document_content, source_name=document_name)
+    index = _retrieval_index(document_content)
+    active_model = settings.get_active_executor_model()
+
+    results: dict[str, list[EvidenceSnippet]] = {}
+    pending: list[tuple[dict, str, list[int]]] = []  # (requirement, cache key, relevant chunk ids)
+    for req in requirements:
+        validation_type = req.get("validation_type", "document_presence")
+        # Key on exactly what the per-pair path would send for this requirement
+        chunk_ids = _relevant_chunk_ids(index, req) if index else []
+        pair_content = index.render(chunk_ids, document_name) if chunk_ids else trimmed_content
+        cache_key = _evidence_cache_key(req, pair_content, document_id, validation_type, active_model)
+        cached = load_from_cache(cache_key) if settings.llm_cache_enabled else None
+        if cached is not None:
+            logger.info(f"📦 Cache hit: {req['requirement_id']} + {document_name}")
+            results[req["requirement_id"]] = cached
+        else:
+            pending.append((req, cache_key, chunk_ids))
+
+    if not pending:
+        return results
+
+    blocks = [_batched_requirement_block(req) for req, _, _ in pending]
+
+    def batch_document(indices: list[int]) -> str:
+        # A narrowed batch carries the union of its requirements' chunks.
+        if index is None or not pending[indices[0]][2]:
+            return trimmed_content
+        return index.render([cid for i in indices for cid in pending[i][2]], document_name)
+
+    def prompt_chars(indices: list[int]) -> int:
+        return len(build_batched_evidence_prompt([blocks[i] for i in indices], batch_document(indices), document_name))
+
+    # Narrowed and whole-document requirements never share a prompt.
+    narrowed = [i for i, (_, _, chunk_ids) in enumerate(pending) if chunk_ids]
+    whole = [i for i, (_, _, chunk_ids) in enumerate(pending) if not chunk_ids]
+    batches = [
+        batch
+        for group in (narrowed, whole)
+        for batch in _plan_evidence_batches(
+            group, prompt_chars, budget.max_total_chars, settings.evidence_batch_max_requirements
+        )
+    ]
+
+    async def run_batch(indices: list[int]) -> None:
+        batch = [(req, cache_key) for req, cache_key, _ in (pending[i] for i in indices)]
+        ids = [req["requirement_id"] for req, _ in batch]
+        logger.info(f"🌐 API call: {len(ids)} requirements + {document_name}")
+
+        answered: dict[str, Any] = {}
+        try:
+            with track_llm_costs(document_name=document_name):
+                response_text = await call_llm(
+                    prompt=build_batched_evidence_prompt(
+                        [blocks[i] for i in indices], batch_document(indices), document_name
+                    ),
+                    system=_EVIDENCE_SYSTEM_PROMPT,
+                    model=active_model,
+                    max_tokens=min(4000 * len(batch), _BATCH_MAX_TOKENS),
+                )
+            json_match = re.search(r"```json\s*(\{.*?\})\s*```", response_text, re.DOTALL)
+            answered = json.loads(json_match.group(1) if json_match else response_text)
+            if not isinstance(answered, dict):
+                raise ValueError(f"expected a JSON object keyed by requirement ID, got {type(answered).__name__}")
+        except Exception as e:
+            error_info = classify_api_error(e)
+            if error_info.is_fatal:
+                logger.error(f"Fatal API error: {error_info.message}")
+                raise
+            logger.warning(f"Batched extraction failed for {document_name} ({', '.join(ids)}): {e}")
+            answered = {}
+
+        for req, cache_key in batch:
+            requirement_id = req["requirement_id"]
+            items = answered.get(requirement_id)
+            snippets = None
+            if isinstance(items, list):
+                try:
+                    snippets = _snippets_from_response_items(items, document_id, document_name)
+                except Exception as e:
+                    logger.warning(f"Malformed batched evidence for {requirement_id} + {document_name}: {e}")
+
+            if snippets is None:
+                # Not answered by the batch: ask for this pair on its own.
+                snippets = await extract_evidence_with_llm(
+                    requirement=req,
+                    document_content=full_content,
+                    document_id=document_id,
+                    document_name=document_name,
+                    validation_type=req.get("validation_type", "document_presence"),
+                )
+            elif settings.llm_cache_enabled:
+                save_to_cache(cache_key, snippets)
+            results[requirement_id] = snippets
+
+    await asyncio.gather(*(run_batch(indices) for indices in batches))
+    return results
+
+
 async def _convert_mapped_spreadsheets(docs_to_convert: list[dict[str, Any]]) -> int:
     """Lazy spreadsheet conversion for the evidence-extraction pipeline.
 
@@ -722,26 +1136,124 @@ async def _convert_mapped_spreadsheets(docs_to_convert: list[dict[str, Any]]) ->
     return converted
 
 
-async def extract_all_evidence(session_id: str) -> dict[str, Any]:
-    """Optimized evidence extraction with LLM and document caching.
+def _mapped_document(doc: dict) -> MappedDocument:
+    return MappedDocument(
+        document_id=doc["document_id"],
+        document_name=doc["filename"],
+        filepath=doc["filepath"],
+        relevance_score=1.0,  # LLM extracts only relevant evidence
+        keywords_found=[],  # Not using keywords anymore
+    )
 
-    Implementation notes:
-    1. Load all documents ONCE into memory
-    2. Use LLM for semantic evidence extraction
-    3. Respect mappings from Stage 3 (only check mapped docs)
-    4. Process requirements in parallel (5 concurrent)
-    5. Use prompt caching to reduce LLM costs
 
-    Performance: 11 minutes → 25 seconds (26x faster)
-    """
-    state_manager = StateManager(session_id)
+def _requirement_evidence(
+    req: dict,
+    mapped_docs: list[MappedDocument],
+    snippets: list[EvidenceSnippet],
+    notes: str | None = None,
+) -> RequirementEvidence:
+    """Classify a requirement from its snippets and build its evidence entry."""
+    # Determine status based on evidence quality.
+    #
+    # Phase F1 proposed a classifier-level schema-match gate (require
+    # confidence > 0.8 AND schema_match=True for ``covered``). The
+    # first full Burton run under that rule dropped exact agreement
+    # from 100% → 82.6% — four requirements flipped covered → partial
+    # where Becca's ground truth said approved. The gate over-corrected
+    # on a clean-fixture scenario where the LLM was conservative about
+    # declaring schema_match=True even on requirements with dozens of
+    # high-confidence snippets. Per Phase F risk table §7 ("Prompt
+    # tuning regresses Burton / Rockscape"), the fallback is to keep
+    # the ``schema_match`` DATA visible to reviewers (it surfaces as a
+    # warning tag in the reviewer preview) but NOT gate the status
+    # classifier on it. The over-scoring reduction that F1 was supposed
+    # to deliver is deferred to Phase G, which will tune against a
+    # richer corpus (Gemma 4 full sweep + external mixed-verdict
+    # fixture) before committing to a classifier rule.
+    if not snippets:
+        status = "missing"
+        confidence = 0.0
+    elif any(s.confidence > 0.8 for s in snippets):
+        status = "covered"
+        confidence = max(s.confidence for s in snippets)
+    else:
+        status = "partial"
+        confidence = max(s.confidence for s in snippets) if snippets else 0.0
+
+    return RequirementEvidence(
+        requirement_id=req["requirement_id"],
+        requirement_text=req.get("requirement_text", ""),
+        category=req.get("category", ""),
+        validation_type=req.get("validation_type", "document_presence"),
+        status=status,
+        confidence=confidence,
+        mapped_documents=mapped_docs,
+        evidence_snippets=snippets,
+        notes=notes,
+    )
 
-    # ========================================================================
-    # Phase 1: Load Everything Once
-    # ========================================================================
 
-    print("📚 Loading session data...", flush=True)
+def _evidence_result(session_id: str, all_evidence: list[RequirementEvidence]) -> EvidenceExtractionResult:
+    covered = sum(1 for e in all_evidence if e.status == "covered")
+    partial = sum(1 for e in all_evidence if e.status == "partial")
+    missing = sum(1 for e in all_evidence if e.status == "missing")
+
+    overall_coverage = (covered + (partial * 0.5)) / len(all_evidence) if all_evidence else 0.0
+
+    return EvidenceExtractionResult(
+        session_id=session_id,
+        requirements_total=len(all_evidence),
+        requirements_covered=covered,
+        requirements_partial=partial,
+        requirements_missing=missing,
+        requirements_flagged=0,
+        overall_coverage=overall_coverage,
+        evidence=list(all_evidence),
+    )
+
+
+def _session_cost_tracker(state_manager: StateManager) -> CostTracker:
+    """The session's cost ledger, for calls made through ``call_llm``."""
+    return CostTracker(state_manager.session_id, storage_path=state_manager.session_dir / "cost_tracking.json")
+
+
+async def _save_evidence_result(state_manager: StateManager, result: EvidenceExtractionResult) -> None:
+    """Write ``evidence.json`` and mark the stage complete in ``session.json``."""
+    await state_manager.async_write_json("evidence.json", result.model_dump())
+
+    # Update session workflow progress (atomic read-modify-write inside lock)
+    await state_manager.async_update_json(
+        "session.json",
+        {
+            "workflow_progress.evidence_extraction": "completed",
+            "statistics.requirements_covered": result.requirements_covered,
+            "statistics.overall_coverage": result.overall_coverage,
+        },
+    )
+
 
+def _evidence_graph(
+    requirements: list[dict],
+    mappings: dict[str, dict],
+    fingerprints: dict[str, dict | None],
+    model: str,
+) -> EvidenceGraph:
+    """Graph of the inputs behind every mapped (requirement, document) pair."""
+    pairs: dict[str, dict[str, dict[str, Any]]] = {}
+    for req in requirements:
+        mapped = (mappings.get(req["requirement_id"]) or {}).get("mapped_documents", [])
+        pairs[req["requirement_id"]] = {
+            doc_id: _pair_inputs(req, (fingerprints.get(doc_id) or {}).get("content_hash"), model) for doc_id in mapped
+        }
+    return EvidenceGraph(documents={k: v for k, v in fingerprints.items() if v}, pairs=pairs)
+
+
+def _load_extraction_inputs(state_manager: StateManager) -> tuple[dict, dict[str, dict], list[dict]]:
+    """Documents data, mappings by requirement id, and checklist requirements.
+
+    Raises:
+        ValueError: If requirement mapping (Stage 3) has not completed.
+    """
     # Check that requirement mapping was completed (Stage 3)
     session_data = state_manager.read_json("session.json")
     workflow_progress = session_data.get("workflow_progress", {})
@@ -754,7 +1266,6 @@ async def extract_all_evidence(session_id: str) -> dict[str, Any]:
 
     # Load documents.json
     docs_data = state_manager.read_json("documents.json")
-    documents = docs_data.get("documents", [])
 
     # Load mappings.json from Stage 3
     mappings_data = state_manager.read_json("mappings.json")
@@ -768,18 +1279,16 @@ async def extract_all_evidence(session_id: str) -> dict[str, Any]:
     checklist_data = load_checklist(methodology, scope)
     requirements = checklist_data.get("requirements", [])
 
-    print(f"📋 Processing {len(requirements)} requirements", flush=True)
+    return docs_data, mappings, requirements
 
-    # ========================================================================
-    # Phase 1.5: Lazy PDF Conversion (Only Mapped PDFs)
-    # ========================================================================
-    # Convert only PDFs that are mapped to requirements and don't have markdown yet
-    # This saves significant time by not converting irrelevant PDFs
 
-    # Collect all document IDs that are mapped to any requirement
-    mapped_doc_ids = set()
-    for mapping in mappings.values():
-        mapped_doc_ids.update(mapping.get("mapped_documents", []))
+async def _convert_mapped_documents(state_manager: StateManager, docs_data: dict, mapped_doc_ids: set[str]) -> None:
+    """Convert mapped PDFs and spreadsheets that have no markdown yet.
+
+    Updates the document records in ``docs_data`` in place and persists
+    ``documents.json``. Conversion failures are reported and skipped.
+    """
+    documents = docs_data.get("documents", [])
 
     # Find PDFs needing conversion (mapped but no markdown)
     pdfs_to_convert = []
@@ -834,7 +1343,7 @@ async def extract_all_evidence(session_id: str) -> dict[str, Any]:
 
             # Save updated documents to disk
             docs_data["documents"] = documents
-            state_manager.write_json("documents.json", docs_data)
+            await state_manager.async_write_json("documents.json", docs_data)
 
         except Exception as e:
             print(f"⚠️  PDF conversion failed: {e}", flush=True)
@@ -843,9 +1352,7 @@ async def extract_all_evidence(session_id: str) -> dict[str, Any]:
     else:
         print("✓ All mapped PDFs already have markdown", flush=True)
 
-    # ========================================================================
-    # Phase 1.6: Lazy Spreadsheet Conversion (Only Mapped XLSX/CSV/TSV)
-    # ========================================================================
+    # Spreadsheets (Phase 1.6: only mapped XLSX/CSV/TSV).
     # Spreadsheets classified during discovery but never converted in the
     # PDF-only lazy path caused "No markdown available for *.xlsx" warnings
     # and left XLSX evidence invisible to the LLM. Phase D closes that gap.
@@ -872,13 +1379,120 @@ async def extract_all_evidence(session_id: str) -> dict[str, Any]:
 
             # Persist the updated doc records
             docs_data["documents"] = documents
-            state_manager.write_json("documents.json", docs_data)
+            await state_manager.async_write_json("documents.json", docs_data)
         except Exception as e:
             print(f"⚠️  Spreadsheet conversion failed: {e}", flush=True)
             print("   Continuing with available documents...", flush=True)
     else:
         print("✓ All mapped spreadsheets already have markdown", flush=True)
 
+
+def _requirement_input_key(requirement: dict, documents: list[tuple[str, str, str | None]], model: str) -> str:
+    """Hash of everything a requirement's evidence depends on.
+
+    ``documents`` lists the mapped documents as ``(document_id, filename,
+    content sha256)``; the content hash is None for documents that could
+    not be loaded. A checkpoint is reused only when this key matches.
+    """
+    payload = {
+        "requirement": requirement,
+        "documents": documents,
+        "model": model,
+        "prompt_version": PROMPT_VERSION,
+        "options": _extraction_options(),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _extraction_options() -> list:
+    """Settings that change what evidence a prompt yields."""
+    options = [
+        settings.evidence_batch_extraction,
+        settings.evidence_retrieval_enabled,
+        settings.evidence_retrieval_max_chars,
+        settings.evidence_retrieval_top_k,
+    ]
+    # Only when active, so checkpoints recorded without it stay valid.
+    if settings.llm_stream_responses and settings.evidence_stream_stop_confidence:
+        options.append(settings.evidence_stream_stop_confidence)
+    return options
+
+
+def _pair_inputs(requirement: dict, document_hash: str | None, model: str) -> dict[str, Any]:
+    """What one (requirement, document) pair's snippets were extracted from."""
+    requirement_json = json.dumps(requirement, sort_keys=True, default=str)
+    return {
+        "requirement_hash": hashlib.sha256(requirement_json.encode("utf-8")).hexdigest(),
+        "content_hash": document_hash,
+        "prompt_version": PROMPT_VERSION,
+        "model": model,
+        "options": _extraction_options(),
+    }
+
+
+def get_evidence_progress(session_id: str) -> dict[str, Any]:
+    """Progress of the session's current (or last) evidence extraction run.
+
+    Counts come from the per-requirement checkpoints, so they advance while
+    ``extract_all_evidence`` is still running and survive an interrupted run.
+    """
+    state_manager = get_session_or_raise(session_id)
+    return {"session_id": session_id, **EvidenceCheckpoints(state_manager).progress()}
+
+
+async def extract_all_evidence(
+    session_id: str,
+    resume: bool = True,
+    group_by_document: bool | None = None,
+) -> dict[str, Any]:
+    """Optimized evidence extraction with LLM and document caching.
+
+    Implementation notes:
+    1. Load all documents ONCE into memory
+    2. Use LLM for semantic evidence extraction
+    3. Respect mappings from Stage 3 (only check mapped docs)
+    4. Process requirements in parallel, as many at once as the LLM
+       throttle's concurrency ceiling
+    5. Use prompt caching to reduce LLM costs
+    6. Batch the requirements mapped to each document into as few prompts as
+       the PromptBudget allows (``settings.evidence_batch_extraction``)
+    7. Checkpoint each requirement as it completes (in batched mode, as
+       soon as every one of its mapped documents' batches has answered);
+       with ``resume`` (the default), requirements checkpointed for the
+       same inputs by an earlier, possibly interrupted, run are not
+       extracted again
+
+    ``group_by_document`` overrides ``settings.evidence_batch_extraction``
+    (item 6) for this run.
+
+    Performance: 11 minutes → 25 seconds (26x faster)
+    """
+    state_manager = StateManager(session_id)
+
+    # ========================================================================
+    # Phase 1: Load Everything Once
+    # ========================================================================
+
+    print("📚 Loading session data...", flush=True)
+
+    docs_data, mappings, requirements = _load_extraction_inputs(state_manager)
+    documents = docs_data.get("documents", [])
+
+    print(f"📋 Processing {len(requirements)} requirements", flush=True)
+
+    # ========================================================================
+    # Phase 1.5: Lazy Conversion (Only Mapped PDFs and Spreadsheets)
+    # ========================================================================
+    # Convert only documents that are mapped to requirements and don't have
+    # markdown yet. This saves significant time by not converting irrelevant PDFs
+
+    # Collect all document IDs that are mapped to any requirement
+    mapped_doc_ids = set()
+    for mapping in mappings.values():
+        mapped_doc_ids.update(mapping.get("mapped_documents", []))
+
+    await _convert_mapped_documents(state_manager, docs_data, mapped_doc_ids)
+
     print(f"\n📄 Loading {len(documents)} documents into memory...", flush=True)
 
     # ========================================================================
@@ -902,14 +1516,122 @@ async def extract_all_evidence(session_id: str) -> dict[str, Any]:
 
     print("\n✅ All documents cached in memory", flush=True)
 
+    # ========================================================================
+    # Phase 2.5: Resume From Checkpoints
+    # ========================================================================
+
+    doc_hashes = {doc_id: content_hash(content) for doc_id, content in doc_cache.items()}
+    active_model = settings.get_active_executor_model()
+    input_keys: dict[str, str] = {}
+    for req in requirements:
+        mapped = (mappings.get(req["requirement_id"]) or {}).get("mapped_documents", [])
+        documents_key = [
+            (doc_id, doc_metadata.get(doc_id, {}).get("filename", ""), doc_hashes.get(doc_id)) for doc_id in mapped
+        ]
+        input_keys[req["requirement_id"]] = _requirement_input_key(req, documents_key, active_model)
+
+    checkpoints = EvidenceCheckpoints(state_manager)
+    resumed: dict[str, dict] = {}
+    if resume:
+        resumed = {
+            requirement_id: record
+            for requirement_id, record in checkpoints.load().items()
+            if input_keys.get(requirement_id) == record.get("input_key")
+        }
+    await checkpoints.async_start_run(total=len(requirements), resumed=resumed)
+    if resumed:
+        print(f"\n♻️  Resuming: {len(resumed)}/{len(requirements)} requirement(s) restored from checkpoints", flush=True)
+
     # ========================================================================
     # Phase 3: Extract Evidence (Parallel)
     # ========================================================================
 
     print("\n🔍 Extracting evidence with LLM...\n", flush=True)
 
-    # Process requirements in parallel (rate-limited)
-    semaphore = asyncio.Semaphore(5)  # Max 5 concurrent LLM calls
+    from ..llm.single_flight import get_single_flight
+
+    coalesced_before = sum(get_single_flight().coalesced.values())
+
+    # Process requirements in parallel. LLM concurrency itself is governed by
+    # the adaptive throttle behind call_llm; this only bounds how many
+    # extractors queue on it, so it follows the throttle's ceiling.
+    from ..llm.throttle import get_throttle
+    from ..llm.token_budget import llm_priority
+
+    semaphore = asyncio.Semaphore(get_throttle().max_concurrent or 5)
+    cost_tracker = _session_cost_tracker(state_manager)
+
+    # Batched mode: one prompt per document covering every requirement mapped
+    # to it (split by PromptBudget), instead of resending the document once
+    # per requirement. Results land in ``batch_results`` keyed by
+    # (requirement_id, document_id); the per-requirement pass below reads
+    # them and only calls the LLM for pairs the batches did not cover.
+    batch_results: dict[tuple[str, str], list[EvidenceSnippet]] = {}
+    # Requirements whose mapped documents have all answered in batches,
+    # checkpointed during the batch phase so an interrupted run keeps them.
+    batch_completed: dict[str, RequirementEvidence] = {}
+
+    def batched_requirement_evidence(req: dict) -> RequirementEvidence | None:
+        """The requirement's evidence if every mapped document has a batch result."""
+        requirement_id = req["requirement_id"]
+        doc_ids = [
+            doc_id for doc_id in (mappings.get(requirement_id) or {}).get("mapped_documents", []) if doc_id in doc_cache
+        ]
+        if any((requirement_id, doc_id) not in batch_results for doc_id in doc_ids):
+            return None
+        snippets = [snippet for doc_id in doc_ids for snippet in batch_results[(requirement_id, doc_id)]]
+        return _requirement_evidence(req, [_mapped_document(doc_metadata[doc_id]) for doc_id in doc_ids], snippets)
+
+    if group_by_document is None:
+        group_by_document = settings.evidence_batch_extraction
+    if group_by_document:
+        requirements_by_doc: dict[str, list[dict]] = {}
+        for req in requirements:
+            if req["requirement_id"] in resumed:
+                continue
+            mapping = mappings.get(req["requirement_id"]) or {}
+            for doc_id in mapping.get("mapped_documents", []):
+                if doc_id in doc_cache:
+                    requirements_by_doc.setdefault(doc_id, []).append(req)
+
+        async def extract_document_evidence(doc_id: str, reqs: list[dict]) -> None:
+            async with semaphore:
+                doc = doc_metadata[doc_id]
+                print(f"  ⏳ {doc['filename']}: {len(reqs)} requirement(s)", flush=True)
+                by_requirement = await extract_evidence_batch_with_llm(
+                    requirements=reqs,
+                    document_content=doc_cache[doc_id],
+                    document_id=doc_id,
+                    document_name=doc["filename"],
+                )
+                for requirement_id, snippets in by_requirement.items():
+                    batch_results[(requirement_id, doc_id)] = snippets
+                for req in reqs:
+                    requirement_id = req["requirement_id"]
+                    if requirement_id in batch_completed:
+                        continue
+                    evidence = batched_requirement_evidence(req)
+                    if evidence is not None:
+                        batch_completed[requirement_id] = evidence
+                        await checkpoints.async_record(
+                            requirement_id, input_keys[requirement_id], evidence.model_dump(mode="json")
+                        )
+
+        try:
+            # Bulk priority: interactive REST calls overtake these in the
+            # token scheduler's queue. Tasks inherit it (and the session's
+            # cost tracker) from this context.
+            with llm_priority("bulk"), track_llm_costs(cost_tracker, extractor="evidence"):
+                await asyncio.gather(
+                    *(extract_document_evidence(doc_id, reqs) for doc_id, reqs in requirements_by_doc.items())
+                )
+        except Exception as e:
+            error_info = classify_api_error(e)
+            if error_info.is_fatal:
+                print(f"\n  LLM API Error: {error_info.category}", flush=True)
+                print(f"  {error_info.message}", flush=True)
+                print(f"\n  How to fix: {error_info.guidance}", flush=True)
+            raise
 
     async def extract_requirement_evidence(req: dict, index: int) -> RequirementEvidence:
         """Extract evidence for one requirement using LLM.
@@ -930,17 +1652,7 @@ async def extract_all_evidence(session_id: str) -> dict[str, Any]:
 
             # If not mapped, mark as missing
             if not mapping or not mapping.get("mapped_documents"):
-                return RequirementEvidence(
-                    requirement_id=requirement_id,
-                    requirement_text=req.get("requirement_text", ""),
-                    category=req.get("category", ""),
-                    validation_type=validation_type,
-                    status="missing",
-                    confidence=0.0,
-                    mapped_documents=[],
-                    evidence_snippets=[],
-                    notes="No documents mapped in Stage 3",
-                )
+                return _requirement_evidence(req, [], [], notes="No documents mapped in Stage 3")
 
             # Get mapped document IDs
             mapped_doc_ids = mapping["mapped_documents"]
@@ -949,6 +1661,18 @@ async def extract_all_evidence(session_id: str) -> dict[str, Any]:
             all_snippets = []
             mapped_docs = []
 
+            first_snippet_reported = False
+
+            def report_first_snippet(snippet: EvidenceSnippet) -> None:
+                # Streamed responses report a requirement's first snippet as it arrives.
+                nonlocal first_snippet_reported
+                if not first_snippet_reported:
+                    first_snippet_reported = True
+                    print(
+                        f"  ✚ {requirement_id}: evidence in {snippet.document_name} ({snippet.confidence:.2f})",
+                        flush=True,
+                    )
+
             for doc_id in mapped_doc_ids:
                 # Get cached content (NO FILE I/O!)
                 content = doc_cache.get(doc_id)
@@ -957,71 +1681,42 @@ async def extract_all_evidence(session_id: str) -> dict[str, Any]:
 
                 doc = doc_metadata[doc_id]
 
-                # Use type-aware LLM extraction based on validation_type
-                snippets = await extract_evidence_with_llm(
-                    requirement=req,
-                    document_content=content,
-                    document_id=doc_id,
-                    document_name=doc["filename"],
-                    validation_type=validation_type,
-                )
+                if (requirement_id, doc_id) in batch_results:
+                    snippets = batch_results[(requirement_id, doc_id)]
+                else:
+                    # Use type-aware LLM extraction based on validation_type
+                    snippets = await extract_evidence_with_llm(
+                        requirement=req,
+                        document_content=content,
+                        document_id=doc_id,
+                        document_name=doc["filename"],
+                        validation_type=validation_type,
+                        on_snippet=report_first_snippet,
+                    )
 
                 all_snippets.extend(snippets)
 
                 # Track mapped document
-                mapped_docs.append(
-                    MappedDocument(
-                        document_id=doc_id,
-                        document_name=doc["filename"],
-                        filepath=doc["filepath"],
-                        relevance_score=1.0,  # LLM extracts only relevant evidence
-                        keywords_found=[],  # Not using keywords anymore
-                    )
-                )
+                mapped_docs.append(_mapped_document(doc))
 
-            # Determine status based on evidence quality.
-            #
-            # Phase F1 proposed a classifier-level schema-match gate (require
-            # confidence > 0.8 AND schema_match=True for ``covered``). The
-            # first full Burton run under that rule dropped exact agreement
-            # from 100% → 82.6% — four requirements flipped covered → partial
-            # where Becca's ground truth said approved. The gate over-corrected
-            # on a clean-fixture scenario where the LLM was conservative about
-            # declaring schema_match=True even on requirements with dozens of
-            # high-confidence snippets. Per Phase F risk table §7 ("Prompt
-            # tuning regresses Burton / Rockscape"), the fallback is to keep
-            # the ``schema_match`` DATA visible to reviewers (it surfaces as a
-            # warning tag in the reviewer preview) but NOT gate the status
-            # classifier on it. The over-scoring reduction that F1 was supposed
-            # to deliver is deferred to Phase G, which will tune against a
-            # richer corpus (Gemma 4 full sweep + external mixed-verdict
-            # fixture) before committing to a classifier rule.
-            if not all_snippets:
-                status = "missing"
-                confidence = 0.0
-            elif any(s.confidence > 0.8 for s in all_snippets):
-                status = "covered"
-                confidence = max(s.confidence for s in all_snippets)
-            else:
-                status = "partial"
-                confidence = max(s.confidence for s in all_snippets) if all_snippets else 0.0
-
-            return RequirementEvidence(
-                requirement_id=requirement_id,
-                requirement_text=req.get("requirement_text", ""),
-                category=req.get("category", ""),
-                validation_type=validation_type,
-                status=status,
-                confidence=confidence,
-                mapped_documents=mapped_docs,
-                evidence_snippets=all_snippets,
-            )
+            return _requirement_evidence(req, mapped_docs, all_snippets)
+
+    async def checkpointed_requirement_evidence(req: dict, index: int) -> RequirementEvidence:
+        requirement_id = req["requirement_id"]
+        if requirement_id in resumed:
+            return RequirementEvidence.model_validate(resumed[requirement_id]["evidence"])
+        if requirement_id in batch_completed:
+            return batch_completed[requirement_id]
+        evidence = await extract_requirement_evidence(req, index)
+        await checkpoints.async_record(requirement_id, input_keys[requirement_id], evidence.model_dump(mode="json"))
+        return evidence
 
     # Process all requirements in parallel
-    tasks = [extract_requirement_evidence(req, i) for i, req in enumerate(requirements, 1)]
+    tasks = [checkpointed_requirement_evidence(req, i) for i, req in enumerate(requirements, 1)]
 
     try:
-        all_evidence = await asyncio.gather(*tasks)
+        with llm_priority("bulk"), track_llm_costs(cost_tracker, extractor="evidence"):
+            all_evidence = await asyncio.gather(*tasks)
     except Exception as e:
         error_info = classify_api_error(e)
         if error_info.is_fatal:
@@ -1034,39 +1729,340 @@ async def extract_all_evidence(session_id: str) -> dict[str, Any]:
     # Phase 4: Calculate Statistics & Save
     # ========================================================================
 
-    covered = sum(1 for e in all_evidence if e.status == "covered")
-    partial = sum(1 for e in all_evidence if e.status == "partial")
-    missing = sum(1 for e in all_evidence if e.status == "missing")
-
-    overall_coverage = (covered + (partial * 0.5)) / len(all_evidence) if all_evidence else 0.0
+    result = _evidence_result(session_id, all_evidence)
+    covered, partial, missing = result.requirements_covered, result.requirements_partial, result.requirements_missing
 
     print("\n✅ Evidence extraction complete:", flush=True)
     print(f"   • Covered: {covered} ({covered / len(requirements) * 100:.0f}%)", flush=True)
     print(f"   • Partial: {partial} ({partial / len(requirements) * 100:.0f}%)", flush=True)
     print(f"   • Missing: {missing} ({missing / len(requirements) * 100:.0f}%)", flush=True)
+    coalesced = sum(get_single_flight().coalesced.values()) - coalesced_before
+    if coalesced:
+        print(f"   • Coalesced duplicate LLM requests: {coalesced}", flush=True)
+    cost_tracker.flush()
+    costs = cost_tracker.get_summary()
+    if costs.total_cache_read_tokens or costs.total_cache_creation_tokens:
+        print(f"   • Prompt cache: {costs.prompt_cache_hit_rate:.0%} of prompt tokens read from cache", flush=True)
+
+    await _save_evidence_result(state_manager, result)
+    await checkpoints.async_finish_run()
+    fingerprints = {
+        doc_id: document_fingerprint(doc_metadata[doc_id], content=content) for doc_id, content in doc_cache.items()
+    }
+    _evidence_graph(requirements, mappings, fingerprints, active_model).save(state_manager)
 
-    result = EvidenceExtractionResult(
-        session_id=session_id,
-        requirements_total=len(requirements),
-        requirements_covered=covered,
-        requirements_partial=partial,
-        requirements_missing=missing,
-        requirements_flagged=0,
-        overall_coverage=overall_coverage,
-        evidence=[e for e in all_evidence],
+    return result.model_dump()
+
+
+async def extract_all_evidence_batch(
+    session_id: str,
+    backend: "BatchBackend | None" = None,
+    poll_interval: float | None = None,
+) -> dict[str, Any]:
+    """Extract evidence through one provider batch job instead of live calls.
+
+    For offline runs (regression fixtures, backfills): every uncached
+    (requirement, document) prompt is serialized into a single batch job
+    (``llm.batch``), exactly as :func:`extract_evidence_with_llm` would
+    send it. Once the job ends its responses are written to the LLM cache
+    under the per-pair keys, and :func:`extract_all_evidence` then builds
+    ``evidence.json`` from cache hits. Pairs the job failed to answer are
+    extracted live by that final pass.
+
+    Args:
+        session_id: Session to extract
+        backend: Batch backend (default: ``llm.batch.get_batch_backend()``)
+        poll_interval: Seconds between job status polls (default: settings)
+
+    Returns:
+        The :func:`extract_all_evidence` result, plus a ``batch`` summary
+
+    Raises:
+        ValueError: If the LLM cache is disabled, or the Anthropic batch API
+            would answer for a model other than the one that serves live calls
+    """
+    from ..llm.batch import BatchRequest, get_batch_backend, run_batch_job
+    from ..utils.llm_client import anthropic_request_params
+
+    if not settings.llm_cache_enabled:
+        raise ValueError("Batch extraction hydrates the LLM cache; enable llm_cache_enabled")
+    backend = backend or get_batch_backend()
+    active_model = settings.get_active_executor_model()
+    if backend.name == "anthropic" and active_model != settings.get_active_llm_model():
+        raise ValueError(f"Live calls are served by {active_model}; the Anthropic batch API cannot answer for it")
+
+    state_manager = StateManager(session_id)
+    docs_data, mappings, requirements = _load_extraction_inputs(state_manager)
+    mapped_doc_ids = {doc_id for mapping in mappings.values() for doc_id in mapping.get("mapped_documents", [])}
+    await _convert_mapped_documents(state_manager, docs_data, mapped_doc_ids)
+
+    documents = {doc["document_id"]: doc for doc in docs_data.get("documents", [])}
+    contents: dict[str, str] = {}
+    for doc_id in mapped_doc_ids & documents.keys():
+        content = await get_markdown_content(documents[doc_id], session_id)
+        if content:
+            contents[doc_id] = content
+
+    # ``pairs`` maps each request to the cache entries it answers (identical
+    # prompts are submitted once).
+    requests: list[BatchRequest] = []
+    pairs: dict[str, list[tuple[str, str, str]]] = {}  # custom_id -> [(cache key, document id, name)]
+    cached = 0
+    for req in requirements:
+        validation_type = req.get("validation_type", "document_presence")
+        for doc_id in (mappings.get(req["requirement_id"]) or {}).get("mapped_documents", []):
+            if doc_id not in contents:
+                continue
+            document_name = documents[doc_id]["filename"]
+            pair_content = _pair_document_content(req, contents[doc_id], document_name)
+            cache_key = _evidence_cache_key(req, pair_content, doc_id, validation_type, active_model)
+            if load_from_cache(cache_key) is not None:
+                cached += 1
+                continue
+            prompt = build_type_aware_prompt(req, pair_content, document_name, validation_type)
+            request = BatchRequest.from_params(
+                anthropic_request_params(prompt, _EVIDENCE_SYSTEM_PROMPT, active_model, 4000)
+            )
+            if request.custom_id not in pairs:
+                requests.append(request)
+            pairs.setdefault(request.custom_id, []).append((cache_key, doc_id, document_name))
+
+    print(f"📦 Batch: {len(requests)} request(s) to submit, {cached} pair(s) already cached", flush=True)
+    results = await run_batch_job(
+        requests, backend, state_manager.session_dir / "evidence_batch_job.json", poll_interval
     )
 
-    # Save to state
-    state_manager.write_json("evidence.json", result.model_dump())
+    cost_tracker = _session_cost_tracker(state_manager)
+    answered = failed = 0
+    for custom_id, entries in pairs.items():
+        result = results.get(custom_id)
+        if result is None or result.message is None:
+            logger.warning(f"Batch request {custom_id} failed: {result.error if result else 'no result'}")
+            failed += 1
+            continue
+        usage = result.usage
+        if usage.get("input_tokens") or usage.get("output_tokens"):
+            cost_tracker.track_api_call(
+                model=result.message.get("model") or active_model,
+                extractor="evidence",
+                document_name=entries[0][2],
+                input_tokens=usage.get("input_tokens") or 0,
+                output_tokens=usage.get("output_tokens") or 0,
+                duration_seconds=0.0,
+                cache_creation_tokens=usage.get("cache_creation_input_tokens") or 0,
+                cache_read_tokens=usage.get("cache_read_input_tokens") or 0,
+                batch=True,
+            )
+        try:
+            evidence_array = _parse_evidence_array(result.text)
+            snippets = [
+                (cache_key, _snippets_from_response_items(evidence_array, doc_id, document_name))
+                for cache_key, doc_id, document_name in entries
+            ]
+        except (ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Unparseable batch response for {entries[0][2]}: {e}")
+            failed += 1
+            continue
+        for cache_key, pair_snippets in snippets:
+            save_to_cache(cache_key, pair_snippets)
+        answered += 1
+    cost_tracker.flush()
+    print(f"📦 Batch: {answered} answered, {failed} left for live extraction", flush=True)
+
+    # Per-pair prompts, so the final pass looks up the keys just written.
+    result = await extract_all_evidence(session_id, group_by_document=False)
+    result["batch"] = {
+        "backend": backend.name,
+        "submitted": len(requests),
+        "answered": answered,
+        "failed": failed,
+        "already_cached": cached,
+    }
+    return result
 
-    # Update session workflow progress (atomic read-modify-write inside lock)
-    state_manager.update_json(
-        "session.json",
-        {
-            "workflow_progress.evidence_extraction": "completed",
-            "statistics.requirements_covered": covered,
-            "statistics.overall_coverage": overall_coverage,
-        },
+
+# Derived artifacts refreshed after an incremental run, if they already exist.
+_DERIVED_REPORTS = (
+    ("report.md", "markdown"),
+    ("report.json", "json"),
+    ("checklist.md", "checklist"),
+    ("checklist.docx", "docx"),
+    ("report.pdf", "pdf"),
+)
+
+
+async def _refresh_derived_artifacts(session_id: str, state_manager: StateManager) -> list[str]:
+    """Regenerate ``validation.json`` and reports that exist, from the patched evidence."""
+    refreshed: list[str] = []
+    if state_manager.exists("validation.json"):
+        from .validation_tools import cross_validate
+
+        await cross_validate(session_id)
+        refreshed.append("validation.json")
+
+    from .report_tools import generate_review_report
+
+    for filename, report_format in _DERIVED_REPORTS:
+        if state_manager.exists(filename):
+            await generate_review_report(session_id, format=report_format)
+            refreshed.append(filename)
+    return refreshed
+
+
+async def extract_evidence_incremental(session_id: str) -> dict[str, Any]:
+    """Re-extract only the (requirement, document) pairs whose inputs changed.
+
+    Diffs the current mappings and document fingerprints against the
+    evidence graph recorded by the last run (``evidence_graph.json``).
+    Pairs whose requirement, document content, prompt version, model or
+    extraction options changed, and newly mapped pairs, are extracted again;
+    unmapped pairs are dropped; every other pair keeps its snippets from
+    ``evidence.json``. Unchanged documents are recognized by ``stat`` and
+    not read. ``evidence.json`` is then patched, and ``validation.json`` and
+    any existing reports are regenerated from it.
+
+    Falls back to :func:`extract_all_evidence` when the session has no
+    evidence graph yet.
+    """
+    state_manager = get_session_or_raise(session_id)
+    graph = EvidenceGraph.load(state_manager)
+    if graph is None or not state_manager.exists("evidence.json"):
+        print("ℹ️  No evidence dependency graph yet; running a full extraction", flush=True)
+        result = await extract_all_evidence(session_id)
+        return {**result, "incremental": {"mode": "full"}}
+
+    docs_data, mappings, requirements = _load_extraction_inputs(state_manager)
+    mapped_doc_ids = {doc_id for m in mappings.values() for doc_id in m.get("mapped_documents", [])}
+    await _convert_mapped_documents(state_manager, docs_data, mapped_doc_ids)
+    doc_metadata = {doc["document_id"]: doc for doc in docs_data.get("documents", [])}
+
+    fingerprints = {
+        doc_id: document_fingerprint(doc_metadata[doc_id], previous=graph.documents.get(doc_id))
+        for doc_id in mapped_doc_ids
+        if doc_id in doc_metadata
+    }
+    active_model = settings.get_active_executor_model()
+    current = _evidence_graph(requirements, mappings, fingerprints, active_model)
+
+    evidence_data = state_manager.read_json("evidence.json")
+    existing = {e["requirement_id"]: RequirementEvidence.model_validate(e) for e in evidence_data.get("evidence", [])}
+    requirement_ids = [req["requirement_id"] for req in requirements]
+
+    stale_pairs: list[tuple[dict, str]] = []
+    changed: set[str] = set()
+    for req in requirements:
+        requirement_id = req["requirement_id"]
+        pairs = current.pairs[requirement_id]
+        previous = graph.pairs.get(requirement_id)
+        if requirement_id not in existing or previous is None or list(previous) != list(pairs):
+            changed.add(requirement_id)
+        for doc_id, inputs in pairs.items():
+            if requirement_id not in existing or (previous or {}).get(doc_id) != inputs:
+                changed.add(requirement_id)
+                if fingerprints.get(doc_id):
+                    stale_pairs.append((req, doc_id))
+
+    dropped = set(existing) - set(requirement_ids)
+    summary = {
+        "mode": "incremental",
+        "pairs_total": sum(len(p) for p in current.pairs.values()),
+        "pairs_recomputed": len(stale_pairs),
+        "requirements_updated": sorted(changed),
+        "requirements_dropped": sorted(dropped),
+    }
+    if not changed and not dropped:
+        print("✓ Evidence is up to date; nothing to re-extract", flush=True)
+        current.save(state_manager)  # refresh fingerprints (e.g. touched but unchanged files)
+        return {**evidence_data, "incremental": {**summary, "refreshed": []}}
+
+    print(
+        f"\n🔁 Incremental extraction: {len(stale_pairs)}/{summary['pairs_total']} pair(s) to recompute, "
+        f"{len(changed)} requirement(s) to update",
+        flush=True,
     )
 
-    return result.model_dump()
+    # Read only the documents behind stale pairs.
+    stale_keys = {(req["requirement_id"], doc_id) for req, doc_id in stale_pairs}
+    doc_cache = {}
+    for doc_id in {doc_id for _, doc_id in stale_pairs}:
+        content = await get_markdown_content(doc_metadata[doc_id], session_id)
+        if content:
+            doc_cache[doc_id] = content
+
+    from ..llm.throttle import get_throttle
+    from ..llm.token_budget import llm_priority
+
+    semaphore = asyncio.Semaphore(get_throttle().max_concurrent or 5)
+    recomputed: dict[tuple[str, str], list[EvidenceSnippet]] = {}
+
+    async def extract_document_pairs(doc_id: str, reqs: list[dict]) -> None:
+        async with semaphore:
+            doc = doc_metadata[doc_id]
+            if settings.evidence_batch_extraction:
+                by_requirement = await extract_evidence_batch_with_llm(
+                    requirements=reqs,
+                    document_content=doc_cache[doc_id],
+                    document_id=doc_id,
+                    document_name=doc["filename"],
+                )
+            else:
+                by_requirement = {
+                    req["requirement_id"]: await extract_evidence_with_llm(
+                        requirement=req,
+                        document_content=doc_cache[doc_id],
+                        document_id=doc_id,
+                        document_name=doc["filename"],
+                        validation_type=req.get("validation_type", "document_presence"),
+                    )
+                    for req in reqs
+                }
+            for requirement_id, snippets in by_requirement.items():
+                recomputed[(requirement_id, doc_id)] = snippets
+
+    stale_by_doc: dict[str, list[dict]] = {}
+    for req, doc_id in stale_pairs:
+        if doc_id in doc_cache:
+            stale_by_doc.setdefault(doc_id, []).append(req)
+
+    cost_tracker = _session_cost_tracker(state_manager)
+    with llm_priority("bulk"), track_llm_costs(cost_tracker, extractor="evidence"):
+        await asyncio.gather(*(extract_document_pairs(doc_id, reqs) for doc_id, reqs in stale_by_doc.items()))
+    cost_tracker.flush()
+
+    all_evidence: list[RequirementEvidence] = []
+    for req in requirements:
+        requirement_id = req["requirement_id"]
+        if requirement_id not in changed:
+            all_evidence.append(existing[requirement_id])
+            continue
+        pairs = current.pairs[requirement_id]
+        if not pairs:
+            all_evidence.append(_requirement_evidence(req, [], [], notes="No documents mapped in Stage 3"))
+            continue
+
+        previous_snippets = existing[requirement_id].evidence_snippets if requirement_id in existing else []
+        mapped_docs: list[MappedDocument] = []
+        snippets: list[EvidenceSnippet] = []
+        for doc_id in pairs:
+            if not fingerprints.get(doc_id):
+                continue  # no markdown: skipped, as in a full run
+            if (requirement_id, doc_id) in recomputed:
+                snippets.extend(recomputed[(requirement_id, doc_id)])
+            elif (requirement_id, doc_id) not in stale_keys:
+                snippets.extend(s for s in previous_snippets if s.document_id == doc_id)
+            else:
+                continue  # could not be read
+            mapped_docs.append(_mapped_document(doc_metadata[doc_id]))
+        all_evidence.append(_requirement_evidence(req, mapped_docs, snippets))
+
+    result = _evidence_result(session_id, all_evidence)
+    await _save_evidence_result(state_manager, result)
+    current.save(state_manager)
+
+    refreshed = await _refresh_derived_artifacts(session_id, state_manager)
+    print(
+        f"✅ Incremental extraction complete: {len(changed)} requirement(s) updated"
+        + (f"; refreshed {', '.join(refreshed)}" if refreshed else ""),
+        flush=True,
+    )
+    return {**result.model_dump(), "incremental": {**summary, "refreshed": ["evidence.json", *refreshed]}}
@@ -10,6 +10,7 @@ Provides tools for human reviewers to:
 from datetime import datetime, timezone
 from typing import Any, Literal
 
+from ..utils.audit_log import AuditLog
 from ..utils.state import get_session_or_raise
 
 OverrideStatus = Literal["approved", "rejected", "needs_revision", "conditional", "pending"]
@@ -38,34 +39,10 @@ def _log_audit_event(
     """Log an event to the audit trail.
 
     This creates a centralized audit log for compliance and transparency.
+    Events are appended to the session's JSONL log (see ``utils.audit_log``),
+    so logging stays O(1) however long the review runs.
     """
-    now = datetime.now(timezone.utc).isoformat()
-
-    # Load or create audit log
-    if state_manager.exists("audit_log.json"):
-        audit_data = state_manager.read_json("audit_log.json")
-    else:
-        audit_data = {
-            "session_id": state_manager.session_id,
-            "events": [],
-            "created_at": now,
-        }
-
-    # Create audit event
-    event = {
-        "id": len(audit_data["events"]) + 1,
-        "timestamp": now,
-        "action": action,
-        "entity_type": entity_type,
-        "entity_id": entity_id,
-        "actor": actor,
-        "details": details,
-    }
-
-    audit_data["events"].append(event)
-    audit_data["updated_at"] = now
-
-    state_manager.write_json("audit_log.json", audit_data)
+    AuditLog(state_manager).append(action, entity_type, entity_id, actor, details)
 
 
 async def set_requirement_override(
@@ -135,7 +112,7 @@ async def set_requirement_override(
     annotations_data["updated_at"] = now
 
     # Save
-    state_manager.write_json("annotations.json", annotations_data)
+    await state_manager.async_write_json("annotations.json", annotations_data)
 
     # Log audit event
     _log_audit_event(
@@ -153,7 +130,7 @@ async def set_requirement_override(
     rejected = sum(1 for o in annotations_data["overrides"].values() if o["status"] == "rejected")
     needs_revision = sum(1 for o in annotations_data["overrides"].values() if o["status"] == "needs_revision")
 
-    state_manager.update_json(
+    await state_manager.async_update_json(
         "session.json",
         {
             "statistics.human_overrides": total_overrides,
@@ -228,7 +205,7 @@ async def add_annotation(
     annotations_data["updated_at"] = now
 
     # Save
-    state_manager.write_json("annotations.json", annotations_data)
+    await state_manager.async_write_json("annotations.json", annotations_data)
 
     # Log audit event
     _log_audit_event(
@@ -374,7 +351,7 @@ async def clear_requirement_override(
     annotations_data["updated_at"] = now
 
     # Save
-    state_manager.write_json("annotations.json", annotations_data)
+    await state_manager.async_write_json("annotations.json", annotations_data)
 
     # Log audit event
     _log_audit_event(
@@ -454,7 +431,7 @@ async def set_final_determination(
     determination_data["updated_at"] = now
 
     # Save determination
-    state_manager.write_json("determination.json", determination_data)
+    await state_manager.async_write_json("determination.json", determination_data)
 
     # Log audit event
     _log_audit_event(
@@ -467,7 +444,7 @@ async def set_final_determination(
     )
 
     # Update session with determination info
-    state_manager.update_json(
+    await state_manager.async_update_json(
         "session.json",
         {
             "final_determination": determination,
@@ -576,7 +553,7 @@ async def clear_final_determination(
     determination_data["set_at"] = None
     determination_data["updated_at"] = now
 
-    state_manager.write_json("determination.json", determination_data)
+    await state_manager.async_write_json("determination.json", determination_data)
 
     # Log audit event
     _log_audit_event(
@@ -589,7 +566,7 @@ async def clear_final_determination(
     )
 
     # Update session
-    state_manager.update_json(
+    await state_manager.async_update_json(
         "session.json",
         {
             "final_determination": None,
@@ -666,7 +643,7 @@ async def request_revision(
     revisions_data["updated_at"] = now
 
     # Save
-    state_manager.write_json("revisions.json", revisions_data)
+    await state_manager.async_write_json("revisions.json", revisions_data)
 
     # Log audit event
     _log_audit_event(
@@ -902,7 +879,7 @@ async def resolve_revision(
     request["resolved_by"] = resolved_by
     revisions_data["updated_at"] = now
 
-    state_manager.write_json("revisions.json", revisions_data)
+    await state_manager.async_write_json("revisions.json", revisions_data)
 
     # Log audit event
     _log_audit_event(
@@ -947,24 +924,36 @@ async def get_audit_log(
     action_filter: AuditActionType | None = None,
     actor_filter: str | None = None,
     limit: int = 100,
+    cursor: int | None = None,
 ) -> dict[str, Any]:
     """Get the audit log for a session.
 
     Returns a chronological list of all actions taken during the review,
-    with optional filtering by action type or actor.
+    with optional filtering by action type or actor. Filters are answered
+    from the log's index, so cost scales with the page returned rather
+    than with the length of the review.
 
     Args:
         session_id: Unique session identifier
         action_filter: Optional filter by action type
         actor_filter: Optional filter by actor
         limit: Maximum number of events to return (default 100)
+        cursor: Return events older than this one; pass the previous
+            response's ``next_cursor`` to page backwards
 
     Returns:
         Audit log with events and summary statistics
     """
     state_manager = get_session_or_raise(session_id)
 
-    if not state_manager.exists("audit_log.json"):
+    page = AuditLog(state_manager).query(
+        action=action_filter,
+        actor=actor_filter,
+        limit=limit,
+        cursor=cursor,
+    )
+
+    if page["total"] == 0:
         return {
             "session_id": session_id,
             "events": [],
@@ -973,40 +962,21 @@ async def get_audit_log(
                 "by_action": {},
                 "by_actor": {},
             },
+            "next_cursor": None,
             "message": "No audit events recorded",
         }
 
-    audit_data = state_manager.read_json("audit_log.json")
-    events = audit_data.get("events", [])
-
-    # Apply filters
-    filtered_events = events
-    if action_filter:
-        filtered_events = [e for e in filtered_events if e.get("action") == action_filter]
-    if actor_filter:
-        filtered_events = [e for e in filtered_events if e.get("actor") == actor_filter]
-
-    # Apply limit (most recent first)
-    filtered_events = filtered_events[-limit:]
-
-    # Calculate summary from all events (not filtered)
-    by_action: dict[str, int] = {}
-    by_actor: dict[str, int] = {}
-    for event in events:
-        action = event.get("action", "unknown")
-        actor = event.get("actor", "unknown")
-        by_action[action] = by_action.get(action, 0) + 1
-        by_actor[actor] = by_actor.get(actor, 0) + 1
-
     return {
         "session_id": session_id,
-        "events": filtered_events,
+        "events": page["events"],
         "summary": {
-            "total_events": len(events),
-            "filtered_events": len(filtered_events),
-            "by_action": by_action,
-            "by_actor": by_actor,
+            "total_events": page["total"],
+            "matching_events": page["matching"],
+            "filtered_events": len(page["events"]),
+            "by_action": page["by_action"],
+            "by_actor": page["by_actor"],
         },
-        "created_at": audit_data.get("created_at"),
-        "updated_at": audit_data.get("updated_at"),
+        "next_cursor": page["next_cursor"],
+        "created_at": page["created_at"],
+        "updated_at": page["updated_at"],
     }
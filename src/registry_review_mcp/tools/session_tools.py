@@ -17,6 +17,7 @@ from ..models.schemas import (
     WorkflowProgress,
 )
 from ..utils.state import StateManager, get_session_or_raise
+from ..utils.state_cache import get_state_cache
 
 
 def generate_session_id() -> str:
@@ -221,6 +222,7 @@ async def delete_session(session_id: str) -> dict[str, Any]:
     # Remove entire session directory using safe_rmtree
     # force=True because we've done our own validation above
     safe_rmtree(session_dir, force=True)
+    get_state_cache().invalidate(session_id)
 
     logger.info(f"SESSION DELETE COMPLETE: {session_id} removed successfully")
 
@@ -0,0 +1,176 @@
+"""Content-addressed store for extraction artifacts.
+
+Extraction results used to be cached by file *path*. The same monitoring
+report uploaded to ten sessions was converted ten times, and a PDF
+re-exported in place at the same path returned the previous conversion.
+
+Artifacts are now keyed by ``(extractor, extractor version, SHA-256 of the
+file bytes, variant)``:
+
+- identical bytes anywhere on disk share one artifact, so cross-session
+  reuse is automatic;
+- editing a file changes its hash, so stale results are unreachable;
+- bumping an entry in :data:`EXTRACTOR_VERSIONS` retires every artifact
+  that extractor produced without touching the others.
+
+``variant`` captures the options that change an extractor's output for the
+same bytes (page range, OCR language/DPI, ...).
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from ..config.settings import settings
+from .cache import Cache
+
+logger = logging.getLogger(__name__)
+
+# Bump an entry whenever that extractor's output format or logic changes.
+EXTRACTOR_VERSIONS: dict[str, str] = {
+    "fast": "1",
+    "marker": "1",
+    "ocr": "1",
+    "spreadsheet": "1",
+    "gis": "1",
+}
+
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+# resolved path -> (mtime_ns, size, sha256), least recently used first.
+# Re-hashing a 200 MB PDF on every cache probe would cost more than some of
+# the extractions it guards. Keyed by path so a changed file replaces its
+# old entry, and capped for long-lived servers that see many files.
+_HASH_MEMO_MAX_ENTRIES = 4096
+_hash_memo: OrderedDict[str, tuple[int, int, str]] = OrderedDict()
+_hash_memo_lock = threading.Lock()
+
+
+def file_sha256(filepath: str | Path) -> str:
+    """Return the SHA-256 hex digest of a file's content.
+
+    Memoised per process (LRU, :data:`_HASH_MEMO_MAX_ENTRIES` paths) and
+    checked against ``(mtime_ns, size)``, so repeat calls for an unchanged
+    file are a single ``stat``.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    path = Path(filepath).resolve()
+    stat = path.stat()
+    memo_key = str(path)
+    with _hash_memo_lock:
+        memo = _hash_memo.get(memo_key)
+        if memo is not None and memo[:2] == (stat.st_mtime_ns, stat.st_size):
+            _hash_memo.move_to_end(memo_key)
+            return memo[2]
+
+    sha256_hash = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+            sha256_hash.update(block)
+    digest = sha256_hash.hexdigest()
+    with _hash_memo_lock:
+        _hash_memo[memo_key] = (stat.st_mtime_ns, stat.st_size, digest)
+        _hash_memo.move_to_end(memo_key)
+        while len(_hash_memo) > _HASH_MEMO_MAX_ENTRIES:
+            _hash_memo.popitem(last=False)
+    return digest
+
+
+class ArtifactStore:
+    """Extraction artifacts addressed by file content rather than path."""
+
+    def __init__(self, namespace: str = "artifacts"):
+        """Initialize the store.
+
+        Args:
+            namespace: Cache namespace (directory under ``settings.cache_dir``)
+        """
+        self._cache = Cache(namespace)
+
+    @staticmethod
+    def artifact_key(extractor: str, content_hash: str, variant: str = "") -> str:
+        """Build the storage key for one artifact.
+
+        Raises:
+            KeyError: If ``extractor`` has no entry in :data:`EXTRACTOR_VERSIONS`.
+        """
+        return f"{extractor}:v{EXTRACTOR_VERSIONS[extractor]}:{content_hash}:{variant}"
+
+    def _resolve_hash(self, filepath: str | Path, content_hash: str | None) -> str | None:
+        if content_hash:
+            return content_hash
+        try:
+            return file_sha256(filepath)
+        except OSError as e:
+            logger.debug(f"Cannot hash {filepath} for artifact lookup: {e}")
+            return None
+
+    def get(
+        self,
+        extractor: str,
+        filepath: str | Path,
+        variant: str = "",
+        content_hash: str | None = None,
+    ) -> Any:
+        """Fetch the artifact ``extractor`` produced for ``filepath``'s content.
+
+        The artifact may have been produced from a copy at another path (or
+        in another session); a top-level ``filepath`` field is rewritten to
+        the caller's path so results stay indistinguishable from a fresh run.
+
+        Args:
+            extractor: Key into :data:`EXTRACTOR_VERSIONS`
+            filepath: File whose content addresses the artifact
+            variant: Output-affecting options, if any
+            content_hash: Precomputed SHA-256, to skip hashing
+
+        Returns:
+            The cached artifact, or None
+        """
+        digest = self._resolve_hash(filepath, content_hash)
+        if digest is None:
+            return None
+
+        value = self._cache.get(self.artifact_key(extractor, digest, variant))
+        if isinstance(value, dict) and "filepath" in value:
+            value = {**value, "filepath": str(filepath)}
+        return value
+
+    def put(
+        self,
+        extractor: str,
+        filepath: str | Path,
+        value: Any,
+        variant: str = "",
+        content_hash: str | None = None,
+    ) -> None:
+        """Store an artifact for ``filepath``'s current content.
+
+        Args:
+            extractor: Key into :data:`EXTRACTOR_VERSIONS`
+            filepath: File whose content addresses the artifact
+            value: JSON-serializable artifact
+            variant: Output-affecting options, if any
+            content_hash: Precomputed SHA-256, to skip hashing
+        """
+        digest = self._resolve_hash(filepath, content_hash)
+        if digest is None:
+            return
+        self._cache.set(self.artifact_key(extractor, digest, variant), value, ttl=settings.artifact_cache_ttl)
+
+    def clear(self) -> int:
+        """Remove every stored artifact.
+
+        Returns:
+            Number of artifacts removed
+        """
+        return self._cache.clear()
+
+
+# Global artifact store
+artifact_store = ArtifactStore()
@@ -0,0 +1,375 @@
+"""Append-only audit trail for human review actions.
+
+``audit_log.json`` used to be loaded, appended to, and rewritten whole for
+every review action (O(n^2) over a long review), and ``get_audit_log``
+re-scanned every event to build its summary on each call.
+
+Events now go to ``audit_log.jsonl``, one JSON object per line, appended
+under the file's lock. A sidecar ``audit_log.index.json`` records, per
+action and per actor, the ids of matching events, plus every event's byte
+offset. Queries seek straight to the events they return, so filtering and
+limiting cost O(result), and counts come from the index.
+
+The index is derived data. It is kept in memory per process, caught up by
+parsing only the bytes appended since it was last seen (by this process or
+another), and persisted in batches alongside the ``fsync`` of the log. A
+missing or inconsistent index is rebuilt from the log.
+
+Durability is batched: the log is ``fsync``-ed once ``audit_fsync_batch``
+events are pending or ``audit_fsync_interval`` seconds have passed since the
+last sync, and at interpreter exit.
+
+Sessions created before this format are migrated on first access
+(:func:`migrate_legacy_audit_log`); the old file is kept as
+``audit_log.json.migrated``.
+"""
+
+import atexit
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Sequence
+
+from ..config.settings import settings
+from .state import StateManager
+
+logger = logging.getLogger(__name__)
+
+LEGACY_FILENAME = "audit_log.json"
+LOG_FILENAME = "audit_log.jsonl"
+INDEX_FILENAME = "audit_log.index.json"
+INDEX_VERSION = 1
+
+
+@dataclass
+class _AuditIndex:
+    """Offsets and per-key event ids for one session's log."""
+
+    size: int = 0  # bytes of the log covered by this index
+    offsets: list[int] = field(default_factory=list)  # offsets[id - 1]
+    by_action: dict[str, list[int]] = field(default_factory=dict)
+    by_actor: dict[str, list[int]] = field(default_factory=dict)
+    created_at: str | None = None
+    updated_at: str | None = None
+    persisted_count: int = 0  # events covered by the index file on disk
+    unsynced: int = 0
+    last_sync: float = field(default_factory=time.monotonic)
+
+    @property
+    def total(self) -> int:
+        return len(self.offsets)
+
+    def add(self, event: dict[str, Any], offset: int) -> None:
+        event_id = len(self.offsets) + 1
+        self.offsets.append(offset)
+        self.by_action.setdefault(event.get("action", "unknown"), []).append(event_id)
+        self.by_actor.setdefault(event.get("actor", "unknown"), []).append(event_id)
+        self.created_at = self.created_at or event.get("timestamp")
+        self.updated_at = event.get("timestamp") or self.updated_at
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "version": INDEX_VERSION,
+            "size": self.size,
+            "offsets": self.offsets,
+            "by_action": self.by_action,
+            "by_actor": self.by_actor,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "_AuditIndex":
+        index = cls(
+            size=data["size"],
+            offsets=list(data["offsets"]),
+            by_action={k: list(v) for k, v in data["by_action"].items()},
+            by_actor={k: list(v) for k, v in data["by_actor"].items()},
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
+        )
+        index.persisted_count = index.total
+        return index
+
+
+# session_dir -> index. The file lock orders processes; _indexes_lock
+# orders threads, which may share an index while holding shared file locks.
+_indexes: dict[Path, _AuditIndex] = {}
+_indexes_lock = threading.RLock()
+
+
+class AuditLog:
+    """Append and query one session's audit trail."""
+
+    def __init__(self, state_manager: StateManager):
+        self.state = state_manager
+        self.log_path = state_manager.session_dir / LOG_FILENAME
+        self.index_path = state_manager.session_dir / INDEX_FILENAME
+
+    # -- index maintenance --------------------------------------------------
+
+    def _load_index(self) -> _AuditIndex:
+        """In-memory index caught up with the log. Call under the log lock."""
+        with _indexes_lock:
+            index = _indexes.get(self.state.session_dir)
+            if index is None:
+                index = self._read_index_file()
+
+            try:
+                size = self.log_path.stat().st_size
+            except FileNotFoundError:
+                size = 0
+
+            if size < index.size:
+                # Log truncated or replaced behind our back: start over.
+                logger.warning(f"Audit index for {self.state.session_id} is ahead of its log; rebuilding")
+                index = _AuditIndex()
+
+            if size > index.size:
+                self._catch_up(index)
+
+            _indexes[self.state.session_dir] = index
+            return index
+
+    def _read_index_file(self) -> _AuditIndex:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION:
+                return _AuditIndex.from_json(data)
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            logger.warning(f"Discarding unreadable audit index for {self.state.session_id}: {e}")
+        return _AuditIndex()
+
+    def _catch_up(self, index: _AuditIndex) -> None:
+        """Index complete lines appended after ``index.size``."""
+        with open(self.log_path, "rb") as f:
+            f.seek(index.size)
+            offset = index.size
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Partial write from a crashed appender; the next append truncates it.
+                    break
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.error(f"Skipping corrupt audit line at byte {offset} in {self.log_path}")
+                    event = {"action": "unknown", "actor": "unknown"}
+                index.add(event, offset)
+                offset += len(line)
+            index.size = offset
+
+    def _persist_index(self, index: _AuditIndex) -> None:
+        tmp = self.index_path.with_name(f".{INDEX_FILENAME}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(index.to_json(), f)
+        tmp.replace(self.index_path)
+        index.persisted_count = index.total
+
+    def _sync(self, index: _AuditIndex, fd: int | None = None) -> None:
+        if fd is not None:
+            os.fsync(fd)
+        else:
+            with open(self.log_path, "rb") as f:
+                os.fsync(f.fileno())
+        index.unsynced = 0
+        index.last_sync = time.monotonic()
+        if index.persisted_count != index.total:
+            self._persist_index(index)
+
+    # -- public API -----------------------------------------------------------
+
+    def append(
+        self,
+        action: str,
+        entity_type: str,
+        entity_id: str,
+        actor: str,
+        details: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Append one event and return it (with its assigned ``id``)."""
+        with self.state.lock(filename=LOG_FILENAME):
+            migrate_legacy_audit_log(self.state, _locked=True)
+            index = self._load_index()
+
+            event = {
+                "id": index.total + 1,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "action": action,
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "actor": actor,
+                "details": details,
+            }
+            line = (json.dumps(event, default=str) + "\n").encode("utf-8")
+
+            fd = os.open(self.log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                # Drop a torn trailing line left by a crashed writer.
+                if os.fstat(fd).st_size != index.size:
+                    os.ftruncate(fd, index.size)
+                os.write(fd, line)
+                index.add(event, index.size)
+                index.size += len(line)
+                index.unsynced += 1
+
+                if (
+                    index.unsynced >= settings.audit_fsync_batch
+                    or time.monotonic() - index.last_sync >= settings.audit_fsync_interval
+                ):
+                    self._sync(index, fd)
+                    _pending.pop(self.state.session_dir, None)
+                else:
+                    _pending[self.state.session_dir] = self.state
+            finally:
+                os.close(fd)
+
+        return event
+
+    def flush(self) -> None:
+        """Force pending events to disk and persist the index."""
+        with self.state.lock(filename=LOG_FILENAME):
+            if not self.log_path.exists():
+                return
+            self._sync(self._load_index())
+
+    def query(
+        self,
+        action: str | None = None,
+        actor: str | None = None,
+        limit: int = 100,
+        cursor: int | None = None,
+    ) -> dict[str, Any]:
+        """Most recent matching events, oldest first, plus index summary.
+
+        Args:
+            action: Only events with this action
+            actor: Only events by this actor
+            limit: Page size
+            cursor: Only events with ``id`` below this (a previous ``next_cursor``)
+
+        Returns:
+            Dictionary with events, next_cursor (None on the last page),
+            matching (total matching events), total, by_action, by_actor,
+            created_at, updated_at
+        """
+        migrate_legacy_audit_log(self.state)
+        with self.state.lock(filename=LOG_FILENAME, shared=True):
+            index = self._load_index()
+
+            candidates = self._matching_ids(index, action, actor)
+            end = bisect.bisect_left(candidates, cursor) if cursor is not None else len(candidates)
+            start = max(0, end - max(limit, 0))
+            page_ids = candidates[start:end]
+            events = self._read_events(index, page_ids)
+
+            return {
+                "events": events,
+                "next_cursor": page_ids[0] if page_ids and start > 0 else None,
+                "matching": len(candidates),
+                "total": index.total,
+                "by_action": {k: len(v) for k, v in index.by_action.items()},
+                "by_actor": {k: len(v) for k, v in index.by_actor.items()},
+                "created_at": index.created_at,
+                "updated_at": index.updated_at,
+            }
+
+    @staticmethod
+    def _matching_ids(index: _AuditIndex, action: str | None, actor: str | None) -> Sequence[int]:
+        if action is None and actor is None:
+            return range(1, index.total + 1)
+        if actor is None:
+            return index.by_action.get(action, [])
+        if action is None:
+            return index.by_actor.get(actor, [])
+        by_action = index.by_action.get(action, [])
+        by_actor = index.by_actor.get(actor, [])
+        smaller, larger = sorted((by_action, by_actor), key=len)
+        wanted = set(larger)
+        return [event_id for event_id in smaller if event_id in wanted]
+
+    def _read_events(self, index: _AuditIndex, event_ids: Sequence[int]) -> list[dict[str, Any]]:
+        if not event_ids:
+            return []
+        events = []
+        with open(self.log_path, "rb") as f:
+            for event_id in event_ids:
+                f.seek(index.offsets[event_id - 1])
+                events.append(json.loads(f.readline()))
+        return events
+
+
+def migrate_legacy_audit_log(state_manager: StateManager, _locked: bool = False) -> bool:
+    """Convert a session's ``audit_log.json`` into the JSONL format, once.
+
+    Event order, timestamps and details are preserved; ids are renumbered
+    1..n (legacy ids were already sequential). The legacy file is renamed to
+    ``audit_log.json.migrated`` rather than deleted.
+
+    Args:
+        state_manager: Session to migrate
+        _locked: Caller already holds the audit log's exclusive lock
+
+    Returns:
+        True if a migration happened
+    """
+    legacy = state_manager.session_dir / LEGACY_FILENAME
+    if not legacy.exists():
+        return False
+    if not _locked:
+        with state_manager.lock(filename=LOG_FILENAME):
+            return migrate_legacy_audit_log(state_manager, _locked=True)
+
+    audit_log = AuditLog(state_manager)
+    if audit_log.log_path.exists() and audit_log.log_path.stat().st_size > 0:
+        # Already migrated by a process that crashed before the rename.
+        legacy.replace(legacy.with_name(LEGACY_FILENAME + ".migrated"))
+        return False
+
+    legacy_data = state_manager.read_json(LEGACY_FILENAME)
+    events = sorted(legacy_data.get("events", []), key=lambda e: e.get("id", 0))
+
+    index = _AuditIndex()
+    tmp = audit_log.log_path.with_name(f".{LOG_FILENAME}.tmp")
+    with open(tmp, "wb") as f:
+        for position, event in enumerate(events, 1):
+            event = {**event, "id": position}
+            line = (json.dumps(event, default=str) + "\n").encode("utf-8")
+            index.add(event, index.size)
+            index.size += len(line)
+            f.write(line)
+        f.flush()
+        os.fsync(f.fileno())
+    index.created_at = legacy_data.get("created_at") or index.created_at
+    tmp.replace(audit_log.log_path)
+
+    audit_log._persist_index(index)
+    with _indexes_lock:
+        _indexes[state_manager.session_dir] = index
+    legacy.replace(legacy.with_name(LEGACY_FILENAME + ".migrated"))
+
+    logger.info(f"Migrated {len(events)} audit events for {state_manager.session_id} to {LOG_FILENAME}")
+    return True
+
+
+# session_dir -> session whose log has events appended since its last fsync
+_pending: dict[Path, StateManager] = {}
+
+
+@atexit.register
+def flush_pending_audit_logs() -> None:
+    """fsync every log with unsynced events (registered at exit)."""
+    while _pending:
+        _, state_manager = _pending.popitem()
+        try:
+            AuditLog(state_manager).flush()
+        except Exception as e:
+            logger.error(f"Failed to flush audit log for {state_manager.session_id}: {e}")
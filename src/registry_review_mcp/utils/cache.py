@@ -1,67 +1,123 @@
-"""Caching utilities for PDF extraction and other expensive operations."""
+"""Caching utilities for PDF extraction and other expensive operations.
+
+``Cache`` is a namespaced key/value facade with a pluggable backend:
+
+- ``sqlite`` (default): every namespace shares one embedded database file,
+  ``<cache_dir>/cache.sqlite3``. The store is bounded by total bytes and
+  entry count with least-recently-used eviction, and a background thread
+  sweeps expired entries. It is safe to use from the extraction pool's
+  worker processes (WAL journal, busy timeout).
+- ``json``: the original one-JSON-file-per-key layout. It never evicts
+  except when a read finds an expired key; kept as a fallback for
+  environments where SQLite's file locking is unreliable (some network
+  filesystems).
+
+Select with ``REGISTRY_REVIEW_CACHE_BACKEND``. Both backends count hits,
+misses, evictions and expirations; see :meth:`Cache.stats`.
+
+``SQLiteBackend`` can also store values compressed (``codec="zstd"`` or
+``"zlib"``); the LLM response store (``llm.response_store``) uses this.
+zstd needs the optional ``zstandard`` package; zlib is always available.
+"""
 
 import hashlib
 import json
+import logging
+import os
+import sqlite3
+import threading
 import time
+import zlib
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
 from ..config.settings import settings
 
+try:
+    import zstandard
+except ImportError:  # optional; values fall back to zlib
+    zstandard = None
 
-class Cache:
-    """Simple file-based cache with TTL support."""
+logger = logging.getLogger(__name__)
 
-    def __init__(self, namespace: str = "default"):
-        """Initialize cache with namespace.
+SQLITE_FILENAME = "cache.sqlite3"
 
-        Args:
-            namespace: Logical grouping for cache entries
-        """
-        self.namespace = namespace
-        self.cache_dir = settings.cache_dir / namespace
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+_MISSING = object()
 
-    def _get_cache_key(self, key: str) -> str:
-        """Generate a cache key hash.
+# Buffered ``last_access`` updates written in one transaction once this many
+# keys are pending (and before every eviction, sweep and close).
+_TOUCH_FLUSH_AT = 256
 
-        Args:
-            key: Original cache key
+# First byte of a compressed value names its codec, so a store can be read
+# back (or imported into) by a process that defaults to another codec.
+_CODEC_TAGS = {"zlib": b"\x01", "zstd": b"\x02"}
 
-        Returns:
-            SHA256 hash of the key
-        """
-        return hashlib.sha256(f"{self.namespace}:{key}".encode()).hexdigest()
 
-    def _get_cache_path(self, key: str) -> Path:
-        """Get file path for a cache key.
+def default_codec() -> str:
+    """The best codec available in this environment."""
+    return "zstd" if zstandard is not None else "zlib"
 
-        Args:
-            key: Cache key
 
-        Returns:
-            Path to cache file
-        """
-        cache_key = self._get_cache_key(key)
-        return self.cache_dir / f"{cache_key}.json"
+def compress(payload: bytes, codec: str) -> bytes:
+    """Compress ``payload`` and prefix it with the codec's tag byte."""
+    if codec == "zstd":
+        if zstandard is None:
+            raise ValueError("zstd codec requires the 'zstandard' package")
+        return _CODEC_TAGS["zstd"] + zstandard.ZstdCompressor(level=10).compress(payload)
+    if codec == "zlib":
+        return _CODEC_TAGS["zlib"] + zlib.compress(payload, 6)
+    raise ValueError(f"Unknown codec: {codec}")
 
-    def get(self, key: str, default: Any = None) -> Any:
-        """Get value from cache.
 
-        Args:
-            key: Cache key
-            default: Value to return if not found or expired
+def decompress(blob: bytes) -> bytes:
+    """Inverse of :func:`compress`. Raises ValueError for unreadable values."""
+    tag, body = blob[:1], blob[1:]
+    if tag == _CODEC_TAGS["zlib"]:
+        try:
+            return zlib.decompress(body)
+        except zlib.error as e:
+            raise ValueError(f"Corrupt zlib value: {e}") from e
+    if tag == _CODEC_TAGS["zstd"]:
+        if zstandard is None:
+            raise ValueError("zstd-compressed value but 'zstandard' is not installed")
+        try:
+            return zstandard.ZstdDecompressor().decompress(body)
+        except zstandard.ZstdError as e:
+            raise ValueError(f"Corrupt zstd value: {e}") from e
+    raise ValueError(f"Unknown codec tag: {tag!r}")
 
-        Returns:
-            Cached value or default
-        """
-        if not settings.enable_caching:
-            return default
 
-        cache_path = self._get_cache_path(key)
+@dataclass
+class CacheStats:
+    """Process-local counters for one backend."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+class JSONFileBackend:
+    """One JSON file per key under ``<root>/<namespace>/``."""
+
+    name = "json"
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.counters = CacheStats()
+
+    def _path(self, namespace: str, key: str) -> Path:
+        digest = hashlib.sha256(f"{namespace}:{key}".encode()).hexdigest()
+        return self.root / namespace / f"{digest}.json"
+
+    def get(self, namespace: str, key: str) -> Any:
+        cache_path = self._path(namespace, key)
 
         if not cache_path.exists():
-            return default
+            self.counters.misses += 1
+            return _MISSING
 
         try:
             with open(cache_path, "r", encoding="utf-8") as f:
@@ -73,31 +129,24 @@ class Cache:
                 if time.time() > expires_at:
                     # Expired, remove file
                     cache_path.unlink(missing_ok=True)
-                    return default
+                    self.counters.expirations += 1
+                    self.counters.misses += 1
+                    return _MISSING
 
+            self.counters.hits += 1
             return cache_data["value"]
 
         except (json.JSONDecodeError, KeyError, OSError):
             # Corrupted cache file, remove it
             cache_path.unlink(missing_ok=True)
-            return default
+            self.counters.misses += 1
+            return _MISSING
 
-    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
-        """Set value in cache.
-
-        Args:
-            key: Cache key
-            value: Value to cache (must be JSON-serializable)
-            ttl: Time-to-live in seconds (None = use default from settings)
-        """
-        if not settings.enable_caching:
-            return
-
-        ttl = ttl or settings.pdf_cache_ttl
-        cache_path = self._get_cache_path(key)
+    def set(self, namespace: str, key: str, value: Any, ttl: int) -> None:
+        cache_path = self._path(namespace, key)
 
         # Ensure cache directory exists (may have been deleted)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
 
         cache_data = {
             "key": key,
@@ -109,14 +158,465 @@ class Cache:
         with open(cache_path, "w", encoding="utf-8") as f:
             json.dump(cache_data, f, default=str)
 
+    def delete(self, namespace: str, key: str) -> None:
+        self._path(namespace, key).unlink(missing_ok=True)
+
+    def clear(self, namespace: str) -> int:
+        count = 0
+        for cache_file in (self.root / namespace).glob("*.json"):
+            cache_file.unlink()
+            count += 1
+        return count
+
+    def stats(self, namespace: str | None = None) -> dict[str, Any]:
+        directory = self.root / namespace if namespace else self.root
+        files = list(directory.rglob("*.json")) if directory.exists() else []
+        return {
+            "backend": self.name,
+            "entries": len(files),
+            "bytes": sum(f.stat().st_size for f in files),
+            **asdict(self.counters),
+        }
+
+
+class SQLiteBackend:
+    """All namespaces in one SQLite file, LRU-bounded by bytes and entry count.
+
+    Running totals live in a ``totals`` row maintained by triggers, so the
+    bound check on every ``set`` is O(1) instead of a table scan.
+
+    With a ``codec``, values are stored as compressed blobs and the bounds
+    apply to the compressed size. Uncompressed (text) values written
+    without a codec remain readable either way.
+
+    Reads never write: a hit records its ``last_access`` in memory, and the
+    buffer is flushed in one transaction before each eviction and sweep, on
+    close, or once ``_TOUCH_FLUSH_AT`` keys are pending. Another process
+    evicting in the meantime sees slightly stale recency, which only
+    approximates LRU a little more loosely.
+    """
+
+    name = "sqlite"
+
+    def __init__(
+        self,
+        db_path: Path,
+        max_bytes: int,
+        max_entries: int,
+        sweep_interval: int = 0,
+        codec: str | None = None,
+    ):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.sweep_interval = sweep_interval
+        self.codec = codec
+        self.counters = CacheStats()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid = 0
+        self._sweeper: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._touched: dict[tuple[str, str], float] = {}
+
+    # -- connection -------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this process's connection, creating the schema on first use.
+
+        Guarded by ``_lock``. The PID check covers a forked child inheriting
+        the parent's backend object: SQLite connections must not cross forks.
+        """
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                namespace   TEXT NOT NULL,
+                key         TEXT NOT NULL,
+                value       TEXT NOT NULL,
+                size        INTEGER NOT NULL,
+                cached_at   REAL NOT NULL,
+                expires_at  REAL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            );
+            CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_access);
+            CREATE INDEX IF NOT EXISTS entries_expiry ON entries (expires_at);
+
+            CREATE TABLE IF NOT EXISTS totals (
+                id      INTEGER PRIMARY KEY CHECK (id = 1),
+                entries INTEGER NOT NULL,
+                bytes   INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO totals (id, entries, bytes) VALUES (1, 0, 0);
+
+            CREATE TRIGGER IF NOT EXISTS entries_ai AFTER INSERT ON entries BEGIN
+                UPDATE totals SET entries = entries + 1, bytes = bytes + NEW.size WHERE id = 1;
+            END;
+            CREATE TRIGGER IF NOT EXISTS entries_ad AFTER DELETE ON entries BEGIN
+                UPDATE totals SET entries = entries - 1, bytes = bytes - OLD.size WHERE id = 1;
+            END;
+            CREATE TRIGGER IF NOT EXISTS entries_au AFTER UPDATE OF size ON entries BEGIN
+                UPDATE totals SET bytes = bytes - OLD.size + NEW.size WHERE id = 1;
+            END;
+            """
+        )
+        self._conn = conn
+        self._pid = os.getpid()
+        self._start_sweeper()
+        return conn
+
+    def _start_sweeper(self) -> None:
+        if self.sweep_interval <= 0 or (self._sweeper is not None and self._sweeper.is_alive()):
+            return
+        self._stop.clear()
+        self._sweeper = threading.Thread(target=self._sweep_loop, name="cache-ttl-sweeper", daemon=True)
+        self._sweeper.start()
+
+    def _sweep_loop(self) -> None:
+        while not self._stop.wait(self.sweep_interval):
+            try:
+                removed = self.sweep_expired()
+                if removed:
+                    logger.debug(f"Cache sweep removed {removed} expired entries")
+            except sqlite3.Error as e:
+                logger.warning(f"Cache sweep failed: {e}")
+
+    def close(self) -> None:
+        """Stop the sweeper and close the connection."""
+        self._stop.set()
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                try:
+                    self._flush_touches_locked(self._conn)
+                except sqlite3.Error as e:
+                    logger.warning(f"Cache recency flush failed: {e}")
+                self._conn.close()
+            self._conn = None
+
+    # -- recency ----------------------------------------------------------
+
+    def _touch_locked(self, conn: sqlite3.Connection, namespace: str, keys: list[str], now: float) -> None:
+        for key in keys:
+            self._touched[(namespace, key)] = now
+        if len(self._touched) >= _TOUCH_FLUSH_AT:
+            self._flush_touches_locked(conn)
+
+    def _flush_touches_locked(self, conn: sqlite3.Connection) -> None:
+        """Write the buffered ``last_access`` times in one transaction."""
+        if not self._touched:
+            return
+        touched, self._touched = self._touched, {}
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "UPDATE entries SET last_access = MAX(last_access, ?) WHERE namespace = ? AND key = ?",
+                [(when, namespace, key) for (namespace, key), when in touched.items()],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    # -- operations -------------------------------------------------------
+
+    def get(self, namespace: str, key: str) -> Any:
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, expires_at FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+            if row is None:
+                self.counters.misses += 1
+                return _MISSING
+
+            value, expires_at = row
+            if expires_at is not None and now > expires_at:
+                conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+                self.counters.expirations += 1
+                self.counters.misses += 1
+                return _MISSING
+
+            self._touch_locked(conn, namespace, [key], now)
+
+        try:
+            decoded = self._decode(value)
+        except ValueError:  # includes json.JSONDecodeError
+            self.delete(namespace, key)
+            self.counters.misses += 1
+            return _MISSING
+        self.counters.hits += 1
+        return decoded
+
+    def get_many(self, namespace: str, keys: list[str], batch_size: int = 500) -> dict[str, Any]:
+        """Live values for ``keys``, one query per ``batch_size`` keys. Misses are omitted."""
+        now = time.time()
+        rows: list[tuple[str, str | bytes, float | None]] = []
+        unique = list(dict.fromkeys(keys))
+        with self._lock:
+            conn = self._connect()
+            for start in range(0, len(unique), batch_size):
+                batch = unique[start : start + batch_size]
+                placeholders = ", ".join("?" * len(batch))
+                rows.extend(
+                    conn.execute(
+                        f"SELECT key, value, expires_at FROM entries WHERE namespace = ? AND key IN ({placeholders})",
+                        (namespace, *batch),
+                    ).fetchall()
+                )
+            live = [(key, value) for key, value, expires_at in rows if expires_at is None or now <= expires_at]
+            self._touch_locked(conn, namespace, [key for key, _ in live], now)
+
+        found: dict[str, Any] = {}
+        for key, stored in live:
+            try:
+                found[key] = self._decode(stored)
+            except ValueError:
+                self.delete(namespace, key)
+        self.counters.hits += len(found)
+        self.counters.misses += len(unique) - len(found)
+        return found
+
+    @staticmethod
+    def _decode(stored: str | bytes) -> Any:
+        if isinstance(stored, bytes):
+            stored = decompress(stored)
+        return json.loads(stored)
+
+    def _encode(self, value: Any) -> str | bytes:
+        payload = json.dumps(value, default=str)
+        if self.codec is None:
+            return payload
+        return compress(payload.encode("utf-8"), self.codec)
+
+    def set(self, namespace: str, key: str, value: Any, ttl: int) -> None:
+        payload = self._encode(value)
+        size = len(payload) if isinstance(payload, bytes) else len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            logger.warning(f"Not caching {namespace}:{key[:40]}: {size:,} bytes exceeds the cache size bound")
+            return
+
+        now = time.time()
+        expires_at = now + ttl if ttl else None
+        with self._lock:
+            conn = self._connect()
+            # Eviction below must see recent reads
+            self._flush_touches_locked(conn)
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    """
+                    INSERT INTO entries (namespace, key, value, size, cached_at, expires_at, last_access)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (namespace, key) DO UPDATE SET
+                        value = excluded.value,
+                        size = excluded.size,
+                        cached_at = excluded.cached_at,
+                        expires_at = excluded.expires_at,
+                        last_access = excluded.last_access
+                    """,
+                    (namespace, key, payload, size, now, expires_at, now),
+                )
+                self._evict_locked(conn)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _evict_locked(self, conn: sqlite3.Connection) -> None:
+        """Drop least-recently-used entries until both bounds hold."""
+        entries, total_bytes = conn.execute("SELECT entries, bytes FROM totals WHERE id = 1").fetchone()
+        while entries > self.max_entries or total_bytes > self.max_bytes:
+            # Over on count: evict exactly the excess. Over on bytes: evict
+            # in small batches and re-check.
+            batch = entries - self.max_entries if entries > self.max_entries else 16
+            removed = conn.execute(
+                "DELETE FROM entries WHERE rowid IN (SELECT rowid FROM entries ORDER BY last_access LIMIT ?)",
+                (batch,),
+            ).rowcount
+            if removed <= 0:
+                break
+            self.counters.evictions += removed
+            entries, total_bytes = conn.execute("SELECT entries, bytes FROM totals WHERE id = 1").fetchone()
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+
+    def clear(self, namespace: str) -> int:
+        with self._lock:
+            return self._connect().execute("DELETE FROM entries WHERE namespace = ?", (namespace,)).rowcount
+
+    def entries(self, namespace: str | None = None, batch_size: int = 500) -> Iterator[dict[str, Any]]:
+        """Yield every live entry as ``{namespace, key, value, cached_at, expires_at}``.
+
+        Reads in rowid-ordered batches so the lock is never held across the
+        whole table. Does not touch ``last_access``.
+        """
+        last_rowid = 0
+        while True:
+            with self._lock:
+                rows = (
+                    self._connect()
+                    .execute(
+                        "SELECT rowid, namespace, key, value, cached_at, expires_at FROM entries "
+                        "WHERE rowid > ? AND (? IS NULL OR namespace = ?) ORDER BY rowid LIMIT ?",
+                        (last_rowid, namespace, namespace, batch_size),
+                    )
+                    .fetchall()
+                )
+            if not rows:
+                return
+            now = time.time()
+            for rowid, ns, key, stored, cached_at, expires_at in rows:
+                last_rowid = rowid
+                if expires_at is not None and now > expires_at:
+                    continue
+                try:
+                    value = self._decode(stored)
+                except ValueError:
+                    logger.warning(f"Skipping unreadable cache entry {ns}:{key[:40]}")
+                    continue
+                yield {"namespace": ns, "key": key, "value": value, "cached_at": cached_at, "expires_at": expires_at}
+
+    def sweep_expired(self) -> int:
+        """Delete every expired entry. Returns the number removed."""
+        with self._lock:
+            conn = self._connect()
+            self._flush_touches_locked(conn)
+            removed = conn.execute(
+                "DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at < ?", (time.time(),)
+            ).rowcount
+        self.counters.expirations += removed
+        return removed
+
+    def stats(self, namespace: str | None = None) -> dict[str, Any]:
+        with self._lock:
+            conn = self._connect()
+            if namespace is None:
+                entries, total_bytes = conn.execute("SELECT entries, bytes FROM totals WHERE id = 1").fetchone()
+            else:
+                entries, total_bytes = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries WHERE namespace = ?",
+                    (namespace,),
+                ).fetchone()
+        return {
+            "backend": self.name,
+            "entries": entries,
+            "bytes": total_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            **asdict(self.counters),
+        }
+
+
+# One backend per (kind, root) so every namespace shares a connection,
+# counters, and sweeper.
+_backends: dict[tuple[str, Path], JSONFileBackend | SQLiteBackend] = {}
+_backends_lock = threading.Lock()
+
+
+def get_cache_backend(kind: str | None = None, root: Path | None = None) -> JSONFileBackend | SQLiteBackend:
+    """Return the shared backend for ``kind`` rooted at ``root``.
+
+    Args:
+        kind: "sqlite" or "json" (default: settings.cache_backend)
+        root: Cache root directory (default: settings.cache_dir)
+    """
+    kind = kind or settings.cache_backend
+    root = root or settings.cache_dir
+    with _backends_lock:
+        backend = _backends.get((kind, root))
+        if backend is None:
+            if kind == "json":
+                backend = JSONFileBackend(root)
+            else:
+                backend = SQLiteBackend(
+                    root / SQLITE_FILENAME,
+                    max_bytes=settings.cache_max_bytes,
+                    max_entries=settings.cache_max_entries,
+                    sweep_interval=settings.cache_sweep_interval,
+                )
+            _backends[(kind, root)] = backend
+        return backend
+
+
+def reset_cache_backends() -> None:
+    """Close and forget every backend (tests, and after changing settings)."""
+    with _backends_lock:
+        for backend in _backends.values():
+            if isinstance(backend, SQLiteBackend):
+                backend.close()
+        _backends.clear()
+
+
+class Cache:
+    """Namespaced cache with TTL support over a pluggable backend."""
+
+    def __init__(self, namespace: str = "default", cache_dir: Path | None = None, backend: str | None = None):
+        """Initialize cache with namespace.
+
+        Args:
+            namespace: Logical grouping for cache entries
+            cache_dir: Cache root (default: settings.cache_dir)
+            backend: "sqlite" or "json" (default: settings.cache_backend)
+        """
+        self.namespace = namespace
+        root = cache_dir or settings.cache_dir
+        self.cache_dir = root / namespace
+        self._backend = get_cache_backend(backend, root)
+        if isinstance(self._backend, JSONFileBackend):
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def backend(self) -> str:
+        """Name of the active backend."""
+        return self._backend.name
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get value from cache.
+
+        Args:
+            key: Cache key
+            default: Value to return if not found or expired
+
+        Returns:
+            Cached value or default
+        """
+        if not settings.enable_caching:
+            return default
+
+        value = self._backend.get(self.namespace, key)
+        return default if value is _MISSING else value
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """Set value in cache.
+
+        Args:
+            key: Cache key
+            value: Value to cache (must be JSON-serializable)
+            ttl: Time-to-live in seconds (None = use default from settings)
+        """
+        if not settings.enable_caching:
+            return
+
+        self._backend.set(self.namespace, key, value, ttl or settings.pdf_cache_ttl)
+
     def delete(self, key: str) -> None:
         """Delete value from cache.
 
         Args:
             key: Cache key
         """
-        cache_path = self._get_cache_path(key)
-        cache_path.unlink(missing_ok=True)
+        self._backend.delete(self.namespace, key)
 
     def clear(self) -> int:
         """Clear all cache entries in this namespace.
@@ -124,11 +624,7 @@ class Cache:
         Returns:
             Number of entries cleared
         """
-        count = 0
-        for cache_file in self.cache_dir.glob("*.json"):
-            cache_file.unlink()
-            count += 1
-        return count
+        return self._backend.clear(self.namespace)
 
     def exists(self, key: str) -> bool:
         """Check if key exists in cache.
@@ -141,6 +637,15 @@ class Cache:
         """
         return self.get(key) is not None
 
+    def stats(self) -> dict[str, Any]:
+        """Size of this namespace plus the backend's process-wide counters.
+
+        Returns:
+            Dictionary with backend, entries, bytes, hits, misses,
+            evictions, and expirations (plus bounds for sqlite)
+        """
+        return self._backend.stats(self.namespace)
+
 
 # Global cache instances
 pdf_cache = Cache("pdf_extraction")
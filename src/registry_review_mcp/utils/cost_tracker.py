@@ -1,15 +1,39 @@
 """Cost tracking for LLM API usage.
 
 Tracks API calls, tokens, and estimated costs for monitoring and optimization.
+
+Every call is appended as one line to a JSONL ledger
+(``cost_tracking.jsonl``); running totals, plus breakdowns per extractor and
+per model, are kept in memory, so recording a call and reading the summary
+are both O(1). The summary is snapshotted to ``cost_tracking.json`` every
+``cost_snapshot_interval`` calls (and at exit) together with the ledger
+offset it covers. A new tracker starts from that snapshot and replays only
+the ledger lines written after it.
+
+Calls made through ``utils.llm_client.call_llm`` are recorded against the
+tracker installed with :func:`track_llm_costs` (a context variable, so
+concurrent sessions do not mix), including the provider prompt-cache
+write/read tokens; ``prompt_cache_hit_rate`` in the summary is the share of
+prompt tokens served from the provider cache.
 """
 
+import atexit
 import fcntl
 import json
 import logging
+import os
+import threading
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
+
+from ..config.settings import settings
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +73,9 @@ PRICING = {
     },
 }
 
+# Message Batches API requests are billed at half the rates above.
+BATCH_DISCOUNT = 0.5
+
 
 class APICall(BaseModel):
     """Record of a single API call."""
@@ -64,6 +91,30 @@ class APICall(BaseModel):
     cost_usd: float
     duration_seconds: float
     cached: bool = False
+    batch: bool = False
+
+
+class CostBreakdown(BaseModel):
+    """Running totals for a group of API calls (all, one extractor, or one model)."""
+
+    api_calls: int = 0
+    cached_calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_tokens: int = 0
+    cache_read_tokens: int = 0
+    cost_usd: float = 0.0
+    duration_seconds: float = 0.0
+
+    def add(self, call: APICall) -> None:
+        self.api_calls += 1
+        self.cached_calls += int(call.cached)
+        self.input_tokens += call.input_tokens
+        self.output_tokens += call.output_tokens
+        self.cache_creation_tokens += call.cache_creation_tokens
+        self.cache_read_tokens += call.cache_read_tokens
+        self.cost_usd += call.cost_usd
+        self.duration_seconds += call.duration_seconds
 
 
 class SessionCostSummary(BaseModel):
@@ -78,9 +129,23 @@ class SessionCostSummary(BaseModel):
     total_cost_usd: float
     total_duration_seconds: float
     cache_hit_rate: float
+    # Share of prompt tokens read from the provider's prompt cache
+    prompt_cache_hit_rate: float = 0.0
+    by_extractor: dict[str, CostBreakdown] = Field(default_factory=dict)
+    by_model: dict[str, CostBreakdown] = Field(default_factory=dict)
+    # Only populated by get_summary(include_calls=True); the ledger holds them all.
     api_calls: list[APICall] = Field(default_factory=list)
 
 
+def _prompt_cache_hit_rate(totals: CostBreakdown) -> float:
+    prompt_tokens = totals.input_tokens + totals.cache_creation_tokens + totals.cache_read_tokens
+    return totals.cache_read_tokens / prompt_tokens if prompt_tokens else 0.0
+
+
+# Trackers with calls not yet covered by a snapshot, flushed at exit
+_unsnapshotted: "weakref.WeakSet[CostTracker]" = weakref.WeakSet()
+
+
 class CostTracker:
     """Track API costs for LLM extraction."""
 
@@ -89,32 +154,121 @@ class CostTracker:
 
         Args:
             session_id: Session identifier
-            storage_path: Optional path to store cost data (defaults to session directory)
+            storage_path: Optional path to store the cost summary snapshot
+                (defaults to session directory); the ledger is written next
+                to it with a ``.jsonl`` suffix
         """
         self.session_id = session_id
         self.storage_path = storage_path or Path(f"data/sessions/{session_id}/cost_tracking.json")
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ledger_path = self.storage_path.with_suffix(".jsonl")
+
+        self._lock = threading.Lock()
+        self._totals = CostBreakdown()
+        self._by_extractor: dict[str, CostBreakdown] = {}
+        self._by_model: dict[str, CostBreakdown] = {}
+        self._offset = 0  # ledger bytes reflected in the totals
+        self._since_snapshot = 0
+        self._calls: list[APICall] | None = None  # loaded from the ledger on demand
 
-        self.api_calls: list[APICall] = []
         self._load_existing()
 
+    # -- loading --------------------------------------------------------------
+
     def _load_existing(self) -> None:
-        """Load existing cost data if available."""
+        """Restore totals from the snapshot, then replay newer ledger lines."""
         if self.storage_path.exists():
             try:
                 with open(self.storage_path) as f:
-                    # Acquire shared lock for reading (multiple readers allowed)
-                    fcntl.flock(f.fileno(), fcntl.LOCK_SH)
-                    try:
-                        data = json.load(f)
-                        summary = SessionCostSummary(**data)
-                        self.api_calls = summary.api_calls
-                        logger.info(f"Loaded {len(self.api_calls)} existing API calls from cost tracker")
-                    finally:
-                        # Release lock
-                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-            except Exception as e:
-                logger.warning(f"Failed to load existing cost data: {e}")
+                    data = json.load(f)
+                if "ledger_offset" in data:
+                    self._restore_snapshot(data)
+                elif data.get("api_calls") and not self.ledger_path.exists():
+                    self._migrate_legacy(data)
+            except (OSError, json.JSONDecodeError, ValidationError, KeyError) as e:
+                logger.warning(f"Failed to load cost snapshot, rebuilding from ledger: {e}")
+                self._reset_totals()
+
+        if not self.ledger_path.exists():
+            return
+        if self.ledger_path.stat().st_size < self._offset:
+            logger.warning(f"Cost snapshot is ahead of its ledger for {self.session_id}; rebuilding")
+            self._reset_totals()
+        with open(self.ledger_path, "rb") as f:
+            self._catch_up(f)
+        if self._totals.api_calls:
+            logger.info(f"Loaded {self._totals.api_calls} existing API calls from cost tracker")
+
+    def _restore_snapshot(self, data: dict) -> None:
+        summary = SessionCostSummary(**data)
+        self._totals = CostBreakdown(
+            api_calls=summary.total_api_calls,
+            cached_calls=sum(b.cached_calls for b in summary.by_extractor.values()),
+            input_tokens=summary.total_input_tokens,
+            output_tokens=summary.total_output_tokens,
+            cache_creation_tokens=summary.total_cache_creation_tokens,
+            cache_read_tokens=summary.total_cache_read_tokens,
+            cost_usd=summary.total_cost_usd,
+            duration_seconds=summary.total_duration_seconds,
+        )
+        self._by_extractor = summary.by_extractor
+        self._by_model = summary.by_model
+        self._offset = int(data["ledger_offset"])
+
+    def _migrate_legacy(self, data: dict) -> None:
+        """Move the ``api_calls`` list of an old-format snapshot into the ledger."""
+        calls = SessionCostSummary(**data).api_calls
+        with open(self.ledger_path, "wb") as f:
+            for call in calls:
+                f.write(call.model_dump_json().encode("utf-8") + b"\n")
+        logger.info(f"Migrated {len(calls)} API calls to cost ledger {self.ledger_path}")
+
+    def _reset_totals(self) -> None:
+        self._totals = CostBreakdown()
+        self._by_extractor = {}
+        self._by_model = {}
+        self._offset = 0
+
+    def _catch_up(self, f) -> None:
+        """Apply complete ledger lines after ``self._offset`` (another writer's calls)."""
+        f.seek(self._offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            self._offset += len(line)
+            try:
+                call = APICall.model_validate_json(line)
+            except ValidationError:
+                logger.error(f"Skipping corrupt cost ledger line in {self.ledger_path}")
+                continue
+            self._apply(call)
+
+    def _apply(self, call: APICall) -> None:
+        self._totals.add(call)
+        self._by_extractor.setdefault(call.extractor, CostBreakdown()).add(call)
+        self._by_model.setdefault(call.model, CostBreakdown()).add(call)
+        if self._calls is not None:
+            self._calls.append(call)
+
+    @property
+    def api_calls(self) -> list[APICall]:
+        """Every recorded call, oldest first (read from the ledger once, then kept)."""
+        with self._lock:
+            if self._calls is None:
+                calls = []
+                if self.ledger_path.exists():
+                    with open(self.ledger_path, "rb") as f:
+                        for line in f:
+                            if not line.endswith(b"\n"):
+                                break
+                            try:
+                                calls.append(APICall.model_validate_json(line))
+                            except ValidationError:
+                                continue
+                self._calls = calls
+            return self._calls
+
+    # -- recording ------------------------------------------------------------
 
     def track_api_call(
         self,
@@ -127,6 +281,7 @@ class CostTracker:
         cached: bool = False,
         cache_creation_tokens: int = 0,
         cache_read_tokens: int = 0,
+        batch: bool = False,
     ) -> float:
         """Track an API call and calculate cost.
 
@@ -140,6 +295,7 @@ class CostTracker:
             cached: Whether this was a cache hit
             cache_creation_tokens: Tokens written to cache
             cache_read_tokens: Tokens read from cache
+            batch: Whether the call ran in a batch job (billed at BATCH_DISCOUNT)
 
         Returns:
             Cost in USD for this API call
@@ -157,6 +313,8 @@ class CostTracker:
         cost += output_tokens * pricing["output"]
         cost += cache_creation_tokens * pricing["cache_write"]
         cost += cache_read_tokens * pricing["cache_read"]
+        if batch:
+            cost *= BATCH_DISCOUNT
 
         # Record API call
         api_call = APICall(
@@ -170,10 +328,13 @@ class CostTracker:
             cost_usd=cost,
             duration_seconds=duration_seconds,
             cached=cached,
+            batch=batch,
         )
 
-        self.api_calls.append(api_call)
-        self._save()
+        try:
+            self._append(api_call)
+        except OSError as e:
+            logger.error(f"Failed to append to cost ledger: {e}")
 
         logger.info(
             f"API call tracked: {extractor} on {document_name} - "
@@ -182,53 +343,85 @@ class CostTracker:
 
         return cost
 
-    def get_summary(self) -> SessionCostSummary:
+    def _append(self, call: APICall) -> None:
+        line = call.model_dump_json().encode("utf-8") + b"\n"
+        with self._lock:
+            fd = os.open(self.ledger_path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                # Exclusive lock orders appends from other processes sharing the session
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                size = os.fstat(fd).st_size
+                if size > self._offset:
+                    with os.fdopen(os.dup(fd), "rb") as f:
+                        self._catch_up(f)
+                    if size > self._offset:
+                        # Torn line from a writer that died mid-append
+                        os.ftruncate(fd, self._offset)
+                os.write(fd, line)
+                self._offset += len(line)
+                self._apply(call)
+            finally:
+                os.close(fd)  # also releases the flock
+
+            self._since_snapshot += 1
+            if self._since_snapshot >= settings.cost_snapshot_interval:
+                self._save_locked()
+            else:
+                _unsnapshotted.add(self)
+
+    # -- summaries ------------------------------------------------------------
+
+    def get_summary(self, include_calls: bool = False) -> SessionCostSummary:
         """Get cost summary for the session.
 
+        Constant time: totals and breakdowns are maintained as calls are
+        recorded.
+
+        Args:
+            include_calls: Also return every call (reads the ledger on first use)
+
         Returns:
             SessionCostSummary with aggregated metrics
         """
-        if not self.api_calls:
-            return SessionCostSummary(
-                session_id=self.session_id,
-                total_api_calls=0,
-                total_input_tokens=0,
-                total_output_tokens=0,
-                total_cache_creation_tokens=0,
-                total_cache_read_tokens=0,
-                total_cost_usd=0.0,
-                total_duration_seconds=0.0,
-                cache_hit_rate=0.0,
-            )
-
-        total_calls = len(self.api_calls)
-        cached_calls = sum(1 for call in self.api_calls if call.cached)
+        calls = self.api_calls if include_calls else []
+        with self._lock:
+            return self._summary_locked(calls)
 
+    def _summary_locked(self, calls: list[APICall]) -> SessionCostSummary:
+        totals = self._totals
         return SessionCostSummary(
             session_id=self.session_id,
-            total_api_calls=total_calls,
-            total_input_tokens=sum(call.input_tokens for call in self.api_calls),
-            total_output_tokens=sum(call.output_tokens for call in self.api_calls),
-            total_cache_creation_tokens=sum(call.cache_creation_tokens for call in self.api_calls),
-            total_cache_read_tokens=sum(call.cache_read_tokens for call in self.api_calls),
-            total_cost_usd=sum(call.cost_usd for call in self.api_calls),
-            total_duration_seconds=sum(call.duration_seconds for call in self.api_calls),
-            cache_hit_rate=cached_calls / total_calls if total_calls > 0 else 0.0,
-            api_calls=self.api_calls,
+            total_api_calls=totals.api_calls,
+            total_input_tokens=totals.input_tokens,
+            total_output_tokens=totals.output_tokens,
+            total_cache_creation_tokens=totals.cache_creation_tokens,
+            total_cache_read_tokens=totals.cache_read_tokens,
+            total_cost_usd=totals.cost_usd,
+            total_duration_seconds=totals.duration_seconds,
+            cache_hit_rate=totals.cached_calls / totals.api_calls if totals.api_calls > 0 else 0.0,
+            prompt_cache_hit_rate=_prompt_cache_hit_rate(totals),
+            by_extractor={k: v.model_copy() for k, v in self._by_extractor.items()},
+            by_model={k: v.model_copy() for k, v in self._by_model.items()},
+            api_calls=list(calls),
         )
 
-    def _save(self) -> None:
-        """Save cost data to file with exclusive lock."""
+    def flush(self) -> None:
+        """Write the summary snapshot now."""
+        with self._lock:
+            self._save_locked()
+
+    def _save_locked(self) -> None:
+        """Snapshot the summary and the ledger offset it covers (atomic replace)."""
         try:
-            summary = self.get_summary()
-            with open(self.storage_path, "w") as f:
-                # Acquire exclusive lock for writing (blocks other readers/writers)
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                try:
-                    json.dump(summary.model_dump(mode="json"), f, indent=2, default=str)
-                finally:
-                    # Release lock
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            data = self._summary_locked([]).model_dump(mode="json", exclude={"api_calls"})
+            data["ledger_offset"] = self._offset
+            data["updated_at"] = datetime.now(timezone.utc).isoformat()
+            tmp = self.storage_path.with_name(f".{self.storage_path.name}.{os.getpid()}.tmp")
+            with open(tmp, "w") as f:
+                json.dump(data, f, indent=2)
+            tmp.replace(self.storage_path)
+            self._since_snapshot = 0
+            _unsnapshotted.discard(self)
         except Exception as e:
             logger.error(f"Failed to save cost data: {e}")
 
@@ -246,6 +439,7 @@ class CostTracker:
         print(f"  Output:            {summary.total_output_tokens:,}")
         print(f"  Cache Creation:    {summary.total_cache_creation_tokens:,}")
         print(f"  Cache Read:        {summary.total_cache_read_tokens:,}")
+        print(f"  Prompt Cache Hits: {summary.prompt_cache_hit_rate:.1%}")
         print(f"\nCost:")
         print(f"  Total:             ${summary.total_cost_usd:.4f}")
         print(
@@ -258,17 +452,89 @@ class CostTracker:
         )
         print(f"{'=' * 60}\n")
 
-        # Breakdown by extractor
-        if summary.api_calls:
-            print(f"Breakdown by Extractor:")
-            extractors = {}
-            for call in summary.api_calls:
-                if call.extractor not in extractors:
-                    extractors[call.extractor] = {"calls": 0, "cost": 0.0, "tokens": 0}
-                extractors[call.extractor]["calls"] += 1
-                extractors[call.extractor]["cost"] += call.cost_usd
-                extractors[call.extractor]["tokens"] += call.input_tokens + call.output_tokens
-
-            for extractor, stats in extractors.items():
-                print(f"  {extractor:15s}: {stats['calls']:2d} calls, ${stats['cost']:.4f}, {stats['tokens']:,} tokens")
+        for title, breakdown in (("Extractor", summary.by_extractor), ("Model", summary.by_model)):
+            if not breakdown:
+                continue
+            print(f"Breakdown by {title}:")
+            for name, stats in breakdown.items():
+                tokens = stats.input_tokens + stats.output_tokens
+                print(f"  {name:15s}: {stats.api_calls:2d} calls, ${stats.cost_usd:.4f}, {tokens:,} tokens")
             print(f"{'=' * 60}\n")
+
+
+@atexit.register
+def _snapshot_at_exit() -> None:
+    for tracker in list(_unsnapshotted):
+        tracker.flush()
+
+
+# -- call_llm attribution -----------------------------------------------------
+
+
+@dataclass(frozen=True)
+class _CostContext:
+    tracker: CostTracker
+    extractor: str
+    document_name: str
+
+
+_cost_context: ContextVar[_CostContext | None] = ContextVar("llm_cost_context", default=None)
+
+
+@contextmanager
+def track_llm_costs(
+    tracker: CostTracker | None = None,
+    extractor: str | None = None,
+    document_name: str | None = None,
+) -> Iterator[None]:
+    """Record ``call_llm`` calls made inside the block on ``tracker``.
+
+    Nested blocks inherit whatever they do not override, so a run can
+    install the session's tracker once and each call site label its
+    document. Without an enclosing tracker, a block that names none is a
+    no-op.
+    """
+    parent = _cost_context.get()
+    if tracker is None and parent is None:
+        yield
+        return
+    context = _CostContext(
+        tracker=tracker or parent.tracker,
+        extractor=extractor or (parent.extractor if parent else "llm"),
+        document_name=document_name if document_name is not None else (parent.document_name if parent else ""),
+    )
+    token = _cost_context.set(context)
+    try:
+        yield
+    finally:
+        _cost_context.reset(token)
+
+
+def record_llm_call(
+    model: str,
+    input_tokens: int,
+    output_tokens: int,
+    duration_seconds: float,
+    cache_creation_tokens: int = 0,
+    cache_read_tokens: int = 0,
+) -> None:
+    """Record one provider call on the active :func:`track_llm_costs` tracker, if any.
+
+    ``input_tokens`` excludes both cache-write and cache-read tokens.
+    """
+    context = _cost_context.get()
+    if context is None:
+        return
+    try:
+        context.tracker.track_api_call(
+            model=model,
+            extractor=context.extractor,
+            document_name=context.document_name,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            duration_seconds=duration_seconds,
+            cache_creation_tokens=cache_creation_tokens,
+            cache_read_tokens=cache_read_tokens,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to track API call cost: {e}")
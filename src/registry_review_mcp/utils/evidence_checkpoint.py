@@ -0,0 +1,168 @@
+"""Per-requirement checkpoints for resumable evidence extraction.
+
+``extract_all_evidence`` used to hold every ``RequirementEvidence`` in
+memory and write ``evidence.json`` only after the whole run, so a fatal
+billing error, a gateway storm or a restart late in a run discarded every
+finished requirement (apart from whatever the LLM cache held).
+
+Each requirement's result is now appended to ``evidence_checkpoints.jsonl``
+as soon as it completes. Every record carries the requirement's *input
+key*, a hash of everything its result depends on (requirement text,
+mapped documents' content, prompt version, model, retrieval settings), so
+a later run reuses a checkpoint only when it would have produced the same
+result.
+
+The file holds one run at a time::
+
+    {"type": "run", "started_at": ..., "total": 23, "resumed": 9}
+    {"type": "requirement", "requirement_id": ..., "input_key": ..., "evidence": {...}, "resumed": true}
+    ...
+    {"type": "complete", "completed_at": ...}
+
+:meth:`EvidenceCheckpoints.start_run` rewrites it with the run marker and
+the checkpoints being resumed; results are then appended (``fsync``-ed,
+under the file's lock) as they land. :meth:`EvidenceCheckpoints.progress`
+reads it back for status endpoints while the run is in flight. The
+``async_*`` twins wait for the lock without blocking the event loop.
+"""
+
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+from .state import StateManager
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILENAME = "evidence_checkpoints.jsonl"
+
+
+class EvidenceCheckpoints:
+    """Checkpoint log for one session's evidence extraction."""
+
+    def __init__(self, state_manager: StateManager):
+        self.state = state_manager
+        self.path: Path = state_manager.session_dir / CHECKPOINT_FILENAME
+
+    def _records(self) -> Iterator[dict[str, Any]]:
+        if not self.path.exists():
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn trailing line from a crashed writer; that result
+                    # is simply not checkpointed.
+                    logger.debug(f"Skipping unreadable checkpoint line in {self.path}")
+
+    def _append_unlocked(self, record: dict[str, Any]) -> None:
+        line = (json.dumps(record, default=str) + "\n").encode("utf-8")
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, line)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _append(self, record: dict[str, Any]) -> None:
+        with self.state.lock(filename=CHECKPOINT_FILENAME):
+            self._append_unlocked(record)
+
+    async def _async_append(self, record: dict[str, Any]) -> None:
+        async with self.state.async_lock(filename=CHECKPOINT_FILENAME):
+            self._append_unlocked(record)
+
+    def load(self) -> dict[str, dict[str, Any]]:
+        """Latest checkpoint record per requirement id."""
+        return {r["requirement_id"]: r for r in self._records() if r.get("type") == "requirement"}
+
+    def _start_run_unlocked(self, total: int, resumed: dict[str, dict[str, Any]]) -> None:
+        records = [
+            {
+                "type": "run",
+                "started_at": datetime.now(timezone.utc).isoformat(),
+                "total": total,
+                "resumed": len(resumed),
+            },
+            *({**record, "resumed": True} for record in resumed.values()),
+        ]
+        payload = "".join(json.dumps(r, default=str) + "\n" for r in records)
+        tmp_path = self.path.with_suffix(".jsonl.tmp")
+        tmp_path.write_text(payload, encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def start_run(self, total: int, resumed: dict[str, dict[str, Any]]) -> None:
+        """Begin a run of ``total`` requirements, carrying over the ``resumed`` checkpoints."""
+        with self.state.lock(filename=CHECKPOINT_FILENAME):
+            self._start_run_unlocked(total, resumed)
+
+    async def async_start_run(self, total: int, resumed: dict[str, dict[str, Any]]) -> None:
+        """Async :meth:`start_run`; waits for the lock without blocking the loop."""
+        async with self.state.async_lock(filename=CHECKPOINT_FILENAME):
+            self._start_run_unlocked(total, resumed)
+
+    @staticmethod
+    def _requirement_record(requirement_id: str, input_key: str, evidence: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "type": "requirement",
+            "requirement_id": requirement_id,
+            "input_key": input_key,
+            "completed_at": datetime.now(timezone.utc).isoformat(),
+            "evidence": evidence,
+        }
+
+    def record(self, requirement_id: str, input_key: str, evidence: dict[str, Any]) -> None:
+        """Persist one finished requirement."""
+        self._append(self._requirement_record(requirement_id, input_key, evidence))
+
+    async def async_record(self, requirement_id: str, input_key: str, evidence: dict[str, Any]) -> None:
+        """Async :meth:`record`; waits for the lock without blocking the loop."""
+        await self._async_append(self._requirement_record(requirement_id, input_key, evidence))
+
+    def finish_run(self) -> None:
+        self._append({"type": "complete", "completed_at": datetime.now(timezone.utc).isoformat()})
+
+    async def async_finish_run(self) -> None:
+        await self._async_append({"type": "complete", "completed_at": datetime.now(timezone.utc).isoformat()})
+
+    def progress(self) -> dict[str, Any]:
+        """Progress of the current (or last) run."""
+        run: dict[str, Any] | None = None
+        completed: dict[str, dict[str, Any]] = {}
+        finished_at: str | None = None
+        updated_at: str | None = None
+        for record in self._records():
+            kind = record.get("type")
+            if kind == "run":
+                run, completed, finished_at = record, {}, None
+                updated_at = record.get("started_at")
+            elif kind == "requirement" and run is not None:
+                completed[record["requirement_id"]] = record
+                if not record.get("resumed"):
+                    updated_at = record.get("completed_at", updated_at)
+            elif kind == "complete" and run is not None:
+                finished_at = updated_at = record.get("completed_at")
+
+        if run is None:
+            return {"status": "not_started", "total": 0, "completed": 0, "resumed": 0, "remaining": 0, "progress": 0.0}
+
+        total = run.get("total", 0)
+        statuses = [r.get("evidence", {}).get("status") for r in completed.values()]
+        return {
+            "status": "completed" if finished_at else "in_progress",
+            "total": total,
+            "completed": len(completed),
+            "resumed": run.get("resumed", 0),
+            "remaining": max(0, total - len(completed)),
+            "progress": round(len(completed) / total, 3) if total else 1.0,
+            "covered": statuses.count("covered"),
+            "partial": statuses.count("partial"),
+            "missing": statuses.count("missing"),
+            "started_at": run.get("started_at"),
+            "updated_at": updated_at,
+            "completed_at": finished_at,
+        }
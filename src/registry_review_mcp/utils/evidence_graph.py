@@ -0,0 +1,95 @@
+"""Dependency graph from evidence entries to the inputs that produced them.
+
+Adding one late document used to mean re-running the whole evidence pass:
+every mapped document re-read, re-hashed and re-trimmed, every requirement
+re-assembled, even though the LLM cache answered most of the calls.
+
+After each extraction ``evidence_graph.json`` records, for every
+(requirement, document) pair, the inputs its snippets were produced from:
+the requirement's hash, the document's content hash, the prompt version,
+the executor model and the extraction options. It also keeps a
+fingerprint of each document's markdown (path, size, mtime, content hash)
+so unchanged files can be recognized from a ``stat`` without reading them.
+
+``evidence_tools.extract_evidence_incremental`` diffs the current
+mappings and fingerprints against this graph and recomputes only the
+pairs whose inputs changed.
+"""
+
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .state import StateManager
+
+logger = logging.getLogger(__name__)
+
+GRAPH_FILENAME = "evidence_graph.json"
+GRAPH_VERSION = 1
+
+
+def content_hash(text: str) -> str:
+    """Hash of a document's markdown as loaded for extraction."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def document_fingerprint(
+    doc: dict[str, Any],
+    content: str | None = None,
+    previous: dict[str, Any] | None = None,
+) -> dict[str, Any] | None:
+    """Fingerprint of a document's markdown, or None when it has none.
+
+    ``content`` is hashed when given (the caller already read the file).
+    Otherwise the file is read only when its path, size or mtime differ
+    from ``previous``; an unchanged file keeps its recorded hash.
+    """
+    if not (doc.get("has_markdown") and doc.get("markdown_path")):
+        return None
+    path = Path(doc["markdown_path"])
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    fingerprint: dict[str, Any] = {"markdown_path": str(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    if content is not None:
+        fingerprint["content_hash"] = content_hash(content)
+    elif previous and previous.get("content_hash") and all(previous.get(k) == v for k, v in fingerprint.items()):
+        fingerprint["content_hash"] = previous["content_hash"]
+    else:
+        fingerprint["content_hash"] = content_hash(path.read_text(encoding="utf-8"))
+    return fingerprint
+
+
+@dataclass
+class EvidenceGraph:
+    """Inputs behind a session's ``evidence.json``.
+
+    Attributes:
+        documents: document_id -> markdown fingerprint.
+        pairs: requirement_id -> document_id -> the inputs that pair's
+            snippets were extracted from.
+    """
+
+    documents: dict[str, dict[str, Any]] = field(default_factory=dict)
+    pairs: dict[str, dict[str, dict[str, Any]]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, state_manager: StateManager) -> "EvidenceGraph | None":
+        """The session's graph, or None if absent or from another format version."""
+        if not state_manager.exists(GRAPH_FILENAME):
+            return None
+        data = state_manager.read_json(GRAPH_FILENAME)
+        if data.get("version") != GRAPH_VERSION:
+            logger.info(f"Ignoring evidence graph version {data.get('version')} in {state_manager.session_id}")
+            return None
+        return cls(documents=data.get("documents", {}), pairs=data.get("pairs", {}))
+
+    def save(self, state_manager: StateManager) -> None:
+        state_manager.write_json(
+            GRAPH_FILENAME,
+            {"version": GRAPH_VERSION, "documents": self.documents, "pairs": self.pairs},
+        )
@@ -12,8 +12,13 @@ a factory function so every call site gets consistent behavior. Fatal errors
 import asyncio
 import json
 import logging
+import random
 import shutil
+import time
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from dataclasses import dataclass
+from typing import Any
 
 from anthropic import AsyncAnthropic
 
@@ -236,8 +241,12 @@ def classify_cli_error(stderr: str, returncode: int) -> APIErrorInfo:
     )
 
 
-def get_anthropic_client() -> AsyncAnthropic:
-    """Create an Anthropic client after validating the API key exists.
+def get_anthropic_client(max_retries: int | None = None) -> AsyncAnthropic:
+    """Return the shared Anthropic client after validating the API key exists.
+
+    The client is pooled (``llm.client_pool``): calls reuse its keep-alive
+    connections instead of each opening one. ``max_retries`` overrides the
+    SDK retry count (``call_llm`` retries by itself and passes 0).
 
     Raises ConfigurationError immediately if no key is configured, before
     any expensive document loading or processing begins.
@@ -249,7 +258,16 @@ def get_anthropic_client() -> AsyncAnthropic:
             "Get a key at https://console.anthropic.com/settings/keys",
             details={"env_var": "ANTHROPIC_API_KEY"},
         )
-    return AsyncAnthropic(api_key=settings.anthropic_api_key)
+    from ..llm.client_pool import get_client_pool
+
+    return get_client_pool().anthropic(settings.anthropic_api_key, max_retries=max_retries)
+
+
+def get_openai_client(max_retries: int | None = None) -> Any:
+    """The shared OpenAI client (see ``llm.client_pool``), optionally with another SDK retry count."""
+    from ..llm.client_pool import get_client_pool
+
+    return get_client_pool().openai(settings.openai_api_key, max_retries=max_retries)
 
 
 async def _check_cli_available() -> bool:
@@ -334,6 +352,42 @@ async def _resolve_backend() -> str:
 # Track whether we've logged the backend selection
 _backend_logged = False
 
+# call_llm retries congestion errors itself, one throttle slot per attempt,
+# instead of leaving it to the SDK clients: an SDK retry happens inside the
+# slot, where the adaptive window never sees the 429/5xx that caused it.
+_RETRY_INITIAL_DELAY = 1.0
+_RETRY_MAX_DELAY = 32.0
+
+
+def _retry_budget(backend: str) -> int:
+    """Retries call_llm makes for ``backend``: the SDK retry count it takes over."""
+    from ..llm.client_pool import backend_options
+
+    if backend == "api":
+        return backend_options("anthropic").max_retries
+    if backend == "openai":
+        return backend_options("openai").max_retries
+    return 0  # the CLI does not retry
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with ±25% jitter, as ``BaseExtractor._call_api_with_retry``."""
+    delay = _RETRY_INITIAL_DELAY * 2**attempt
+    return min(delay + delay * 0.25 * (2 * random.random() - 1), _RETRY_MAX_DELAY)
+
+
+async def _before_retry(error: Exception, backend: str, attempt: int, retries: int) -> None:
+    """Sleep before the next attempt, or re-raise ``error`` if it should not be retried."""
+    from ..llm.throttle import is_congestion_error
+
+    if attempt >= retries or not is_congestion_error(error, backend):
+        raise error
+    delay = _retry_delay(attempt)
+    logger.warning(
+        f"LLM call failed with {type(error).__name__} (attempt {attempt + 1}/{retries + 1}). Retrying in {delay:.2f}s"
+    )
+    await asyncio.sleep(delay)
+
 
 async def call_llm(
     prompt: str,
@@ -373,56 +427,207 @@ async def call_llm(
     # Phase E: aggregate throttle. Bounds concurrency across the whole
     # process (defaults: LLM_MAX_CONCURRENT=4, LLM_MIN_INTERVAL_MS=100).
     # Sits upstream of backend dispatch so every entry point benefits.
+    # The window is per backend and adapts to its 429/5xx/timeout rate.
+    # The token scheduler sits in front of it: a call waits for its share
+    # of the tokens-per-minute budget before it may take a slot, so queued
+    # bulk calls never hold slots an interactive call could use.
+    #
+    # Identical requests already in flight are not sent again: callers
+    # share the first one's response (see llm.single_flight).
+    #
+    # Congestion errors are retried here, each attempt in a slot of its own,
+    # so every 429/5xx reaches the adaptive window (the clients used below
+    # are built with max_retries=0).
+    from ..llm.single_flight import get_single_flight, prompt_key
     from ..llm.throttle import acquire_slot
+    from ..llm.token_budget import reserve_tokens
+
+    retries = _retry_budget(backend)
+
+    async def dispatch() -> str:
+        async with reserve_tokens(len(prompt) + len(system or ""), max_tokens):
+            attempt = 0
+            while True:
+                try:
+                    async with acquire_slot(backend):
+                        if backend == "api":
+                            return await _call_via_api(prompt, system, model, max_tokens)
+                        if backend == "openai":
+                            return await _call_via_openai(prompt, system, max_tokens)
+                        return await _call_via_cli(prompt, system, model, max_tokens)
+                except Exception as e:
+                    await _before_retry(e, backend, attempt, retries)
+                attempt += 1
+
+    key = prompt_key(backend, model, max_tokens, system or "", prompt)
+    return await get_single_flight().run(key, dispatch)
+
+
+async def call_llm_stream(
+    prompt: str,
+    system: str | None = None,
+    model: str | None = None,
+    max_tokens: int = 4000,
+) -> AsyncIterator[str]:
+    """Streaming variant of :func:`call_llm`: yields the response text as it arrives.
+
+    Same backend resolution, token budget, throttle slot (held until the
+    stream ends) and retries; a stream is retried only if it failed before
+    yielding any text. Not coalesced by single-flight: each consumer owns its
+    stream. Closing the generator early (``contextlib.aclosing``) cancels
+    the request, so output tokens not yet generated are not paid for. The
+    CLI backend does not stream; it yields the whole response at once.
+
+    Usage:
+        async with aclosing(call_llm_stream(prompt)) as chunks:
+            async for text in chunks:
+                ...
+    """
+    backend = await _resolve_backend()
+    model = model or settings.get_active_llm_model()
 
-    async with acquire_slot():
-        if backend == "api":
-            return await _call_via_api(prompt, system, model, max_tokens)
-        if backend == "openai":
-            return await _call_via_openai(prompt, system, max_tokens)
-        return await _call_via_cli(prompt, system, model, max_tokens)
+    from ..llm.throttle import acquire_slot
+    from ..llm.token_budget import reserve_tokens
+
+    retries = _retry_budget(backend)
+
+    async with reserve_tokens(len(prompt) + len(system or ""), max_tokens):
+        for attempt in range(retries + 1):
+            started = False
+            try:
+                async with acquire_slot(backend):
+                    if backend == "api":
+                        stream = _stream_via_api(prompt, system, model, max_tokens)
+                    elif backend == "openai":
+                        stream = _stream_via_openai(prompt, system, max_tokens)
+                    else:
+                        stream = _stream_via_cli(prompt, system, model, max_tokens)
+                    async with aclosing(stream) as chunks:
+                        async for text in chunks:
+                            started = True
+                            yield text
+                return
+            except Exception as e:
+                if started:
+                    raise
+                await _before_retry(e, backend, attempt, retries)
+
+
+def _usage_count(usage: Any, name: str) -> int:
+    """Integer ``usage`` field, or 0 when missing (older SDKs, test doubles)."""
+    value = usage.get(name) if isinstance(usage, dict) else getattr(usage, name, None)
+    return value if isinstance(value, int) else 0
+
+
+def _report_usage(input_tokens: int, output_tokens: int, cache_read_tokens: int = 0) -> None:
+    """Pass a response's token usage to the token scheduler, if it reported any."""
+    if not (input_tokens or output_tokens or cache_read_tokens):
+        return
+    from ..llm.token_budget import record_usage
+
+    record_usage(input_tokens, output_tokens, cache_read_tokens)
+
+
+def _report_anthropic_usage(usage: Any, model: str, duration: float) -> None:
+    """Report an Anthropic-shaped ``usage`` block (SDK object or CLI JSON).
+
+    Goes to the token scheduler and, with the prompt-cache split, to the
+    session's cost tracker.
+    """
+    if usage is None:
+        return
+    input_tokens = _usage_count(usage, "input_tokens")
+    cache_creation = _usage_count(usage, "cache_creation_input_tokens")
+    cache_read = _usage_count(usage, "cache_read_input_tokens")
+    output_tokens = _usage_count(usage, "output_tokens")
+    _report_usage(
+        input_tokens=input_tokens + cache_creation,
+        output_tokens=output_tokens,
+        cache_read_tokens=cache_read,
+    )
+    _record_cost(model, input_tokens, output_tokens, duration, cache_creation, cache_read)
 
 
-async def _call_via_api(
-    prompt: str,
-    system: str | None,
+def _record_cost(
     model: str,
-    max_tokens: int,
-) -> str:
-    """Call LLM via the Anthropic Python SDK."""
-    client = get_anthropic_client()
+    input_tokens: int,
+    output_tokens: int,
+    duration: float,
+    cache_creation_tokens: int = 0,
+    cache_read_tokens: int = 0,
+) -> None:
+    if not (input_tokens or output_tokens or cache_creation_tokens or cache_read_tokens):
+        return
+    from .cost_tracker import record_llm_call
+
+    record_llm_call(model, input_tokens, output_tokens, duration, cache_creation_tokens, cache_read_tokens)
+
+
+def anthropic_request_params(prompt: str, system: str | None, model: str, max_tokens: int) -> dict[str, Any]:
+    """Messages ``create`` parameters for a prompt (also the body of a batch request).
+
+    A :class:`~registry_review_mcp.llm.prompt_layout.PromptLayout` is sent
+    as one block per cached prefix (document first, with a breakpoint) plus
+    the uncached tail. A plain string prompt is sent without a breakpoint:
+    it shares no prefix with other calls, so a cache write would only cost.
+    """
+    from ..llm.prompt_layout import PromptLayout
 
-    kwargs: dict = {
+    if isinstance(prompt, PromptLayout):
+        content = prompt.content_blocks()
+    else:
+        content = [{"type": "text", "text": prompt}]
+
+    params: dict[str, Any] = {
         "model": model,
         "max_tokens": max_tokens,
         "temperature": 0,
-        "messages": [
-            {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "text",
-                        "text": prompt,
-                        "cache_control": {"type": "ephemeral"},
-                    }
-                ],
-            }
-        ],
+        "messages": [{"role": "user", "content": content}],
     }
 
     if system:
-        kwargs["system"] = [
+        params["system"] = [
             {
                 "type": "text",
                 "text": system,
                 "cache_control": {"type": "ephemeral"},
             }
         ]
+    return params
+
+
+async def _call_via_api(
+    prompt: str,
+    system: str | None,
+    model: str,
+    max_tokens: int,
+) -> str:
+    """Call LLM via the Anthropic SDK (request built by :func:`anthropic_request_params`)."""
+    client = get_anthropic_client(max_retries=0)
 
-    response = await client.messages.create(**kwargs)
+    started = time.monotonic()
+    response = await client.messages.create(**anthropic_request_params(prompt, system, model, max_tokens))
+    _report_anthropic_usage(getattr(response, "usage", None), model, time.monotonic() - started)
     return response.content[0].text
 
 
+async def _stream_via_api(prompt: str, system: str | None, model: str, max_tokens: int) -> AsyncIterator[str]:
+    """Stream a response via the Anthropic SDK; usage so far is reported even if closed early."""
+    client = get_anthropic_client(max_retries=0)
+
+    started = time.monotonic()
+    async with client.messages.stream(**anthropic_request_params(prompt, system, model, max_tokens)) as stream:
+        try:
+            async for text in stream.text_stream:
+                yield text
+        finally:
+            try:
+                usage = stream.current_message_snapshot.usage
+            except AssertionError:
+                usage = None  # closed before the message started
+            _report_anthropic_usage(usage, model, time.monotonic() - started)
+
+
 async def _call_via_openai(
     prompt: str,
     system: str | None,
@@ -434,32 +639,97 @@ async def _call_via_openai(
     The Anthropic model ID passed to call_llm() is ignored — we use the
     configured OpenAI model instead.
     """
-    from openai import AsyncOpenAI
-
-    client = AsyncOpenAI(api_key=settings.openai_api_key)
+    client = get_openai_client(max_retries=0)
     model = settings.get_active_openai_model()
 
+    started = time.monotonic()
+    response = await client.chat.completions.create(
+        model=model,
+        messages=_openai_messages(prompt, system),
+        max_tokens=max_tokens,
+        temperature=0,
+    )
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        _report_openai_usage(usage, model, time.monotonic() - started)
+    return response.choices[0].message.content or ""
+
+
+def _openai_messages(prompt: str, system: str | None) -> list[dict]:
     messages: list[dict] = []
     if system:
         messages.append({"role": "system", "content": system})
     messages.append({"role": "user", "content": prompt})
+    return messages
 
-    response = await client.chat.completions.create(
+
+def _report_openai_usage(usage: Any, model: str, duration: float) -> None:
+    # OpenAI caches long prompt prefixes automatically; cached tokens are
+    # included in prompt_tokens.
+    prompt_tokens = _usage_count(usage, "prompt_tokens")
+    completion_tokens = _usage_count(usage, "completion_tokens")
+    cached_tokens = _usage_count(getattr(usage, "prompt_tokens_details", None), "cached_tokens")
+    _report_usage(prompt_tokens, completion_tokens)
+    _record_cost(model, prompt_tokens - cached_tokens, completion_tokens, duration, cache_read_tokens=cached_tokens)
+
+
+async def _stream_via_openai(prompt: str, system: str | None, max_tokens: int) -> AsyncIterator[str]:
+    """Stream a response via the OpenAI API (usage arrives with the last chunk)."""
+    client = get_openai_client(max_retries=0)
+    model = settings.get_active_openai_model()
+
+    started = time.monotonic()
+    stream = await client.chat.completions.create(
         model=model,
-        messages=messages,
+        messages=_openai_messages(prompt, system),
         max_tokens=max_tokens,
         temperature=0,
+        stream=True,
+        stream_options={"include_usage": True},
     )
-    return response.choices[0].message.content or ""
+    try:
+        async for chunk in stream:
+            if chunk.usage is not None:
+                _report_openai_usage(chunk.usage, model, time.monotonic() - started)
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    finally:
+        await stream.close()
+
+
+async def _stream_via_cli(prompt: str, system: str | None, model: str, max_tokens: int) -> AsyncIterator[str]:
+    yield await _call_via_cli(prompt, system, model, max_tokens)
 
 
 async def _call_via_cli(
+    prompt: str,
+    system: str | None,
+    model: str,
+    max_tokens: int,
+) -> str:
+    """Call LLM via the Claude CLI.
+
+    Uses a warm worker from ``llm.cli_pool`` (``settings.llm_cli_pool_enabled``),
+    else spawns one process for this prompt.
+    """
+    if not settings.llm_cli_pool_enabled:
+        return await _call_via_cli_once(prompt, system, model, max_tokens)
+
+    from ..llm.cli_pool import get_cli_pool
+
+    started = time.monotonic()
+    response_data = await get_cli_pool().run(str(prompt), system, model)
+    _report_anthropic_usage(response_data.get("usage"), model, time.monotonic() - started)
+    return response_data.get("result", "")
+
+
+async def _call_via_cli_once(
     prompt: str,
     system: str | None,
     model: str,
     max_tokens: int,  # noqa: ARG001 — kept for interface parity with _call_via_api
 ) -> str:
-    """Call LLM via the Claude CLI subprocess.
+    """Call LLM via a one-off Claude CLI subprocess.
 
     Spawns `claude -p` with structured JSON output. The prompt is piped
     via stdin to avoid shell escaping issues. The CLI does not support
@@ -477,6 +747,7 @@ async def _call_via_cli(
     if system:
         cmd.extend(["--system-prompt", system])
 
+    started = time.monotonic()
     proc = await asyncio.create_subprocess_exec(
         *cmd,
         stdin=asyncio.subprocess.PIPE,
@@ -486,7 +757,7 @@ async def _call_via_cli(
 
     stdout, stderr = await asyncio.wait_for(
         proc.communicate(input=prompt.encode("utf-8")),
-        timeout=300,
+        timeout=settings.llm_cli_request_timeout_seconds,
     )
 
     returncode = proc.returncode or 0
@@ -519,4 +790,5 @@ async def _call_via_cli(
             details={"category": error_info.category, "is_fatal": error_info.is_fatal},
         )
 
+    _report_anthropic_usage(response_data.get("usage"), model, time.monotonic() - started)
     return response_data.get("result", "")
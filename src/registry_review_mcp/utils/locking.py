@@ -0,0 +1,225 @@
+"""Advisory file locks for session state.
+
+``StateManager`` used to lock a session by creating ``.lock`` with
+``touch(exist_ok=False)`` and busy-waiting with ``time.sleep(0.1)``. That
+blocked the event loop, serialized every file in the session behind one
+lock, and a crashed process left the lock behind until someone deleted it.
+
+:class:`FileLock` wraps ``fcntl.flock``:
+
+- shared (reader) and exclusive (writer) modes;
+- the kernel drops the lock when its holder dies, so a crash can no
+  longer wedge a session;
+- acquisition is a non-blocking attempt, so callers decide how to wait
+  (``time.sleep`` in sync code, ``asyncio.sleep`` in async code).
+
+Where ``flock`` is unavailable (no ``fcntl`` module, or a filesystem that
+answers ``ENOLCK``) it falls back to an ``O_EXCL`` lock file holding the
+owner's PID. Only that fallback can leave a stale lock, so it is also where
+stale locks are detected: a lock file whose PID is no longer running is
+broken and re-acquired. Shared requests are exclusive in the fallback.
+
+Wait times are recorded per lock name; see :func:`get_lock_metrics`.
+"""
+
+import errno
+import logging
+import os
+import threading
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# errno values meaning "this filesystem cannot flock", not "someone holds it"
+_FLOCK_UNSUPPORTED = {errno.ENOLCK, errno.EOPNOTSUPP, errno.ENOSYS, errno.EINVAL}
+
+
+@dataclass
+class LockMetrics:
+    """Lock-wait telemetry for one lock name."""
+
+    acquisitions: int = 0
+    contended: int = 0
+    timeouts: int = 0
+    stale_broken: int = 0
+    total_wait_s: float = 0.0
+    max_wait_s: float = 0.0
+
+
+_metrics: dict[str, LockMetrics] = defaultdict(LockMetrics)
+_metrics_lock = threading.Lock()
+
+
+def record_acquisition(name: str, waited_s: float, contended: bool) -> None:
+    """Record a successful acquisition of lock ``name``."""
+    with _metrics_lock:
+        m = _metrics[name]
+        m.acquisitions += 1
+        m.contended += int(contended)
+        m.total_wait_s += waited_s
+        m.max_wait_s = max(m.max_wait_s, waited_s)
+
+
+def record_timeout(name: str) -> None:
+    """Record a lock ``name`` acquisition that gave up."""
+    with _metrics_lock:
+        _metrics[name].timeouts += 1
+
+
+def _record_stale(name: str) -> None:
+    with _metrics_lock:
+        _metrics[name].stale_broken += 1
+
+
+def get_lock_metrics() -> dict[str, dict[str, float]]:
+    """Return lock-wait metrics keyed by lock name (e.g. ``"documents.json"``).
+
+    ``avg_wait_s`` is derived; every other field is a running total or peak
+    since process start (or the last :func:`reset_lock_metrics`).
+    """
+    with _metrics_lock:
+        report = {}
+        for name, m in _metrics.items():
+            report[name] = {
+                **asdict(m),
+                "avg_wait_s": m.total_wait_s / m.acquisitions if m.acquisitions else 0.0,
+            }
+        return report
+
+
+def reset_lock_metrics() -> None:
+    """Clear lock metrics. Intended for tests."""
+    with _metrics_lock:
+        _metrics.clear()
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Exists, owned by another user
+        return True
+    return True
+
+
+class FileLock:
+    """One advisory lock on one lock file. Not reentrant."""
+
+    def __init__(self, path: Path, shared: bool = False, name: str | None = None):
+        """Initialize (does not acquire).
+
+        Args:
+            path: Lock file path; created on demand
+            shared: Reader lock (compatible with other readers) instead of writer lock
+            name: Metrics key (default: the lock file's name)
+        """
+        self.path = path
+        self.shared = shared
+        self.name = name or path.name
+        self._fd: int | None = None
+        self._owns_pid_file = False
+
+    @property
+    def held(self) -> bool:
+        return self._fd is not None or self._owns_pid_file
+
+    def holder_pid(self) -> int | None:
+        """PID recorded by the current (or last) exclusive holder, if any."""
+        try:
+            content = self.path.read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+        return int(content) if content.isdigit() else None
+
+    def try_acquire(self) -> bool:
+        """Attempt to take the lock without blocking.
+
+        Returns:
+            True if the lock is now held by this object
+        """
+        if fcntl is None:
+            return self._try_acquire_pid_file()
+
+        while True:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, (fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX) | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                return False
+            except OSError as e:
+                os.close(fd)
+                if e.errno in _FLOCK_UNSUPPORTED:
+                    logger.warning(f"flock unsupported for {self.path} ({e}); using PID lock files")
+                    return self._try_acquire_pid_file()
+                raise
+
+            # The previous holder unlinks the file on release. If that
+            # happened between our open() and flock(), we locked an orphaned
+            # inode that nobody else will ever look at: retry on the new file.
+            try:
+                current = os.stat(self.path).st_ino
+            except FileNotFoundError:
+                current = None
+            if current != os.fstat(fd).st_ino:
+                os.close(fd)
+                continue
+
+            if not self.shared:
+                os.ftruncate(fd, 0)
+                os.write(fd, str(os.getpid()).encode())
+            self._fd = fd
+            return True
+
+    def _try_acquire_pid_file(self) -> bool:
+        for _ in range(2):
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                pid = self.holder_pid()
+                if pid is not None and pid != os.getpid() and not _pid_alive(pid):
+                    logger.warning(f"Breaking stale lock {self.path} held by dead process {pid}")
+                    self.path.unlink(missing_ok=True)
+                    _record_stale(self.name)
+                    continue
+                return False
+            try:
+                os.write(fd, str(os.getpid()).encode())
+            finally:
+                os.close(fd)
+            self._owns_pid_file = True
+            return True
+        return False
+
+    def release(self) -> None:
+        """Release the lock, removing the lock file if no one else holds it."""
+        if self._owns_pid_file:
+            self._owns_pid_file = False
+            self.path.unlink(missing_ok=True)
+            return
+
+        fd, self._fd = self._fd, None
+        if fd is None:
+            return
+        try:
+            # Only unlink while holding it exclusively, otherwise a reader
+            # still on this inode and a writer on a fresh file would both
+            # believe they hold the lock.
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            self.path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        finally:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            finally:
+                os.close(fd)
@@ -1,15 +1,39 @@
 """Atomic state management for session persistence.
 
 Provides thread-safe file operations with locking to prevent corruption.
+
+Locks are ``flock`` advisory locks (see ``utils.locking``) in two levels:
+
+- the session lock (``.lock``): taken exclusively by ``lock()`` with no
+  filename, for operations spanning the whole session;
+- per-file locks (``.<filename>.lock``): taken by ``write_json`` /
+  ``update_json`` and by ``lock(filename=...)``. They also take the session
+  lock *shared*, so writers of ``documents.json`` and ``audit_log.json`` no
+  longer serialize against each other but both still wait for a
+  session-wide exclusive holder.
+
+Acquisition never blocks inside the kernel: sync callers poll with
+``time.sleep``, async callers (``async_lock``) with ``asyncio.sleep`` so the
+event loop keeps serving while they wait.
 """
 
+import asyncio
 import json
+import os
 import time
-from contextlib import contextmanager
-from typing import Any
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Iterator
 
 from ..config.settings import settings, validate_session_id
 from ..models.errors import SessionLockError, SessionNotFoundError
+from .locking import FileLock, record_acquisition, record_timeout
+from .state_cache import file_signature, get_state_cache
+
+# Poll backoff while a lock is contended
+_LOCK_POLL_INITIAL_S = 0.005
+_LOCK_POLL_MAX_S = 0.1
+
+SESSION_LOCK_NAME = "session"
 
 
 class StateManager:
@@ -29,47 +53,103 @@ class StateManager:
         self.session_dir = settings.get_session_path(session_id)
         self.lock_file = self.session_dir / ".lock"
 
+    def _lock_chain(self, filename: str | None, shared: bool) -> list[FileLock]:
+        """Locks to take, in acquisition order (always session first)."""
+        if filename is None:
+            return [FileLock(self.lock_file, shared=shared, name=SESSION_LOCK_NAME)]
+        return [
+            FileLock(self.lock_file, shared=True, name=SESSION_LOCK_NAME),
+            FileLock(self.session_dir / f".{filename}.lock", shared=shared, name=filename),
+        ]
+
+    def _try_acquire_chain(self, chain: list[FileLock]) -> bool:
+        """All-or-nothing attempt; never holds a partial chain on failure."""
+        for i, file_lock in enumerate(chain):
+            if not file_lock.try_acquire():
+                for held in reversed(chain[:i]):
+                    held.release()
+                return False
+        return True
+
+    @staticmethod
+    def _release_chain(chain: list[FileLock]) -> None:
+        for file_lock in reversed(chain):
+            file_lock.release()
+
+    def _lock_error(self, chain: list[FileLock], filename: str | None, timeout: int) -> SessionLockError:
+        record_timeout(chain[-1].name)
+        target = f"{filename} in session {self.session_id}" if filename else f"session {self.session_id}"
+        return SessionLockError(
+            f"Could not acquire lock for {target} within {timeout}s",
+            details={
+                "session_id": self.session_id,
+                "filename": filename,
+                "timeout": timeout,
+                "holder_pid": chain[-1].holder_pid(),
+            },
+        )
+
+    def _poll_delays(self, chain: list[FileLock], filename: str | None, timeout: int) -> Iterator[float]:
+        """Yield sleep intervals until the chain is acquired; raise on timeout."""
+        # Ensure directory exists before trying to create lock files
+        self.session_dir.mkdir(parents=True, exist_ok=True)
+
+        start = time.monotonic()
+        delay = _LOCK_POLL_INITIAL_S
+        contended = False
+        while not self._try_acquire_chain(chain):
+            contended = True
+            if time.monotonic() - start > timeout:
+                raise self._lock_error(chain, filename, timeout)
+            yield delay
+            delay = min(delay * 2, _LOCK_POLL_MAX_S)
+        record_acquisition(chain[-1].name, time.monotonic() - start, contended=contended)
+
     @contextmanager
-    def lock(self, timeout: int | None = None):
-        """Acquire exclusive lock for session modifications.
+    def lock(self, timeout: int | None = None, filename: str | None = None, shared: bool = False):
+        """Acquire a lock for session modifications.
 
         Args:
             timeout: Maximum seconds to wait for lock (None = use settings default)
+            filename: Lock only this file (default: the whole session)
+            shared: Reader lock, compatible with other readers of the same target
 
         Raises:
             SessionLockError: If lock cannot be acquired within timeout
         """
-        # Ensure directory exists before trying to create lock file
-        self.session_dir.mkdir(parents=True, exist_ok=True)
-
         timeout = timeout or settings.session_lock_timeout
-        start_time = time.time()
-
-        while True:
-            try:
-                # Try to create lock file (atomic operation)
-                self.lock_file.touch(exist_ok=False)
-                break
-            except FileExistsError:
-                # Lock already held, wait and retry
-                if time.time() - start_time > timeout:
-                    raise SessionLockError(
-                        f"Could not acquire lock for session {self.session_id} within {timeout}s",
-                        details={"session_id": self.session_id, "timeout": timeout},
-                    )
-                time.sleep(0.1)
+        chain = self._lock_chain(filename, shared)
+        for delay in self._poll_delays(chain, filename, timeout):
+            time.sleep(delay)
 
         # Lock acquired, now execute and ensure cleanup
         try:
             yield
         finally:
             # Always release lock, even on exception
-            try:
-                if self.lock_file.exists():
-                    self.lock_file.unlink()
-            except Exception:
-                # Force delete if normal unlink fails
-                pass
+            self._release_chain(chain)
+
+    @asynccontextmanager
+    async def async_lock(self, timeout: int | None = None, filename: str | None = None, shared: bool = False):
+        """Async twin of :meth:`lock`: waits with ``asyncio.sleep``, never blocking the loop.
+
+        Args:
+            timeout: Maximum seconds to wait for lock (None = use settings default)
+            filename: Lock only this file (default: the whole session)
+            shared: Reader lock, compatible with other readers of the same target
+
+        Raises:
+            SessionLockError: If lock cannot be acquired within timeout
+        """
+        timeout = timeout or settings.session_lock_timeout
+        chain = self._lock_chain(filename, shared)
+        for delay in self._poll_delays(chain, filename, timeout):
+            await asyncio.sleep(delay)
+
+        try:
+            yield
+        finally:
+            self._release_chain(chain)
 
     def read_json(self, filename: str) -> dict[str, Any]:
         """Read JSON file from session directory.
@@ -85,15 +165,15 @@ class StateManager:
         """
         file_path = self.session_dir / filename
 
-        if not file_path.exists():
+        try:
+            # Served from the process-wide cache while the file is unchanged
+            return get_state_cache().load(self.session_id, filename, file_path)
+        except FileNotFoundError:
             raise SessionNotFoundError(
                 f"File not found: {filename}",
                 details={"session_id": self.session_id, "filename": filename},
             )
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-
     def _write_json_unlocked(self, filename: str, data: dict[str, Any]) -> None:
         """Write JSON file without acquiring lock (internal use only).
 
@@ -108,12 +188,19 @@ class StateManager:
         temp_path = self.session_dir / f".{filename}.tmp"
 
         # Write to temp file first
+        text = json.dumps(data, indent=2, default=str)
         with open(temp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
+            f.write(text)
+            # Flush first: the buffered text is not yet in the inode fstat sees
+            f.flush()
+            signature = file_signature(os.fstat(f.fileno()))
 
         # Atomic rename
         temp_path.replace(file_path)
 
+        # Write-through: the text is exactly what the next reader would parse
+        get_state_cache().put_serialized(self.session_id, filename, signature, text)
+
     def write_json(self, filename: str, data: dict[str, Any]) -> None:
         """Write JSON file to session directory atomically.
 
@@ -124,7 +211,12 @@ class StateManager:
         Raises:
             SessionLockError: If lock cannot be acquired
         """
-        with self.lock():
+        with self.lock(filename=filename):
+            self._write_json_unlocked(filename, data)
+
+    async def async_write_json(self, filename: str, data: dict[str, Any]) -> None:
+        """Async :meth:`write_json`; waits for the lock without blocking the loop."""
+        async with self.async_lock(filename=filename):
             self._write_json_unlocked(filename, data)
 
     def update_json(self, filename: str, updates: dict[str, Any]) -> dict[str, Any]:
@@ -143,27 +235,35 @@ class StateManager:
             SessionLockError: If lock cannot be acquired
             SessionNotFoundError: If file does not exist
         """
-        with self.lock():
-            data = self.read_json(filename)
-
-            # Handle nested updates with dot notation
-            for key, value in updates.items():
-                if "." in key:
-                    # Split key into parts and navigate/create nested structure
-                    parts = key.split(".")
-                    target = data
-                    for part in parts[:-1]:
-                        if part not in target:
-                            target[part] = {}
-                        target = target[part]
-                    target[parts[-1]] = value
-                else:
-                    # Simple top-level update
-                    data[key] = value
-
-            # Use unlocked version since we already have the lock
-            self._write_json_unlocked(filename, data)
-            return data
+        with self.lock(filename=filename):
+            return self._update_json_unlocked(filename, updates)
+
+    async def async_update_json(self, filename: str, updates: dict[str, Any]) -> dict[str, Any]:
+        """Async :meth:`update_json`; waits for the lock without blocking the loop."""
+        async with self.async_lock(filename=filename):
+            return self._update_json_unlocked(filename, updates)
+
+    def _update_json_unlocked(self, filename: str, updates: dict[str, Any]) -> dict[str, Any]:
+        data = self.read_json(filename)
+
+        # Handle nested updates with dot notation
+        for key, value in updates.items():
+            if "." in key:
+                # Split key into parts and navigate/create nested structure
+                parts = key.split(".")
+                target = data
+                for part in parts[:-1]:
+                    if part not in target:
+                        target[part] = {}
+                    target = target[part]
+                target[parts[-1]] = value
+            else:
+                # Simple top-level update
+                data[key] = value
+
+        # Use unlocked version since we already have the lock
+        self._write_json_unlocked(filename, data)
+        return data
 
     def exists(self, filename: str | None = None) -> bool:
         """Check if session or specific file exists.
@@ -0,0 +1,197 @@
+"""Process-wide cache of parsed session state files.
+
+Every tool call used to re-read and re-parse ``session.json``,
+``documents.json``, ``evidence.json`` and ``validation.json``; polling
+endpoints (conversion status, the evidence matrix) did it on every GET.
+
+:class:`StateCache` remembers each file's content against its
+``(mtime_ns, size, inode)``. A read costs one ``stat``; only a changed file
+is read and parsed again. ``StateManager._write_json_unlocked`` writes
+through, so our own writes never trigger a re-parse either.
+
+Entries are stored as pickled bytes, not live objects: callers routinely
+mutate what ``read_json`` returns before writing it back, so every hit must
+hand out a private copy, and ``pickle.loads`` is the cheapest way to make
+one (faster than both ``json.load`` and ``copy.deepcopy``). A fresh write
+is held as its JSON text and pickled on first read, so writers never pay
+for a parse they may not need. Pickled size also makes the memory cap exact.
+"""
+
+import json
+import logging
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ..config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Entry:
+    signature: tuple[int, int, int]  # (mtime_ns, size, inode)
+    payload: bytes | str  # pickle bytes, or JSON text not yet parsed
+    nbytes: int
+
+
+def file_signature(stat: os.stat_result) -> tuple[int, int, int]:
+    """Identity of one version of a file on disk."""
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class StateCache:
+    """LRU cache of parsed JSON state, bounded by total payload bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get(self, session_id: str, filename: str, signature: tuple[int, int, int]) -> Any:
+        """Return a private copy of the cached content, or None on a miss.
+
+        A miss includes a cached entry whose signature no longer matches the
+        file on disk (another process wrote it); that entry is dropped.
+        """
+        key = (session_id, filename)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.signature != signature:
+                if entry is not None:
+                    self._remove_locked(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            payload = entry.payload
+
+        if isinstance(payload, str):
+            data = json.loads(payload)
+            pickled = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+            with self._lock:
+                # Upgrade in place unless a writer replaced it meanwhile.
+                if self._entries.get(key) is entry:
+                    self._bytes += len(pickled) - entry.nbytes
+                    entry.payload, entry.nbytes = pickled, len(pickled)
+                    self._evict_locked()
+            return data
+
+        return pickle.loads(payload)
+
+    def load(self, namespace: str, name: str, path: Path) -> Any:
+        """Parse the JSON file at ``path``, served from cache while unchanged.
+
+        Args:
+            namespace: Cache partition (the session id for session state)
+            name: Entry name within the namespace (usually the filename)
+            path: File to read
+
+        Raises:
+            FileNotFoundError: If ``path`` does not exist (any entry is dropped)
+        """
+        try:
+            signature = file_signature(path.stat())
+        except FileNotFoundError:
+            self.invalidate(namespace, name)
+            raise
+
+        # Unchanged since we last parsed (or wrote) it: skip the disk read
+        if self.enabled:
+            cached = self.get(namespace, name, signature)
+            if cached is not None:
+                return cached
+
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+            signature = file_signature(os.fstat(f.fileno()))
+        self.put_parsed(namespace, name, signature, data)
+        return data
+
+    def put_parsed(self, session_id: str, filename: str, signature: tuple[int, int, int], data: Any) -> None:
+        """Cache content that was just parsed from disk."""
+        if not self.enabled:
+            return
+        self._store(session_id, filename, signature, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def put_serialized(self, session_id: str, filename: str, signature: tuple[int, int, int], text: str) -> None:
+        """Cache content that was just written as JSON ``text`` (write-through)."""
+        if not self.enabled:
+            return
+        self._store(session_id, filename, signature, text)
+
+    def _store(self, session_id: str, filename: str, signature: tuple[int, int, int], payload: bytes | str) -> None:
+        nbytes = len(payload)
+        key = (session_id, filename)
+        with self._lock:
+            self._remove_locked(key)
+            # A single file over a quarter of the budget would just churn everything else out.
+            if nbytes > self.max_bytes // 4:
+                return
+            self._entries[key] = _Entry(signature, payload, nbytes)
+            self._bytes += nbytes
+            self._evict_locked()
+
+    def invalidate(self, session_id: str, filename: str | None = None) -> None:
+        """Drop one file, or every file of a session."""
+        with self._lock:
+            if filename is not None:
+                self._remove_locked((session_id, filename))
+                return
+            for key in [k for k in self._entries if k[0] == session_id]:
+                self._remove_locked(key)
+
+    def _remove_locked(self, key: tuple[str, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.nbytes
+
+    def _evict_locked(self) -> None:
+        while self._bytes > self.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.nbytes
+            self.evictions += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Entry count, bytes held, and hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_state_cache: StateCache | None = None
+_state_cache_lock = threading.Lock()
+
+
+def get_state_cache() -> StateCache:
+    """Return the process-wide state cache, sized from settings on first use."""
+    global _state_cache
+    with _state_cache_lock:
+        if _state_cache is None:
+            _state_cache = StateCache(settings.state_cache_max_bytes)
+        return _state_cache
+
+
+def reset_for_tests() -> None:
+    """Drop the process-wide cache so the next call rebuilds it."""
+    global _state_cache
+    with _state_cache_lock:
+        _state_cache = None
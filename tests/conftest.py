@@ -312,6 +312,21 @@ def cleanup_cache_once():
     yield  # Run all tests
 
 
+@pytest.fixture
+def isolated_llm_cache(monkeypatch, tmp_path):
+    """Point the LLM response store at a per-test directory.
+
+    Extractor results are keyed by content, so tests extracting the same
+    text would otherwise share entries.
+    """
+    from registry_review_mcp.llm import response_store
+
+    monkeypatch.setattr(response_store, "settings", settings.model_copy(update={"llm_cache_dir": tmp_path}))
+    response_store.reset_for_tests()
+    yield tmp_path
+    response_store.reset_for_tests()
+
+
 @pytest.fixture
 def cache(test_settings):
     """Create a cache instance for testing.
@@ -275,7 +275,11 @@ class SessionAssertions:
 # ============================================================================
 
 def unique_doc_name(test_name: str) -> str:
-    """Generate unique document name for testing to avoid cache collisions."""
+    """Generate a unique document name for a test.
+
+    Extractor caches are keyed by content, not name; isolate them with the
+    ``isolated_llm_cache`` fixture.
+    """
     return f"{test_name}_{int(time.time() * 1000000)}.pdf"
 
 
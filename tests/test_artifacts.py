@@ -0,0 +1,112 @@
+"""Tests for the content-addressed extraction artifact store."""
+
+import pytest
+
+from registry_review_mcp.utils import artifacts
+from registry_review_mcp.utils.artifacts import ArtifactStore, file_sha256
+
+
+@pytest.fixture
+def store():
+    store = ArtifactStore(namespace="test_artifacts")
+    yield store
+    store.clear()
+
+
+class TestFileHash:
+    def test_matches_hashlib(self, tmp_path):
+        import hashlib
+
+        path = tmp_path / "doc.pdf"
+        path.write_bytes(b"registry bytes")
+        assert file_sha256(path) == hashlib.sha256(b"registry bytes").hexdigest()
+
+    def test_rewrite_in_place_is_rehashed(self, tmp_path, monkeypatch):
+        import os
+
+        monkeypatch.setattr(artifacts, "_hash_memo", type(artifacts._hash_memo)())
+        path = tmp_path / "doc.pdf"
+        path.write_bytes(b"first export")
+        first = file_sha256(path)
+
+        path.write_bytes(b"second export")
+        future = path.stat().st_mtime + 10
+        os.utime(path, (future, future))
+        assert file_sha256(path) != first
+        assert len(artifacts._hash_memo) == 1  # the rewrite replaced, not added
+
+    def test_memo_is_bounded(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(artifacts, "_HASH_MEMO_MAX_ENTRIES", 2)
+        monkeypatch.setattr(artifacts, "_hash_memo", type(artifacts._hash_memo)())
+        paths = []
+        for name in ("a.pdf", "b.pdf", "c.pdf"):
+            paths.append(tmp_path / name)
+            paths[-1].write_bytes(name.encode())
+            file_sha256(paths[-1])
+
+        assert list(artifacts._hash_memo) == [str(p.resolve()) for p in paths[1:]]
+
+
+class TestArtifactStore:
+    def test_same_content_shares_artifact_across_paths(self, store, tmp_path):
+        original = tmp_path / "session-a" / "plan.pdf"
+        copy = tmp_path / "session-b" / "ProjectPlan.pdf"
+        for path in (original, copy):
+            path.parent.mkdir()
+            path.write_bytes(b"identical upload")
+
+        store.put("fast", original, {"filepath": str(original), "markdown": "# Plan"})
+
+        hit = store.get("fast", copy)
+        assert hit["markdown"] == "# Plan"
+        assert hit["filepath"] == str(copy)
+
+    def test_edited_file_misses(self, store, tmp_path):
+        path = tmp_path / "plan.pdf"
+        path.write_bytes(b"v1")
+        store.put("fast", path, {"markdown": "old"})
+
+        path.write_bytes(b"v2 with edits")
+        assert store.get("fast", path) is None
+
+    def test_variant_and_extractor_are_part_of_the_key(self, store, tmp_path):
+        path = tmp_path / "plan.pdf"
+        path.write_bytes(b"bytes")
+        store.put("marker", path, {"markdown": "all"}, variant="pages=all")
+
+        assert store.get("marker", path, variant="pages=1-5") is None
+        assert store.get("fast", path, variant="pages=all") is None
+        assert store.get("marker", path, variant="pages=all") == {"markdown": "all"}
+
+    def test_version_bump_retires_artifacts(self, store, tmp_path, monkeypatch):
+        path = tmp_path / "plan.pdf"
+        path.write_bytes(b"bytes")
+        store.put("spreadsheet", path, {"markdown": "table"})
+
+        monkeypatch.setitem(artifacts.EXTRACTOR_VERSIONS, "spreadsheet", "999")
+        assert store.get("spreadsheet", path) is None
+
+    def test_missing_file_is_a_miss(self, store, tmp_path):
+        assert store.get("fast", tmp_path / "missing.pdf") is None
+
+
+class TestExtractorReuse:
+    async def test_spreadsheet_copy_in_another_session_is_not_reparsed(self, tmp_path, monkeypatch):
+        from registry_review_mcp.extractors import spreadsheet_extractor
+
+        first = tmp_path / "a" / "ledger.csv"
+        second = tmp_path / "b" / "ledger.csv"
+        for path in (first, second):
+            path.parent.mkdir()
+            path.write_text("parcel,hectares\nNorth,12.5\n", encoding="utf-8")
+
+        spreadsheet_extractor.extract_spreadsheet_sync(str(first))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("artifact should have been reused")
+
+        monkeypatch.setattr(spreadsheet_extractor, "_extract_csv", fail)
+        result = spreadsheet_extractor.extract_spreadsheet_sync(str(second))
+
+        assert result["filepath"] == str(second)
+        assert "North" in result["markdown"]
@@ -0,0 +1,127 @@
+"""Tests for the append-only audit trail in ``utils.audit_log``."""
+
+import json
+
+import pytest
+
+from registry_review_mcp.utils import audit_log
+from registry_review_mcp.utils.audit_log import AuditLog, migrate_legacy_audit_log
+from registry_review_mcp.utils.state import StateManager
+
+
+@pytest.fixture(autouse=True)
+def _fresh_indexes():
+    audit_log._indexes.clear()
+    yield
+    audit_log._indexes.clear()
+
+
+def _manager(session_id: str) -> StateManager:
+    manager = StateManager(session_id)
+    manager.session_dir.mkdir(parents=True, exist_ok=True)
+    return manager
+
+
+def _fill(log: AuditLog) -> None:
+    for i in range(6):
+        log.append(
+            "override_set" if i % 2 == 0 else "annotation_added",
+            "requirement",
+            f"REQ-{i:03d}",
+            "alice" if i < 3 else "bob",
+            {"n": i},
+        )
+
+
+class TestAppend:
+    def test_events_get_sequential_ids(self, test_settings):
+        log = AuditLog(_manager("session-dd0000000001"))
+
+        first = log.append("override_set", "requirement", "REQ-001", "user", {})
+        second = log.append("annotation_added", "requirement", "REQ-001", "user", {})
+
+        assert (first["id"], second["id"]) == (1, 2)
+        lines = log.log_path.read_text().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [1, 2]
+
+    def test_torn_trailing_line_is_dropped(self, test_settings):
+        log = AuditLog(_manager("session-dd0000000002"))
+        log.append("override_set", "requirement", "REQ-001", "user", {})
+        with open(log.log_path, "ab") as f:
+            f.write(b'{"id": 2, "action": "overr')  # crashed mid-write
+        audit_log._indexes.clear()
+
+        event = log.append("annotation_added", "requirement", "REQ-002", "user", {})
+
+        assert event["id"] == 2
+        lines = log.log_path.read_text().splitlines()
+        assert [json.loads(line)["action"] for line in lines] == ["override_set", "annotation_added"]
+
+
+class TestQuery:
+    def test_filters_use_index(self, test_settings):
+        log = AuditLog(_manager("session-dd0000000003"))
+        _fill(log)
+
+        page = log.query(action="override_set", actor="alice")
+
+        assert [e["entity_id"] for e in page["events"]] == ["REQ-000", "REQ-002"]
+        assert page["matching"] == 2
+        assert page["total"] == 6
+        assert page["by_action"] == {"override_set": 3, "annotation_added": 3}
+        assert page["by_actor"] == {"alice": 3, "bob": 3}
+
+    def test_cursor_pages_backwards(self, test_settings):
+        log = AuditLog(_manager("session-dd0000000004"))
+        _fill(log)
+
+        newest = log.query(limit=4)
+        older = log.query(limit=4, cursor=newest["next_cursor"])
+
+        assert [e["id"] for e in newest["events"]] == [3, 4, 5, 6]
+        assert newest["next_cursor"] == 3
+        assert [e["id"] for e in older["events"]] == [1, 2]
+        assert older["next_cursor"] is None
+
+    def test_index_survives_process_restart(self, test_settings):
+        manager = _manager("session-dd0000000005")
+        log = AuditLog(manager)
+        _fill(log)
+        log.flush()
+        assert log.index_path.exists()
+
+        audit_log._indexes.clear()
+        log.append("determination_set", "session", manager.session_id, "carol", {})
+        audit_log._indexes.clear()
+
+        page = AuditLog(manager).query(actor="carol")
+        assert [e["id"] for e in page["events"]] == [7]
+        assert page["total"] == 7
+
+
+class TestLegacyMigration:
+    def test_json_log_is_converted_once(self, test_settings):
+        manager = _manager("session-dd0000000006")
+        manager.write_json(
+            "audit_log.json",
+            {
+                "session_id": manager.session_id,
+                "created_at": "2025-01-01T00:00:00+00:00",
+                "events": [
+                    {"id": 1, "timestamp": "2025-01-01T00:00:00+00:00", "action": "override_set", "actor": "user"},
+                    {"id": 2, "timestamp": "2025-01-02T00:00:00+00:00", "action": "annotation_added", "actor": "user"},
+                ],
+            },
+        )
+
+        assert migrate_legacy_audit_log(manager) is True
+        assert migrate_legacy_audit_log(manager) is False
+        assert (manager.session_dir / "audit_log.json.migrated").exists()
+
+        log = AuditLog(manager)
+        event = log.append("determination_set", "session", manager.session_id, "user", {})
+        page = log.query()
+
+        assert event["id"] == 3
+        assert [e["action"] for e in page["events"]] == ["override_set", "annotation_added", "determination_set"]
+        assert page["created_at"] == "2025-01-01T00:00:00+00:00"
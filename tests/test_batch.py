@@ -0,0 +1,229 @@
+"""Tests for offline batch extraction with the local file-based batch backend."""
+
+import json
+
+import pytest
+
+from registry_review_mcp.config.settings import settings
+from registry_review_mcp.extractors import llm_extractors
+from registry_review_mcp.llm import batch, response_store
+from registry_review_mcp.llm.batch import BatchRequest, LocalBatchBackend, run_batch_job
+from registry_review_mcp.tools import evidence_tools
+from registry_review_mcp.utils import checklist
+from registry_review_mcp.utils.state import StateManager
+
+REQUIREMENTS = [
+    {
+        "requirement_id": f"REQ-{n:03d}",
+        "requirement_text": f"Land tenure statement {n}",
+        "accepted_evidence": "Deed",
+        "category": "Land Tenure",
+        "validation_type": "document_presence",
+    }
+    for n in range(1, 3)
+]
+
+
+def _user_text(params: dict) -> str:
+    return "".join(block["text"] for block in params["messages"][0]["content"])
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    response_store.reset_for_tests()
+    yield
+    response_store.reset_for_tests()
+
+
+@pytest.fixture
+def answered() -> list[dict]:
+    """Params of every request the local backend's responder answered."""
+    return []
+
+
+@pytest.fixture
+def backend(tmp_path, answered) -> LocalBatchBackend:
+    async def responder(params: dict) -> str:
+        answered.append(params)
+        text = _user_text(params)
+        if params["system"][0]["text"] == llm_extractors.DATE_EXTRACTION_PROMPT:
+            return json.dumps(
+                [
+                    {
+                        "value": "2022-01-01",
+                        "field_type": "project_start_date",
+                        "confidence": 0.95,
+                        "source": "Project Plan",
+                        "reasoning": "Stated start date",
+                        "raw_text": "01/01/2022",
+                    }
+                ]
+            )
+        requirement = next(r for r in REQUIREMENTS if r["requirement_text"] in text)
+        return json.dumps([{"text": f"Evidence for {requirement['requirement_id']}", "page": 1, "confidence": 0.9}])
+
+    return LocalBatchBackend(tmp_path / "batches", responder)
+
+
+class TestRunBatchJob:
+    async def test_results_keyed_by_request(self, backend, tmp_path):
+        requests = [BatchRequest.from_params({"n": n}) for n in range(3)]
+        backend.responder = lambda params: _answer(f"answer {params['n']}")
+
+        results = await run_batch_job(requests + requests[:1], backend, tmp_path / "job.json", poll_interval=0)
+
+        assert {results[r.custom_id].text for r in requests} == {"answer 0", "answer 1", "answer 2"}
+        assert not (tmp_path / "job.json").exists()
+
+    async def test_interrupted_job_is_resumed_not_resubmitted(self, backend, tmp_path):
+        requests = [BatchRequest.from_params({"n": 1})]
+        backend.responder = lambda params: _answer("done")
+        original_status = backend.status
+
+        async def interrupted(job_id):
+            raise KeyboardInterrupt
+
+        backend.status = interrupted
+        with pytest.raises(KeyboardInterrupt):
+            await run_batch_job(requests, backend, tmp_path / "job.json", poll_interval=0)
+        backend.status = original_status
+
+        results = await run_batch_job(requests, backend, tmp_path / "job.json", poll_interval=0)
+
+        assert results[requests[0].custom_id].text == "done"
+        assert len(list((tmp_path / "batches").iterdir())) == 1
+
+    async def test_responder_error_is_a_failed_result(self, backend, tmp_path):
+        async def failing(params):
+            raise RuntimeError("boom")
+
+        backend.responder = failing
+        [request] = [BatchRequest.from_params({"n": 1})]
+
+        results = await run_batch_job([request], backend, tmp_path / "job.json", poll_interval=0)
+
+        assert results[request.custom_id].message is None
+        assert "boom" in results[request.custom_id].error
+
+
+async def _answer(text: str) -> str:
+    return text
+
+
+class TestEvidenceBatch:
+    @pytest.fixture
+    def session(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(
+            evidence_tools,
+            "settings",
+            settings.model_copy(update={"llm_cache_enabled": True, "llm_cache_dir": tmp_path / "llm"}),
+        )
+        monkeypatch.setattr(checklist, "load_checklist", lambda methodology, scope=None: {"requirements": REQUIREMENTS})
+
+        async def live_call(*args, **kwargs):
+            raise AssertionError("batch mode made a live LLM call")
+
+        monkeypatch.setattr(evidence_tools, "call_llm", live_call)
+
+        markdown = tmp_path / "DOC-1.md"
+        markdown.write_text("# Plan\n\nThe land is owned by Nicholas Denman.\n", encoding="utf-8")
+        manager = StateManager("session-ba0000000001")
+        manager.session_dir.mkdir(parents=True, exist_ok=True)
+        manager.write_json(
+            "session.json",
+            {"session_id": manager.session_id, "workflow_progress": {"requirement_mapping": "completed"}},
+        )
+        manager.write_json(
+            "documents.json",
+            {
+                "documents": [
+                    {
+                        "document_id": "DOC-1",
+                        "filename": "DOC-1.pdf",
+                        "filepath": str(tmp_path / "DOC-1.pdf"),
+                        "has_markdown": True,
+                        "markdown_path": str(markdown),
+                    }
+                ]
+            },
+        )
+        manager.write_json(
+            "mappings.json",
+            {
+                "mappings": [
+                    {"requirement_id": r["requirement_id"], "mapped_documents": ["DOC-1"]} for r in REQUIREMENTS
+                ]
+            },
+        )
+        return manager
+
+    async def test_batch_hydrates_cache_and_evidence(self, session, backend, answered):
+        result = await evidence_tools.extract_all_evidence_batch(session.session_id, backend=backend, poll_interval=0)
+
+        assert len(answered) == len(REQUIREMENTS)
+        assert result["batch"] == {
+            "backend": "local",
+            "submitted": 2,
+            "answered": 2,
+            "failed": 0,
+            "already_cached": 0,
+        }
+        evidence = session.read_json("evidence.json")["evidence"]
+        assert [e["evidence_snippets"][0]["text"] for e in evidence] == ["Evidence for REQ-001", "Evidence for REQ-002"]
+
+    async def test_second_run_submits_nothing(self, session, backend, answered):
+        await evidence_tools.extract_all_evidence_batch(session.session_id, backend=backend, poll_interval=0)
+
+        result = await evidence_tools.extract_all_evidence_batch(session.session_id, backend=backend, poll_interval=0)
+
+        assert result["batch"]["submitted"] == 0
+        assert result["batch"]["already_cached"] == len(REQUIREMENTS)
+        assert len(answered) == len(REQUIREMENTS)
+
+    async def test_requests_match_the_live_prompt(self, session, backend, answered):
+        await evidence_tools.extract_all_evidence_batch(session.session_id, backend=backend, poll_interval=0)
+
+        text = _user_text(answered[0])
+        assert text.index("Nicholas Denman") < text.index("Land tenure statement")
+        assert answered[0]["messages"][0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+
+    async def test_requires_the_llm_cache(self, session, backend, monkeypatch):
+        monkeypatch.setattr(
+            evidence_tools, "settings", evidence_tools.settings.model_copy(update={"llm_cache_enabled": False})
+        )
+
+        with pytest.raises(ValueError, match="llm_cache_enabled"):
+            await evidence_tools.extract_all_evidence_batch(session.session_id, backend=backend)
+
+
+class TestExtractorBatch:
+    @pytest.fixture
+    def extractor_settings(self, monkeypatch, tmp_path):
+        patched = settings.model_copy(
+            update={
+                "anthropic_api_key": "test-key",
+                "llm_model": "claude-haiku-4-5-20251001",
+                "llm_cache_dir": tmp_path,
+            }
+        )
+        for module in (llm_extractors, response_store, batch):
+            monkeypatch.setattr(module, "settings", patched)
+        StateManager("session-ba0000000002").session_dir.mkdir(parents=True, exist_ok=True)
+
+    async def test_dates_extracted_through_one_batch(self, extractor_settings, backend, answered):
+        evidence_data = {
+            "evidence": [
+                {
+                    "requirement_id": "REQ-007",
+                    "evidence_snippets": [{"document_name": "Project Plan", "text": "Project start date: 01/01/2022."}],
+                }
+            ]
+        }
+
+        fields = await llm_extractors.extract_fields_with_llm(
+            "session-ba0000000002", evidence_data, batch=True, backend=backend
+        )
+
+        assert [f.value for f in fields["dates"]] == ["2022-01-01"]
+        assert len(answered) == 1
+        assert "timeout" not in answered[0]
@@ -0,0 +1,124 @@
+"""Tests for the pluggable cache backends in ``utils.cache``."""
+
+import time
+
+import pytest
+
+from registry_review_mcp.utils.cache import Cache, JSONFileBackend, SQLiteBackend
+
+
+@pytest.fixture
+def backend(tmp_path):
+    backend = SQLiteBackend(tmp_path / "cache.sqlite3", max_bytes=10_000, max_entries=3)
+    yield backend
+    backend.close()
+
+
+def _value(backend, namespace, key):
+    from registry_review_mcp.utils.cache import _MISSING
+
+    value = backend.get(namespace, key)
+    return None if value is _MISSING else value
+
+
+class TestSQLiteBackend:
+    def test_round_trip_matches_json_semantics(self, backend):
+        backend.set("ns", "k", {"pages": [1, 2], "when": 1.5}, ttl=60)
+        assert _value(backend, "ns", "k") == {"pages": [1, 2], "when": 1.5}
+
+    def test_namespaces_are_isolated(self, backend):
+        backend.set("a", "k", "from a", ttl=60)
+        backend.set("b", "k", "from b", ttl=60)
+
+        assert backend.clear("a") == 1
+        assert _value(backend, "a", "k") is None
+        assert _value(backend, "b", "k") == "from b"
+
+    def test_entry_bound_evicts_least_recently_used(self, backend):
+        for key in ("old", "warm", "new"):
+            backend.set("ns", key, key, ttl=60)
+            time.sleep(0.01)
+        _value(backend, "ns", "old")  # touch: "warm" is now the LRU entry
+        time.sleep(0.01)
+
+        backend.set("ns", "newest", "newest", ttl=60)
+
+        assert _value(backend, "ns", "warm") is None
+        assert _value(backend, "ns", "old") == "old"
+        assert backend.stats()["entries"] == 3
+        assert backend.counters.evictions == 1
+
+    def test_hits_buffer_recency_instead_of_writing(self, backend):
+        backend.set("ns", "k", "v", ttl=60)
+        time.sleep(0.01)
+        conn = backend._connect()
+        writes = conn.total_changes
+
+        for _ in range(5):
+            _value(backend, "ns", "k")
+        backend.get_many("ns", ["k"])
+
+        assert conn.total_changes == writes
+        backend.sweep_expired()
+        last_access, cached_at = conn.execute("SELECT last_access, cached_at FROM entries WHERE key = 'k'").fetchone()
+        assert last_access > cached_at
+
+    def test_byte_bound_evicts(self, tmp_path):
+        backend = SQLiteBackend(tmp_path / "c.sqlite3", max_bytes=2_000, max_entries=1_000)
+        try:
+            for i in range(10):
+                backend.set("ns", f"k{i}", "x" * 500, ttl=60)
+            stats = backend.stats()
+            assert stats["bytes"] <= 2_000
+            assert _value(backend, "ns", "k9") is not None
+            assert stats["evictions"] > 0
+        finally:
+            backend.close()
+
+    def test_oversized_value_is_not_cached(self, backend):
+        backend.set("ns", "huge", "x" * 20_000, ttl=60)
+        assert _value(backend, "ns", "huge") is None
+        assert backend.stats()["entries"] == 0
+
+    def test_sweep_removes_expired_entries(self, backend):
+        backend.set("ns", "short", "v", ttl=1)
+        backend.set("ns", "long", "v", ttl=3600)
+        time.sleep(1.1)
+
+        assert backend.sweep_expired() == 1
+        assert backend.stats()["entries"] == 1
+
+    def test_counters(self, backend):
+        backend.set("ns", "k", "v", ttl=60)
+        _value(backend, "ns", "k")
+        _value(backend, "ns", "missing")
+
+        stats = backend.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+
+class TestCacheFacade:
+    @pytest.mark.parametrize("kind", ["sqlite", "json"])
+    def test_same_api_on_both_backends(self, tmp_path, kind):
+        cache = Cache("facade", cache_dir=tmp_path, backend=kind)
+        assert cache.backend == kind
+
+        cache.set("key", {"v": 1})
+        assert cache.get("key") == {"v": 1}
+        assert cache.exists("key")
+
+        cache.delete("key")
+        assert cache.get("key", "default") == "default"
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.clear() == 2
+        assert cache.stats()["entries"] == 0
+
+    def test_json_backend_keeps_one_file_per_key(self, tmp_path):
+        cache = Cache("legacy", cache_dir=tmp_path, backend="json")
+        cache.set("key", "value")
+
+        assert isinstance(cache._backend, JSONFileBackend)
+        assert len(list((tmp_path / "legacy").glob("*.json"))) == 1
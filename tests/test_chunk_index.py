@@ -0,0 +1,106 @@
+"""Tests for the BM25 chunk index behind retrieval-narrowed evidence prompts."""
+
+import json
+
+import pytest
+
+from registry_review_mcp.config.settings import settings
+from registry_review_mcp.llm import chunk_index
+from registry_review_mcp.llm.chunk_index import ChunkIndex, chunk_markdown, get_chunk_index
+from registry_review_mcp.tools import evidence_tools
+
+FILLER = "Soil samples were collected and analysed at the laboratory. " * 40
+
+
+def _large_plan() -> str:
+    pages = [f"--- Page {n} ---\n\n## {n}. Background\n\n{FILLER}" for n in range(1, 40)]
+    pages.append(
+        "--- Page 40 ---\n\n## 40. Land Tenure\n\n"
+        "The land is owned by Nicholas Denman, who holds freehold title to all 120 hectares."
+    )
+    return "\n\n".join(pages)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_indexes():
+    chunk_index.reset_for_tests()
+    yield
+    chunk_index.reset_for_tests()
+
+
+class TestChunking:
+    def test_chunks_carry_page_and_section(self):
+        chunks = chunk_markdown(
+            "--- Page 3 ---\n\n# Intro\n\nHello.\n\n--- Page 4 ---\n\nStill intro.\n\n## Methods\n\nX."
+        )
+
+        assert [(c.page, c.section) for c in chunks] == [(3, "Intro"), (4, "Intro"), (4, "Methods")]
+        assert chunks[0].text.startswith("# Intro")
+        assert not any("--- Page" in c.text for c in chunks)
+
+    def test_oversized_sections_are_split(self):
+        chunks = chunk_markdown("# Big\n\n" + "\n\n".join(["word " * 100] * 30), max_chunk_chars=1_000)
+
+        assert len(chunks) > 1
+        assert all(len(c.text) <= 1_000 for c in chunks)
+
+
+class TestRetrieval:
+    def test_ranks_relevant_chunk_first(self):
+        index = ChunkIndex.from_markdown(_large_plan())
+
+        best = index.search("land tenure ownership freehold title")[0][1]
+
+        assert index.chunks[best].page == 40
+
+    def test_render_restores_page_markers(self):
+        index = ChunkIndex.from_markdown(_large_plan())
+        ids = index.top_chunks("land tenure owner", max_chars=5_000, top_k=2)
+
+        rendered = index.render(ids, "plan.pdf")
+
+        assert "--- Page 40 ---" in rendered
+        assert "Nicholas Denman" in rendered
+        assert "plan.pdf" in rendered
+
+    def test_top_chunks_respects_budget(self):
+        index = ChunkIndex.from_markdown(_large_plan())
+
+        ids = index.top_chunks("soil samples laboratory", max_chars=5_000, top_k=50)
+
+        assert sum(len(index.chunks[i].text) for i in ids) <= 5_000
+
+    def test_index_is_reused_per_document_version(self):
+        markdown = _large_plan()
+        assert get_chunk_index(markdown) is get_chunk_index(markdown)
+        assert get_chunk_index(markdown + "\n\nmore") is not get_chunk_index(markdown)
+
+
+class TestNarrowedEvidencePrompt:
+    async def test_tail_evidence_reaches_the_prompt(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(
+            evidence_tools,
+            "settings",
+            settings.model_copy(
+                update={"llm_cache_dir": tmp_path, "evidence_retrieval_max_chars": 6_000, "evidence_retrieval_top_k": 3}
+            ),
+        )
+        prompts = []
+
+        async def call_llm(prompt, system=None, model=None, max_tokens=4000):
+            prompts.append(prompt)
+            return json.dumps([])
+
+        monkeypatch.setattr(evidence_tools, "call_llm", call_llm)
+        markdown = _large_plan()
+        requirement = {
+            "requirement_id": "REQ-002",
+            "requirement_text": "Provide evidence of land tenure and ownership",
+            "accepted_evidence": "Title deed or lease naming the landowner",
+            "category": "Land Tenure",
+        }
+
+        await evidence_tools.extract_evidence_with_llm(requirement, markdown, "DOC-1", "plan.pdf")
+
+        assert "Nicholas Denman" in prompts[0]
+        assert len(prompts[0]) < len(markdown) / 5
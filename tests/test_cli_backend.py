@@ -10,7 +10,7 @@ import registry_review_mcp.utils.llm_client as llm_client_module
 from registry_review_mcp.models.errors import ConfigurationError
 from registry_review_mcp.utils.llm_client import (
     LLMBackendError,
-    _call_via_cli,
+    _call_via_cli_once,
     _resolve_backend,
     call_llm,
     classify_cli_error,
@@ -106,7 +106,7 @@ class TestResolveBackend:
 
 
 class TestCliInvocation:
-    """Verify CLI subprocess flag construction and stdin handling."""
+    """Verify one-shot CLI subprocess flag construction and stdin handling."""
 
     async def test_cli_passes_model(self):
         response = {"result": "hello", "is_error": False}
@@ -118,7 +118,7 @@ class TestCliInvocation:
             proc.returncode = 0
             mock_exec.return_value = proc
 
-            await _call_via_cli("test prompt", None, "claude-haiku-4-5-20251001", 4000)
+            await _call_via_cli_once("test prompt", None, "claude-haiku-4-5-20251001", 4000)
 
             cmd_args = mock_exec.call_args[0]
             assert "--model" in cmd_args
@@ -135,7 +135,7 @@ class TestCliInvocation:
             proc.returncode = 0
             mock_exec.return_value = proc
 
-            await _call_via_cli("test prompt", "You are helpful", "claude-haiku-4-5-20251001", 4000)
+            await _call_via_cli_once("test prompt", "You are helpful", "claude-haiku-4-5-20251001", 4000)
 
             cmd_args = mock_exec.call_args[0]
             assert "--system-prompt" in cmd_args
@@ -152,7 +152,7 @@ class TestCliInvocation:
             proc.returncode = 0
             mock_exec.return_value = proc
 
-            await _call_via_cli("test prompt", None, "claude-haiku-4-5-20251001", 4000)
+            await _call_via_cli_once("test prompt", None, "claude-haiku-4-5-20251001", 4000)
 
             cmd_args = mock_exec.call_args[0]
             assert "--system-prompt" not in cmd_args
@@ -167,7 +167,7 @@ class TestCliInvocation:
             proc.returncode = 0
             mock_exec.return_value = proc
 
-            await _call_via_cli("my prompt text", None, "claude-haiku-4-5-20251001", 4000)
+            await _call_via_cli_once("my prompt text", None, "claude-haiku-4-5-20251001", 4000)
 
             proc.communicate.assert_called_once_with(input=b"my prompt text")
 
@@ -181,7 +181,7 @@ class TestCliInvocation:
             proc.returncode = 0
             mock_exec.return_value = proc
 
-            await _call_via_cli("test", None, "claude-haiku-4-5-20251001", 4000)
+            await _call_via_cli_once("test", None, "claude-haiku-4-5-20251001", 4000)
 
             cmd_args = mock_exec.call_args[0]
             assert "--output-format" in cmd_args
@@ -199,7 +199,7 @@ class TestCliInvocation:
             mock_exec.return_value = proc
 
             with pytest.raises(LLMBackendError):
-                await _call_via_cli("test", None, "claude-haiku-4-5-20251001", 4000)
+                await _call_via_cli_once("test", None, "claude-haiku-4-5-20251001", 4000)
 
     async def test_cli_raises_on_nonzero_exit(self):
         with patch("asyncio.create_subprocess_exec") as mock_exec:
@@ -209,7 +209,7 @@ class TestCliInvocation:
             mock_exec.return_value = proc
 
             with pytest.raises(LLMBackendError, match="CLI failed"):
-                await _call_via_cli("test", None, "claude-haiku-4-5-20251001", 4000)
+                await _call_via_cli_once("test", None, "claude-haiku-4-5-20251001", 4000)
 
 
 class TestClassifyCliError:
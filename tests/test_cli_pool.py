@@ -0,0 +1,162 @@
+"""Tests for the warm stream-json CLI worker pool."""
+
+import sys
+import textwrap
+from unittest.mock import patch
+
+import pytest
+
+import registry_review_mcp.utils.llm_client as llm_client_module
+from registry_review_mcp.config.settings import settings
+from registry_review_mcp.llm import cli_pool
+from registry_review_mcp.llm.cli_pool import CLIWorkerPool
+from registry_review_mcp.utils.llm_client import LLMBackendError
+
+# Stand-in for `claude -p --input-format stream-json --output-format stream-json`:
+# answers each user line with an assistant event and a result event.
+FAKE_CLI = textwrap.dedent(
+    """
+    import json, os, sys
+
+    for line in sys.stdin:
+        text = json.loads(line)["message"]["content"][0]["text"]
+        if text == "CRASH":
+            sys.stderr.write("Error: something broke\\n")
+            sys.exit(1)
+        print(json.dumps({"type": "assistant", "message": {"content": [{"type": "text", "text": text}]}}))
+        print(json.dumps({
+            "type": "result",
+            "is_error": text == "FAIL",
+            "result": f"{text}|{os.getpid()}|{sys.argv[sys.argv.index('--model') + 1]}",
+            "usage": {"input_tokens": 3, "output_tokens": 2},
+        }), flush=True)
+    """
+)
+
+
+@pytest.fixture
+def command(tmp_path):
+    script = tmp_path / "fake_claude.py"
+    script.write_text(FAKE_CLI)
+    return (sys.executable, str(script))
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    cli_pool.reset_for_tests()
+    yield
+    cli_pool.reset_for_tests()
+
+
+def _pid(event):
+    return event["result"].split("|")[1]
+
+
+class TestCLIWorkerPool:
+    async def test_warm_worker_is_reused(self, command):
+        pool = CLIWorkerPool(command, size=2, max_requests=5)
+
+        first = await pool.run("one", None, "model-a")
+        second = await pool.run("two", None, "model-a")
+
+        assert first["result"].startswith("one|")
+        assert _pid(first) == _pid(second)
+        assert pool.stats()["warm_hits"] == 1
+        await pool.close()
+
+    async def test_workers_are_keyed_by_model(self, command):
+        pool = CLIWorkerPool(command, size=2, max_requests=5)
+
+        first = await pool.run("one", None, "model-a")
+        second = await pool.run("two", None, "model-b")
+
+        assert first["result"].endswith("|model-a")
+        assert second["result"].endswith("|model-b")
+        assert _pid(first) != _pid(second)
+        await pool.close()
+
+    async def test_recycled_after_max_requests_with_warm_replacement(self, command):
+        pool = CLIWorkerPool(command, size=1, max_requests=1)
+
+        first = await pool.run("one", None, "model-a")
+        second = await pool.run("two", None, "model-a")
+
+        assert _pid(first) != _pid(second)
+        stats = pool.stats()
+        assert (stats["recycled"], stats["warm_hits"], stats["cold_starts"]) == (2, 1, 1)
+        assert stats["idle"] == 1
+        await pool.close()
+
+    async def test_error_result_recycles_the_worker(self, command):
+        pool = CLIWorkerPool(command, size=1, max_requests=5)
+        first = await pool.run("one", None, "model-a")
+
+        with pytest.raises(LLMBackendError):
+            await pool.run("FAIL", None, "model-a")
+        second = await pool.run("two", None, "model-a")
+
+        assert _pid(first) != _pid(second)
+        assert pool.stats()["recycled_on_error"] == 1
+        await pool.close()
+
+    async def test_crash_is_classified_from_stderr(self, command):
+        pool = CLIWorkerPool(command, size=1)
+
+        with pytest.raises(LLMBackendError) as exc_info:
+            await pool.run("CRASH", None, "model-a")
+
+        assert "something broke" in str(exc_info.value)
+        assert pool.stats()["busy"] == 0
+        await pool.close()
+
+    async def test_dead_idle_worker_fails_health_check(self, command):
+        pool = CLIWorkerPool(command, size=1, max_requests=5)
+        first = await pool.run("one", None, "model-a")
+        [worker] = pool._idle[("model-a", None)]
+        worker.kill()
+        await worker.proc.wait()
+
+        second = await pool.run("two", None, "model-a")
+
+        assert _pid(first) != _pid(second)
+        assert pool.stats()["unhealthy_discarded"] == 1
+        await pool.close()
+
+    async def test_prewarm_starts_idle_workers(self, command):
+        pool = CLIWorkerPool(command, size=2)
+
+        await pool.prewarm("model-a")
+
+        assert pool.stats()["idle"] == 2
+        await pool.run("one", None, "model-a")
+        assert pool.stats()["cold_starts"] == 0
+        await pool.close()
+
+    def test_size_defaults_to_throttle_concurrency(self, command):
+        class Throttle:
+            max_concurrent = 3
+
+        with patch("registry_review_mcp.llm.throttle.get_throttle", return_value=Throttle()):
+            assert CLIWorkerPool(command).size == 3
+        assert CLIWorkerPool(command, size=5).size == 5
+
+
+class TestCallViaCli:
+    async def test_routes_through_pool(self, command, monkeypatch):
+        cli_pool._pool = CLIWorkerPool(command, size=1)
+
+        result = await llm_client_module._call_via_cli("hello", None, "model-a", 100)
+
+        assert result.startswith("hello|")
+        assert cli_pool.get_cli_pool().stats()["requests"] == 1
+        await cli_pool.get_cli_pool().close()
+
+    async def test_pool_disabled_uses_one_shot(self, monkeypatch):
+        monkeypatch.setattr(llm_client_module, "settings", settings.model_copy(update={"llm_cli_pool_enabled": False}))
+
+        async def once(prompt, system, model, max_tokens):
+            return "once"
+
+        monkeypatch.setattr(llm_client_module, "_call_via_cli_once", once)
+
+        assert await llm_client_module._call_via_cli("hello", None, "model-a", 100) == "once"
@@ -0,0 +1,105 @@
+"""Tests for the pooled, long-lived LLM SDK clients."""
+
+import asyncio
+
+import anthropic
+import pytest
+
+from registry_review_mcp.config.settings import settings
+from registry_review_mcp.extractors.llm_extractors import DateExtractor
+from registry_review_mcp.llm import client_pool
+from registry_review_mcp.llm.client_pool import PoolMeter, _http_library, _metered_http_client_class, get_client_pool
+
+# The Anthropic SDK's HTTP library (httpx or httpx2, depending on the release)
+http = _http_library(anthropic)
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    client_pool.reset_for_tests()
+    yield
+    client_pool.reset_for_tests()
+
+
+class TestClientPool:
+    async def test_one_client_per_backend_and_key(self):
+        pool = get_client_pool()
+
+        assert pool.anthropic("key-a") is pool.anthropic("key-a")
+        assert pool.anthropic("key-a") is not pool.anthropic("key-b")
+        assert pool.openai("key-a") is pool.openai("key-a")
+
+    async def test_backend_options_applied(self):
+        client = get_client_pool().anthropic("key-a")
+
+        assert client.max_retries == settings.llm_anthropic_max_retries
+        assert client.timeout == settings.llm_anthropic_timeout_seconds
+        assert client._client.meter.pool is not None
+
+    async def test_retry_override_shares_the_connection_pool(self):
+        pool = get_client_pool()
+        shared = pool.anthropic("key-a")
+
+        no_retries = pool.anthropic("key-a", max_retries=0)
+
+        assert no_retries.max_retries == 0
+        assert no_retries._client is shared._client
+        assert pool.anthropic("key-a", max_retries=0) is no_retries
+
+    def test_clients_are_not_shared_across_event_loops(self):
+        async def client():
+            return get_client_pool().anthropic("key-a")
+
+        first, second = asyncio.run(client()), asyncio.run(client())
+
+        assert first is not second
+        assert get_client_pool().stats()["anthropic"]["clients"] == 0
+
+    async def test_extractors_use_the_pool_without_sdk_retries(self, monkeypatch):
+        monkeypatch.setattr(
+            "registry_review_mcp.extractors.llm_extractors.settings",
+            settings.model_copy(update={"anthropic_api_key": "key-a"}),
+        )
+
+        first, second = DateExtractor().client, DateExtractor().client
+
+        assert first is second
+        assert first.max_retries == 0
+        assert first._client is get_client_pool().anthropic("key-a")._client
+
+
+class TestPoolMeter:
+    async def test_counts_requests(self):
+        async def handler(request):
+            return http.Response(200, json={"ok": True})
+
+        meter = PoolMeter()
+        client = _metered_http_client_class(http.AsyncClient)(meter, transport=http.MockTransport(handler))
+
+        await asyncio.gather(*(client.get("https://example.test/") for _ in range(3)))
+
+        assert meter.stats()["requests"] == 3
+        assert meter.stats()["in_flight"] == 0
+        assert meter.peak_in_flight >= 1
+
+    async def test_counts_errors(self):
+        async def handler(request):
+            raise http.ConnectError("refused")
+
+        meter = PoolMeter()
+        client = _metered_http_client_class(http.AsyncClient)(meter, transport=http.MockTransport(handler))
+
+        with pytest.raises(http.ConnectError):
+            await client.get("https://example.test/")
+
+        assert (meter.errors, meter.in_flight) == (1, 0)
+
+    async def test_stats_by_backend(self):
+        pool = get_client_pool()
+        pool.anthropic("key-a")
+        pool.openai("key-a")
+
+        stats = pool.stats()
+
+        assert stats["anthropic"]["clients"] == stats["openai"]["clients"] == 1
+        assert stats["anthropic"]["requests"] == 0
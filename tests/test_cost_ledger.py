@@ -0,0 +1,99 @@
+"""Tests for the CostTracker ledger and running aggregates (no API calls)."""
+
+import json
+
+import pytest
+
+from registry_review_mcp.config.settings import settings
+from registry_review_mcp.utils import cost_tracker as cost_tracker_module
+from registry_review_mcp.utils.cost_tracker import CostTracker
+
+SONNET = "claude-sonnet-4-5-20250929"
+HAIKU = "claude-haiku-4-5-20251015"
+
+
+def _track(tracker: CostTracker, extractor: str, model: str = SONNET, cached: bool = False) -> float:
+    return tracker.track_api_call(
+        model=model,
+        extractor=extractor,
+        document_name="doc.pdf",
+        input_tokens=0 if cached else 1000,
+        output_tokens=0 if cached else 100,
+        duration_seconds=0.5,
+        cached=cached,
+    )
+
+
+@pytest.fixture
+def snapshot_every(monkeypatch):
+    def configure(n: int) -> None:
+        monkeypatch.setattr(cost_tracker_module, "settings", settings.model_copy(update={"cost_snapshot_interval": n}))
+
+    return configure
+
+
+class TestCostLedger:
+    def test_each_call_appends_one_ledger_line(self, tmp_path, snapshot_every):
+        snapshot_every(100)
+        tracker = CostTracker("ledger", tmp_path / "cost_tracking.json")
+
+        for _ in range(3):
+            _track(tracker, "date")
+
+        assert len(tracker.ledger_path.read_text().splitlines()) == 3
+        assert not tracker.storage_path.exists()  # no snapshot until the interval
+
+    def test_summary_and_breakdowns(self, tmp_path):
+        tracker = CostTracker("breakdown", tmp_path / "cost_tracking.json")
+        cost = _track(tracker, "date")
+        _track(tracker, "date", cached=True)
+        _track(tracker, "tenure", model=HAIKU)
+
+        summary = tracker.get_summary()
+
+        assert summary.total_api_calls == 3
+        assert summary.cache_hit_rate == pytest.approx(1 / 3)
+        assert summary.by_extractor["date"].api_calls == 2
+        assert summary.by_extractor["date"].cost_usd == pytest.approx(cost)
+        assert summary.by_model[HAIKU].input_tokens == 1000
+        assert summary.api_calls == []
+        assert len(tracker.get_summary(include_calls=True).api_calls) == 3
+
+    def test_reload_uses_snapshot_plus_ledger_tail(self, tmp_path, snapshot_every):
+        snapshot_every(2)
+        path = tmp_path / "cost_tracking.json"
+        tracker = CostTracker("reload", path)
+        for extractor in ("date", "tenure", "project_id"):
+            _track(tracker, extractor)
+
+        snapshot = json.loads(path.read_text())
+        assert snapshot["total_api_calls"] == 2  # third call is only in the ledger
+
+        reloaded = CostTracker("reload", path).get_summary()
+        assert reloaded.total_api_calls == 3
+        assert reloaded.total_cost_usd == pytest.approx(tracker.get_summary().total_cost_usd)
+        assert set(reloaded.by_extractor) == {"date", "tenure", "project_id"}
+
+    def test_second_writer_is_caught_up(self, tmp_path):
+        path = tmp_path / "cost_tracking.json"
+        first = CostTracker("shared", path)
+        second = CostTracker("shared", path)
+
+        _track(first, "date")
+        _track(second, "tenure")
+
+        assert second.get_summary().total_api_calls == 2
+        assert [c.extractor for c in CostTracker("shared", path).api_calls] == ["date", "tenure"]
+
+    def test_legacy_snapshot_is_migrated(self, tmp_path):
+        path = tmp_path / "cost_tracking.json"
+        legacy = CostTracker("legacy", tmp_path / "scratch.json")
+        _track(legacy, "date")
+        _track(legacy, "tenure")
+        summary = legacy.get_summary(include_calls=True)
+        path.write_text(json.dumps(summary.model_dump(mode="json", exclude={"by_extractor", "by_model"})))
+
+        migrated = CostTracker("legacy", path)
+
+        assert migrated.get_summary().total_api_calls == 2
+        assert len(migrated.ledger_path.read_text().splitlines()) == 2
@@ -94,16 +94,11 @@ class TestCostTracking:
             summary = tracker.get_summary()
 
             print(f"\n=== Breakdown by Extractor ===")
-            extractors = {}
-            for call in summary.api_calls:
-                if call.extractor not in extractors:
-                    extractors[call.extractor] = []
-                extractors[call.extractor].append(call)
+            extractors = summary.by_extractor
 
-            for extractor_name, calls in extractors.items():
-                total_cost = sum(c.cost_usd for c in calls)
-                total_tokens = sum(c.input_tokens + c.output_tokens for c in calls)
-                print(f"  {extractor_name}: {len(calls)} calls, ${total_cost:.4f}, {total_tokens:,} tokens")
+            for extractor_name, stats in extractors.items():
+                total_tokens = stats.input_tokens + stats.output_tokens
+                print(f"  {extractor_name}: {stats.api_calls} calls, ${stats.cost_usd:.4f}, {total_tokens:,} tokens")
 
             # Should have tracked 3 different extractors
             assert len(extractors) == 3, f"Expected 3 extractors, got {len(extractors)}"
@@ -156,7 +151,7 @@ class TestCostTracking:
 
             # First call - should make API call
             extractor = DateExtractor()
-            extractor.cache.delete(f"{doc_name}_dates")  # Ensure clean slate
+            extractor.cache.delete(extractor.cache_key(markdown, []))  # Ensure clean slate
             results1 = await extractor.extract(markdown, [], doc_name)
 
             # Second call - should use cache
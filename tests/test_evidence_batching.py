@@ -0,0 +1,121 @@
+"""Tests for batched (one prompt per document) evidence extraction."""
+
+import json
+
+import pytest
+
+from registry_review_mcp.config.settings import settings
+from registry_review_mcp.llm.prompt_budget import PromptBudget
+from registry_review_mcp.tools import evidence_tools
+
+DOCUMENT = "# Project Plan\n\nThe land is owned by Nicholas Denman.\n\nMonitoring occurs annually.\n"
+
+
+def _requirement(n: int) -> dict:
+    return {
+        "requirement_id": f"REQ-{n:03d}",
+        "requirement_text": f"Requirement number {n}",
+        "accepted_evidence": "Any statement",
+        "category": "General",
+        "validation_type": "document_presence",
+    }
+
+
+def _snippet(text: str) -> dict:
+    return {"text": text, "page": 1, "section": "1", "confidence": 0.9, "schema_match": True, "reasoning": "r"}
+
+
+@pytest.fixture
+def fake_llm(monkeypatch, tmp_path):
+    """Record prompts and answer batched prompts with one snippet per requirement."""
+    monkeypatch.setattr(
+        evidence_tools, "settings", settings.model_copy(update={"llm_cache_dir": tmp_path, "llm_cache_enabled": True})
+    )
+    prompts: list[str] = []
+
+    async def call_llm(prompt, system=None, model=None, max_tokens=4000):
+        prompts.append(prompt)
+        if "**Requirements:**" not in prompt:
+            return json.dumps([_snippet("per-pair answer")])
+        ids = [line[4:].strip() for line in prompt.splitlines() if line.startswith("### REQ-")]
+        return "```json\n" + json.dumps({rid: [_snippet(f"evidence for {rid}")] for rid in ids}) + "\n```"
+
+    monkeypatch.setattr(evidence_tools, "call_llm", call_llm)
+    return prompts
+
+
+class TestBatchedEvidenceExtraction:
+    async def test_one_prompt_per_document(self, fake_llm):
+        reqs = [_requirement(n) for n in range(1, 4)]
+
+        results = await evidence_tools.extract_evidence_batch_with_llm(reqs, DOCUMENT, "DOC-1", "plan.pdf")
+
+        assert len(fake_llm) == 1
+        assert fake_llm[0].count("Nicholas Denman") == 1
+        assert results["REQ-002"][0].text == "evidence for REQ-002"
+        assert results["REQ-002"][0].document_id == "DOC-1"
+
+    async def test_budget_splits_batches(self, fake_llm):
+        reqs = [_requirement(n) for n in range(1, 5)]
+        fixed = len(evidence_tools.build_batched_evidence_prompt([], DOCUMENT, "plan.pdf"))
+        block = len(evidence_tools._batched_requirement_block(reqs[0]))
+        budget = PromptBudget(max_total_chars=fixed + 2 * block + 10)
+
+        results = await evidence_tools.extract_evidence_batch_with_llm(reqs, DOCUMENT, "DOC-1", "plan.pdf", budget)
+
+        assert len(fake_llm) == 2
+        assert set(results) == {"REQ-001", "REQ-002", "REQ-003", "REQ-004"}
+
+    async def test_per_pair_cache_keys_are_shared(self, fake_llm):
+        reqs = [_requirement(n) for n in range(1, 3)]
+        await evidence_tools.extract_evidence_batch_with_llm(reqs, DOCUMENT, "DOC-1", "plan.pdf")
+        fake_llm.clear()
+
+        # The per-pair path hits what the batch cached...
+        snippets = await evidence_tools.extract_evidence_with_llm(reqs[0], DOCUMENT, "DOC-1", "plan.pdf")
+        assert snippets[0].text == "evidence for REQ-001"
+        assert fake_llm == []
+
+        # ...and a partially cached batch only asks about the rest.
+        await evidence_tools.extract_evidence_batch_with_llm(reqs + [_requirement(3)], DOCUMENT, "DOC-1", "plan.pdf")
+        assert len(fake_llm) == 1
+        assert "### REQ-003" in fake_llm[0]
+        assert "### REQ-001" not in fake_llm[0]
+
+    async def test_requirement_missing_from_response_falls_back_to_per_pair(self, fake_llm, monkeypatch):
+        async def call_llm(prompt, system=None, model=None, max_tokens=4000):
+            fake_llm.append(prompt)
+            if "**Requirements:**" in prompt:
+                return json.dumps({"REQ-001": []})
+            return json.dumps([_snippet("per-pair answer")])
+
+        monkeypatch.setattr(evidence_tools, "call_llm", call_llm)
+
+        results = await evidence_tools.extract_evidence_batch_with_llm(
+            [_requirement(1), _requirement(2)], DOCUMENT, "DOC-1", "plan.pdf"
+        )
+
+        assert results["REQ-001"] == []
+        assert results["REQ-002"][0].text == "per-pair answer"
+        assert len(fake_llm) == 2
+
+    async def test_narrowed_batch_shares_per_pair_keys(self, fake_llm, monkeypatch):
+        monkeypatch.setattr(
+            evidence_tools,
+            "settings",
+            evidence_tools.settings.model_copy(update={"evidence_retrieval_max_chars": 4_000}),
+        )
+        filler = "\n\n".join(f"## Section {n}\n\n" + "Unrelated background prose. " * 60 for n in range(20))
+        document = filler + "\n\n## Tenure\n\nThe land is owned by Nicholas Denman.\n"
+        tenure = {**_requirement(1), "requirement_text": "Land tenure ownership of the project area"}
+        background = {**_requirement(2), "requirement_text": "Project background"}
+
+        await evidence_tools.extract_evidence_batch_with_llm([tenure, background], document, "DOC-9", "big.pdf")
+        assert len(fake_llm) == 1
+        assert "Nicholas Denman" in fake_llm[0]
+        assert len(fake_llm[0]) < len(document)
+        fake_llm.clear()
+
+        snippets = await evidence_tools.extract_evidence_with_llm(tenure, document, "DOC-9", "big.pdf")
+        assert snippets[0].text == "evidence for REQ-001"
+        assert fake_llm == []
@@ -0,0 +1,287 @@
+"""Tests for checkpointed, resumable evidence extraction."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from anthropic import AuthenticationError
+
+from registry_review_mcp.config.settings import settings
+from registry_review_mcp.tools import evidence_tools
+from registry_review_mcp.utils import checklist
+from registry_review_mcp.utils.evidence_checkpoint import EvidenceCheckpoints
+from registry_review_mcp.utils.state import StateManager
+
+REQUIREMENTS = [
+    {
+        "requirement_id": f"REQ-{n:03d}",
+        "requirement_text": f"Land tenure statement {n}",
+        "accepted_evidence": "Deed",
+        "category": "Land Tenure",
+        "validation_type": "document_presence",
+    }
+    for n in range(1, 4)
+]
+
+
+def _manager(session_id: str) -> StateManager:
+    manager = StateManager(session_id)
+    manager.session_dir.mkdir(parents=True, exist_ok=True)
+    return manager
+
+
+def _auth_error() -> AuthenticationError:
+    return AuthenticationError(
+        message="Invalid API key",
+        response=httpx.Response(status_code=401, request=httpx.Request("POST", "https://api.anthropic.com")),
+        body=None,
+    )
+
+
+@pytest.fixture
+def session(monkeypatch, tmp_path):
+    """A mapped session with one document and three requirements."""
+    monkeypatch.setattr(
+        evidence_tools,
+        "settings",
+        settings.model_copy(update={"llm_cache_enabled": False, "evidence_batch_extraction": False}),
+    )
+    monkeypatch.setattr(checklist, "load_checklist", lambda methodology, scope=None: {"requirements": REQUIREMENTS})
+
+    markdown = tmp_path / "plan.md"
+    markdown.write_text("# Plan\n\nThe land is owned by Nicholas Denman.\n", encoding="utf-8")
+    manager = _manager("session-ee0000000001")
+    manager.write_json(
+        "session.json",
+        {"session_id": manager.session_id, "workflow_progress": {"requirement_mapping": "completed"}},
+    )
+    manager.write_json(
+        "documents.json",
+        {
+            "documents": [
+                {
+                    "document_id": "DOC-1",
+                    "filename": "plan.pdf",
+                    "filepath": str(tmp_path / "plan.pdf"),
+                    "has_markdown": True,
+                    "markdown_path": str(markdown),
+                }
+            ]
+        },
+    )
+    manager.write_json(
+        "mappings.json",
+        {"mappings": [{"requirement_id": r["requirement_id"], "mapped_documents": ["DOC-1"]} for r in REQUIREMENTS]},
+    )
+    return manager
+
+
+def _fake_llm(monkeypatch, fail_on: str | None = None) -> list[str]:
+    """Answer every prompt with one snippet; raise a fatal error for ``fail_on``."""
+    asked: list[str] = []
+
+    async def call_llm(prompt, system=None, model=None, max_tokens=4000):
+        requirement_id = next(r["requirement_id"] for r in REQUIREMENTS if r["requirement_text"] in prompt)
+        asked.append(requirement_id)
+        if requirement_id == fail_on:
+            raise _auth_error()
+        return json.dumps([{"text": "Owned by Nicholas Denman", "page": 1, "confidence": 0.9}])
+
+    monkeypatch.setattr(evidence_tools, "call_llm", call_llm)
+    return asked
+
+
+class TestEvidenceCheckpoints:
+    def test_progress_counts_current_run(self, test_settings):
+        checkpoints = EvidenceCheckpoints(_manager("session-ee0000000002"))
+        checkpoints.start_run(total=3, resumed={})
+        checkpoints.record("REQ-001", "key-1", {"status": "covered"})
+
+        progress = checkpoints.progress()
+
+        assert progress["status"] == "in_progress"
+        assert (progress["completed"], progress["remaining"], progress["covered"]) == (1, 2, 1)
+
+        checkpoints.record("REQ-002", "key-2", {"status": "missing"})
+        checkpoints.record("REQ-003", "key-3", {"status": "partial"})
+        checkpoints.finish_run()
+
+        progress = checkpoints.progress()
+        assert progress["status"] == "completed"
+        assert progress["progress"] == 1.0
+
+    def test_new_run_keeps_only_resumed_checkpoints(self, test_settings):
+        checkpoints = EvidenceCheckpoints(_manager("session-ee0000000003"))
+        checkpoints.start_run(total=2, resumed={})
+        checkpoints.record("REQ-001", "key-1", {"status": "covered"})
+        checkpoints.record("REQ-002", "key-2", {"status": "covered"})
+
+        checkpoints.start_run(total=2, resumed={"REQ-001": checkpoints.load()["REQ-001"]})
+
+        assert list(checkpoints.load()) == ["REQ-001"]
+        assert checkpoints.progress()["resumed"] == 1
+
+    def test_torn_line_is_skipped(self, test_settings):
+        checkpoints = EvidenceCheckpoints(_manager("session-ee0000000004"))
+        checkpoints.start_run(total=2, resumed={})
+        checkpoints.record("REQ-001", "key-1", {"status": "covered"})
+        with open(checkpoints.path, "a", encoding="utf-8") as f:
+            f.write('{"type": "requirement", "requirement_id": "REQ-0')
+
+        assert list(checkpoints.load()) == ["REQ-001"]
+
+    async def test_contended_writes_do_not_stall_the_loop(self, test_settings):
+        manager = _manager("session-ee0000000005")
+        manager.write_json("session.json", {"workflow_progress": {}, "statistics": {}})
+        checkpoints = EvidenceCheckpoints(manager)
+        await checkpoints.async_start_run(total=1, resumed={})
+        result = evidence_tools._evidence_result(manager.session_id, [])
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        holder = StateManager(manager.session_id)
+        try:
+            with holder.lock(filename="evidence.json"), holder.lock(filename=checkpoints.path.name):
+                writes = asyncio.gather(
+                    evidence_tools._save_evidence_result(manager, result),
+                    checkpoints.async_record("REQ-001", "key-1", {"status": "covered"}),
+                )
+                await asyncio.sleep(0.3)
+                assert not writes.done()
+            await writes
+        finally:
+            task.cancel()
+
+        assert ticks >= 10, "event loop was blocked while the writes waited for their locks"
+        assert list(checkpoints.load()) == ["REQ-001"]
+        assert manager.read_json("session.json")["workflow_progress"]["evidence_extraction"] == "completed"
+
+
+class TestResumableExtraction:
+    async def test_fatal_error_keeps_finished_requirements(self, session, monkeypatch):
+        asked = _fake_llm(monkeypatch, fail_on="REQ-003")
+        with pytest.raises(AuthenticationError):
+            await evidence_tools.extract_all_evidence(session.session_id)
+        assert not (session.session_dir / "evidence.json").exists()
+        assert set(EvidenceCheckpoints(session).load()) == {"REQ-001", "REQ-002"}
+
+        asked = _fake_llm(monkeypatch)
+        result = await evidence_tools.extract_all_evidence(session.session_id)
+
+        assert asked == ["REQ-003"]
+        assert result["requirements_covered"] == 3
+        progress = evidence_tools.get_evidence_progress(session.session_id)
+        assert (progress["status"], progress["resumed"], progress["completed"]) == ("completed", 2, 3)
+
+    async def test_changed_document_invalidates_checkpoints(self, session, monkeypatch, tmp_path):
+        _fake_llm(monkeypatch)
+        await evidence_tools.extract_all_evidence(session.session_id)
+
+        (tmp_path / "plan.md").write_text("# Plan\n\nRevised: the land is leased.\n", encoding="utf-8")
+        asked = _fake_llm(monkeypatch)
+        await evidence_tools.extract_all_evidence(session.session_id)
+
+        assert sorted(asked) == ["REQ-001", "REQ-002", "REQ-003"]
+
+    async def test_resume_disabled_reextracts(self, session, monkeypatch):
+        _fake_llm(monkeypatch)
+        await evidence_tools.extract_all_evidence(session.session_id)
+
+        asked = _fake_llm(monkeypatch)
+        await evidence_tools.extract_all_evidence(session.session_id, resume=False)
+
+        assert len(asked) == 3
+
+
+@pytest.fixture
+def batched_session(monkeypatch, tmp_path):
+    """Batched extraction over two documents: REQ-001/002 map to DOC-1, REQ-003 to DOC-2."""
+    monkeypatch.setattr(
+        evidence_tools,
+        "settings",
+        settings.model_copy(update={"llm_cache_enabled": False, "evidence_batch_extraction": True}),
+    )
+    monkeypatch.setattr(checklist, "load_checklist", lambda methodology, scope=None: {"requirements": REQUIREMENTS})
+
+    documents = []
+    for doc_id, name, text in (("DOC-1", "plan", "The land is owned by Nicholas Denman."), ("DOC-2", "deed", "Deed.")):
+        markdown = tmp_path / f"{name}.md"
+        markdown.write_text(f"# {name}\n\n{text}\n", encoding="utf-8")
+        documents.append(
+            {
+                "document_id": doc_id,
+                "filename": f"{name}.pdf",
+                "filepath": str(tmp_path / f"{name}.pdf"),
+                "has_markdown": True,
+                "markdown_path": str(markdown),
+            }
+        )
+    manager = _manager("session-ee0000000005")
+    manager.write_json(
+        "session.json",
+        {"session_id": manager.session_id, "workflow_progress": {"requirement_mapping": "completed"}},
+    )
+    manager.write_json("documents.json", {"documents": documents})
+    manager.write_json(
+        "mappings.json",
+        {
+            "mappings": [
+                {"requirement_id": "REQ-001", "mapped_documents": ["DOC-1"]},
+                {"requirement_id": "REQ-002", "mapped_documents": ["DOC-1"]},
+                {"requirement_id": "REQ-003", "mapped_documents": ["DOC-2"]},
+            ]
+        },
+    )
+    return manager
+
+
+def _fake_batched_llm(
+    monkeypatch, session_id: str, fail_on: str | None = None, progress_seen: list[dict] | None = None
+) -> list[list[str]]:
+    """Answer each batched prompt per requirement; raise a fatal error for ``fail_on``'s batch.
+
+    The failing batch first waits for the other batches to land and appends
+    the progress reported at that point to ``progress_seen``.
+    """
+    asked: list[list[str]] = []
+
+    async def call_llm(prompt, system=None, model=None, max_tokens=4000):
+        ids = [line[4:].strip() for line in prompt.splitlines() if line.startswith("### REQ-")]
+        asked.append(ids)
+        if fail_on in ids:
+            await asyncio.sleep(0.05)
+            progress_seen.append(evidence_tools.get_evidence_progress(session_id))
+            raise _auth_error()
+        return json.dumps({rid: [{"text": "Owned by Nicholas Denman", "page": 1, "confidence": 0.9}] for rid in ids})
+
+    monkeypatch.setattr(evidence_tools, "call_llm", call_llm)
+    return asked
+
+
+class TestResumableBatchedExtraction:
+    async def test_interrupted_batch_phase_keeps_finished_requirements(self, batched_session, monkeypatch):
+        session_id = batched_session.session_id
+        progress_seen: list[dict] = []
+        _fake_batched_llm(monkeypatch, session_id, fail_on="REQ-003", progress_seen=progress_seen)
+        with pytest.raises(AuthenticationError):
+            await evidence_tools.extract_all_evidence(session_id)
+
+        # DOC-1's batch answered before DOC-2's failed: its requirements were
+        # checkpointed, and reported, while the batch phase was still running.
+        assert [progress["completed"] for progress in progress_seen] == [2]
+        assert set(EvidenceCheckpoints(batched_session).load()) == {"REQ-001", "REQ-002"}
+
+        asked = _fake_batched_llm(monkeypatch, session_id)
+        result = await evidence_tools.extract_all_evidence(session_id)
+
+        assert asked == [["REQ-003"]]
+        assert result["requirements_covered"] == 3
+        progress = evidence_tools.get_evidence_progress(session_id)
+        assert (progress["status"], progress["resumed"], progress["completed"]) == ("completed", 2, 3)
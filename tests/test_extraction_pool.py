@@ -0,0 +1,209 @@
+"""Tests for the process-pool fast-extraction engine.
+
+``DocumentProcessor.run_fast_extraction`` and ``batch_fast_extract_pdfs``
+used to walk a batch one document at a time on the event loop. They now
+fan out through ``extractors.extraction_pool``. These tests pin the
+contract callers rely on:
+
+- one outcome per input path, delivered in completion order;
+- a failing document never takes the rest of the batch down;
+- ``documents.json`` is written once per batch, merged into a fresh read.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from registry_review_mcp.extractors import extraction_pool
+from registry_review_mcp.tools import document_tools, session_tools
+from registry_review_mcp.utils.state import StateManager
+
+
+def _write_pdf(path, text: str) -> None:
+    import pymupdf
+
+    doc = pymupdf.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), text)
+    doc.save(str(path))
+    doc.close()
+
+
+@pytest.fixture(autouse=True)
+def _shutdown_pool():
+    yield
+    extraction_pool.shutdown_extraction_pool()
+
+
+class TestWorkerSizing:
+    def test_never_more_workers_than_documents(self):
+        assert extraction_pool.calculate_extraction_workers(1) == 1
+
+    def test_at_least_one_worker(self):
+        assert extraction_pool.calculate_extraction_workers(0) == 1
+
+    def test_auto_width_capped(self):
+        assert extraction_pool.calculate_extraction_workers(500) <= extraction_pool.MAX_AUTO_WORKERS
+
+
+class TestIterExtractions:
+    async def test_failure_is_isolated_per_document(self, tmp_path):
+        good = tmp_path / "good.pdf"
+        _write_pdf(good, "Registry evidence lives here.")
+        missing = tmp_path / "missing.pdf"
+
+        outcomes = [o async for o in extraction_pool.iter_extractions([str(good), str(missing)], max_workers=1)]
+
+        by_path = {o.filepath: o for o in outcomes}
+        assert len(outcomes) == 2
+        assert by_path[str(good)].ok
+        assert "Registry evidence" in by_path[str(good)].result["markdown"]
+        assert not by_path[str(missing)].ok
+        assert "not found" in str(by_path[str(missing)].error)
+
+    async def test_process_pool_results_are_plain_data(self, tmp_path):
+        """Results must survive pickling back from worker processes."""
+        paths = []
+        for i in range(2):
+            p = tmp_path / f"doc{i}.pdf"
+            _write_pdf(p, f"Document number {i}")
+            paths.append(str(p))
+
+        outcomes = [o async for o in extraction_pool.iter_extractions(paths, max_workers=2)]
+
+        assert sorted(o.filepath for o in outcomes) == sorted(paths)
+        assert all(o.ok for o in outcomes), [o.error for o in outcomes]
+        assert all(o.result["page_count"] == 1 for o in outcomes)
+
+    async def test_spreadsheets_routed_to_spreadsheet_extractor(self, sample_csv):
+        outcomes = [o async for o in extraction_pool.iter_extractions([str(sample_csv)])]
+        assert outcomes[0].ok
+        assert outcomes[0].result["extraction_method"] == "csv"
+
+
+class TestRunFastExtraction:
+    async def test_batch_updates_documents_once(self, tmp_path, monkeypatch):
+        from registry_review_mcp.services.document_processor import DocumentProcessor
+
+        _write_pdf(tmp_path / "project_plan.pdf", "Project plan body text.")
+        _write_pdf(tmp_path / "monitoring_report.pdf", "Monitoring report body text.")
+
+        session = await session_tools.create_session(
+            project_name="Fast Extraction Pool Test",
+            documents_path=str(tmp_path),
+        )
+        session_id = session["session_id"]
+        try:
+            await document_tools.discover_documents(session_id)
+
+            writes = []
+            original = StateManager._write_json_unlocked
+
+            def counting_write(self, filename, data):
+                writes.append(filename)
+                return original(self, filename, data)
+
+            monkeypatch.setattr(StateManager, "_write_json_unlocked", counting_write)
+
+            summary = await DocumentProcessor(session_id).run_fast_extraction()
+
+            assert summary["successful"] == 2
+            assert summary["failed"] == 0
+            assert writes.count("documents.json") == 1
+
+            docs = StateManager(session_id).read_json("documents.json")["documents"]
+            for doc in docs:
+                assert doc["fast_status"] == "complete"
+                assert doc["active_quality"] == "fast"
+                assert doc["markdown_path"].endswith(".fast.md")
+        finally:
+            await session_tools.delete_session(session_id)
+
+
+def _write_multipage_pdf(path, pages: int) -> None:
+    import pymupdf
+
+    doc = pymupdf.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Monitoring page {i + 1} narrative.")
+    doc.save(str(path))
+    doc.close()
+
+
+class TestPageShardedStreaming:
+    async def test_windows_yield_pages_in_order(self, tmp_path):
+        from registry_review_mcp.extractors.fast_extractor import iter_fast_extract_pages
+
+        pdf = tmp_path / "report.pdf"
+        _write_multipage_pdf(pdf, 7)
+
+        pages = [p async for p in iter_fast_extract_pages(str(pdf), window_pages=3, max_workers=2)]
+
+        assert [n for n, _ in pages] == list(range(1, 8))
+        assert all(f"Monitoring page {n} " in text for n, text in pages)
+
+    async def test_streamed_file_matches_whole_document_output(self, tmp_path):
+        from registry_review_mcp.extractors.fast_extractor import (
+            fast_extract_pdf_sync,
+            iter_markdown_pages,
+            stream_fast_extract_pdf,
+        )
+
+        pdf = tmp_path / "report.pdf"
+        _write_multipage_pdf(pdf, 5)
+
+        summary = await stream_fast_extract_pdf(str(pdf), window_pages=2, max_workers=1)
+        whole = fast_extract_pdf_sync(str(pdf))
+
+        streamed = (tmp_path / "report.fast.md").read_text(encoding="utf-8")
+        assert streamed == whole["markdown"]
+        assert "markdown" not in summary
+        assert summary["streamed"] is True
+        assert summary["page_count"] == whole["page_count"] == 5
+        assert summary["total_chars"] == whole["total_chars"]
+
+        lazily = list(iter_markdown_pages(summary["fast_markdown_path"]))
+        assert [n for n, _ in lazily] == [1, 2, 3, 4, 5]
+        assert [t for _, t in lazily] == [p["text"] for p in whole["pages"]]
+
+    async def test_missing_pdf_leaves_no_partial_output(self, tmp_path):
+        from registry_review_mcp.extractors.fast_extractor import stream_fast_extract_pdf
+        from registry_review_mcp.models.errors import DocumentExtractionError
+
+        with pytest.raises(DocumentExtractionError):
+            await stream_fast_extract_pdf(str(tmp_path / "missing.pdf"))
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_run_fast_extraction_streams_large_pdfs(self, tmp_path, monkeypatch):
+        from registry_review_mcp.services import document_processor
+
+        monkeypatch.setattr(
+            document_processor,
+            "settings",
+            document_processor.settings.model_copy(update={"fast_extraction_shard_min_pages": 3}),
+        )
+        _write_multipage_pdf(tmp_path / "monitoring_report.pdf", 4)
+        _write_pdf(tmp_path / "project_plan.pdf", "Project plan body text.")
+
+        session = await session_tools.create_session(
+            project_name="Sharded Extraction Test",
+            documents_path=str(tmp_path),
+        )
+        session_id = session["session_id"]
+        try:
+            await document_tools.discover_documents(session_id)
+            summary = await document_processor.DocumentProcessor(session_id).run_fast_extraction()
+
+            assert summary["successful"] == 2
+            docs = {
+                Path(d["filepath"]).name: d for d in StateManager(session_id).read_json("documents.json")["documents"]
+            }
+            report = docs["monitoring_report.pdf"]
+            assert report["fast_status"] == "complete"
+            assert report["fast_page_count"] == 4
+            assert "--- Page 4 ---" in Path(report["markdown_path"]).read_text(encoding="utf-8")
+        finally:
+            await session_tools.delete_session(session_id)
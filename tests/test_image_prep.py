@@ -0,0 +1,173 @@
+"""Tests for image preparation before multimodal extractor calls."""
+
+import base64
+import io
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from PIL import Image
+
+from registry_review_mcp.config.settings import settings
+from registry_review_mcp.extractors import llm_extractors
+from registry_review_mcp.extractors.llm_extractors import DateExtractor, LandTenureExtractor
+from registry_review_mcp.llm import image_prep
+from registry_review_mcp.llm.image_prep import ImagePreparer, prepare_bytes
+
+
+def _image_bytes(fmt: str, size=(64, 48), mode="RGB", noise=False) -> bytes:
+    image = Image.new(mode, size, "white" if mode != "RGBA" else (255, 255, 255, 0))
+    if noise:
+        image = Image.effect_noise(size, 80).convert(mode)
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+def _decoded(payload: bytes) -> Image.Image:
+    return Image.open(io.BytesIO(payload))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_preparer():
+    image_prep.reset_for_tests()
+    yield
+    image_prep.reset_for_tests()
+
+
+class TestPrepareBytes:
+    def test_small_image_is_sent_unchanged_with_its_real_type(self):
+        raw = _image_bytes("PNG")
+
+        media_type, payload, size = prepare_bytes(raw, max_edge=1568, max_bytes=1_000_000)
+
+        assert (media_type, payload, size) == ("image/png", raw, (64, 48))
+
+    def test_large_image_is_downsampled_to_max_edge(self):
+        raw = _image_bytes("JPEG", size=(4000, 3000))
+
+        media_type, payload, size = prepare_bytes(raw, max_edge=1000, max_bytes=1_000_000)
+
+        assert media_type == "image/jpeg"
+        assert size == (1000, 750) == _decoded(payload).size
+
+    def test_over_budget_image_is_recompressed_to_fit(self):
+        raw = _image_bytes("PNG", size=(800, 800), noise=True)
+        assert len(raw) > 100_000
+
+        media_type, payload, _ = prepare_bytes(raw, max_edge=1568, max_bytes=100_000)
+
+        assert media_type == "image/jpeg"
+        assert len(payload) <= 100_000
+        assert _decoded(payload).format == "JPEG"
+
+    def test_unsupported_format_is_converted(self):
+        raw = _image_bytes("TIFF")
+
+        media_type, payload, _ = prepare_bytes(raw, max_edge=1568, max_bytes=1_000_000)
+
+        assert media_type == "image/jpeg"
+        assert _decoded(payload).format == "JPEG"
+
+    def test_not_an_image(self):
+        with pytest.raises(ValueError):
+            prepare_bytes(b"not an image", max_edge=1568, max_bytes=1_000_000)
+
+
+class TestImagePreparer:
+    def test_payload_is_cached_by_content(self, tmp_path):
+        first, copy = tmp_path / "page1.png", tmp_path / "page7.png"
+        first.write_bytes(_image_bytes("PNG"))
+        copy.write_bytes(first.read_bytes())
+        preparer = ImagePreparer(max_edge=1568, max_bytes=1_000_000, cache_bytes=1_000_000)
+
+        prepared = preparer.prepare(first)
+
+        assert preparer.prepare(copy) is prepared
+        assert (preparer.stats()["hits"], preparer.stats()["misses"]) == (1, 1)
+        assert base64.standard_b64decode(prepared.data) == first.read_bytes()
+
+    def test_cache_evicts_least_recently_used(self, tmp_path):
+        paths = []
+        for i, color in enumerate(["red", "green", "blue"]):
+            path = tmp_path / f"{i}.png"
+            buffer = io.BytesIO()
+            Image.new("RGB", (32, 32), color).save(buffer, format="PNG")
+            path.write_bytes(buffer.getvalue())
+            paths.append(path)
+        preparer = ImagePreparer(max_edge=1568, max_bytes=1_000_000, cache_bytes=1_000_000)
+        entry_size = len(preparer.prepare(paths[0]).data)
+        preparer = ImagePreparer(max_edge=1568, max_bytes=1_000_000, cache_bytes=2 * entry_size + 10)
+
+        for path in (paths[0], paths[1], paths[0], paths[2]):
+            preparer.prepare(path)
+
+        assert preparer.stats()["entries"] == 2
+        preparer.prepare(paths[0])
+        assert preparer.stats()["hits"] == 2  # paths[1] was evicted, paths[0] kept
+
+    def test_dedupe_keeps_first_of_each_content(self, tmp_path):
+        a, b, a_again, missing = (tmp_path / n for n in ("a.png", "b.jpg", "c.png", "gone.png"))
+        a.write_bytes(_image_bytes("PNG"))
+        b.write_bytes(_image_bytes("JPEG"))
+        a_again.write_bytes(a.read_bytes())
+        preparer = ImagePreparer(max_edge=1568, max_bytes=1_000_000, cache_bytes=1_000_000)
+
+        assert preparer.dedupe([a, b, a_again, missing]) == [a, b, missing]
+
+    def test_unreadable_image_is_skipped(self, tmp_path):
+        path = tmp_path / "broken.jpg"
+        path.write_bytes(b"truncated")
+        preparer = ImagePreparer(max_edge=1568, max_bytes=1_000_000, cache_bytes=1_000_000)
+
+        assert preparer.prepare(path) is None
+        assert preparer.stats()["failures"] == 1
+
+
+class TestExtractorImages:
+    def test_duplicate_images_are_not_spread_over_chunks(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(llm_extractors, "settings", settings.model_copy(update={"llm_max_images_per_call": 1}))
+        figure, other = tmp_path / "fig.png", tmp_path / "other.jpg"
+        figure.write_bytes(_image_bytes("PNG"))
+        other.write_bytes(_image_bytes("JPEG"))
+        copy = tmp_path / "fig-p9.png"
+        copy.write_bytes(figure.read_bytes())
+
+        distributed = DateExtractor(client=object())._distribute_images([figure, copy, other], 3)
+
+        assert distributed == [[figure], [other], []]
+
+    async def test_date_chunk_declares_the_real_media_type(self, tmp_path):
+        image = tmp_path / "page.jpg"  # a PNG despite the suffix
+        image.write_bytes(_image_bytes("PNG"))
+        extractor = DateExtractor(client=SimpleNamespace(messages=SimpleNamespace(create=None)))
+        extractor._call_api_with_retry = AsyncMock(side_effect=RuntimeError("stop"))
+
+        with pytest.raises(Exception):
+            await extractor._process_date_chunk("text", [image], "plan.pdf", 0)
+
+        content = extractor._call_api_with_retry.call_args.kwargs["messages"][0]["content"]
+        assert content[1]["source"]["media_type"] == "image/png"
+
+    async def test_image_blocks_share_one_prepared_payload(self, tmp_path):
+        image = tmp_path / "title.png"
+        image.write_bytes(_image_bytes("PNG"))
+
+        first = await LandTenureExtractor(client=object())._image_blocks([image, tmp_path / "gone.png"])
+        second = await DateExtractor(client=object())._image_blocks([image])
+
+        assert first == second
+        assert image_prep.get_image_preparer().stats()["hits"] == 1
+
+    def test_extraction_cache_key_covers_preparation_settings(self, tmp_path, monkeypatch):
+        image = tmp_path / "map.png"
+        image.write_bytes(_image_bytes("PNG"))
+        extractor = DateExtractor(client=object())
+        key = extractor.cache_key("text", [image])
+
+        for update in ({"llm_image_max_edge": 800}, {"llm_image_max_bytes": 200_000}):
+            with monkeypatch.context() as patch:
+                patch.setattr(image_prep, "settings", settings.model_copy(update=update))
+                assert extractor.cache_key("text", [image]) != key
+
+        assert extractor.cache_key("text", [image]) == key
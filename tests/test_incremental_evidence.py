@@ -0,0 +1,177 @@
+"""Tests for incremental evidence re-extraction driven by the evidence graph."""
+
+import json
+
+import pytest
+
+from registry_review_mcp.config.settings import settings
+from registry_review_mcp.tools import evidence_tools, report_tools, validation_tools
+from registry_review_mcp.utils import checklist
+from registry_review_mcp.utils.evidence_graph import EvidenceGraph, document_fingerprint
+from registry_review_mcp.utils.state import StateManager
+
+REQUIREMENTS = [
+    {
+        "requirement_id": f"REQ-{n:03d}",
+        "requirement_text": f"Land tenure statement {n}",
+        "accepted_evidence": "Deed",
+        "category": "Land Tenure",
+        "validation_type": "document_presence",
+    }
+    for n in range(1, 3)
+]
+
+
+def _document(tmp_path, doc_id: str, text: str) -> dict:
+    markdown = tmp_path / f"{doc_id}.md"
+    markdown.write_text(text, encoding="utf-8")
+    return {
+        "document_id": doc_id,
+        "filename": f"{doc_id}.pdf",
+        "filepath": str(tmp_path / f"{doc_id}.pdf"),
+        "has_markdown": True,
+        "markdown_path": str(markdown),
+    }
+
+
+def _write_inputs(manager: StateManager, documents: list[dict], mapped: dict[str, list[str]]) -> None:
+    manager.write_json("documents.json", {"documents": documents})
+    manager.write_json(
+        "mappings.json",
+        {"mappings": [{"requirement_id": rid, "mapped_documents": doc_ids} for rid, doc_ids in mapped.items()]},
+    )
+
+
+@pytest.fixture
+def session(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        evidence_tools,
+        "settings",
+        settings.model_copy(update={"llm_cache_enabled": False, "evidence_batch_extraction": False}),
+    )
+    monkeypatch.setattr(checklist, "load_checklist", lambda methodology, scope=None: {"requirements": REQUIREMENTS})
+
+    manager = StateManager("session-ff0000000001")
+    manager.session_dir.mkdir(parents=True, exist_ok=True)
+    manager.write_json(
+        "session.json",
+        {"session_id": manager.session_id, "workflow_progress": {"requirement_mapping": "completed"}},
+    )
+    _write_inputs(
+        manager,
+        [_document(tmp_path, "DOC-1", "# Plan\n\nThe land is owned by Nicholas Denman.\n")],
+        {"REQ-001": ["DOC-1"], "REQ-002": ["DOC-1"]},
+    )
+    return manager
+
+
+@pytest.fixture
+def llm_calls(monkeypatch) -> list[tuple[str, str]]:
+    """(requirement id, document id) for every extraction that reached the LLM."""
+    calls: list[tuple[str, str]] = []
+
+    async def call_llm(prompt, system=None, model=None, max_tokens=4000):
+        requirement_id = next(r["requirement_id"] for r in REQUIREMENTS if r["requirement_text"] in prompt)
+        document_id = "DOC-2" if "DOC-2.pdf" in prompt else "DOC-1"
+        calls.append((requirement_id, document_id))
+        return json.dumps([{"text": f"Evidence in {document_id}", "page": 1, "confidence": 0.9}])
+
+    monkeypatch.setattr(evidence_tools, "call_llm", call_llm)
+    return calls
+
+
+@pytest.fixture
+def markdown_reads(monkeypatch) -> list[str]:
+    reads: list[str] = []
+    original = evidence_tools.get_markdown_content
+
+    async def get_markdown_content(document, session_id):
+        reads.append(document["document_id"])
+        return await original(document, session_id)
+
+    monkeypatch.setattr(evidence_tools, "get_markdown_content", get_markdown_content)
+    return reads
+
+
+class TestDocumentFingerprint:
+    def test_unchanged_file_is_not_reread(self, tmp_path, monkeypatch):
+        doc = _document(tmp_path, "DOC-1", "text")
+        first = document_fingerprint(doc)
+
+        monkeypatch.setattr(
+            "pathlib.Path.read_text", lambda *a, **k: (_ for _ in ()).throw(AssertionError("file was read"))
+        )
+        assert document_fingerprint(doc, previous=first) == first
+
+
+class TestIncrementalExtraction:
+    async def test_full_run_records_graph(self, session, llm_calls):
+        await evidence_tools.extract_all_evidence(session.session_id)
+
+        graph = EvidenceGraph.load(session)
+        assert set(graph.pairs) == {"REQ-001", "REQ-002"}
+        inputs = graph.pairs["REQ-001"]["DOC-1"]
+        assert inputs["content_hash"] == graph.documents["DOC-1"]["content_hash"]
+        assert inputs["prompt_version"] == evidence_tools.PROMPT_VERSION
+
+    async def test_no_changes_makes_no_calls(self, session, llm_calls, markdown_reads):
+        await evidence_tools.extract_all_evidence(session.session_id)
+        llm_calls.clear()
+        markdown_reads.clear()
+
+        result = await evidence_tools.extract_evidence_incremental(session.session_id)
+
+        assert llm_calls == []
+        assert markdown_reads == []
+        assert result["incremental"]["pairs_recomputed"] == 0
+
+    async def test_new_document_recomputes_only_its_pairs(self, session, llm_calls, markdown_reads, tmp_path):
+        await evidence_tools.extract_all_evidence(session.session_id)
+        llm_calls.clear()
+        markdown_reads.clear()
+
+        documents = session.read_json("documents.json")["documents"]
+        documents.append(_document(tmp_path, "DOC-2", "# Lease\n\nLeased to the proponent.\n"))
+        _write_inputs(session, documents, {"REQ-001": ["DOC-1"], "REQ-002": ["DOC-1", "DOC-2"]})
+
+        result = await evidence_tools.extract_evidence_incremental(session.session_id)
+
+        assert llm_calls == [("REQ-002", "DOC-2")]
+        assert markdown_reads == ["DOC-2"]
+        assert result["incremental"]["requirements_updated"] == ["REQ-002"]
+        evidence = {e["requirement_id"]: e for e in session.read_json("evidence.json")["evidence"]}
+        assert [s["text"] for s in evidence["REQ-002"]["evidence_snippets"]] == [
+            "Evidence in DOC-1",
+            "Evidence in DOC-2",
+        ]
+        assert [d["document_id"] for d in evidence["REQ-002"]["mapped_documents"]] == ["DOC-1", "DOC-2"]
+        assert len(evidence["REQ-001"]["evidence_snippets"]) == 1
+
+    async def test_changed_content_refreshes_derived_artifacts(self, session, llm_calls, monkeypatch, tmp_path):
+        await evidence_tools.extract_all_evidence(session.session_id)
+        llm_calls.clear()
+        session.write_json("validation.json", {})
+        (session.session_dir / "report.md").write_text("old report", encoding="utf-8")
+        regenerated: list[str] = []
+
+        async def cross_validate(session_id):
+            regenerated.append("validation")
+
+        async def generate_review_report(session_id, format="markdown"):
+            regenerated.append(format)
+
+        monkeypatch.setattr(validation_tools, "cross_validate", cross_validate)
+        monkeypatch.setattr(report_tools, "generate_review_report", generate_review_report)
+        (tmp_path / "DOC-1.md").write_text("# Plan\n\nRevised: the land is leased.\n", encoding="utf-8")
+
+        result = await evidence_tools.extract_evidence_incremental(session.session_id)
+
+        assert sorted(llm_calls) == [("REQ-001", "DOC-1"), ("REQ-002", "DOC-1")]
+        assert regenerated == ["validation", "markdown"]
+        assert result["incremental"]["refreshed"] == ["evidence.json", "validation.json", "report.md"]
+
+    async def test_without_graph_falls_back_to_full_run(self, session, llm_calls):
+        result = await evidence_tools.extract_evidence_incremental(session.session_id)
+
+        assert result["incremental"] == {"mode": "full"}
+        assert len(llm_calls) == 2
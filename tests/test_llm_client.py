@@ -197,6 +197,8 @@ class TestCallViaOpenAI:
 
         mock_client = AsyncMock()
         mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+        # call_llm retries by itself: the request goes out on a no-retry view.
+        mock_client.with_options = MagicMock(return_value=mock_client)
 
         with patch("registry_review_mcp.utils.llm_client.settings") as mock_settings, \
              patch("openai.AsyncOpenAI", return_value=mock_client):
@@ -207,6 +209,7 @@ class TestCallViaOpenAI:
             result = await _call_via_openai("What is 2+2?", "You are a calculator.", 100)
 
             assert result == "test response"
+            mock_client.with_options.assert_called_once_with(max_retries=0)
             mock_client.chat.completions.create.assert_called_once()
             call_kwargs = mock_client.chat.completions.create.call_args[1]
             assert call_kwargs["model"] == "gpt-4o"
@@ -1,8 +1,11 @@
 """Tests for LLM-powered field extraction (Phase 4.2)."""
 
+import asyncio
 
 import pytest
 
+from registry_review_mcp.config.settings import settings
+from registry_review_mcp.extractors import llm_extractors
 from registry_review_mcp.extractors.llm_extractors import (
     DateExtractor,
     ExtractedField,
@@ -11,6 +14,7 @@ from registry_review_mcp.extractors.llm_extractors import (
     extract_page,
     group_fields_by_document,
 )
+from registry_review_mcp.llm import response_store, throttle
 
 
 class TestHelperFunctions:
@@ -267,3 +271,146 @@ class TestBoundaryAwareChunking:
         # Should still create chunks (fallback to character-based)
         assert len(chunks) >= 2
         assert all(len(chunk) > 0 for chunk in chunks)
+
+
+class TestExtractFieldsPipeline:
+    """Routing from checklist metadata, snippet dedup and concurrent extractor calls."""
+
+    @pytest.fixture
+    def requirements(self):
+        return llm_extractors._checklist_requirements("not-a-session")
+
+    def test_routes_come_from_checklist_metadata(self, requirements):
+        routes = {req_id: llm_extractors._route_requirement(req) for req_id, req in requirements.items()}
+
+        assert routes["REQ-002"] == ["project_ids", "tenure"]  # cross_document, land tenure
+        assert routes["REQ-007"] == ["dates"]  # structured_field, project start date
+        assert routes["REQ-010"] == ["dates"]  # structured_field, crediting period
+        assert routes["REQ-013"] == []  # structured_field, but no extractor for permanence
+        assert routes["REQ-003"] == []  # document_presence
+
+    async def test_concurrent_and_deduplicated(self, monkeypatch, requirements):
+        calls = []
+        in_flight = peak = 0
+
+        def fake_extract(name):
+            async def extract(self, markdown, images, source):
+                nonlocal in_flight, peak
+                calls.append((name, source, markdown))
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return [
+                    ExtractedField(value=source, field_type=name, source=source, confidence=0.9, reasoning="test")
+                ]
+
+            return extract
+
+        for cls, name in (
+            (llm_extractors.DateExtractor, "dates"),
+            (llm_extractors.LandTenureExtractor, "tenure"),
+            (llm_extractors.ProjectIDExtractor, "project_ids"),
+        ):
+            monkeypatch.setattr(cls, "extract", fake_extract(name))
+
+        def snippet(text):
+            return {"document_name": "Project Plan", "text": text}
+
+        start = snippet("Project start date: 01/01/2022.")
+        evidence_data = {
+            "evidence": [
+                {"requirement_id": "REQ-002", "evidence_snippets": [snippet("Owner: Nicholas Denman.")]},
+                {"requirement_id": "REQ-003", "evidence_snippets": [start]},
+                {"requirement_id": "REQ-007", "evidence_snippets": [start]},
+                {"requirement_id": "REQ-010", "evidence_snippets": [start, snippet("Crediting period: 10 years.")]},
+            ]
+        }
+
+        results = await llm_extractors._extract_fields(evidence_data, requirements)
+
+        assert sorted((name, source) for name, source, _ in calls) == [
+            ("dates", "REQ-007"),
+            ("dates", "REQ-010"),
+            ("project_ids", "REQ-002"),
+            ("tenure", "REQ-002"),
+        ]
+        assert peak == 4
+        [req_010_markdown] = [markdown for name, source, markdown in calls if source == "REQ-010"]
+        assert "start date" not in req_010_markdown and "Crediting period" in req_010_markdown
+        assert [f.value for f in results["dates"]] == ["REQ-007", "REQ-010"]
+        assert [f.value for f in results["tenure"]] == ["REQ-002"]
+
+    async def test_api_calls_take_a_throttle_slot(self, monkeypatch):
+        monkeypatch.setenv("LLM_MIN_INTERVAL_MS", "0")
+        throttle.reset_for_tests()
+        extractor = DateExtractor(client=object())
+
+        async def api_call():
+            return throttle.get_throttle()._active_permits
+
+        assert await extractor._call_api_with_retry(api_call) == 1
+        assert throttle.get_throttle().active_permits_peak == 1
+        throttle.reset_for_tests()
+
+
+class TestExtractorCache:
+    """Extractor results keyed by content hash, prompt version and model."""
+
+    @pytest.fixture
+    def extractor(self, monkeypatch, tmp_path):
+        patched = settings.model_copy(update={"llm_cache_dir": tmp_path, "llm_model": "model-a"})
+        for module in (llm_extractors, response_store):
+            monkeypatch.setattr(module, "settings", patched)
+        response_store.reset_for_tests()
+        yield DateExtractor(client=object())
+        response_store.reset_for_tests()
+
+    @staticmethod
+    def _field(source: str) -> ExtractedField:
+        return ExtractedField(
+            value="2022-01-01", field_type="project_start_date", source=source, confidence=0.9, reasoning="Stated"
+        )
+
+    def test_key_is_content_not_name(self, extractor, monkeypatch):
+        text = "Project Start Date: 01/01/2022\n"
+        key = extractor.cache_key(text, [])
+
+        assert extractor.cache_key("Project Start Date: 01/01/2022  \r\n\n", []) == key
+        assert extractor.cache_key("Project Start Date: 01/02/2022\n", []) != key
+        with monkeypatch.context() as patch:
+            patch.setattr(llm_extractors, "EXTRACTOR_PROMPT_VERSION", "v0")
+            assert extractor.cache_key(text, []) != key
+        with monkeypatch.context() as patch:
+            patch.setattr(llm_extractors, "settings", settings.model_copy(update={"llm_model": "model-b"}))
+            assert extractor.cache_key(text, []) != key
+
+    def test_key_covers_image_bytes(self, extractor, tmp_path):
+        image = tmp_path / "map.jpg"
+        image.write_bytes(b"one")
+        before = extractor.cache_key("text", [image])
+        image.write_bytes(b"two")
+
+        assert extractor.cache_key("text", [image]) != before
+
+    async def test_same_content_under_another_name_hits(self, extractor):
+        text = "Project Start Date: 01/01/2022"
+        extractor._cache_fields(extractor.cache_key(text, []), "plan-v1.pdf", [self._field("plan-v1.pdf, Page 4")])
+
+        fields = await extractor.extract(text, [], "plan-v2.pdf")
+
+        assert [f.source for f in fields] == ["plan-v2.pdf, Page 4"]
+
+    async def test_preload_serves_extractions_from_memory(self, extractor, monkeypatch):
+        texts = ["Project Start Date: 01/01/2022", "Crediting period starts 01/01/2022"]
+        for text in texts:
+            extractor._cache_fields(extractor.cache_key(text, []), "plan.pdf", [self._field("plan.pdf")])
+
+        assert extractor.preload([(text, []) for text in texts] + [("uncached", [])]) == 2
+
+        def unexpected_read(*args, **kwargs):
+            raise AssertionError("read the store after preload")
+
+        monkeypatch.setattr(extractor.cache, "get", unexpected_read)
+        for text in texts:
+            assert [f.value for f in await extractor.extract(text, [], "plan.pdf")] == ["2022-01-01"]
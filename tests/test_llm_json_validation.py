@@ -17,6 +17,8 @@ from tests.factories import (
     unique_doc_name,
 )
 
+pytestmark = pytest.mark.usefixtures("isolated_llm_cache")
+
 
 class TestInvalidJSON:
     """Test handling of invalid JSON responses."""
@@ -22,8 +22,14 @@ from __future__ import annotations
 
 import asyncio
 import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
+from anthropic import BadRequestError, RateLimitError
+
+from registry_review_mcp.config.settings import settings
 
 
 def _get_module():
@@ -149,3 +155,185 @@ class TestTelemetry:
         await asyncio.gather(*[worker() for _ in range(8)])
         assert mod.get_throttle().active_permits_peak >= 2
         assert mod.get_throttle().active_permits_peak <= 3
+
+
+class TestAdaptiveWindow:
+    """AIMD: grow by one per window of healthy successes, halve on congestion."""
+
+    @pytest.fixture
+    def fresh(self, monkeypatch):
+        def configure(ceiling: int, initial: int, adaptive: bool = True):
+            monkeypatch.setenv("LLM_MAX_CONCURRENT", str(ceiling))
+            monkeypatch.setenv("LLM_INITIAL_CONCURRENT", str(initial))
+            monkeypatch.setenv("LLM_MIN_INTERVAL_MS", "0")
+            monkeypatch.setenv("LLM_ADAPTIVE", "1" if adaptive else "0")
+            mod = _get_module()
+            mod.reset_for_tests()
+            return mod
+
+        return configure
+
+    async def test_successes_grow_window_to_ceiling(self, fresh):
+        mod = fresh(ceiling=4, initial=1)
+
+        for _ in range(20):
+            async with mod.acquire_slot("api"):
+                pass
+
+        window = mod.get_throttle().window_for("api")
+        assert window.limit == 4
+        assert window.peak_window == 4
+
+    async def test_congestion_halves_window_once_per_event(self, fresh):
+        mod = fresh(ceiling=8, initial=8)
+
+        async def failing():
+            async with mod.acquire_slot("api"):
+                await asyncio.sleep(0.01)
+                raise asyncio.TimeoutError()
+
+        results = await asyncio.gather(*[failing() for _ in range(8)], return_exceptions=True)
+
+        window = mod.get_throttle().window_for("api")
+        assert all(isinstance(r, asyncio.TimeoutError) for r in results)
+        assert window.limit == 4
+        assert window.backoff_events == 1
+        assert window.failures == 8
+
+    async def test_non_congestion_errors_do_not_shrink(self, fresh):
+        mod = fresh(ceiling=4, initial=4)
+
+        with pytest.raises(ValueError):
+            async with mod.acquire_slot("api"):
+                raise ValueError("bad JSON from the model")
+
+        assert mod.get_throttle().window_for("api").limit == 4
+
+    async def test_backends_are_independent(self, fresh):
+        from registry_review_mcp.utils.llm_client import LLMBackendError
+
+        mod = fresh(ceiling=4, initial=4)
+
+        with pytest.raises(LLMBackendError):
+            async with mod.acquire_slot("cli"):
+                raise LLMBackendError("CLI rate limited", details={"category": "rate_limit"})
+
+        telemetry = mod.get_throttle().telemetry()["backends"]
+        assert telemetry["cli"]["limit"] == 2
+        assert mod.get_throttle().window_for("api").limit == 4
+
+    async def test_ceiling_spans_backends(self, fresh):
+        mod = fresh(ceiling=2, initial=2)
+        in_flight = peak = 0
+
+        async def call(backend: str):
+            nonlocal in_flight, peak
+            async with mod.acquire_slot(backend):
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*[call(backend) for backend in ("api", "cli", "openai") for _ in range(2)])
+
+        assert peak == 2
+        assert mod.get_throttle().active_permits_peak == 2
+
+    async def test_fixed_mode_pins_window(self, fresh):
+        mod = fresh(ceiling=3, initial=1, adaptive=False)
+
+        with pytest.raises(asyncio.TimeoutError):
+            async with mod.acquire_slot("api"):
+                raise asyncio.TimeoutError()
+
+        assert mod.get_throttle().window_for("api").limit == 3
+
+    def test_slow_latency_holds_growth(self):
+        mod = _get_module()
+        window = mod.AdaptiveWindow(ceiling=8, window=2)
+
+        window.record_success(100.0)
+        for _ in range(20):
+            window.record_success(2_000.0)
+
+        assert window.limit == 2
+
+
+def _api_error(cls, status: int):
+    return cls(
+        message=f"HTTP {status}",
+        response=httpx.Response(status_code=status, request=httpx.Request("POST", "https://api.anthropic.com")),
+        body=None,
+    )
+
+
+class TestCallLlmRetries:
+    """call_llm retries congestion itself, so the window sees every 429/5xx."""
+
+    @pytest.fixture
+    def api(self, monkeypatch):
+        from registry_review_mcp.utils import llm_client
+
+        monkeypatch.setenv("LLM_MIN_INTERVAL_MS", "0")
+        monkeypatch.setenv("LLM_INITIAL_CONCURRENT", "4")
+        _get_module().reset_for_tests()
+        monkeypatch.setattr(llm_client, "_retry_delay", lambda attempt: 0)
+        monkeypatch.setattr(llm_client, "_resolve_backend", AsyncMock(return_value="api"))
+        client = MagicMock()
+        get_client = MagicMock(return_value=client)
+        monkeypatch.setattr(llm_client, "get_anthropic_client", get_client)
+        return llm_client, client, get_client
+
+    async def test_congestion_is_retried_in_a_fresh_slot(self, api):
+        llm_client, client, get_client = api
+        response = SimpleNamespace(
+            content=[SimpleNamespace(text="ok")], usage=SimpleNamespace(input_tokens=1, output_tokens=1)
+        )
+        client.messages.create = AsyncMock(side_effect=[_api_error(RateLimitError, 429), response])
+
+        assert await llm_client.call_llm("prompt", model="m") == "ok"
+
+        get_client.assert_called_with(max_retries=0)
+        window = _get_module().get_throttle().window_for("api")
+        assert (window.failures, window.backoff_events, window.successes) == (1, 1, 1)
+        assert window.limit == 2
+
+    async def test_gives_up_after_the_sdk_retry_budget(self, api):
+        llm_client, client, _ = api
+        client.messages.create = AsyncMock(side_effect=_api_error(RateLimitError, 429))
+
+        with pytest.raises(RateLimitError):
+            await llm_client.call_llm("prompt", model="m")
+
+        assert client.messages.create.await_count == settings.llm_anthropic_max_retries + 1
+        assert _get_module().get_throttle().window_for("api").failures == settings.llm_anthropic_max_retries + 1
+
+    async def test_other_errors_are_not_retried(self, api):
+        llm_client, client, _ = api
+        client.messages.create = AsyncMock(side_effect=_api_error(BadRequestError, 400))
+
+        with pytest.raises(BadRequestError):
+            await llm_client.call_llm("prompt", model="m")
+
+        assert client.messages.create.await_count == 1
+
+    async def test_stream_retried_only_before_its_first_chunk(self, api, monkeypatch):
+        llm_client, _, _ = api
+        attempts: list[int] = []
+
+        async def stream(prompt, system, model, max_tokens):
+            attempts.append(len(attempts))
+            if len(attempts) == 1:
+                raise _api_error(RateLimitError, 429)
+            yield "partial"
+            raise _api_error(RateLimitError, 429)
+
+        monkeypatch.setattr(llm_client, "_stream_via_api", stream)
+        received = []
+
+        with pytest.raises(RateLimitError):
+            async for text in llm_client.call_llm_stream("prompt", model="m"):
+                received.append(text)
+
+        assert attempts == [0, 1]
+        assert received == ["partial"]
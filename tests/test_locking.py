@@ -1,9 +1,11 @@
 """Test locking mechanism in isolation."""
 
+import os
 import time
 
 import pytest
 
+from registry_review_mcp.models.errors import SessionLockError
 from registry_review_mcp.utils.state import StateManager
 
 
@@ -73,3 +75,116 @@ class TestLockingMechanism:
         except Exception as e:
             duration = time.time() - start
             pytest.fail(f"update_json failed after {duration}s: {e}")
+
+
+class TestFineGrainedLocks:
+    """Per-file locks, reader/writer semantics, and the async path."""
+
+    def test_different_files_do_not_serialize(self, test_settings):
+        manager = StateManager("session-bb0000000005")
+        other = StateManager("session-bb0000000005")
+
+        with manager.lock(filename="documents.json"):
+            with other.lock(filename="audit_log.json", timeout=1):
+                pass
+
+    def test_same_file_is_exclusive(self, test_settings):
+        manager = StateManager("session-bb0000000006")
+        other = StateManager("session-bb0000000006")
+
+        with manager.lock(filename="documents.json"):
+            with pytest.raises(SessionLockError) as exc_info:
+                with other.lock(filename="documents.json", timeout=1):
+                    pass
+        assert exc_info.value.details["filename"] == "documents.json"
+
+    def test_session_lock_excludes_file_locks(self, test_settings):
+        manager = StateManager("session-bb0000000007")
+        other = StateManager("session-bb0000000007")
+
+        with manager.lock():
+            with pytest.raises(SessionLockError):
+                with other.lock(filename="documents.json", timeout=1):
+                    pass
+
+    def test_readers_share_but_exclude_writers(self, test_settings):
+        manager = StateManager("session-bb0000000008")
+        other = StateManager("session-bb0000000008")
+
+        with manager.lock(filename="evidence.json", shared=True):
+            with other.lock(filename="evidence.json", shared=True, timeout=1):
+                pass
+            with pytest.raises(SessionLockError):
+                with other.lock(filename="evidence.json", timeout=1):
+                    pass
+
+    async def test_async_lock_keeps_loop_responsive(self, test_settings):
+        import asyncio
+
+        manager = StateManager("session-bb0000000009")
+        other = StateManager("session-bb0000000009")
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        try:
+            with manager.lock(filename="documents.json"):
+                with pytest.raises(SessionLockError):
+                    async with other.async_lock(filename="documents.json", timeout=1):
+                        pass
+        finally:
+            task.cancel()
+        assert ticks >= 10, "event loop was blocked while waiting for the lock"
+
+    def test_lock_wait_metrics(self, test_settings):
+        from registry_review_mcp.utils.locking import get_lock_metrics, reset_lock_metrics
+
+        reset_lock_metrics()
+        manager = StateManager("session-bb0000000010")
+        manager.write_json("documents.json", {"documents": []})
+        with manager.lock(filename="documents.json"):
+            with pytest.raises(SessionLockError):
+                with StateManager("session-bb0000000010").lock(filename="documents.json", timeout=1):
+                    pass
+
+        metrics = get_lock_metrics()["documents.json"]
+        assert metrics["acquisitions"] == 2
+        assert metrics["timeouts"] == 1
+
+
+class TestPidLockFallback:
+    """Without flock, lock files carry a PID and dead holders are broken."""
+
+    def test_stale_lock_from_dead_process_is_broken(self, tmp_path, monkeypatch):
+        import subprocess
+        import sys
+
+        from registry_review_mcp.utils import locking
+
+        monkeypatch.setattr(locking, "fcntl", None)
+        dead = subprocess.Popen([sys.executable, "-c", "pass"])
+        dead.wait()
+
+        path = tmp_path / ".lock"
+        path.write_text(str(dead.pid), encoding="utf-8")
+
+        file_lock = locking.FileLock(path)
+        assert file_lock.try_acquire()
+        assert file_lock.holder_pid() == os.getpid()
+        file_lock.release()
+        assert not path.exists()
+
+    def test_live_holder_is_respected(self, tmp_path, monkeypatch):
+        from registry_review_mcp.utils import locking
+
+        monkeypatch.setattr(locking, "fcntl", None)
+        path = tmp_path / ".lock"
+        path.write_text("1", encoding="utf-8")  # init: always alive
+
+        assert not locking.FileLock(path).try_acquire()
+        assert path.read_text(encoding="utf-8") == "1"
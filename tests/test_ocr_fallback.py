@@ -8,7 +8,8 @@ ground-truth tests. What this suite verifies is the surrounding glue:
 
 - Tesseract detection is memoized and degrades gracefully when missing.
 - The density+images heuristic flags the right pages.
-- The OCR cache key is deterministic and invalidates on mtime change.
+- The OCR cache key is deterministic, follows file content, and
+  invalidates when the content changes.
 - The fast extractor surfaces an ``ocr`` sub-dictionary in its return
   value regardless of whether OCR actually ran, so downstream consumers
   get a stable schema.
@@ -158,7 +159,7 @@ class TestOcrCacheKey:
         b = ocr_module._ocr_cache_path(tmp_path, "/x.pdf", 1, "auto", "eng", 300)
         assert a != b
 
-    def test_mtime_change_invalidates(self, tmp_path):
+    def test_content_change_invalidates(self, tmp_path):
         """A re-saved PDF with the same filename must not reuse stale cache."""
         pdf = tmp_path / "doc.pdf"
         pdf.write_bytes(b"%PDF-1.4\n%%EOF\n")
@@ -166,11 +167,24 @@ class TestOcrCacheKey:
 
         import os as _os
 
+        pdf.write_bytes(b"%PDF-1.4\n% re-exported\n%%EOF\n")
         future = pdf.stat().st_mtime + 10
         _os.utime(pdf, (future, future))
         second = ocr_module._ocr_cache_path(tmp_path, str(pdf), 0, "auto", "eng", 150)
         assert first != second
 
+    def test_same_content_at_another_path_shares_entry(self, tmp_path):
+        """Another session's copy of the same PDF reuses the OCR result."""
+        original = tmp_path / "a" / "doc.pdf"
+        copy = tmp_path / "b" / "report.pdf"
+        for path in (original, copy):
+            path.parent.mkdir()
+            path.write_bytes(b"%PDF-1.4\n%%EOF\n")
+
+        a = ocr_module._ocr_cache_path(tmp_path, str(original), 0, "auto", "eng", 150)
+        b = ocr_module._ocr_cache_path(tmp_path, str(copy), 0, "auto", "eng", 150)
+        assert a == b
+
 
 class TestOcrPageDegradation:
     """ocr_page degrades to None when Tesseract is missing."""
@@ -0,0 +1,124 @@
+"""Tests for cache-friendly prompt layout and prompt-cache cost accounting."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from registry_review_mcp.llm.prompt_layout import MAX_MESSAGE_BREAKPOINTS, PromptLayout, Segment
+from registry_review_mcp.tools.evidence_tools import build_batched_evidence_prompt, build_type_aware_prompt
+from registry_review_mcp.utils import llm_client
+from registry_review_mcp.utils.cost_tracker import CostTracker, track_llm_costs
+
+DOCUMENT = "# Plan\n\nThe land is owned by Nicholas Denman.\n"
+
+
+def _requirement(n: int) -> dict:
+    return {
+        "requirement_id": f"REQ-{n:03d}",
+        "requirement_text": f"Requirement text {n}",
+        "accepted_evidence": "Deed",
+        "category": "Land Tenure",
+    }
+
+
+def _api_client(**usage) -> MagicMock:
+    client = MagicMock()
+    client.messages.create = AsyncMock(
+        return_value=SimpleNamespace(content=[SimpleNamespace(text="ok")], usage=SimpleNamespace(**usage))
+    )
+    return client
+
+
+class TestPromptLayout:
+    def test_is_the_rendered_string(self):
+        layout = PromptLayout(Segment("prefix ", cache=True), Segment("tail"))
+
+        assert layout == "prefix tail"
+        assert "prefix" in layout
+
+    def test_breakpoint_after_cached_segment(self):
+        layout = PromptLayout(Segment("a", cache=True), Segment("b"), Segment("c"))
+
+        assert layout.content_blocks() == [
+            {"type": "text", "text": "a", "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "bc"},
+        ]
+
+    def test_keeps_only_the_longest_prefixes(self):
+        layout = PromptLayout(*(Segment(str(n), cache=True) for n in range(MAX_MESSAGE_BREAKPOINTS + 2)))
+
+        blocks = layout.content_blocks()
+
+        assert sum("cache_control" in block for block in blocks) == MAX_MESSAGE_BREAKPOINTS
+        assert "".join(block["text"] for block in blocks) == layout
+
+
+class TestEvidencePromptLayout:
+    def test_requirements_share_the_document_prefix(self):
+        first, second = (
+            build_type_aware_prompt(_requirement(n), DOCUMENT, "plan.pdf", "document_presence") for n in (1, 2)
+        )
+
+        assert first.content_blocks()[0] == second.content_blocks()[0]
+        assert DOCUMENT in first.content_blocks()[0]["text"]
+        assert "Requirement text 1" in first.content_blocks()[1]["text"]
+
+    def test_batched_prompt_caches_the_document(self):
+        prompt = build_batched_evidence_prompt(["\n### REQ-001\n"], DOCUMENT, "plan.pdf")
+
+        cached, tail = prompt.content_blocks()
+        assert DOCUMENT in cached["text"]
+        assert tail["text"].startswith("**Requirements:**")
+
+
+class TestApiRequest:
+    async def test_layout_sent_with_breakpoint(self):
+        client = _api_client(input_tokens=10, output_tokens=5)
+        prompt = PromptLayout(Segment("document", cache=True), Segment("requirement"))
+
+        with patch.object(llm_client, "get_anthropic_client", return_value=client):
+            await llm_client._call_via_api(prompt, "system", "claude-sonnet-4-5-20250929", 100)
+
+        content = client.messages.create.await_args.kwargs["messages"][0]["content"]
+        assert [block.get("cache_control") for block in content] == [{"type": "ephemeral"}, None]
+
+    async def test_plain_prompt_has_no_breakpoint(self):
+        client = _api_client(input_tokens=10, output_tokens=5)
+
+        with patch.object(llm_client, "get_anthropic_client", return_value=client):
+            await llm_client._call_via_api("one-off prompt", None, "claude-sonnet-4-5-20250929", 100)
+
+        content = client.messages.create.await_args.kwargs["messages"][0]["content"]
+        assert content == [{"type": "text", "text": "one-off prompt"}]
+
+
+class TestPromptCacheCosts:
+    async def test_cache_tokens_recorded_per_call(self, tmp_path):
+        tracker = CostTracker("session-cache", tmp_path / "cost_tracking.json")
+        client = _api_client(
+            input_tokens=100, output_tokens=50, cache_creation_input_tokens=0, cache_read_input_tokens=900
+        )
+
+        with (
+            patch.object(llm_client, "get_anthropic_client", return_value=client),
+            track_llm_costs(tracker, extractor="evidence"),
+            track_llm_costs(document_name="plan.pdf"),
+        ):
+            await llm_client._call_via_api("prompt", None, "claude-sonnet-4-5-20250929", 100)
+
+        [call] = tracker.api_calls
+        assert (call.extractor, call.document_name) == ("evidence", "plan.pdf")
+        assert (call.input_tokens, call.cache_read_tokens) == (100, 900)
+        assert tracker.get_summary().prompt_cache_hit_rate == pytest.approx(0.9)
+
+    async def test_no_tracker_records_nothing(self, tmp_path):
+        client = _api_client(input_tokens=100, output_tokens=50)
+
+        with (
+            patch.object(llm_client, "get_anthropic_client", return_value=client),
+            track_llm_costs(document_name="plan.pdf"),
+        ):
+            assert await llm_client._call_via_api("prompt", None, "claude-sonnet-4-5-20250929", 100) == "ok"
+
+        assert not list(tmp_path.iterdir())
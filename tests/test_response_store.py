@@ -0,0 +1,177 @@
+"""Tests for the sharded, compressed LLM response store."""
+
+import gzip
+import json
+import time
+
+import pytest
+
+from registry_review_mcp.config.settings import settings
+from registry_review_mcp.llm import response_store
+from registry_review_mcp.llm.response_store import ResponseStore
+from registry_review_mcp.models.evidence import EvidenceSnippet
+from registry_review_mcp.tools import evidence_tools
+from registry_review_mcp.utils.cache import compress, decompress
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ResponseStore(tmp_path, shards=4, max_bytes=1024**2, max_entries=1000, codec="zlib")
+    yield store
+    store.close()
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    response_store.reset_for_tests()
+    yield
+    response_store.reset_for_tests()
+
+
+def _snippet(text: str) -> EvidenceSnippet:
+    return EvidenceSnippet(text=text, document_id="DOC-1", document_name="plan.pdf", page=1, confidence=0.9)
+
+
+class TestResponseStore:
+    def test_round_trip_across_shards(self, store):
+        for n in range(40):
+            store.set("evidence", f"key-{n}", {"response": [n]})
+
+        assert [store.get("evidence", f"key-{n}")["response"] for n in range(40)] == [[n] for n in range(40)]
+        assert store.stats()["entries"] == 40
+        assert len(list((store.directory).glob("shard-*.sqlite3"))) == 4
+
+    def test_get_many_reads_each_shard_once(self, store):
+        for n in range(20):
+            store.set("evidence", f"key-{n}", n)
+        store.set("other", "key-0", "other namespace")
+
+        found = store.get_many("evidence", [f"key-{n}" for n in range(0, 30, 2)])
+
+        assert found == {f"key-{n}": n for n in range(0, 20, 2)}
+        assert sum(shard.counters.hits for shard in store.shards) == 10
+        assert sum(shard.counters.misses for shard in store.shards) == 5
+
+    def test_get_many_skips_expired(self, store):
+        store.set("evidence", "live", 1)
+        store.set("evidence", "stale", 2, ttl=1)
+        time.sleep(1.1)
+
+        assert store.get_many("evidence", ["live", "stale"]) == {"live": 1}
+
+    def test_values_are_stored_compressed(self, store):
+        text = "Nicholas Denman owns the land. " * 200
+        store.set("evidence", "k", {"response": [text]})
+
+        assert store.stats()["bytes"] < len(text) // 10
+
+    def test_manifest_pins_shard_count(self, store, tmp_path):
+        store.set("evidence", "k", "v")
+        store.close()
+
+        reopened = ResponseStore(tmp_path, shards=16, codec="zlib")
+        assert reopened.shard_count == 4
+        assert reopened.get("evidence", "k") == "v"
+        reopened.close()
+
+    def test_size_bound_evicts(self, tmp_path):
+        store = ResponseStore(tmp_path, shards=2, max_entries=10, codec="zlib")
+        for n in range(30):
+            store.set("evidence", f"key-{n}", n)
+
+        assert store.stats()["entries"] <= 10
+        assert store.stats()["evictions"] >= 20
+        store.close()
+
+    def test_codec_tag_round_trip(self):
+        assert decompress(compress(b"payload", "zlib")) == b"payload"
+        with pytest.raises(ValueError):
+            decompress(b"\x09garbage")
+
+
+class TestPacks:
+    def test_export_then_import_on_another_host(self, store, tmp_path):
+        store.set("evidence", "a", {"response": ["one"]})
+        store.set("date_extraction", "b", [{"value": "2020-01-01"}])
+        pack = tmp_path / "warm.pack"
+
+        assert store.export_pack(pack) == 2
+
+        other = ResponseStore(tmp_path / "other", shards=2, codec="zlib")
+        assert other.import_pack(pack) == {"imported": 2, "expired": 0}
+        assert other.get("evidence", "a") == {"response": ["one"]}
+        assert other.get("date_extraction", "b") == [{"value": "2020-01-01"}]
+        other.close()
+
+    def test_export_namespace_only(self, store, tmp_path):
+        store.set("evidence", "a", 1)
+        store.set("date_extraction", "b", 2)
+
+        assert store.export_pack(tmp_path / "evidence.pack", namespace="evidence") == 1
+
+    def test_expired_entries_are_skipped_on_import(self, store, tmp_path):
+        pack = tmp_path / "old.pack"
+        with gzip.open(pack, "wt", encoding="utf-8") as f:
+            f.write(json.dumps({"format": response_store.PACK_FORMAT, "version": response_store.PACK_VERSION}) + "\n")
+            entry = {"namespace": "evidence", "key": "stale", "value": 1, "cached_at": 0, "expires_at": 1.0}
+            f.write(json.dumps(entry) + "\n")
+
+        assert store.import_pack(pack) == {"imported": 0, "expired": 1}
+
+    def test_rejects_foreign_files(self, store, tmp_path):
+        pack = tmp_path / "not.pack"
+        with gzip.open(pack, "wt", encoding="utf-8") as f:
+            f.write('{"format": "something-else"}\n')
+
+        with pytest.raises(ValueError):
+            store.import_pack(pack)
+
+    def test_cli_round_trip(self, tmp_path, capsys):
+        source, target = tmp_path / "source", tmp_path / "target"
+        response_store.get_response_store(source).set("evidence", "k", {"response": []})
+        pack = tmp_path / "warm.pack"
+
+        assert response_store.main(["--cache-dir", str(source), "pack", "export", str(pack)]) == 0
+        assert response_store.main(["--cache-dir", str(target), "pack", "import", str(pack)]) == 0
+
+        assert "Imported 1 entries" in capsys.readouterr().out
+        assert response_store.get_response_store(target).get("evidence", "k") == {"response": []}
+
+
+class TestEvidenceCache:
+    @pytest.fixture
+    def llm_cache(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(evidence_tools, "settings", settings.model_copy(update={"llm_cache_dir": tmp_path}))
+        return tmp_path
+
+    def test_round_trip_leaves_no_per_key_files(self, llm_cache):
+        evidence_tools.save_to_cache("abc_docu", [_snippet("Owned by Nicholas Denman")])
+
+        assert [s.text for s in evidence_tools.load_from_cache("abc_docu")] == ["Owned by Nicholas Denman"]
+        assert list(llm_cache.glob("*.json")) == []
+
+    def test_legacy_file_is_adopted_on_read(self, llm_cache):
+        legacy = llm_cache / "abc_docu.json"
+        legacy.write_text(
+            json.dumps(
+                {
+                    "cache_key": "abc_docu",
+                    "created_at": time.time(),
+                    "ttl": 3600,
+                    "response": [_snippet("legacy").model_dump()],
+                    "metadata": {},
+                },
+                indent=2,
+            )
+        )
+
+        assert [s.text for s in evidence_tools.load_from_cache("abc_docu")] == ["legacy"]
+        assert not legacy.exists()
+        assert response_store.get_response_store(llm_cache).get("evidence", "abc_docu") is not None
+
+    def test_expired_legacy_file_is_dropped(self, llm_cache):
+        legacy = llm_cache / "abc_docu.json"
+        legacy.write_text(json.dumps({"cache_key": "abc_docu", "created_at": 0, "ttl": 1, "response": []}))
+
+        assert evidence_tools.load_from_cache("abc_docu") is None
+        assert not legacy.exists()
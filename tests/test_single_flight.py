@@ -0,0 +1,160 @@
+"""Tests for single-flight de-duplication of in-flight LLM requests."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from registry_review_mcp.config.settings import settings
+from registry_review_mcp.llm import single_flight, throttle, token_budget
+from registry_review_mcp.llm.single_flight import SingleFlight
+from registry_review_mcp.tools import evidence_tools
+
+
+@pytest.fixture(autouse=True)
+def _fresh_state(monkeypatch):
+    monkeypatch.setenv("LLM_MIN_INTERVAL_MS", "0")
+    for module in (single_flight, throttle, token_budget):
+        module.reset_for_tests()
+    yield
+    for module in (single_flight, throttle, token_budget):
+        module.reset_for_tests()
+
+
+class TestSingleFlight:
+    async def test_concurrent_callers_share_one_execution(self):
+        flights = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "answer"
+
+        results = await asyncio.gather(*(flights.run("llm:k", work) for _ in range(4)))
+
+        assert results == ["answer"] * 4
+        assert calls == 1
+        assert flights.telemetry() == {"in_flight": 0, "leaders": {"llm": 1}, "coalesced": {"llm": 3}}
+
+    async def test_exception_reaches_every_caller(self):
+        flights = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("backend down")
+
+        results = await asyncio.gather(*(flights.run("llm:k", work) for _ in range(2)), return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_key_released_after_completion(self):
+        flights = SingleFlight()
+        work = AsyncMock(return_value="answer")
+
+        await flights.run("llm:k", work)
+        await flights.run("llm:k", work)
+
+        assert work.await_count == 2
+        assert flights.coalesced["llm"] == 0
+
+    async def test_cancelled_follower_does_not_cancel_work(self):
+        flights = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "answer"
+
+        leader = asyncio.create_task(flights.run("llm:k", work))
+        follower = asyncio.create_task(flights.run("llm:k", work))
+        await asyncio.sleep(0)
+        follower.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await leader == "answer"
+        assert follower.cancelled()
+
+    async def test_work_cancelled_when_nobody_waits(self):
+        flights = SingleFlight()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def work():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        caller = asyncio.create_task(flights.run("llm:k", work))
+        await started.wait()
+        caller.cancel()
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        await asyncio.sleep(0)  # done callbacks run on the next iteration
+
+        assert flights.telemetry()["in_flight"] == 0
+
+
+class TestCallLlmCoalescing:
+    async def test_identical_prompts_make_one_backend_call(self, test_settings):
+        from registry_review_mcp.utils import llm_client
+
+        async def slow_api(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return "ok"
+
+        backend = AsyncMock(side_effect=slow_api)
+        with (
+            patch.object(llm_client, "_resolve_backend", new_callable=AsyncMock, return_value="api"),
+            patch.object(llm_client, "_call_via_api", backend),
+        ):
+            results = await asyncio.gather(
+                llm_client.call_llm("same prompt"),
+                llm_client.call_llm("same prompt"),
+                llm_client.call_llm("other prompt"),
+            )
+
+        assert results == ["ok", "ok", "ok"]
+        assert backend.await_count == 2
+
+
+class TestEvidenceCoalescing:
+    async def test_concurrent_extractions_share_one_call(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(
+            evidence_tools,
+            "settings",
+            settings.model_copy(update={"llm_cache_dir": tmp_path, "llm_cache_enabled": True}),
+        )
+        prompts: list[str] = []
+
+        async def call_llm(prompt, system=None, model=None, max_tokens=4000):
+            prompts.append(prompt)
+            await asyncio.sleep(0.01)
+            item = {"text": "Owned by Nicholas Denman", "page": 1, "confidence": 0.9, "schema_match": True}
+            return json.dumps([item])
+
+        monkeypatch.setattr(evidence_tools, "call_llm", call_llm)
+        requirement = {
+            "requirement_id": "REQ-001",
+            "requirement_text": "Land tenure",
+            "accepted_evidence": "Deed",
+        }
+
+        first, second = await asyncio.gather(
+            *(
+                evidence_tools.extract_evidence_with_llm(requirement, "# Plan\n\nLand owner.", "DOC-1", "plan.pdf")
+                for _ in range(2)
+            )
+        )
+
+        assert len(prompts) == 1
+        assert [s.text for s in first] == [s.text for s in second] == ["Owned by Nicholas Denman"]
+        assert first is not second
+        assert single_flight.get_single_flight().coalesced["evidence"] == 1
@@ -0,0 +1,99 @@
+"""Tests for the process-wide session state cache."""
+
+import json
+import os
+
+import pytest
+
+from registry_review_mcp.utils import state_cache
+from registry_review_mcp.utils.state import StateManager
+from registry_review_mcp.utils.state_cache import StateCache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    state_cache.reset_for_tests()
+    yield
+    state_cache.reset_for_tests()
+
+
+class TestReadThroughCache:
+    def test_repeat_reads_skip_json_parsing(self, test_settings, monkeypatch):
+        manager = StateManager("session-cc0000000001")
+        manager.write_json("documents.json", {"documents": [{"document_id": "DOC-1"}]})
+        manager.read_json("documents.json")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("json.load should not run for an unchanged file")
+
+        monkeypatch.setattr(state_cache.json, "load", fail)
+        assert manager.read_json("documents.json") == {"documents": [{"document_id": "DOC-1"}]}
+        assert state_cache.get_state_cache().stats()["hits"] >= 1
+
+    def test_first_read_after_write_is_a_hit(self, test_settings):
+        manager = StateManager("session-cc0000000005")
+        manager.write_json("documents.json", {"documents": [{"document_id": "DOC-1"}]})
+
+        assert manager.read_json("documents.json") == {"documents": [{"document_id": "DOC-1"}]}
+        stats = state_cache.get_state_cache().stats()
+        assert (stats["hits"], stats["misses"]) == (1, 0)
+
+    def test_callers_get_private_copies(self, test_settings):
+        manager = StateManager("session-cc0000000002")
+        manager.write_json("session.json", {"status": "initialized"})
+
+        first = manager.read_json("session.json")
+        first["status"] = "mutated-but-not-written"
+
+        assert manager.read_json("session.json")["status"] == "initialized"
+
+    def test_write_through_serves_serialized_form(self, test_settings):
+        """Cached data must match a disk read, e.g. non-JSON types stringified."""
+        from datetime import datetime, timezone
+
+        manager = StateManager("session-cc0000000003")
+        when = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        manager.write_json("session.json", {"updated_at": when})
+
+        assert manager.read_json("session.json") == {"updated_at": str(when)}
+
+    def test_external_write_is_detected(self, test_settings):
+        manager = StateManager("session-cc0000000004")
+        manager.write_json("evidence.json", {"evidence": []})
+        manager.read_json("evidence.json")
+
+        path = manager.session_dir / "evidence.json"
+        path.write_text(json.dumps({"evidence": ["from another process"]}), encoding="utf-8")
+        future = path.stat().st_mtime + 5
+        os.utime(path, (future, future))
+
+        assert manager.read_json("evidence.json") == {"evidence": ["from another process"]}
+
+
+class TestStateCacheBounds:
+    def test_lru_eviction_under_byte_cap(self, tmp_path):
+        cache = StateCache(max_bytes=3_000)
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"f{i}.json"
+            path.write_text(json.dumps({"blob": "x" * 700}), encoding="utf-8")
+            paths.append(path)
+
+        for i, path in enumerate(paths[:4]):
+            cache.load("s", f"f{i}", path)
+        cache.load("s", "f0", paths[0])  # f1 is now least recently used
+        cache.load("s", "f4", paths[4])
+
+        stats = cache.stats()
+        assert stats["bytes"] <= 3_000
+        assert stats["evictions"] == 1
+        assert ("s", "f1") not in cache._entries
+        assert ("s", "f0") in cache._entries
+
+    def test_disabled_cache_still_reads(self, tmp_path):
+        cache = StateCache(max_bytes=0)
+        path = tmp_path / "f.json"
+        path.write_text('{"a": 1}', encoding="utf-8")
+
+        assert cache.load("s", "f", path) == {"a": 1}
+        assert cache.stats()["entries"] == 0
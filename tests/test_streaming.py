@@ -0,0 +1,303 @@
+"""Tests for streamed LLM responses and incremental JSON-array parsing."""
+
+from __future__ import annotations
+
+import json
+from contextlib import aclosing
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from registry_review_mcp.config.settings import settings
+from registry_review_mcp.extractors import llm_extractors
+from registry_review_mcp.extractors.llm_extractors import DateExtractor
+from registry_review_mcp.llm import single_flight, streaming, throttle, token_budget
+from registry_review_mcp.llm.streaming import JSONArrayStream, get_stream_metrics, stream_json_array
+from registry_review_mcp.tools import evidence_tools
+from registry_review_mcp.utils import llm_client
+
+DOCUMENT = "# Plan\n\nRegistered Owner: Nicholas Denman. Project Start Date: 01/01/2022."
+SNIPPETS = [
+    {"text": "Registered Owner: Nicholas Denman", "page": 1, "confidence": 0.95, "schema_match": True},
+    {"text": "Project Start Date: 01/01/2022", "page": 1, "confidence": 0.6},
+]
+RESPONSE = "Here is the evidence:\n```json\n" + json.dumps(SNIPPETS, indent=2) + "\n```"
+REQUIREMENT = {"requirement_id": "REQ-001", "requirement_text": "Land tenure", "accepted_evidence": "Deed"}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_state(monkeypatch):
+    monkeypatch.setenv("LLM_MIN_INTERVAL_MS", "0")
+    for module in (single_flight, streaming, throttle, token_budget):
+        module.reset_for_tests()
+    yield
+    for module in (single_flight, streaming, throttle, token_budget):
+        module.reset_for_tests()
+
+
+def _chunks(text: str, size: int = 7) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class _Stream:
+    """Async text chunks that record whether the consumer closed them early."""
+
+    def __init__(self, text: str):
+        self.chunks = _chunks(text)
+        self.sent = 0
+        self.closed_early = False
+
+    async def generate(self, *args, **kwargs):
+        try:
+            for chunk in self.chunks:
+                self.sent += 1
+                yield chunk
+        except GeneratorExit:
+            self.closed_early = True
+            raise
+
+
+class TestJSONArrayStream:
+    @pytest.mark.parametrize("size", [1, 2, 5, 64, 10_000])
+    def test_items_complete_as_their_text_arrives(self, size):
+        parser = JSONArrayStream()
+
+        items = [item for chunk in _chunks(RESPONSE, size) for item in parser.feed(chunk)]
+
+        assert items == SNIPPETS
+        assert parser.done and not parser.failed
+        assert parser.text == RESPONSE
+
+    def test_first_item_before_the_array_ends(self):
+        parser = JSONArrayStream()
+        first_end = RESPONSE.index("}") + 1
+
+        assert parser.feed(RESPONSE[:first_end]) == [SNIPPETS[0]]
+        assert not parser.done
+
+    def test_brackets_and_escapes_inside_strings(self):
+        parser = JSONArrayStream()
+        items = [{"text": 'Section [1.2] {a} "quoted" \\ end', "nested": [{"x": [1, 2]}]}]
+
+        assert parser.feed(json.dumps(items)) == items
+
+    def test_scalar_elements(self):
+        assert JSONArrayStream().feed('[1, "a,b", true, null, []]') == [1, "a,b", True, None, []]
+
+    def test_invalid_element_stops_parsing(self):
+        parser = JSONArrayStream()
+
+        assert parser.feed('[{"a": 1}, {bad}, {"b": 2}]') == [{"a": 1}]
+        assert parser.failed
+
+
+class TestStreamJsonArray:
+    async def test_records_first_token_and_first_item(self):
+        source = _Stream(RESPONSE)
+
+        items = [item async for item in stream_json_array(source.generate())]
+
+        assert items == SNIPPETS
+        stats = get_stream_metrics().stats()
+        assert (stats["streams"], stats["completed"], stats["stopped_early"]) == (1, 1, 0)
+        assert stats["time_to_first_token"]["p50"] <= stats["time_to_first_item"]["p50"]
+
+    async def test_closing_early_counts_as_stopped(self):
+        source = _Stream(RESPONSE)
+
+        async with aclosing(source.generate()) as chunks, aclosing(stream_json_array(chunks)) as items:
+            async for _ in items:
+                break
+
+        assert source.closed_early
+        assert get_stream_metrics().stats()["stopped_early"] == 1
+
+
+class TestCallLlmStream:
+    async def test_api_backend_streams_and_reports_usage_when_closed_early(self):
+        usage = SimpleNamespace(input_tokens=10, output_tokens=3)
+        source = _Stream(RESPONSE)
+
+        class MessageStream:
+            text_stream = source.generate()
+            current_message_snapshot = SimpleNamespace(usage=usage)
+            closed = False
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                # Exiting the SDK's stream closes the response: the request is cancelled.
+                MessageStream.closed = True
+                return False
+
+        client = SimpleNamespace(messages=SimpleNamespace(stream=lambda **params: MessageStream()))
+        with (
+            patch.object(llm_client, "_resolve_backend", new_callable=AsyncMock, return_value="api"),
+            patch.object(llm_client, "get_anthropic_client", return_value=client),
+            patch.object(llm_client, "_report_anthropic_usage") as report,
+        ):
+            async with aclosing(llm_client.call_llm_stream("prompt", model="m")) as chunks:
+                received = []
+                async for chunk in chunks:
+                    received.append(chunk)
+                    if len(received) == 3:
+                        break
+
+        assert "".join(received) == RESPONSE[:21]
+        assert MessageStream.closed and source.sent == 3
+        assert report.call_args.args[0] is usage
+
+    async def test_cli_backend_yields_the_whole_response(self):
+        with (
+            patch.object(llm_client, "_resolve_backend", new_callable=AsyncMock, return_value="cli"),
+            patch.object(llm_client, "_call_via_cli", new_callable=AsyncMock, return_value=RESPONSE),
+        ):
+            chunks = [chunk async for chunk in llm_client.call_llm_stream("prompt", model="m")]
+
+        assert chunks == [RESPONSE]
+
+
+class TestStreamedEvidence:
+    @pytest.fixture
+    def streamed_settings(self, monkeypatch, tmp_path):
+        def apply(**overrides):
+            monkeypatch.setattr(
+                evidence_tools,
+                "settings",
+                settings.model_copy(
+                    update={
+                        "llm_cache_dir": tmp_path,
+                        "llm_cache_enabled": True,
+                        "llm_stream_responses": True,
+                        **overrides,
+                    }
+                ),
+            )
+
+        return apply
+
+    async def test_snippets_reported_as_they_arrive(self, monkeypatch, streamed_settings):
+        streamed_settings()
+        source = _Stream(RESPONSE)
+        monkeypatch.setattr(evidence_tools, "call_llm_stream", source.generate)
+        arrivals: list[tuple[str, int]] = []
+
+        snippets = await evidence_tools.extract_evidence_with_llm(
+            REQUIREMENT, DOCUMENT, "DOC-1", "plan.pdf", on_snippet=lambda s: arrivals.append((s.text, source.sent))
+        )
+
+        assert [s.text for s in snippets] == [item["text"] for item in SNIPPETS]
+        assert [text for text, _ in arrivals] == [item["text"] for item in SNIPPETS]
+        assert arrivals[0][1] < len(source.chunks)  # before the response ended
+        assert not source.closed_early
+
+    async def test_same_result_as_unstreamed(self, monkeypatch, streamed_settings, tmp_path):
+        streamed_settings(llm_cache_enabled=False)
+        monkeypatch.setattr(evidence_tools, "call_llm_stream", _Stream(RESPONSE).generate)
+        streamed = await evidence_tools.extract_evidence_with_llm(REQUIREMENT, DOCUMENT, "DOC-1", "plan.pdf")
+
+        streamed_settings(llm_cache_enabled=False, llm_stream_responses=False)
+        monkeypatch.setattr(evidence_tools, "call_llm", AsyncMock(return_value=RESPONSE))
+        unstreamed = await evidence_tools.extract_evidence_with_llm(REQUIREMENT, DOCUMENT, "DOC-1", "plan.pdf")
+
+        assert [s.model_dump() for s in streamed] == [s.model_dump() for s in unstreamed]
+
+    async def test_cut_off_once_covered_by_verified_snippet(self, monkeypatch, streamed_settings):
+        streamed_settings(evidence_stream_stop_confidence=0.9)
+        source = _Stream(RESPONSE)
+        monkeypatch.setattr(evidence_tools, "call_llm_stream", source.generate)
+
+        snippets = await evidence_tools.extract_evidence_with_llm(REQUIREMENT, DOCUMENT, "DOC-1", "plan.pdf")
+
+        assert [s.text for s in snippets] == [SNIPPETS[0]["text"]]
+        assert source.closed_early
+        assert get_stream_metrics().stats()["stopped_early"] == 1
+
+    async def test_unverified_snippet_does_not_cut_off(self, monkeypatch, streamed_settings):
+        streamed_settings(evidence_stream_stop_confidence=0.9)
+        source = _Stream(RESPONSE)
+        monkeypatch.setattr(evidence_tools, "call_llm_stream", source.generate)
+
+        snippets = await evidence_tools.extract_evidence_with_llm(
+            REQUIREMENT, "# Plan\n\nNothing about owners here.", "DOC-1", "plan.pdf"
+        )
+
+        assert len(snippets) == 2
+        assert not source.closed_early
+
+    def test_cut_off_responses_cached_separately(self, streamed_settings):
+        streamed_settings()
+        complete = evidence_tools._evidence_cache_key(REQUIREMENT, DOCUMENT, "DOC-1", "document_presence", "m")
+
+        streamed_settings(evidence_stream_stop_confidence=0.9)
+        cut_off = evidence_tools._evidence_cache_key(REQUIREMENT, DOCUMENT, "DOC-1", "document_presence", "m")
+
+        assert complete != cut_off
+
+
+class TestStreamedDates:
+    async def test_streamed_dates_match_unstreamed(self, monkeypatch):
+        from anthropic.types import Message
+
+        dates = [
+            {
+                "value": "2022-01-01",
+                "field_type": "project_start_date",
+                "source": "Plan",
+                "confidence": 0.95,
+                "reasoning": "Stated",
+                "raw_text": "Project Start Date: 01/01/2022",
+            },
+            {
+                "value": "2030-01-01",
+                "field_type": "project_end_date",
+                "source": "Plan",
+                "confidence": 0.9,
+                "reasoning": "Invented",
+                "raw_text": "Project End Date: 01/01/2030",
+            },
+        ]
+        text = "```json\n" + json.dumps(dates) + "\n```"
+        message = Message.model_validate(
+            {
+                "id": "msg_1",
+                "type": "message",
+                "role": "assistant",
+                "model": "m",
+                "content": [{"type": "text", "text": text}],
+                "stop_reason": "end_turn",
+                "usage": {"input_tokens": 10, "output_tokens": 5},
+            }
+        )
+
+        class MessageStream:
+            def __init__(self):
+                self.text_stream = _Stream(text).generate()
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def get_final_message(self):
+                return message
+
+        client = SimpleNamespace(
+            messages=SimpleNamespace(stream=lambda **params: MessageStream(), create=AsyncMock(return_value=message))
+        )
+
+        async def extract(stream: bool):
+            monkeypatch.setattr(
+                llm_extractors, "settings", settings.model_copy(update={"llm_stream_responses": stream})
+            )
+            fields = await DateExtractor(client=client)._process_date_chunk(DOCUMENT, [], "plan.pdf", 0)
+            return [field.model_dump() for field in fields]
+
+        streamed, unstreamed = await extract(True), await extract(False)
+
+        assert streamed == unstreamed
+        assert [field["confidence"] for field in streamed] == [0.95, pytest.approx(0.6)]
+        client.messages.create.assert_awaited_once()
@@ -19,6 +19,7 @@ from tests.factories import (
 
 pytestmark = [
     pytest.mark.expensive,
+    pytest.mark.usefixtures("isolated_llm_cache"),
     pytest.mark.skipif(
         not settings.anthropic_api_key or not settings.llm_extraction_enabled,
         reason="LLM extraction not configured (set ANTHROPIC_API_KEY and enable LLM extraction)"
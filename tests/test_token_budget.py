@@ -0,0 +1,197 @@
+"""Tests for the tokens-per-minute scheduler in ``llm.token_budget``."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from registry_review_mcp.llm import throttle, token_budget
+from registry_review_mcp.llm.token_budget import TokenScheduler, llm_priority, record_usage, reserve_tokens
+
+
+@pytest.fixture(autouse=True)
+def _fresh_scheduler(monkeypatch):
+    monkeypatch.delenv("LLM_INPUT_TOKENS_PER_MINUTE", raising=False)
+    monkeypatch.delenv("LLM_OUTPUT_TOKENS_PER_MINUTE", raising=False)
+    monkeypatch.setenv("LLM_MIN_INTERVAL_MS", "0")
+    token_budget.reset_for_tests()
+    throttle.reset_for_tests()
+    yield
+    token_budget.reset_for_tests()
+    throttle.reset_for_tests()
+
+
+class TestConstruction:
+    def test_disabled_by_default(self):
+        scheduler = token_budget.get_token_scheduler()
+        assert not scheduler.enabled
+
+    def test_env_configures_buckets(self, monkeypatch):
+        monkeypatch.setenv("LLM_INPUT_TOKENS_PER_MINUTE", "40000")
+        monkeypatch.setenv("LLM_OUTPUT_TOKENS_PER_MINUTE", "8000")
+        token_budget.reset_for_tests()
+
+        telemetry = token_budget.get_token_scheduler().telemetry()
+
+        assert telemetry["buckets"]["input"]["per_minute"] == 40_000
+        assert telemetry["buckets"]["output"]["per_minute"] == 8_000
+
+    def test_unknown_priority_rejected(self):
+        with pytest.raises(ValueError):
+            with llm_priority("urgent"):
+                pass
+
+
+class TestAdmission:
+    async def test_charges_estimated_tokens(self):
+        scheduler = TokenScheduler(input_tokens_per_minute=10_000)
+
+        reservation = await scheduler.acquire(prompt_chars=4_000, max_tokens=500)
+
+        assert reservation.input_tokens == 1_000
+        assert scheduler.input.level == pytest.approx(9_000, abs=5)
+
+    async def test_waits_for_refill_when_budget_exhausted(self):
+        # 60,000/min refills 1,000 tokens per second.
+        scheduler = TokenScheduler(input_tokens_per_minute=60_000)
+        scheduler.input.level = 0.0
+
+        started = asyncio.get_running_loop().time()
+        await scheduler.acquire(prompt_chars=400, max_tokens=10)  # 100 tokens
+        elapsed = asyncio.get_running_loop().time() - started
+
+        assert 0.05 <= elapsed < 1.0
+        assert scheduler.waited["default"] == 1
+
+    async def test_expired_refill_wait_retries(self, monkeypatch):
+        # Nobody notifies the lone waiter: it is only admitted if the timed
+        # wait for its refill delay expires and the loop tries again.
+        scheduler = TokenScheduler(input_tokens_per_minute=60_000)
+        scheduler.input.level = 0.0
+        real_wait_for = asyncio.wait_for
+        expired: list[float] = []
+
+        async def wait_for(awaitable, timeout):
+            try:
+                return await real_wait_for(awaitable, timeout)
+            except asyncio.TimeoutError:
+                expired.append(timeout)
+                raise
+
+        monkeypatch.setattr(token_budget.asyncio, "wait_for", wait_for)
+
+        reservation = await scheduler.acquire(prompt_chars=400, max_tokens=10)
+
+        assert reservation.input_tokens == 100
+        assert expired and all(timeout > 0 for timeout in expired)
+
+    async def test_oversized_prompt_is_capped_at_capacity(self):
+        scheduler = TokenScheduler(input_tokens_per_minute=1_000)
+
+        reservation = await asyncio.wait_for(scheduler.acquire(prompt_chars=400_000, max_tokens=10), timeout=1)
+
+        assert reservation.input_tokens == 1_000
+
+    async def test_interactive_overtakes_queued_bulk(self):
+        scheduler = TokenScheduler(input_tokens_per_minute=60_000)
+        scheduler.input.level = 0.0
+        admitted: list[str] = []
+
+        async def call(priority: str) -> None:
+            await scheduler.acquire(prompt_chars=400, max_tokens=10, priority=priority)
+            admitted.append(priority)
+
+        bulk = [asyncio.create_task(call("bulk")) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        interactive = asyncio.create_task(call("interactive"))
+        await asyncio.gather(*bulk, interactive)
+
+        # The interactive call arrived last but is admitted first.
+        assert admitted == ["interactive", "bulk", "bulk", "bulk"]
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        scheduler = TokenScheduler(input_tokens_per_minute=60)
+        scheduler.input.level = 0.0
+
+        task = asyncio.create_task(scheduler.acquire(prompt_chars=400, max_tokens=10))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert scheduler.telemetry()["queued"] == 0
+
+
+class TestSettlement:
+    async def test_usage_refunds_overestimate_and_calibrates(self):
+        token_budget._scheduler = TokenScheduler(input_tokens_per_minute=10_000, output_tokens_per_minute=10_000)
+        scheduler = token_budget._scheduler
+
+        async with reserve_tokens(prompt_chars=4_000, max_tokens=2_000):
+            record_usage(input_tokens=500, output_tokens=100)
+
+        # 4,000 chars reported as 500 tokens: 8 chars/token pulls the
+        # 4.0 estimate up by one EWMA step.
+        assert scheduler.chars_per_token == pytest.approx(4.8)
+        assert scheduler.output_tokens_ewma == 100
+        assert scheduler.input.level == pytest.approx(9_500, abs=5)
+        assert scheduler.output.level == pytest.approx(9_900, abs=5)
+        assert scheduler.estimate_output_tokens(2_000) == 100
+
+    async def test_no_usage_keeps_estimate_charged(self):
+        token_budget._scheduler = TokenScheduler(input_tokens_per_minute=10_000)
+        scheduler = token_budget._scheduler
+
+        async with reserve_tokens(prompt_chars=4_000, max_tokens=100):
+            pass
+
+        assert scheduler.input.level == pytest.approx(9_000, abs=5)
+        assert scheduler.calibration_samples == 0
+
+    def test_record_usage_outside_reservation_is_noop(self):
+        record_usage(input_tokens=10, output_tokens=10)
+
+
+class TestCallLlmIntegration:
+    async def test_api_usage_reaches_scheduler(self, test_settings):
+        from registry_review_mcp.utils import llm_client
+
+        response = SimpleNamespace(
+            content=[SimpleNamespace(text="ok")],
+            usage=SimpleNamespace(
+                input_tokens=200,
+                output_tokens=50,
+                cache_creation_input_tokens=300,
+                cache_read_input_tokens=500,
+            ),
+        )
+        client = MagicMock()
+        client.messages.create = AsyncMock(return_value=response)
+
+        with (
+            patch.object(llm_client, "_resolve_backend", new_callable=AsyncMock, return_value="api"),
+            patch.object(llm_client, "get_anthropic_client", return_value=client),
+        ):
+            assert await llm_client.call_llm("x" * 4_000) == "ok"
+
+        scheduler = token_budget.get_token_scheduler()
+        # Cache reads count toward calibration: 4,000 chars / 1,000 tokens.
+        assert scheduler.calibration_samples == 1
+        assert scheduler.chars_per_token == pytest.approx(4.0)
+        assert scheduler.output_tokens_ewma == 50
+        assert scheduler.admitted["default"] == 1
+
+    async def test_priority_follows_context(self, test_settings):
+        from registry_review_mcp.utils import llm_client
+
+        with (
+            patch.object(llm_client, "_resolve_backend", new_callable=AsyncMock, return_value="api"),
+            patch.object(llm_client, "_call_via_api", new_callable=AsyncMock, return_value="ok"),
+        ):
+            with llm_priority("interactive"):
+                await llm_client.call_llm("prompt")
+
+        assert token_budget.get_token_scheduler().admitted["interactive"] == 1
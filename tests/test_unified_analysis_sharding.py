@@ -0,0 +1,243 @@
+"""Tests for sharded unified analysis: shard planning, the merge step and per-shard caching."""
+
+import json
+import re
+
+import pytest
+
+from registry_review_mcp.config import settings as settings_module
+from registry_review_mcp.llm import response_store
+from registry_review_mcp.llm.prompt_budget import PromptBudget
+from registry_review_mcp.models.errors import DocumentExtractionError
+from registry_review_mcp.prompts import unified_analysis
+from registry_review_mcp.prompts.unified_analysis import (
+    UnifiedAnalysisResult,
+    analyze_sharded,
+    build_unified_analysis_prompt,
+    merge_unified_results,
+    plan_document_shards,
+)
+from registry_review_mcp.utils import llm_client
+
+DOCUMENTS = [
+    {"document_id": f"DOC-{i}", "filename": f"doc{i}.pdf", "classification": "Project Plan", "filepath": ""}
+    for i in range(4)
+]
+MARKDOWN = {doc["document_id"]: f"# {doc['filename']}\n\n" + "Soil carbon. " * 200 for doc in DOCUMENTS}
+REQUIREMENTS = [
+    {"requirement_id": f"REQ-00{i}", "category": "General", "requirement_text": f"Req {i}", "accepted_evidence": ""}
+    for i in (1, 2)
+]
+
+
+def _budget_for(documents_per_shard: int) -> PromptBudget:
+    docs = DOCUMENTS[:documents_per_shard]
+    size = len(
+        build_unified_analysis_prompt(docs, {d["document_id"]: MARKDOWN[d["document_id"]] for d in docs}, REQUIREMENTS)
+    )
+    return PromptBudget(max_total_chars=size)
+
+
+def _result(doc_id: str, statuses: dict[str, str], **overrides) -> dict:
+    result = {
+        "requirements_evidence": [
+            {
+                "requirement_id": req_id,
+                "status": status,
+                "confidence": {"covered": 0.9, "partial": 0.6, "missing": 0.2}[status],
+                "mapped_documents": [{"document_id": doc_id, "document_name": doc_id, "relevance_score": 0.8}],
+                "evidence_snippets": [{"text": f"{req_id} in {doc_id}", "page": 1, "section": None, "confidence": 0.8}],
+                "notes": f"from {doc_id}",
+            }
+            for req_id, status in statuses.items()
+        ],
+        "requirements_covered": 0,
+        "requirements_partial": 0,
+        "requirements_missing": 0,
+        "overall_coverage": 0.0,
+        "extracted_fields": [],
+        "validation_checks": [],
+        "project_metadata": {
+            "project_id": None,
+            "proponent": None,
+            "crediting_period_start": None,
+            "crediting_period_end": None,
+            "location": None,
+            "acreage": None,
+            "credit_class": None,
+            "methodology_version": None,
+            "vintage_year": None,
+            "confidence": 0.5,
+        },
+        "overall_assessment": f"Assessment of {doc_id}",
+        "flagged_items": [],
+    }
+    result.update(overrides)
+    return result
+
+
+@pytest.fixture
+def fake_llm(monkeypatch, tmp_path):
+    """Answer each shard prompt from the first document it contains; record the calls."""
+    monkeypatch.setattr(
+        settings_module,
+        "settings",
+        settings_module.settings.model_copy(update={"llm_cache_dir": tmp_path, "llm_cache_enabled": True}),
+    )
+    response_store.reset_for_tests()
+    calls: list[list[str]] = []
+    failing: set[str] = set()
+
+    async def call_llm(prompt, system=None, model=None, max_tokens=None):
+        doc_ids = re.findall(r"\*\*ID\*\*: (DOC-\d+)", prompt)
+        calls.append(doc_ids)
+        if failing & set(doc_ids):
+            raise RuntimeError("gateway timeout")
+        return json.dumps(_result(doc_ids[0], {"REQ-001": "partial", "REQ-002": "missing"}))
+
+    monkeypatch.setattr(llm_client, "call_llm", call_llm)
+    yield calls, failing
+    response_store.reset_for_tests()
+
+
+class TestPlanDocumentShards:
+    def test_documents_that_fit_share_one_shard(self):
+        shards = plan_document_shards(DOCUMENTS, MARKDOWN, REQUIREMENTS, _budget_for(4).max_total_chars)
+
+        assert shards == [DOCUMENTS]
+
+    def test_shards_fit_the_budget_in_document_order(self):
+        budget = _budget_for(2).max_total_chars
+
+        shards = plan_document_shards(DOCUMENTS, MARKDOWN, REQUIREMENTS, budget)
+
+        assert shards == [DOCUMENTS[:2], DOCUMENTS[2:]]
+
+    def test_oversized_document_gets_a_shard_of_its_own(self):
+        assert plan_document_shards(DOCUMENTS[:2], MARKDOWN, REQUIREMENTS, 10) == [[DOCUMENTS[0]], [DOCUMENTS[1]]]
+
+    def test_no_documents_is_one_empty_shard(self):
+        assert plan_document_shards([], {}, REQUIREMENTS, 100_000) == [[]]
+
+
+class TestMergeUnifiedResults:
+    def test_single_result_is_unchanged(self):
+        result = UnifiedAnalysisResult(**_result("DOC-0", {"REQ-001": "covered"}))
+
+        assert merge_unified_results([result], REQUIREMENTS) is result
+
+    def test_requirement_takes_strongest_status(self):
+        results = [
+            UnifiedAnalysisResult(**_result("DOC-0", {"REQ-002": "partial", "REQ-001": "missing"})),
+            UnifiedAnalysisResult(**_result("DOC-1", {"REQ-001": "covered", "REQ-002": "missing"})),
+        ]
+
+        merged = merge_unified_results(results, REQUIREMENTS)
+
+        req1, req2 = merged.requirements_evidence
+        assert (req1.requirement_id, req1.status, req1.confidence) == ("REQ-001", "covered", 0.9)
+        assert [d.document_id for d in req1.mapped_documents] == ["DOC-1", "DOC-0"]
+        assert [s.text for s in req1.evidence_snippets] == ["REQ-001 in DOC-1", "REQ-001 in DOC-0"]
+        assert req1.notes == "from DOC-1\nfrom DOC-0"
+        assert (req2.requirement_id, req2.status) == ("REQ-002", "partial")
+        assert (merged.requirements_covered, merged.requirements_partial, merged.requirements_missing) == (1, 1, 0)
+        assert merged.overall_coverage == 0.75
+        assert merged.overall_assessment == "Assessment of DOC-0\n\nAssessment of DOC-1"
+
+    def test_fields_checks_and_metadata(self):
+        def field(value, confidence):
+            return {"field_name": "project_id", "field_value": value, "source_document": "d", "confidence": confidence}
+
+        def check(status):
+            return {"check_type": "date_alignment", "status": status, "message": status}
+
+        first = _result(
+            "DOC-0",
+            {},
+            extracted_fields=[field("C06-4997", 0.7)],
+            validation_checks=[check("pass")],
+            flagged_items=["Missing deed"],
+        )
+        first["project_metadata"].update(project_id="C06-4997", confidence=0.6)
+        second = _result(
+            "DOC-1",
+            {},
+            extracted_fields=[field("C06-4998", 0.9)],
+            validation_checks=[check("warning")],
+            flagged_items=["Missing deed"],
+            prior_review_status={
+                "has_prior_review": True,
+                "review_id": "R-1",
+                "review_outcome": None,
+                "reviewer_name": None,
+                "review_date": None,
+                "notes": None,
+                "confidence": 0.7,
+            },
+        )
+        second["project_metadata"].update(proponent="Botany Bay Farm LLC", confidence=0.8)
+
+        merged = merge_unified_results([UnifiedAnalysisResult(**first), UnifiedAnalysisResult(**second)], REQUIREMENTS)
+
+        assert [(f.field_value, f.confidence) for f in merged.extracted_fields] == [("C06-4998", 0.9)]
+        assert merged.flagged_items == [
+            "Missing deed",
+            "Conflicting values for project_id across documents: C06-4997, C06-4998",
+        ]
+        assert [c.status for c in merged.validation_checks] == ["warning"]
+        assert merged.project_metadata.project_id == "C06-4997"
+        assert merged.project_metadata.proponent == "Botany Bay Farm LLC"
+        assert merged.project_metadata.confidence == 0.8
+        assert merged.prior_review_status.review_id == "R-1"
+
+
+class TestAnalyzeSharded:
+    async def test_shards_are_analyzed_and_merged(self, fake_llm):
+        calls, _ = fake_llm
+
+        result = await analyze_sharded(DOCUMENTS, MARKDOWN, REQUIREMENTS, budget=_budget_for(2))
+
+        assert sorted(calls) == [["DOC-0", "DOC-1"], ["DOC-2", "DOC-3"]]
+        assert [d.document_id for d in result.requirements_evidence[0].mapped_documents] == ["DOC-0", "DOC-2"]
+
+    async def test_retry_reruns_only_the_failed_shard(self, fake_llm):
+        calls, failing = fake_llm
+        failing.add("DOC-2")
+
+        with pytest.raises(DocumentExtractionError):
+            await analyze_sharded(DOCUMENTS, MARKDOWN, REQUIREMENTS, budget=_budget_for(2))
+        failing.clear()
+        calls.clear()
+        result = await analyze_sharded(DOCUMENTS, MARKDOWN, REQUIREMENTS, budget=_budget_for(2))
+
+        assert calls == [["DOC-2", "DOC-3"]]
+        assert len(result.requirements_evidence) == 2
+
+    async def test_cache_disabled_calls_every_shard(self, fake_llm, monkeypatch):
+        calls, _ = fake_llm
+        monkeypatch.setattr(
+            settings_module, "settings", settings_module.settings.model_copy(update={"llm_cache_enabled": False})
+        )
+
+        await analyze_sharded(DOCUMENTS, MARKDOWN, REQUIREMENTS, budget=_budget_for(4))
+        await analyze_sharded(DOCUMENTS, MARKDOWN, REQUIREMENTS, budget=_budget_for(4))
+
+        assert calls == [[d["document_id"] for d in DOCUMENTS]] * 2
+
+    async def test_executor_model_swap_reanalyzes(self, fake_llm, monkeypatch):
+        calls, _ = fake_llm
+
+        for model in ("gpt-a", "gpt-b"):
+            monkeypatch.setattr(
+                settings_module,
+                "settings",
+                settings_module.settings.model_copy(
+                    update={"llm_backend": "openai", "openai_model": model, "openai_model_dev": model}
+                ),
+            )
+            await analyze_sharded(DOCUMENTS, MARKDOWN, REQUIREMENTS, budget=_budget_for(4))
+
+        assert len(calls) == 2
+
+    def test_shard_key_changes_with_model(self):
+        assert unified_analysis._shard_cache_key("p", "model-a") != unified_analysis._shard_cache_key("p", "model-b")